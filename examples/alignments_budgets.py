@@ -0,0 +1,39 @@
+import os
+import time
+
+import pm4py
+from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
+from pm4py.algo.conformance.alignments.petri_net.variants import state_equation_a_star
+
+
+def execute_script(max_nodes=100):
+    log_paths = [os.path.join("..", "tests", "input_data", "running-example.xes"),
+                 os.path.join("..", "tests", "compressed_input_data", "04_reviewing.xes.gz")]
+    for log_path in log_paths:
+        log = pm4py.read_xes(log_path, return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.5)
+
+        aa = time.time()
+        aligned_traces = alignments.apply(log, net, im, fm, variant=alignments.Variants.VERSION_STATE_EQUATION_A_STAR)
+        bb = time.time()
+        # at most max_nodes visited states per trace, then a beam search (with the same budget)
+        # from the open set of the exact search
+        bounded_traces = alignments.apply(log, net, im, fm, variant=alignments.Variants.VERSION_STATE_EQUATION_A_STAR,
+                                          parameters={state_equation_a_star.Parameters.MAX_NODES_TRACE: max_nodes})
+        cc = time.time()
+
+        print(os.path.basename(log_path))
+        print("state_equation_a_star: %.3f s, %d visited states" % (bb - aa, sum(x["visited_states"] for x in aligned_traces)))
+        print("state_equation_a_star (max %d visited states per trace): %.3f s, %d visited states" % (
+            max_nodes, cc - bb, sum(x["visited_states"] for x in bounded_traces if x is not None)))
+        print("alignments with exhausted budget: ", sum(1 for x in bounded_traces if x is not None and "exhausted_budget" in x))
+        # the alignments found after the exhaustion of the budget are proven optimal if reaching the lower bound
+        print("approximate alignments: ", sum(1 for x in bounded_traces if x is not None and not x["optimal"]))
+        print("alignments not found: ", sum(1 for x in bounded_traces if x is None))
+        print("total cost of the alignments found: ",
+              sum(x["cost"] for x, y in zip(aligned_traces, bounded_traces) if y is not None),
+              sum(x["cost"] for x in bounded_traces if x is not None))
+
+
+if __name__ == "__main__":
+    execute_script()
@@ -0,0 +1,37 @@
+import os
+import tempfile
+import time
+
+import pm4py
+from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
+
+
+def execute_script():
+    log = pm4py.read_xes(os.path.join("..", "tests", "compressed_input_data", "04_reviewing.xes.gz"),
+                         return_legacy_log_object=True)
+    net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.2)
+
+    cache_dir = tempfile.mkdtemp()
+    # opt-in persistent cache of the alignments of the variants, shared by the executions on the same model
+    parameters = {alignments.Parameters.CACHE_PATH: os.path.join(cache_dir, "alignments.sqlite"),
+                  alignments.Parameters.SHOW_PROGRESS_BAR: False}
+
+    aa = time.time()
+    aligned_traces = alignments.apply(log, net, im, fm, variant=alignments.Variants.VERSION_STATE_EQUATION_A_STAR,
+                                      parameters=parameters)
+    bb = time.time()
+    cached_aligned_traces = alignments.apply(log, net, im, fm,
+                                             variant=alignments.Variants.VERSION_STATE_EQUATION_A_STAR,
+                                             parameters=parameters)
+    cc = time.time()
+
+    print("first execution (alignments stored in the cache): %.3f s" % (bb - aa))
+    print("second execution (alignments read from the cache): %.3f s" % (cc - bb))
+    print("same alignments: ", aligned_traces == cached_aligned_traces)
+
+    os.remove(parameters[alignments.Parameters.CACHE_PATH])
+    os.rmdir(cache_dir)
+
+
+if __name__ == "__main__":
+    execute_script()
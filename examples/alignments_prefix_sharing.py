@@ -0,0 +1,31 @@
+import os
+import time
+
+import pm4py
+from pm4py.algo.conformance.alignments.petri_net.variants import state_equation_a_star
+
+
+def execute_script():
+    log_paths = [os.path.join("..", "tests", "compressed_input_data", "03_repairExample.xes.gz"),
+                 os.path.join("..", "tests", "compressed_input_data", "04_reviewing.xes.gz")]
+    for log_path in log_paths:
+        log = pm4py.read_xes(log_path, return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.2)
+        var_list = [(variant, count) for variant, count in pm4py.get_variants(log).items()]
+
+        aa = time.time()
+        aligned_variants = state_equation_a_star.apply_from_variants_list(var_list, net, im, fm)
+        bb = time.time()
+        # a single search on the trie of the variants, shared along their common prefixes
+        aligned_variants_ps = state_equation_a_star.apply_from_variants_list(
+            var_list, net, im, fm, parameters={state_equation_a_star.Parameters.PREFIX_SHARING: True})
+        cc = time.time()
+
+        print(os.path.basename(log_path), "variants: %d" % len(var_list))
+        print("apply_from_variants_list: %.3f s" % (bb - aa))
+        print("apply_from_variants_list (prefix sharing): %.3f s" % (cc - bb))
+        print("same costs: ", all(aligned_variants[v]["cost"] == aligned_variants_ps[v]["cost"] for v in aligned_variants))
+
+
+if __name__ == "__main__":
+    execute_script()
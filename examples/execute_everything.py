@@ -799,6 +799,12 @@ def streaming_xes_reader_event_stream():
     streaming_xes_reader_event_stream.execute_script()
 
 
+def streaming_yaml_tail_reader():
+    from examples import streaming_yaml_tail_reader
+    print("\n\nstreaming_yaml_tail_reader")
+    streaming_yaml_tail_reader.execute_script()
+
+
 def streaming_xes_reader_trace_stream():
     from examples import streaming_xes_reader_trace_stream
     print("\n\nstreaming_xes_reader_trace_stream")
@@ -871,6 +877,90 @@ def process_tree_reduction():
     process_tree_reduction.execute_script()
 
 
+def xes_yaml_import_benchmark():
+    from examples import xes_yaml_import_benchmark
+    print("\n\nxes_yaml_import_benchmark")
+    xes_yaml_import_benchmark.execute_script()
+
+
+def iot_datastream_index_benchmark():
+    from examples import iot_datastream_index_benchmark
+    print("\n\niot_datastream_index_benchmark")
+    iot_datastream_index_benchmark.execute_script()
+
+
+def iot_columnar_datastream():
+    from examples import iot_columnar_datastream
+    print("\n\niot_columnar_datastream")
+    iot_columnar_datastream.execute_script()
+
+
+def iot_sensor_query():
+    from examples import iot_sensor_query
+    print("\n\niot_sensor_query")
+    iot_sensor_query.execute_script()
+
+
+def iot_xes_import_benchmark():
+    from examples import iot_xes_import_benchmark
+    print("\n\niot_xes_import_benchmark")
+    iot_xes_import_benchmark.execute_script()
+
+
+def iot_streaming_import():
+    from examples import iot_streaming_import
+    print("\n\niot_streaming_import")
+    iot_streaming_import.execute_script()
+
+
+def iot_xes_export_benchmark():
+    from examples import iot_xes_export_benchmark
+    print("\n\niot_xes_export_benchmark")
+    iot_xes_export_benchmark.execute_script()
+
+
+def iot_sensor_dataframe():
+    from examples import iot_sensor_dataframe
+    print("\n\niot_sensor_dataframe")
+    iot_sensor_dataframe.execute_script()
+
+
+def iot_sensor_join():
+    from examples import iot_sensor_join
+    print("\n\niot_sensor_join")
+    iot_sensor_join.execute_script()
+
+
+def alignments_integer_markings():
+    from examples import alignments_integer_markings
+    print("\n\nalignments_integer_markings")
+    alignments_integer_markings.execute_script()
+
+
+def alignments_cache():
+    from examples import alignments_cache
+    print("\n\nalignments_cache")
+    alignments_cache.execute_script()
+
+
+def alignments_prefix_sharing():
+    from examples import alignments_prefix_sharing
+    print("\n\nalignments_prefix_sharing")
+    alignments_prefix_sharing.execute_script()
+
+
+def shared_pool_scaling():
+    from examples import shared_pool_scaling
+    print("\n\nshared_pool_scaling")
+    shared_pool_scaling.execute_script()
+
+
+def alignments_budgets():
+    from examples import alignments_budgets
+    print("\n\nalignments_budgets")
+    alignments_budgets.execute_script()
+
+
 def execute_script(f):
     try:
         f()
@@ -1027,9 +1117,24 @@ def main():
         execute_script(streaming_csv_reader_event_stream)
         execute_script(streaming_discovery_dfg)
         execute_script(streaming_xes_reader_event_stream)
+        execute_script(streaming_yaml_tail_reader)
         execute_script(streaming_xes_reader_trace_stream)
         execute_script(monte_carlo_dfg)
         execute_script(monte_carlo_petri_net)
+        execute_script(xes_yaml_import_benchmark)
+        execute_script(iot_datastream_index_benchmark)
+        execute_script(iot_columnar_datastream)
+        execute_script(iot_sensor_query)
+        execute_script(iot_xes_import_benchmark)
+        execute_script(iot_streaming_import)
+        execute_script(iot_xes_export_benchmark)
+        execute_script(iot_sensor_dataframe)
+        execute_script(iot_sensor_join)
+        execute_script(alignments_integer_markings)
+        execute_script(alignments_cache)
+        execute_script(alignments_prefix_sharing)
+        execute_script(shared_pool_scaling)
+        execute_script(alignments_budgets)
 
     print("numpy version: "+str(numpy.__version__))
     print("pandas version: "+str(pandas.__version__))
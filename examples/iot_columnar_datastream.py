@@ -0,0 +1,46 @@
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from pm4py.objects.iot.obj import DataStream, FilterSet, Point
+
+
+def generate_points(num_points):
+    """
+    Generates the readings of a 10 Hz sensor, with the nested meta attributes of the IoT XES importer
+    """
+    start = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=2)))
+    for i in range(num_points):
+        yield Point(id="sensor" + str(i % 4), timestamp=start + timedelta(milliseconds=100 * i),
+                    value=20.0 + (i % 100) / 10.0, source="sensor_source", meta=[{"type": "System.Double"}])
+
+
+def build_datastream(num_points, columnar):
+    tracemalloc.start()
+    aa = time.time()
+    datastream = DataStream(name="temperature", columnar=columnar)
+    for point in generate_points(num_points):
+        datastream.append(point)
+    bb = time.time()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return datastream, bb - aa, memory
+
+
+def execute_script(num_points=200000):
+    # a day of 10 Hz readings amounts to 864000 points
+    for columnar in [False, True]:
+        datastream, build_time, memory = build_datastream(num_points, columnar)
+        aa = time.time()
+        values = datastream.fetch_sensor_values(FilterSet(id="sensor1"))
+        bb = time.time()
+        print("%s datastream with %d points: %.1f MB, built in %.3f s, fetched %d values in %.3f s" % (
+            "columnar" if columnar else "list-based", len(datastream), memory / 1024 / 1024, build_time,
+            len(values), bb - aa))
+
+    print("first point: ", datastream[0])
+    print("timestamps: ", datastream._list.timestamps[:3])
+
+
+if __name__ == "__main__":
+    execute_script()
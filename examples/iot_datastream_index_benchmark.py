@@ -0,0 +1,81 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+from pm4py.objects.iot.obj import DataStream, MultiPoint, Point
+
+
+def generate_points(num_points=100000):
+    """
+    Generates distinct points of a few sensors, with the nested meta attributes of the IoT XES importer
+    """
+    start = datetime(2024, 1, 1)
+    points = []
+    for i in range(num_points):
+        sensor = "sensor" + str(i % 10)
+        points.append(Point(id=sensor, timestamp=start + timedelta(seconds=i), value=random.random(),
+                            source=sensor + "_source", meta=[{"type": "System.Double"}]))
+    return points
+
+
+def linear_contains(datastream, point):
+    """
+    Membership test scanning the whole datastream, as done without the index
+    """
+    for item in datastream:
+        if type(item) == Point and point == item:
+            return True
+    return False
+
+
+def execute_script(num_points=100000, num_queries=1000):
+    print("datastream with %d points" % num_points)
+    points = generate_points(num_points)
+
+    aa = time.time()
+    datastream = DataStream()
+    for point in points:
+        datastream.add_sensor_value(point)
+    # adding again existing points is a no-op
+    for point in random.sample(points, num_queries):
+        datastream.add_sensor_value(point)
+    bb = time.time()
+    print("indexed insertion of %d points (+%d duplicates): %.3f s" % (num_points, num_queries, bb - aa))
+
+    queries = random.sample(points, 20)
+    aa = time.time()
+    for point in queries:
+        linear_contains(datastream, point)
+    bb = time.time()
+    linear_time = (bb - aa) / len(queries)
+    print("linear membership test: %.6f s per point" % linear_time)
+
+    queries = random.sample(points, num_queries)
+    aa = time.time()
+    for point in queries:
+        datastream.add_sensor_value(point)
+    bb = time.time()
+    indexed_time = (bb - aa) / len(queries)
+    print("indexed membership test: %.6f s per point (speedup %.0fx)" % (indexed_time, linear_time / indexed_time))
+
+    aa = time.time()
+    for point in queries[:100]:
+        datastream.remove_sensor_value(point)
+    bb = time.time()
+    print("indexed removal: %.6f s per point" % ((bb - aa) / 100))
+    print("remaining points: ", len(datastream))
+
+    # multipoint grouping the values of a single sensor
+    multipoint = MultiPoint(id="sensor0", meta=[{"type": "System.Double"}])
+    aa = time.time()
+    for point in points[::10]:
+        multipoint.add_sensor_value(point)
+    for point in points[::100]:
+        multipoint.contains(point)
+    bb = time.time()
+    print("multipoint insertion of %d points and %d lookups: %.3f s" % (len(multipoint), len(points[::100]), bb - aa))
+
+
+if __name__ == "__main__":
+    for num_points in [100000, 1000000]:
+        execute_script(num_points=num_points)
@@ -0,0 +1,37 @@
+import time
+
+from pm4py.objects.iot import dataframe
+from examples.iot_sensor_query import generate_log
+
+
+def execute_script():
+    log = generate_log(num_traces=500)
+    for i, trace in enumerate(log):
+        trace.attributes["concept:name"] = str(i)
+        for j, event in enumerate(trace):
+            event.attributes["concept:name"] = "activity" + str(j)
+
+    aa = time.time()
+    events_df, sensor_df = dataframe.to_dataframes(log)
+    bb = time.time()
+    print("%d events and %d points converted in %.3f s" % (len(events_df), len(sensor_df), bb - aa))
+
+    aa = time.time()
+    # per-case statistics of each sensor, and the mean reading of each sensor per activity
+    per_case = sensor_df.groupby(["case:concept:name", "stream:id"], observed=True)["stream:value"].agg(["count", "min", "max", "mean"])
+    per_activity = sensor_df.merge(events_df[[dataframe.TRACE_INDEX, dataframe.ITEM_INDEX, "concept:name"]],
+                                   on=[dataframe.TRACE_INDEX, dataframe.ITEM_INDEX])
+    per_activity = per_activity.pivot_table(index="concept:name", columns="stream:id", values="stream:value", aggfunc="mean", observed=True)
+    bb = time.time()
+    print("sensor KPIs computed in %.3f s" % (bb - aa))
+    print(per_case.head())
+    print(per_activity.round(2))
+
+    aa = time.time()
+    converted_log = dataframe.to_iot_log(events_df, sensor_df)
+    bb = time.time()
+    print("converted back in %.3f s, same log: %s" % (bb - aa, converted_log == log))
+
+
+if __name__ == "__main__":
+    execute_script()
@@ -0,0 +1,84 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+from pm4py.objects.iot import join
+from pm4py.objects.iot.obj import IOTEventLog, IOTTrace, IOTEvent, DataStream, Point
+
+
+def generate_log(num_traces, num_activities, points_per_trace):
+    """
+    Generates a log whose cases execute a sequence of activities (start and complete events) while a
+    machine records the readings of its sensors, in a datastream of the trace
+    """
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    log = IOTEventLog(version="2.0", features="nested-attributes")
+    for i in range(num_traces):
+        trace = IOTTrace(attributes={"concept:name": str(i)})
+        case_start = start + timedelta(hours=i)
+        for j in range(2 * num_activities):
+            trace.append(IOTEvent(attributes={"concept:name": "activity" + str(j // 2), "lifecycle:transition": "start" if j % 2 == 0 else "complete",
+                                              "time:timestamp": case_start + timedelta(seconds=points_per_trace * j // (4 * num_activities))}))
+        datastream = DataStream(name="machine", source="machine")
+        for j in range(points_per_trace):
+            datastream.append(Point(id="temperature" if j % 2 == 0 else "pressure", timestamp=case_start + timedelta(seconds=j // 2),
+                                    value=20.0 + (i + j) % 50 / 10.0))
+        trace.append(datastream)
+        log.append(trace)
+    return log
+
+
+def nested_loop(log):
+    """
+    Sensor values at each event, and mean values during each activity, scanning all the points for each event
+    """
+    ret = []
+    for trace in log:
+        points = [point for item in trace if type(item) == DataStream for point in item]
+        starts = {}
+        for event in trace:
+            if type(event) != IOTEvent:
+                continue
+            timestamp = event.attributes["time:timestamp"]
+            for sensor in ["temperature", "pressure"]:
+                before = [point for point in points if point.id == sensor and point.timestamp <= timestamp]
+                ret.append(max(before, key=lambda point: point.timestamp).value if before else None)
+            if event.attributes["lifecycle:transition"] == "start":
+                starts[event.attributes["concept:name"]] = timestamp
+                continue
+            window_start = starts[event.attributes["concept:name"]]
+            for sensor in ["temperature", "pressure"]:
+                values = [point.value for point in points if point.id == sensor and window_start <= point.timestamp <= timestamp]
+                ret.append(sum(values) / len(values) if values else None)
+    return ret
+
+
+def execute_script(num_traces=100, num_activities=10, points_per_trace=2000):
+    log = generate_log(num_traces, num_activities, points_per_trace)
+
+    aa = time.time()
+    expected = nested_loop(log)
+    bb = time.time()
+    print("nested loop: %.3f s" % (bb - aa))
+
+    aa = time.time()
+    # the index is built once and shared by the two joins
+    index = join.SensorIndex(log)
+    join.asof_join(log, parameters={join.Parameters.SENSOR_INDEX: index})
+    join.window_join(log, parameters={join.Parameters.SENSOR_INDEX: index, join.Parameters.AGGREGATIONS: ["mean"]})
+    bb = time.time()
+    print("sorted index of %d readings and joins: %.3f s" % (len(index), bb - aa))
+
+    have = []
+    for trace in log:
+        for event in trace:
+            if type(event) != IOTEvent:
+                continue
+            have.extend(event.attributes.get("sensor:" + sensor) for sensor in ["temperature", "pressure"])
+            if event.attributes["lifecycle:transition"] == "complete":
+                have.extend(event.attributes.get("sensor:" + sensor + ":mean") for sensor in ["temperature", "pressure"])
+    print("same results: ", len(have) == len(expected) and all(x == y or abs(x - y) < 1e-9 for x, y in zip(have, expected)))
+    print(log[0][1].attributes)
+
+
+if __name__ == "__main__":
+    execute_script()
@@ -0,0 +1,61 @@
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from pm4py.objects.iot import query
+from pm4py.objects.iot.obj import IOTEventLog, IOTTrace, IOTEvent, DataStream, Point, FilterSet
+
+
+def generate_log(num_traces=2000, num_events=5, num_points=20, num_sensors=10):
+    """
+    Generates an IoT log where each event carries a datastream with the readings of some sensors
+    """
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    log = IOTEventLog(version="2.0", features="nested-attributes")
+    for i in range(num_traces):
+        trace = IOTTrace()
+        for j in range(num_events):
+            event = IOTEvent()
+            datastream = DataStream(name="sensors")
+            for k in range(num_points):
+                sensor = "sensor" + str(random.randrange(num_sensors))
+                datastream.append(Point(id=sensor, timestamp=start + timedelta(seconds=i * 1000 + j * 100 + k),
+                                        value=round(random.gauss(20.0, 5.0), 1), source=sensor + "_source",
+                                        meta=[{"type": "System.Double"}]))
+            event.append(datastream)
+            trace.append(event)
+        log.append(trace)
+    return log
+
+
+def execute_script():
+    log = generate_log()
+    fsets = [FilterSet(id="sensor" + str(i)) for i in range(5)] + [FilterSet(source="sensor9_source", value=20.0)]
+
+    aa = time.time()
+    expected = []
+    for fset in fsets:
+        values = set()
+        for trace in log:
+            for event in trace:
+                values.update(event.fetch_sensor_values(fset))
+        expected.append(sorted(values))
+    bb = time.time()
+    print("fetch_sensor_values over all events: %.3f s" % (bb - aa))
+
+    aa = time.time()
+    table = query.SensorTable(log)
+    bb = time.time()
+    statistics = query.apply(table, fsets)
+    cc = time.time()
+    print("sensor table of %d points built in %.3f s, %d queries in %.3f s" % (len(table), bb - aa, len(fsets), cc - bb))
+
+    for fset, values, stats in zip(fsets, expected, statistics):
+        for sensor_id, sensor_stats in stats.items():
+            print(fset, sensor_id, "count=%d min=%.1f max=%.1f mean=%.2f" % (
+                sensor_stats["count"], sensor_stats["min"], sensor_stats["max"], sensor_stats["mean"]))
+        assert sorted(set(value for sensor_stats in stats.values() for value in sensor_stats["values"])) == values
+
+
+if __name__ == "__main__":
+    execute_script()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import pm4py
+from pm4py.objects.iot.exporter.xes import exporter as iot_xes_exporter
+from pm4py.objects.iot.importer.xes import importer as iot_xes_importer
+from pm4py.objects.iot.obj import IOTEventLog, IOTTrace, IOTEvent, DataStream, Point
+
+
+def generate_log(num_traces, points_per_trace):
+    """
+    Generates a log whose cases record the readings of a sensor while their single activity is executed
+    """
+    start = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=2)))
+    log = IOTEventLog(version="2.0", features="nested-attributes")
+    for i in range(num_traces):
+        trace = IOTTrace(attributes={"concept:name": str(i)})
+        event = IOTEvent(attributes={"concept:name": "measure", "time:timestamp": start + timedelta(hours=i)})
+        datastream = DataStream(name="thermometer", source="thermometer")
+        for j in range(points_per_trace):
+            datastream.append(Point(id="temperature", timestamp=start + timedelta(hours=i, seconds=j),
+                                    value=20.0 + (i + j) % 50 / 10.0, meta=[{"type": "System.Double"}]))
+        event.append(datastream)
+        trace.append(event)
+        log.append(trace)
+    return log
+
+
+def execute_script(num_traces=100, points_per_trace=200):
+    file = tempfile.NamedTemporaryFile(suffix='.xes', delete=False)
+    file.close()
+    iot_xes_exporter.apply(generate_log(num_traces, points_per_trace), file.name)
+    print("log with %d traces: %.1f MB" % (num_traces, os.path.getsize(file.name) / 1024 / 1024))
+
+    header = iot_xes_importer.get_log_header(file.name)
+    print("header: version %s, features %s" % (header.version, header.features))
+
+    tracemalloc.start()
+    aa = time.time()
+    log = pm4py.read_iot_xes(file.name)
+    maximum = {trace.attributes["concept:name"]: max(point.value for point in trace[0][0]) for trace in log}
+    bb = time.time()
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del log
+    print("read_iot_xes: %.3f s, peak memory %.1f MB" % (bb - aa, memory / 1024 / 1024))
+
+    tracemalloc.start()
+    aa = time.time()
+    # per-case analytics, keeping a single trace in memory
+    streamed_maximum = {}
+    for trace in pm4py.iter_iot_xes(file.name):
+        streamed_maximum[trace.attributes["concept:name"]] = max(point.value for point in trace[0][0])
+    bb = time.time()
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("iter_iot_xes: %.3f s, peak memory %.1f MB" % (bb - aa, memory / 1024 / 1024))
+    print("same results: ", maximum == streamed_maximum)
+    os.remove(file.name)
+
+
+if __name__ == "__main__":
+    execute_script()
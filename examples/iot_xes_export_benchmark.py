@@ -0,0 +1,38 @@
+import gzip
+import os
+import tempfile
+import time
+
+from pm4py.objects.iot.exporter.xes import exporter as iot_xes_exporter
+from examples.iot_xes_import_benchmark import generate_log
+
+
+def execute_script(num_events=100, points_per_event=1000):
+    log = generate_log(num_events, points_per_event)
+    parameters = {"apply_verifier": False, "show_progress_bar": False}
+
+    aa = time.time()
+    expected = iot_xes_exporter.serialize(log, variant=iot_xes_exporter.Variants.LINE_BY_LINE, parameters=parameters)
+    bb = time.time()
+    print("LINE_BY_LINE export of %d points: %.3f s" % (num_events * points_per_event, bb - aa))
+
+    aa = time.time()
+    content = iot_xes_exporter.serialize(log, variant=iot_xes_exporter.Variants.BUFFERED, parameters=parameters)
+    bb = time.time()
+    print("BUFFERED export: %.3f s, same content: %s" % (bb - aa, content == expected))
+
+    # the .gz extension compresses the file, each worker compressing the traces it renders
+    file = tempfile.NamedTemporaryFile(suffix='.xes.gz', delete=False)
+    file.close()
+    aa = time.time()
+    iot_xes_exporter.apply(log, file.name, variant=iot_xes_exporter.Variants.BUFFERED,
+                           parameters={**parameters, "multiprocessing": True})
+    bb = time.time()
+    with gzip.open(file.name, "rb") as f:
+        print("BUFFERED gzip export with multiprocessing: %.3f s, %.1f MB, same content: %s" % (
+            bb - aa, os.path.getsize(file.name) / 1024 / 1024, f.read() == expected))
+    os.remove(file.name)
+
+
+if __name__ == "__main__":
+    execute_script()
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from pm4py.objects.iot.exporter.xes import exporter as iot_xes_exporter
+from pm4py.objects.iot.importer.xes import importer as iot_xes_importer
+from pm4py.objects.iot.obj import IOTEventLog, IOTTrace, IOTEvent, DataStream, Point
+
+
+def generate_log(num_events, points_per_event):
+    """
+    Generates a log whose events carry the readings of a few sensors, as recorded by the CPEE
+    """
+    start = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=2)))
+    log = IOTEventLog(version="2.0", features="nested-attributes")
+    trace = IOTTrace(attributes={"concept:name": "0"})
+    for i in range(num_events):
+        event = IOTEvent(attributes={"concept:name": "activity" + str(i % 5), "time:timestamp": start + timedelta(seconds=i)})
+        datastream = DataStream(name="robot", source="robot")
+        for j in range(points_per_event):
+            # the sensors of the robot are read together, hence they share their timestamps
+            datastream.append(Point(id="sensor" + str(j % 4), timestamp=start + timedelta(seconds=i, milliseconds=100 * (j // 4)),
+                                    value=20.0 + (j % 100) / 10.0, source="robot", meta=[{"type": "System.Double"}]))
+        event.append(datastream)
+        trace.append(event)
+    log.append(trace)
+    return log
+
+
+def execute_script(num_events=100, points_per_event=1000):
+    log = generate_log(num_events, points_per_event)
+    file = tempfile.NamedTemporaryFile(suffix='.xes', delete=False)
+    file.close()
+    iot_xes_exporter.apply(log, file.name)
+    print("log with %d points: %.1f MB" % (num_events * points_per_event, os.path.getsize(file.name) / 1024 / 1024))
+
+    logs = {}
+    for variant in [iot_xes_importer.Variants.XMLXES20, iot_xes_importer.Variants.CHUNK_REGEX]:
+        aa = time.time()
+        logs[variant] = iot_xes_importer.apply(file.name, variant=variant, parameters={"apply_verifier": False})
+        bb = time.time()
+        print("%s import: %.3f s" % (variant.name, bb - aa))
+    print("same log: ", logs[iot_xes_importer.Variants.XMLXES20] == logs[iot_xes_importer.Variants.CHUNK_REGEX])
+    os.remove(file.name)
+
+
+if __name__ == "__main__":
+    execute_script()
@@ -0,0 +1,65 @@
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pm4py
+from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
+from pm4py.objects.petri_net.utils.shared_pool import SharedNetPool
+from pm4py.util import variants_util
+
+
+def generate_variants(log, num_variants):
+    """
+    Generates small variants, removing some events from the variants of the log and appending an unknown activity
+    """
+    base = list(pm4py.get_variants(log))
+    rng = random.Random(0)
+    variants = set()
+    while len(variants) < num_variants:
+        variant = list(rng.choice(base))
+        i = rng.randrange(len(variant))
+        del variant[i:i + rng.randrange(1, 4)]
+        variants.add(tuple(variant[:8] + [str(rng.randrange(50))]))
+    return list(variants)
+
+
+def align_per_task(variants, net, im, fm, parameters, variant, num_cores):
+    # one task per variant, receiving the (pickled) Petri net
+    with ProcessPoolExecutor(max_workers=num_cores) as executor:
+        futures = [executor.submit(alignments.apply_trace, variants_util.variant_to_trace(v), net, im, fm,
+                                   dict(parameters), str(variant)) for v in variants]
+        return [future.result() for future in futures]
+
+
+def execute_script(num_variants=500):
+    log = pm4py.read_xes(os.path.join("..", "tests", "input_data", "running-example.xes"),
+                         return_legacy_log_object=True)
+    net, im, fm = pm4py.discover_petri_net_inductive(log)
+    variants = generate_variants(log, num_variants)
+    parameters = {alignments.Parameters.ENABLE_BEST_WORST_COST: False}
+    variant = alignments.Variants.VERSION_DIJKSTRA_LESS_MEMORY
+
+    aa = time.time()
+    for v in variants:
+        alignments.apply_trace(variants_util.variant_to_trace(v), net, im, fm, dict(parameters), variant)
+    bb = time.time()
+    print("variants: %d, sequential alignments: %.3f s" % (len(variants), bb - aa))
+
+    for num_cores in range(1, multiprocessing.cpu_count() + 1):
+        aa = time.time()
+        align_per_task(variants, net, im, fm, parameters, variant, num_cores)
+        bb = time.time()
+        # the Petri net is sent once to each worker, and the variants are shared as integer codes
+        with SharedNetPool(net, im, fm, parameters=parameters, num_cores=num_cores) as pool:
+            pool.apply_alignments(variants, variant=variant)
+            cc = time.time()
+            pool.apply_token_replay(variants)
+            dd = time.time()
+        print("%d cores: alignments %.3f s (one task per variant) / %.3f s (shared pool), token-based replay %.3f s"
+              % (num_cores, bb - aa, cc - bb, dd - cc))
+
+
+if __name__ == "__main__":
+    execute_script()
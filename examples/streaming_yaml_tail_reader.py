@@ -0,0 +1,50 @@
+import os
+import tempfile
+import threading
+import time
+
+import pm4py
+from pm4py.objects.log.obj import EventLog
+from pm4py.streaming.algo.discovery.dfg import algorithm as dfg_discovery
+from pm4py.streaming.importer.yaml import importer as streaming_yaml_importer
+from pm4py.streaming.importer.yaml.variants.yaml_tail_event_stream import Parameters
+from pm4py.streaming.stream.live_event_stream import LiveEventStream
+
+
+def execute_script():
+    log = pm4py.read_xes(os.path.join("..", "tests", "input_data", "running-example.xes"), return_legacy_log_object=True)
+
+    fp = tempfile.NamedTemporaryFile(suffix=".xes.yaml")
+    fp.close()
+
+    # writes the header of the log with the first traces, then appends the other traces while the log is followed
+    pm4py.write_yaml(EventLog(log[:2]), fp.name)
+
+    def producer():
+        for i in range(2, len(log), 2):
+            time.sleep(0.2)
+            pm4py.write.append_yaml(EventLog(log[i:i + 2]), fp.name)
+
+    producer_thread = threading.Thread(target=producer)
+    producer_thread.start()
+
+    live_stream = LiveEventStream()
+    stream_dfg_disc = dfg_discovery.apply()
+    live_stream.register(stream_dfg_disc)
+    live_stream.start()
+    # follows the log until it stops growing for one second
+    reader = streaming_yaml_importer.apply(fp.name, parameters={Parameters.POLL_INTERVAL: 0.1,
+                                                                Parameters.IDLE_TIMEOUT: 1.0,
+                                                                Parameters.PERSIST_OFFSET: False})
+    reader.to_event_stream(live_stream)
+    live_stream.stop()
+    producer_thread.join()
+
+    dfg, activities, start_activities, end_activities = stream_dfg_disc.get()
+    print(dfg)
+
+    os.remove(fp.name)
+
+
+if __name__ == "__main__":
+    execute_script()
@@ -0,0 +1,68 @@
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from pm4py.objects.log.obj import EventLog, Trace, Event
+from pm4py.objects.log.exporter.yaml import exporter as yaml_exporter
+from pm4py.objects.log.exporter.yaml.variants.yaml_dumper import DumperType, Parameters as DumperParameters
+from pm4py.objects.log.importer.yaml import importer as yaml_importer
+from pm4py.objects.log.importer.yaml.variants.yaml_loader import LoaderType, Parameters
+
+
+def generate_log(num_traces=500, num_events=40):
+    """
+    Generates a log with flat (scalar) event attributes, similar to the CPEE logs
+    """
+    log = EventLog()
+    start = datetime(2024, 1, 1)
+
+    for i in range(num_traces):
+        trace = Trace()
+        trace.attributes["concept:name"] = str(i)
+        for j in range(num_events):
+            event = Event()
+            event["concept:name"] = "activity " + str(random.randrange(20))
+            event["concept:instance"] = i
+            event["cpee:activity_uuid"] = "%032x" % random.getrandbits(128)
+            event["lifecycle:transition"] = random.choice(["start", "complete"])
+            event["cost"] = random.random() * 100.0
+            event["approved"] = random.random() < 0.5
+            event["time:timestamp"] = start + timedelta(minutes=i * num_events + j)
+            trace.append(event)
+        log.append(trace)
+
+    return log
+
+
+def execute_script():
+    log = generate_log()
+
+    fp = tempfile.NamedTemporaryFile(suffix=".xes.yaml")
+    fp.close()
+
+    aa = time.time()
+    yaml_exporter.apply(log, fp.name, variant=DumperType.C_SAFE_DUMPER)
+    bb = time.time()
+    yaml_exporter.apply(log, fp.name, variant=DumperType.C_SAFE_DUMPER, parameters={DumperParameters.BATCHED: True})
+    cc = time.time()
+
+    print("C_SAFE_DUMPER export time: %.3f s" % (bb - aa))
+    print("batched export time: %.3f s" % (cc - bb))
+
+    aa = time.time()
+    log1 = yaml_importer.apply(fp.name, variant=LoaderType.C_SAFE_PYYAML)
+    bb = time.time()
+    log2 = yaml_importer.apply(fp.name, variant=LoaderType.C_SAFE_PYYAML, parameters={Parameters.LINE_SCANNER: True})
+    cc = time.time()
+
+    print("C_SAFE_PYYAML import time: %.3f s" % (bb - aa))
+    print("line scanner import time: %.3f s" % (cc - bb))
+    print("same log: ", [list(map(dict, t)) for t in log1] == [list(map(dict, t)) for t in log2])
+
+    os.remove(fp.name)
+
+
+if __name__ == "__main__":
+    execute_script()
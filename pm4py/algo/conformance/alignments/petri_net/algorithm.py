@@ -17,6 +17,7 @@
 from copy import copy
 
 from pm4py.algo.conformance.alignments.petri_net import variants
+from pm4py.algo.conformance.alignments.petri_net.utils import cache as alignments_cache
 from pm4py.objects.petri_net.utils import align_utils, check_soundness
 from pm4py.objects.conversion.log import converter as log_converter
 from pm4py.util.xes_constants import DEFAULT_NAME_KEY, DEFAULT_TRACEID_KEY
@@ -63,6 +64,8 @@ class Parameters(Enum):
     SYNCHRONOUS = "synchronous_dijkstra"
     EXPONENT="theta"
     ENABLE_BEST_WORST_COST = "enable_best_worst_cost"
+    CACHE_PATH = "cache_path"
+    MAX_CACHE_SIZE = alignments_cache.Parameters.MAX_CACHE_SIZE.value
 
 
 def __variant_mapper(variant):
@@ -183,7 +186,10 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
     variant
         selected variant of the algorithm, possible values: {\'Variants.VERSION_STATE_EQUATION_A_STAR, Variants.VERSION_DIJKSTRA_NO_HEURISTICS \'}
     parameters
-        :class:`dict` parameters of the algorithm,
+        :class:`dict` parameters of the algorithm, including:
+            Parameters.CACHE_PATH -> (if provided) path to a SQLite database caching the alignments of the variants,
+            for the same model (net, markings), variant of the algorithm and cost functions, across executions
+            Parameters.MAX_CACHE_SIZE -> maximum size (in bytes) of the alignments stored in the cache (default: 1 GB)
 
     Returns
     -----------
@@ -211,14 +217,20 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
                                                      sys.maxsize)
 
     variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
-    progress = __get_progress_bar(len(one_tr_per_var), parameters)
+    cache_path, model_fingerprint, cached_alignments = __get_cached_alignments(petri_net, initial_marking,
+                                                                               final_marking, variant, variants_idxs,
+                                                                               parameters)
+    progress = __get_progress_bar(len(one_tr_per_var) - len(cached_alignments), parameters)
 
-    if enable_best_worst_cost:
+    if enable_best_worst_cost and len(cached_alignments) < len(one_tr_per_var):
         best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
         parameters[Parameters.BEST_WORST_COST_INTERNAL] = best_worst_cost
 
     all_alignments = []
-    for trace in one_tr_per_var:
+    for var, trace in zip(variants_idxs, one_tr_per_var):
+        if var in cached_alignments:
+            all_alignments.append(cached_alignments[var])
+            continue
         this_max_align_time = min(max_align_time_case, (max_align_time - (time.time() - start_time)) * 0.5)
         parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
         all_alignments.append(apply_trace(trace, petri_net, initial_marking, final_marking, parameters=copy(parameters),
@@ -226,6 +238,8 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
         if progress is not None:
             progress.update()
 
+    __put_cached_alignments(cache_path, model_fingerprint, variants_idxs, all_alignments, cached_alignments,
+                            parameters)
     alignments = __form_alignments(variants_idxs, all_alignments)
     __close_progress_bar(progress)
 
@@ -234,7 +248,9 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
 
 def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parameters=None, variant=DEFAULT_VARIANT):
     """
-    Applies the alignments using a process pool (multiprocessing)
+    Applies the alignments using a process pool (multiprocessing), whose workers receive the Petri net once,
+    and the variants as integer-encoded activities in shared memory
+    (see pm4py.objects.petri_net.utils.shared_pool)
 
     Parameters
     ---------------
@@ -247,7 +263,10 @@ def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parame
     final_marking
         Final marking
     parameters
-        Parameters of the algorithm
+        Parameters of the algorithm, including:
+            Parameters.CORES -> number of processes
+            Parameters.CACHE_PATH -> (if provided) path to a SQLite database caching the alignments of the variants
+            (see apply_log)
 
     Returns
     ----------------
@@ -261,38 +280,36 @@ def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parame
 
     variant = __variant_mapper(variant)
 
-    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count() - 2)
+    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, max(1, multiprocessing.cpu_count() - 2))
 
     enable_best_worst_cost = exec_utils.get_param_value(Parameters.ENABLE_BEST_WORST_COST, parameters, True)
 
     variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
+    cache_path, model_fingerprint, cached_alignments = __get_cached_alignments(petri_net, initial_marking,
+                                                                               final_marking, variant, variants_idxs,
+                                                                               parameters)
+    variants_to_align = [var for var in variants_idxs if var not in cached_alignments]
 
-    if enable_best_worst_cost:
+    if enable_best_worst_cost and variants_to_align:
         best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
         parameters[Parameters.BEST_WORST_COST_INTERNAL] = best_worst_cost
 
     all_alignments = []
 
-    from concurrent.futures import ProcessPoolExecutor
-    with ProcessPoolExecutor(max_workers=num_cores) as executor:
-        futures = []
-        for trace in one_tr_per_var:
-            futures.append(executor.submit(apply_trace, trace, petri_net, initial_marking, final_marking, parameters, str(variant)))
-        progress = __get_progress_bar(len(one_tr_per_var), parameters)
-        if progress is not None:
-            alignments_ready = 0
-            while alignments_ready != len(futures):
-                current = 0
-                for index, variant in enumerate(futures):
-                    current = current + 1 if futures[index].done() else current
-                if current > alignments_ready:
-                    for i in range(0, current - alignments_ready):
-                        progress.update()
-                alignments_ready = current
-        for index, variant in enumerate(futures):
-            all_alignments.append(futures[index].result())
-        __close_progress_bar(progress)
+    from pm4py.objects.petri_net.utils.shared_pool import SharedNetPool
+    progress = __get_progress_bar(len(variants_to_align), parameters)
+    new_alignments = []
+    if variants_to_align:
+        with SharedNetPool(petri_net, initial_marking, final_marking, parameters=parameters,
+                           num_cores=num_cores) as pool:
+            new_alignments = pool.apply_alignments(variants_to_align, variant=variant, progress=progress)
+    aligned = iter(new_alignments)
+    for var in variants_idxs:
+        all_alignments.append(cached_alignments[var] if var in cached_alignments else next(aligned))
+    __close_progress_bar(progress)
 
+    __put_cached_alignments(cache_path, model_fingerprint, variants_idxs, all_alignments, cached_alignments,
+                            parameters)
     alignments = __form_alignments(variants_idxs, all_alignments)
 
     return alignments
@@ -307,6 +324,39 @@ def __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, pa
     return best_worst_cost
 
 
+def __get_cached_alignments(petri_net, initial_marking, final_marking, variant, variants_idxs, parameters):
+    """
+    Gets the alignments of the variants stored in the cache (if the cache is enabled), along with
+    the path to the cache and the key of the model in the cache
+    """
+    cache_path = exec_utils.get_param_value(Parameters.CACHE_PATH, parameters, None)
+    if cache_path is None:
+        return None, None, {}
+
+    # the parameters changing the alignments are part of the key of the model
+    key_parameters = tuple(exec_utils.get_param_value(p, parameters, None) for p in [
+        Parameters.PARAM_TRACE_COST_FUNCTION, Parameters.PARAM_MODEL_COST_FUNCTION,
+        Parameters.PARAM_SYNC_COST_FUNCTION, Parameters.PARAM_TRACE_NET_COSTS,
+        Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE, Parameters.SYNCHRONOUS, Parameters.EXPONENT,
+        Parameters.ENABLE_BEST_WORST_COST, Parameters.FITNESS_ROUND_DIGITS])
+    model_fingerprint = alignments_cache.get_model_fingerprint(petri_net, initial_marking, final_marking,
+                                                               str(variant), key_parameters)
+
+    return cache_path, model_fingerprint, alignments_cache.get(cache_path, model_fingerprint, list(variants_idxs))
+
+
+def __put_cached_alignments(cache_path, model_fingerprint, variants_idxs, all_alignments, cached_alignments,
+                            parameters):
+    if cache_path is None:
+        return
+
+    # the approximate alignments (returned on the exhaustion of a budget of the search) are not cached
+    new_alignments = {var: al for var, al in zip(variants_idxs, all_alignments) if var not in cached_alignments
+                      and not (al is not None and al.get("optimal") is False)}
+    if new_alignments:
+        alignments_cache.put(cache_path, model_fingerprint, new_alignments, parameters=parameters)
+
+
 def __get_variants_structure(log, parameters):
     if parameters is None:
         parameters = {}
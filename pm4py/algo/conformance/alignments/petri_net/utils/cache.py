@@ -0,0 +1,246 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from enum import Enum
+from typing import Optional, Dict, Any, List, Tuple
+
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    MAX_CACHE_SIZE = "max_cache_size"
+
+
+# default maximum size (in bytes) of the alignments stored in the cache
+DEFAULT_MAX_CACHE_SIZE = 1024 ** 3
+# number of variants looked up in the cache by a single query
+LOOKUP_BATCH_SIZE = 500
+# seconds waited for the lock of the database, held by another process writing to it
+LOCK_TIMEOUT = 60
+
+__CREATE_TABLE = "CREATE TABLE IF NOT EXISTS alignments (model TEXT NOT NULL, variant TEXT NOT NULL, " \
+                 "alignment BLOB NOT NULL, size INTEGER NOT NULL, last_access INTEGER NOT NULL, " \
+                 "PRIMARY KEY (model, variant))"
+__CREATE_INDEX = "CREATE INDEX IF NOT EXISTS alignments_last_access ON alignments (last_access)"
+
+
+def __canonical(obj):
+    """
+    Canonical (order-independent) representation of the objects describing the model
+    and the costs of the alignments, referring to the places and transitions by name
+    """
+    if isinstance(obj, PetriNet.Transition):
+        return "t", str(obj.name), str(obj.label)
+    if isinstance(obj, PetriNet.Place):
+        return "p", str(obj.name)
+    if isinstance(obj, dict):
+        return "dict", sorted((repr(__canonical(k)), repr(__canonical(v))) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return "list", [__canonical(x) for x in obj]
+    if isinstance(obj, Enum):
+        return str(obj)
+    return repr(obj)
+
+
+def get_model_fingerprint(petri_net: PetriNet, initial_marking: Marking, final_marking: Marking, variant,
+                          key_parameters=None) -> str:
+    """
+    Gets the key of a model in the cache, as a hash of a canonical description of the Petri net
+    (names and labels of the places and transitions, arcs and their weights), of the markings,
+    of the alignments variant and of the parameters changing the alignments (e.g., the cost functions)
+
+    Parameters
+    ------------
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    variant
+        Variant of the alignments
+    key_parameters
+        (if provided) values of the parameters changing the alignments
+
+    Returns
+    ------------
+    fingerprint
+        Hexadecimal key
+    """
+    places = sorted(str(p.name) for p in petri_net.places)
+    transitions = sorted((str(t.name), str(t.label)) for t in petri_net.transitions)
+    arcs = sorted((str(a.source.name), str(a.target.name), a.weight) for a in petri_net.arcs)
+    description = (places, transitions, arcs, __canonical(dict(initial_marking)), __canonical(dict(final_marking)),
+                   __canonical(variant), __canonical(key_parameters))
+    return hashlib.sha256(repr(description).encode("utf-8")).hexdigest()
+
+
+def get_variant_key(variant: Tuple) -> str:
+    """
+    Gets the key of a variant (tuple of activities) in the cache
+    """
+    return hashlib.sha256(repr(tuple(variant)).encode("utf-8")).hexdigest()
+
+
+def __to_builtin(obj):
+    # scalars of numpy (e.g., the costs of some variants) are stored as the corresponding Python scalars
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError("unsupported value of type %s" % type(obj).__name__)
+
+
+def __to_tuple(obj):
+    if isinstance(obj, list):
+        return tuple(__to_tuple(x) for x in obj)
+    return obj
+
+
+def encode_alignment(alignment: Dict[str, Any]) -> bytes:
+    """
+    Encodes an alignment (dictionary of scalars, plus the list of moves) as JSON
+    """
+    return json.dumps(alignment, default=__to_builtin).encode("utf-8")
+
+
+def decode_alignment(value: bytes) -> Dict[str, Any]:
+    """
+    Decodes an alignment encoded by encode_alignment, restoring its moves
+    (and their transition descriptions, when present) as tuples
+    """
+    alignment = json.loads(value.decode("utf-8"))
+    if alignment.get("alignment") is not None:
+        alignment["alignment"] = [__to_tuple(move) for move in alignment["alignment"]]
+    return alignment
+
+
+def __connect(cache_path: str):
+    conn = sqlite3.connect(cache_path, timeout=LOCK_TIMEOUT)
+    conn.execute(__CREATE_TABLE)
+    conn.execute(__CREATE_INDEX)
+    return conn
+
+
+def get(cache_path: str, model_fingerprint: str, variants: List[Tuple]) -> Dict[Tuple, Any]:
+    """
+    Gets the alignments of the given variants stored in the cache for the given model
+
+    Parameters
+    ------------
+    cache_path
+        Path to the SQLite database of the cache
+    model_fingerprint
+        Key of the model (see get_model_fingerprint)
+    variants
+        Variants (tuples of activities)
+
+    Returns
+    ------------
+    alignments
+        Dictionary associating to the variants found in the cache their alignment
+    """
+    keys = {get_variant_key(v): v for v in variants}
+    key_list = list(keys)
+    alignments = {}
+
+    with closing(__connect(cache_path)) as conn:
+        for i in range(0, len(key_list), LOOKUP_BATCH_SIZE):
+            batch = key_list[i:i + LOOKUP_BATCH_SIZE]
+            query = "SELECT variant, alignment FROM alignments WHERE model = ? AND variant IN (%s)" % ", ".join(
+                "?" * len(batch))
+            for key, alignment in conn.execute(query, [model_fingerprint] + batch):
+                try:
+                    alignments[keys[key]] = decode_alignment(alignment)
+                except ValueError:
+                    # entry not written as JSON (e.g., by a previous version of the cache), aligned again
+                    continue
+
+        if alignments:
+            # records the access, for the least-recently-used eviction
+            now = time.time_ns()
+            with conn:
+                conn.executemany("UPDATE alignments SET last_access = ? WHERE model = ? AND variant = ?",
+                                 [(now, model_fingerprint, get_variant_key(v)) for v in alignments])
+
+    return alignments
+
+
+def put(cache_path: str, model_fingerprint: str, alignments: Dict[Tuple, Any], parameters: Optional[dict] = None):
+    """
+    Stores the alignments of some variants in the cache, evicting the least recently used alignments
+    when the cache exceeds its maximum size. The alignments are stored as JSON (see encode_alignment).
+    The alignments which are None (timeout of the search), or contain values which cannot be encoded,
+    are not stored
+
+    Parameters
+    ------------
+    cache_path
+        Path to the SQLite database of the cache
+    model_fingerprint
+        Key of the model (see get_model_fingerprint)
+    alignments
+        Dictionary associating to the variants (tuples of activities) their alignment
+    parameters
+        Parameters, including:
+            Parameters.MAX_CACHE_SIZE -> maximum size (in bytes) of the stored alignments (default: 1 GB)
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_cache_size = exec_utils.get_param_value(Parameters.MAX_CACHE_SIZE, parameters, DEFAULT_MAX_CACHE_SIZE)
+
+    now = time.time_ns()
+    rows = []
+    for v, alignment in alignments.items():
+        if alignment is not None:
+            try:
+                value = encode_alignment(alignment)
+            except (TypeError, ValueError):
+                continue
+            rows.append((model_fingerprint, get_variant_key(v), value, len(value), now))
+
+    with closing(__connect(cache_path)) as conn:
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO alignments VALUES (?, ?, ?, ?, ?)", rows)
+            __evict(conn, max_cache_size)
+
+
+def __evict(conn, max_cache_size: int):
+    total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM alignments").fetchone()[0]
+    if total_size <= max_cache_size:
+        return
+
+    evicted = []
+    for rowid, size in conn.execute("SELECT rowid, size FROM alignments ORDER BY last_access"):
+        if total_size <= max_cache_size:
+            break
+        evicted.append((rowid,))
+        total_size -= size
+    conn.executemany("DELETE FROM alignments WHERE rowid = ?", evicted)
+
+
+def evict(cache_path: str, max_cache_size: int):
+    """
+    Removes the least recently used alignments of the cache, until their size is below the given maximum size
+    """
+    with closing(__connect(cache_path)) as conn:
+        with conn:
+            __evict(conn, max_cache_size)
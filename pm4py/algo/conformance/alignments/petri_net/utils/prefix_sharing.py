@@ -0,0 +1,292 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import heapq
+import sys
+import time
+from enum import Enum
+from typing import Optional, Dict, Any, List
+
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.objects.petri_net.utils import align_utils as utils
+from pm4py.objects.petri_net.utils.compiled_net import compile_net
+from pm4py.objects.trie.obj import Trie
+from pm4py.util import exec_utils, variants_util, constants
+
+
+class Parameters(Enum):
+    PARAM_TRACE_COST_FUNCTION = 'trace_cost_function'
+    PARAM_MODEL_COST_FUNCTION = 'model_cost_function'
+    PARAM_SYNC_COST_FUNCTION = 'sync_cost_function'
+    PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE = 'ret_tuple_as_trans_desc'
+    PARAM_MAX_ALIGN_TIME = "max_align_time"
+    PARAMETER_VARIANT_DELIMITER = "variant_delimiter"
+
+
+# kinds of moves of the search
+LOG_MOVE = 0
+MODEL_MOVE = 1
+SYNC_MOVE = 2
+
+
+def build_trie(variants: List) -> Trie:
+    """
+    Inserts the variants (tuples of activities) in a trie, whose final nodes are the ends of the variants
+    (the root being final for the empty variant)
+    """
+    root = Trie()
+    # children of the nodes by label, to avoid scanning the list of children at each insertion
+    children = {}
+
+    for variant in variants:
+        trie = root
+        for activity in variant:
+            key = (id(trie), activity)
+            node = children.get(key)
+            if node is None:
+                node = Trie(label=activity, parent=trie, depth=trie.depth + 1)
+                trie.children.append(node)
+                children[key] = node
+            trie = node
+        trie.final = True
+
+    return root
+
+
+class _TrieIndex(object):
+    """
+    Integer encoding of the nodes of the trie (numbered in breadth-first order), with, for each node:
+    its label, its depth, the children by label, and the number of final nodes in its subtree
+    """
+
+    def __init__(self, root):
+        self.nodes = [root]
+        self.parents = [-1]
+        i = 0
+        while i < len(self.nodes):
+            for child in self.nodes[i].children:
+                self.nodes.append(child)
+                self.parents.append(i)
+            i += 1
+        indices = {id(node): i for i, node in enumerate(self.nodes)}
+        self.labels = [node.label for node in self.nodes]
+        self.depths = [node.depth for node in self.nodes]
+        self.finals = [node.final for node in self.nodes]
+        self.children = [{child.label: indices[id(child)] for child in node.children} for node in self.nodes]
+
+        self.pending = [1 if final else 0 for final in self.finals]
+        for i in range(len(self.nodes) - 1, 0, -1):
+            self.pending[self.parents[i]] += self.pending[i]
+
+
+def __get_lower_bounds(trie_index, matchable_labels, log_move_costs):
+    """
+    Gets, for each node of the trie, the minimum (over the final nodes of its subtree) cost of the log moves
+    on the activities that cannot be synchronized with any transition of the model. The bound is consistent
+    for all the variants sharing the node, hence it can guide the search shared by them
+    """
+    bounds = [0] * len(trie_index.nodes)
+    for i in range(len(trie_index.nodes) - 1, -1, -1):
+        bound = 0 if trie_index.finals[i] else sys.maxsize
+        for label, child in trie_index.children[i].items():
+            cost = bounds[child]
+            if label not in matchable_labels:
+                cost += log_move_costs(trie_index.depths[child] - 1)
+            bound = min(bound, cost)
+        bounds[i] = bound
+    return bounds
+
+
+def __reconstruct_alignment(state, trie_index, transitions, visited, queued, traversed, ret_tuple_as_trans_desc):
+    cost = state[1]
+    moves = []
+    while state[5] is not None:
+        moves.append(state[6])
+        state = state[5]
+    moves.reverse()
+
+    alignment = []
+    for kind, t_index, node in moves:
+        if kind != MODEL_MOVE:
+            label = trie_index.labels[node]
+            log_name = "t_" + str(label) + "_" + str(trie_index.depths[node] - 1)
+        else:
+            label = log_name = utils.SKIP
+        if kind != LOG_MOVE:
+            t = transitions[t_index]
+            model_name, model_label = t.name, t.label
+        else:
+            model_name = model_label = utils.SKIP
+        if ret_tuple_as_trans_desc:
+            alignment.append(((log_name, model_name), (label, model_label)))
+        else:
+            alignment.append((label, model_label))
+
+    return {"alignment": alignment, "cost": cost, "visited_states": visited, "queued_states": queued,
+            "traversed_arcs": traversed, "lp_solved": 0}
+
+
+def apply(var_list: List, petri_net: PetriNet, initial_marking: Marking, final_marking: Marking,
+          parameters: Optional[Dict[Any, Any]] = None) -> Dict[Any, Any]:
+    """
+    Aligns a list of variants with a single search shared by the variants having a common prefix.
+
+    The variants are inserted in a trie, and the search is performed on the product between the
+    reachability graph of the model and the trie: a state is a pair (marking of the model, node of the trie),
+    and the alignment of a variant is the cheapest path from (initial marking, root) to (final marking,
+    node where the variant ends). Model moves change the marking only, log moves go from a node to one
+    of its children, and synchronous moves do both. Hence, the states on the shared prefixes are visited
+    once for all the variants, and the enabled transitions of a marking are computed once for all the nodes.
+
+    Contrarily to the A* search of the state equation, whose heuristic depends on the whole trace, the search
+    is a uniform-cost search (shared by many targets), guided by a lower bound valid for all the variants
+    of the subtree of a node (the cost of the log moves on activities that the model cannot execute).
+    The search stops when all the variants are aligned, and does not expand the states of subtrees
+    whose variants are all aligned. The alignments are optimal (with the same cost as the other variants).
+
+    Parameters
+    -------------
+    var_list
+        List of variants (for each item, the first entry is the variant itself, the second entry may be the number of cases)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.PARAM_TRACE_COST_FUNCTION -> mapping of each index of the trace to the cost of its log move
+            (default: utils.STD_MODEL_LOG_MOVE_COST)
+            Parameters.PARAM_MODEL_COST_FUNCTION -> mapping of each transition to the cost of its model move
+            Parameters.PARAM_SYNC_COST_FUNCTION -> mapping of each visible transition to the cost of its synchronous move
+            Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE -> returns the names of the transitions in the moves
+            Parameters.PARAM_MAX_ALIGN_TIME -> maximum time of the search (the variants that are not aligned
+            when it expires are associated to None)
+            Parameters.PARAMETER_VARIANT_DELIMITER -> delimiter of the variants specified as strings
+
+    Returns
+    --------------
+    dictio_alignments
+        Dictionary that assigns to each variant its alignment (the counts of visited/queued states and traversed
+        arcs are the ones of the shared search when the variant is aligned)
+    """
+    if parameters is None:
+        parameters = {}
+
+    start_time = time.time()
+
+    trace_cost_function = exec_utils.get_param_value(Parameters.PARAM_TRACE_COST_FUNCTION, parameters, None)
+    model_cost_function = exec_utils.get_param_value(Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None)
+    sync_cost_function = exec_utils.get_param_value(Parameters.PARAM_SYNC_COST_FUNCTION, parameters, None)
+    ret_tuple_as_trans_desc = exec_utils.get_param_value(Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE,
+                                                         parameters, False)
+    max_align_time = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME, parameters, sys.maxsize)
+    variant_delimiter = exec_utils.get_param_value(Parameters.PARAMETER_VARIANT_DELIMITER, parameters,
+                                                   constants.DEFAULT_VARIANT_SEP)
+
+    if model_cost_function is None or sync_cost_function is None:
+        model_cost_function = {t: utils.STD_MODEL_LOG_MOVE_COST if t.label is not None else utils.STD_TAU_COST
+                               for t in petri_net.transitions}
+        sync_cost_function = {t: utils.STD_SYNC_COST for t in petri_net.transitions if t.label is not None}
+
+    def log_move_costs(index):
+        return trace_cost_function[index] if trace_cost_function is not None else utils.STD_MODEL_LOG_MOVE_COST
+
+    variants = {}
+    for varitem in var_list:
+        variant = varitem[0]
+        activities = variant.split(variant_delimiter) if type(variant) is str else \
+            variants_util.get_activities_from_variant(variant)
+        variants[variant] = tuple(activities)
+
+    trie_index = _TrieIndex(build_trie(variants.values()))
+    compiled = compile_net(petri_net)
+    transitions = compiled.transitions
+    model_costs = [model_cost_function[t] for t in transitions]
+    sync_costs = [sync_cost_function[t] if t.label is not None else None for t in transitions]
+    bounds = __get_lower_bounds(trie_index, set(t.label for t in transitions if t.label is not None),
+                                log_move_costs)
+
+    fin = compiled.encode(final_marking)
+    pending = list(trie_index.pending)
+    aligned = {}
+    # enabled transitions (with the reached markings) of the markings, shared by all the nodes of the trie
+    successors = {}
+
+    # a state is (f, g, counter, marking, node, parent state, move)
+    ini_state = (bounds[0], 0, 0, compiled.encode(initial_marking), 0, None, None)
+    open_set = [ini_state]
+    closed = set()
+    counter = 1
+    visited = 0
+    queued = 0
+    traversed = 0
+
+    while open_set and pending[0] > 0:
+        if (time.time() - start_time) > max_align_time:
+            break
+
+        curr = heapq.heappop(open_set)
+        _, g, _, marking, node, _, _ = curr
+        if pending[node] == 0 or (marking, node) in closed:
+            # all the variants of the subtree are aligned, or the state has already been expanded
+            continue
+        closed.add((marking, node))
+        visited += 1
+
+        if marking == fin and trie_index.finals[node] and node not in aligned:
+            aligned[node] = __reconstruct_alignment(curr, trie_index, transitions, visited, queued, traversed,
+                                                    ret_tuple_as_trans_desc)
+            parent = node
+            while parent >= 0:
+                pending[parent] -= 1
+                parent = trie_index.parents[parent]
+            if pending[node] == 0:
+                continue
+
+        enabled = successors.get(marking)
+        if enabled is None:
+            enabled = [(t_index, compiled.fire(marking, t_index)) for t_index in compiled.enabled(marking)]
+            successors[marking] = enabled
+
+        children = trie_index.children[node]
+        moves = []
+        for label, child in children.items():
+            moves.append((g + log_move_costs(trie_index.depths[child] - 1), marking, child, (LOG_MOVE, None, child)))
+        for t_index, new_marking in enabled:
+            moves.append((g + model_costs[t_index], new_marking, node, (MODEL_MOVE, t_index, node)))
+            label = transitions[t_index].label
+            if label is not None and label in children:
+                child = children[label]
+                moves.append((g + sync_costs[t_index], new_marking, child, (SYNC_MOVE, t_index, child)))
+
+        for new_g, new_marking, new_node, move in moves:
+            traversed += 1
+            if pending[new_node] == 0 or (new_marking, new_node) in closed:
+                continue
+            queued += 1
+            heapq.heappush(open_set, (new_g + bounds[new_node], new_g, counter, new_marking, new_node, curr, move))
+            counter += 1
+
+    return {variant: aligned.get(__get_node(trie_index, activities)) for variant, activities in variants.items()}
+
+
+def __get_node(trie_index, activities):
+    node = 0
+    for activity in activities:
+        node = trie_index.children[node][activity]
+    return node
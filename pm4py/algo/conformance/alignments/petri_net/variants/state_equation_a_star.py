@@ -39,6 +39,7 @@ import numpy as np
 from pm4py.objects.log import obj as log_implementation
 from pm4py.objects.petri_net.utils import align_utils as utils
 from pm4py.objects.petri_net.utils.incidence_matrix import construct as inc_mat_construct
+from pm4py.objects.petri_net.utils.compiled_net import compile_net
 from pm4py.objects.petri_net.utils.synchronous_product import construct_cost_aware, construct
 from pm4py.objects.petri_net.utils.petri_utils import construct_trace_net_cost_aware, decorate_places_preset_trans, \
     decorate_transitions_prepostset
@@ -67,12 +68,54 @@ class Parameters(Enum):
     ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
     VARIANTS_IDX = "variants_idx"
     RETURN_SYNC_COST_FUNCTION = "return_sync_cost_function"
+    INTEGER_MARKINGS = "integer_markings"
+    PREFIX_SHARING = "prefix_sharing"
+    MAX_NODES_TRACE = "max_nodes_trace"
+    MAX_MEMORY_TRACE = "max_memory_trace"
+    ANYTIME = "anytime"
+    BEAM_WIDTH = "beam_width"
+    FALLBACK_WEIGHT = "fallback_weight"
 
 
 PARAM_TRACE_COST_FUNCTION = Parameters.PARAM_TRACE_COST_FUNCTION.value
 PARAM_MODEL_COST_FUNCTION = Parameters.PARAM_MODEL_COST_FUNCTION.value
 PARAM_SYNC_COST_FUNCTION = Parameters.PARAM_SYNC_COST_FUNCTION.value
 
+DEFAULT_BEAM_WIDTH = 10
+DEFAULT_FALLBACK_WEIGHT = 2.0
+
+
+class SearchBudget(object):
+    """
+    Budgets of the alignment search of a trace. When the number of visited states or the (estimated) memory of the
+    states in the open and closed sets exceeds its budget, or when the time exceeds its budget in anytime mode,
+    the exact search is stopped and an approximate alignment is searched by a beam search starting from the open set.
+    The beam search has the same budgets, hence the search of a trace takes at most twice each budget
+    """
+
+    def __init__(self, max_nodes=sys.maxsize, max_memory=sys.maxsize, anytime=False, beam_width=DEFAULT_BEAM_WIDTH,
+                 weight=DEFAULT_FALLBACK_WEIGHT):
+        self.max_nodes = max_nodes
+        self.max_memory = max_memory
+        self.anytime = anytime
+        self.beam_width = beam_width
+        self.weight = weight
+
+    def is_bounded(self):
+        return self.anytime or self.max_nodes < sys.maxsize or self.max_memory < sys.maxsize
+
+    def get_exhausted(self, visited, memory, elapsed, max_time):
+        """
+        Gets the name of the exhausted budget (nodes, memory or time), or None if no budget is exhausted
+        """
+        if visited >= self.max_nodes:
+            return "nodes"
+        if memory > self.max_memory:
+            return "memory"
+        if self.anytime and elapsed > max_time:
+            return "time"
+        return None
+
 
 def get_best_worst_cost(petri_net, initial_marking, final_marking, parameters=None):
     """
@@ -244,7 +287,9 @@ def apply_from_variants_list(var_list, petri_net, initial_marking, final_marking
     final_marking
         Final marking
     parameters
-        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default), including:
+            Parameters.PREFIX_SHARING -> aligns the variants with a single search shared along their common prefixes
+            (see pm4py.algo.conformance.alignments.petri_net.utils.prefix_sharing), default False
 
     Returns
     --------------
@@ -253,6 +298,9 @@ def apply_from_variants_list(var_list, petri_net, initial_marking, final_marking
     """
     if parameters is None:
         parameters = {}
+    if exec_utils.get_param_value(Parameters.PREFIX_SHARING, parameters, False):
+        from pm4py.algo.conformance.alignments.petri_net.utils import prefix_sharing
+        return prefix_sharing.apply(var_list, petri_net, initial_marking, final_marking, parameters=parameters)
     start_time = time.time()
     max_align_time = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME, parameters,
                                                 sys.maxsize)
@@ -263,8 +311,9 @@ def apply_from_variants_list(var_list, petri_net, initial_marking, final_marking
         this_max_align_time = min(max_align_time_trace, (max_align_time - (time.time() - start_time)) * 0.5)
         variant = varitem[0]
         parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
+        # copy, so that the cost functions set for a variant are not used for the following ones
         dictio_alignments[variant] = apply_from_variant(variant, petri_net, initial_marking, final_marking,
-                                                        parameters=parameters)
+                                                        parameters=copy(parameters))
     return dictio_alignments
 
 
@@ -339,10 +388,26 @@ def apply_trace_net(petri_net, initial_marking, final_marking, trace_net, trace_
             synchronous costs
             Parameters.ACTIVITY_KEY: :class:`str` (parameter) key to use to identify the activity described by the events
             Parameters.PARAM_TRACE_NET_COSTS: :class:`dict` (parameter) mapping between transitions and costs
+            Parameters.INTEGER_MARKINGS: :class:`bool` (parameter) search on markings encoded as tuples of token counts
+            (see pm4py.objects.petri_net.utils.compiled_net), default False
+            Parameters.MAX_NODES_TRACE: :class:`int` (parameter) maximum number of visited states of the exact search
+            Parameters.MAX_MEMORY_TRACE: :class:`int` (parameter) maximum memory (in bytes, estimated) of the states
+            of the exact search
+            Parameters.ANYTIME: :class:`bool` (parameter) on the exhaustion of Parameters.PARAM_MAX_ALIGN_TIME_TRACE,
+            searches an approximate alignment (within a further time budget) instead of returning None, default False
+            Parameters.BEAM_WIDTH: :class:`int` (parameter) width of the beam search of the approximate alignment,
+            default 10
+            Parameters.FALLBACK_WEIGHT: :class:`float` (parameter) weight of the heuristics in the beam search
+            of the approximate alignment, default 2.0
 
         Returns
         -------
-        dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**
+        dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**.
+        When a budget is set, the dictionary contains also the key **optimal**, and an alignment returned on the
+        exhaustion of a budget contains the keys **exhausted_budget** (nodes, memory or time) and **cost_lower_bound**
+        (lower bound of the cost of the optimal alignment), being flagged as optimal only when its cost reaches
+        the lower bound. The search of the approximate alignment has the same budgets as the exact search,
+        and None is returned when it exhausts them without reaching the final marking
         """
     if parameters is None:
         parameters = {}
@@ -375,10 +440,18 @@ def apply_trace_net(petri_net, initial_marking, final_marking, trace_net, trace_
 
     max_align_time_trace = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
                                                       sys.maxsize)
+    integer_markings = exec_utils.get_param_value(Parameters.INTEGER_MARKINGS, parameters, False)
+    budget = SearchBudget(max_nodes=exec_utils.get_param_value(Parameters.MAX_NODES_TRACE, parameters, sys.maxsize),
+                          max_memory=exec_utils.get_param_value(Parameters.MAX_MEMORY_TRACE, parameters, sys.maxsize),
+                          anytime=exec_utils.get_param_value(Parameters.ANYTIME, parameters, False),
+                          beam_width=exec_utils.get_param_value(Parameters.BEAM_WIDTH, parameters, DEFAULT_BEAM_WIDTH),
+                          weight=exec_utils.get_param_value(Parameters.FALLBACK_WEIGHT, parameters,
+                                                            DEFAULT_FALLBACK_WEIGHT))
 
     alignment = apply_sync_prod(sync_prod, sync_initial_marking, sync_final_marking, cost_function,
                            utils.SKIP, ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
-                           max_align_time_trace=max_align_time_trace)
+                           max_align_time_trace=max_align_time_trace, integer_markings=integer_markings,
+                           budget=budget)
 
     return_sync_cost = exec_utils.get_param_value(Parameters.RETURN_SYNC_COST_FUNCTION, parameters, False)
     if return_sync_cost:
@@ -389,7 +462,7 @@ def apply_trace_net(petri_net, initial_marking, final_marking, trace_net, trace_
 
 
 def apply_sync_prod(sync_prod, initial_marking, final_marking, cost_function, skip, ret_tuple_as_trans_desc=False,
-                    max_align_time_trace=sys.maxsize):
+                    max_align_time_trace=sys.maxsize, integer_markings=False, budget=None):
     """
     Performs the basic alignment search on top of the synchronous product net, given a cost function and skip-symbol
 
@@ -400,18 +473,117 @@ def apply_sync_prod(sync_prod, initial_marking, final_marking, cost_function, sk
     final_marking: :class:`pm4py.objects.petri.net.Marking` final marking in the synchronous product net
     cost_function: :class:`dict` cost function mapping transitions to the synchronous product net
     skip: :class:`Any` symbol to use for skips in the alignment
+    integer_markings: :class:`bool` search on markings encoded as tuples of token counts
+    budget: :class:`SearchBudget` (optional) budgets of the search
 
     Returns
     -------
     dictionary : :class:`dict` with keys **alignment**, **cost**, **visited_states**, **queued_states**
-    and **traversed_arcs**
+    and **traversed_arcs** (and **optimal**, **exhausted_budget**, **cost_lower_bound** when a budget is set)
     """
+    if integer_markings:
+        return __search_integer_markings(sync_prod, initial_marking, final_marking, cost_function, skip,
+                                         ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+                                         max_align_time_trace=max_align_time_trace, budget=budget)
     return __search(sync_prod, initial_marking, final_marking, cost_function, skip,
-                    ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, max_align_time_trace=max_align_time_trace)
+                    ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, max_align_time_trace=max_align_time_trace,
+                    budget=budget)
+
+
+def __get_state_size(state):
+    """
+    Estimates the memory (in bytes) of a state of the search: the search tuple, its solution vector and its marking
+    """
+    return sys.getsizeof(state) + sys.getsizeof(state.__dict__) + sys.getsizeof(state.x) + 24 * len(state.x) + \
+           sys.getsizeof(state.m)
+
+
+def __approximate_alignment(open_set, closed, expand, is_final, budget, max_time, state_size):
+    """
+    Searches an approximate alignment when a budget of the exact search is exhausted, by a beam search
+    (keeping the budget.beam_width states minimizing g + budget.weight * h) starting from the open set, whose states
+    are then released. The beam keeps being expanded while it contains states that could lead to a cheaper final
+    state than the best one found (according to the admissible f).
+    The beam search has budgets equal to the ones of the exact search: at most budget.max_nodes layers (hence at most
+    budget.beam_width states expanded per visited state of the exact search), budget.max_memory bytes (estimated)
+    of states and, in anytime mode, max_time seconds. When one of them is exhausted, the search stops.
+
+    Returns
+    -------
+    best_state
+        Cheapest final state found (None if the beam search does not reach the final marking)
+    cost_lower_bound
+        Lower bound of the cost of the optimal alignment, from the open set of the exact search
+    expanded
+        Number of states expanded by the beam search
+    """
+    start_time = time.time()
+    # the open set contains, with the heuristics being admissible, a lower bound of the cost of the optimal alignment
+    cost_lower_bound = min((state.f for state in open_set if state.m not in closed), default=None)
+    if cost_lower_bound is None:
+        return None, None, 0
+
+    def weighted_f(state):
+        return state.g + budget.weight * state.h
+
+    initial_states = {}
+    for state in heapq.nsmallest(budget.beam_width, (state for state in open_set if state.m not in closed),
+                                 key=weighted_f):
+        if state.m not in initial_states or state.g < initial_states[state.m].g:
+            initial_states[state.m] = state
+    beam = list(initial_states.values())
+    # the states of the exact search are not needed anymore
+    open_set.clear()
+    closed.clear()
+    # cost of the cheapest state found for each marking (at most budget.beam_width markings per layer),
+    # a marking being reached again only with a lower cost
+    best_g = {state.m: state.g for state in beam}
+
+    best = None
+    expanded = 0
+    layers = 0
+    while beam:
+        for state in beam:
+            if is_final(state.m) and (best is None or state.g < best.g):
+                best = state
+        if best is not None:
+            beam = [state for state in beam if state.f < best.g and not is_final(state.m)]
+        candidates = {}
+        for state in beam:
+            if budget.get_exhausted(layers, (len(best_g) + len(candidates) + len(beam)) * state_size,
+                                    time.time() - start_time, max_time) is not None:
+                return best, cost_lower_bound, expanded
+            expanded += 1
+            for new_state in expand(state, ()):
+                if new_state.g < best_g.get(new_state.m, sys.maxsize) and (
+                        new_state.m not in candidates or new_state.g < candidates[new_state.m].g):
+                    candidates[new_state.m] = new_state
+        beam = heapq.nsmallest(budget.beam_width, candidates.values(), key=weighted_f)
+        del candidates
+        best_g.update((state.m, state.g) for state in beam)
+        layers += 1
+
+    return best, cost_lower_bound, expanded
+
+
+def __get_approximate_result(best, cost_lower_bound, exhausted, visited, queued, traversed, lp_solved,
+                             ret_tuple_as_trans_desc=False):
+    """
+    Gets the result of the search from the final state found by the beam search (see __approximate_alignment),
+    flagging it as optimal only when its cost reaches the lower bound given by the open set
+    """
+    if best is None:
+        return None
+    alignment = utils.__reconstruct_alignment(best, visited, queued, traversed,
+                                              ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, lp_solved=lp_solved)
+    alignment["optimal"] = best.g <= cost_lower_bound
+    alignment["exhausted_budget"] = exhausted
+    alignment["cost_lower_bound"] = cost_lower_bound
+    return alignment
 
 
 def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=False,
-             max_align_time_trace=sys.maxsize):
+             max_align_time_trace=sys.maxsize, budget=None):
     start_time = time.time()
 
     decorate_transitions_prepostset(sync_net)
@@ -454,7 +626,51 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
 
     trans_empty_preset = set(t for t in sync_net.transitions if len(t.in_arcs) == 0)
 
+    def expand(curr, closed):
+        nonlocal traversed, queued
+        current_marking = curr.m
+        enabled_trans = copy(trans_empty_preset)
+        for p in current_marking:
+            for t in p.ass_trans:
+                if t.sub_marking <= current_marking:
+                    enabled_trans.add(t)
+
+        trans_to_visit_with_cost = [(t, cost_function[t]) for t in enabled_trans if not (
+                t is not None and utils.__is_log_move(t, skip) and utils.__is_model_move(t, skip))]
+
+        new_states = []
+        for t, cost in trans_to_visit_with_cost:
+            traversed += 1
+            new_marking = utils.add_markings(current_marking, t.add_marking)
+
+            if new_marking in closed:
+                continue
+            g = curr.g + cost
+
+            queued += 1
+            h, x = utils.__derive_heuristic(incidence_matrix, cost_vec, curr.x, t, curr.h)
+            trustable = utils.__trust_solution(x)
+            new_f = g + h
+
+            new_states.append(utils.SearchTuple(new_f, g, h, new_marking, curr, t, x, trustable))
+        return new_states
+
+    bounded = budget is not None and budget.is_bounded()
+    state_size = __get_state_size(ini_state) if bounded else 0
+
+    def approximate(exhausted):
+        best, cost_lower_bound, expanded = __approximate_alignment(open_set, closed, expand, lambda m: m == fin,
+                                                                   budget, max_align_time_trace, state_size)
+        return __get_approximate_result(best, cost_lower_bound, exhausted, visited + expanded, queued, traversed,
+                                        lp_solved, ret_tuple_as_trans_desc=ret_tuple_as_trans_desc)
+
     while not len(open_set) == 0:
+        if bounded:
+            exhausted = budget.get_exhausted(visited, (len(open_set) + len(closed)) * state_size,
+                                             time.time() - start_time, max_align_time_trace)
+            if exhausted is not None:
+                return approximate(exhausted)
+
         if (time.time() - start_time) > max_align_time_trace:
             return None
 
@@ -464,6 +680,9 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
 
         while not curr.trust:
             if (time.time() - start_time) > max_align_time_trace:
+                if bounded and budget.anytime:
+                    heapq.heappush(open_set, curr)
+                    return approximate("time")
                 return None
 
             already_closed = current_marking in closed
@@ -499,34 +718,152 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
         # (underestimation of the remaining cost) is 0. Low-hanging fruits
         if curr.h < 0.01:
             if current_marking == fin:
-                return utils.__reconstruct_alignment(curr, visited, queued, traversed,
-                                                     ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
-                                                     lp_solved=lp_solved)
+                alignment = utils.__reconstruct_alignment(curr, visited, queued, traversed,
+                                                          ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+                                                          lp_solved=lp_solved)
+                if bounded:
+                    alignment["optimal"] = True
+                return alignment
 
         closed.add(current_marking)
         visited += 1
 
-        enabled_trans = copy(trans_empty_preset)
-        for p in current_marking:
-            for t in p.ass_trans:
-                if t.sub_marking <= current_marking:
-                    enabled_trans.add(t)
+        for tp in expand(curr, closed):
+            heapq.heappush(open_set, tp)
 
-        trans_to_visit_with_cost = [(t, cost_function[t]) for t in enabled_trans if not (
-                t is not None and utils.__is_log_move(t, skip) and utils.__is_model_move(t, skip))]
 
-        for t, cost in trans_to_visit_with_cost:
+def __search_integer_markings(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=False,
+                              max_align_time_trace=sys.maxsize, budget=None):
+    """
+    Same search as __search, on markings encoded as tuples of token counts (indexed as the places of the incidence
+    matrix): the enabled transitions and the successors are computed on the compiled net, and the closed set
+    contains tuples, hence no Marking is built during the search
+    """
+    start_time = time.time()
+
+    incidence_matrix = inc_mat_construct(sync_net)
+    compiled = compile_net(sync_net, incidence_matrix=incidence_matrix)
+    ini_vec, fin_vec, cost_vec = utils.__vectorize_initial_final_cost(incidence_matrix, ini, fin, cost_function)
+    ini_vec = tuple(ini_vec)
+    fin_vec = tuple(fin_vec)
+    transitions = compiled.transitions
+    # costs of the transitions by index, the transitions being indexed as in the incidence matrix
+    trans_costs = [cost_function[t] for t in transitions]
+
+    closed = set()
+
+    a_matrix = np.asmatrix(incidence_matrix.a_matrix).astype(np.float64)
+    g_matrix = -np.eye(len(sync_net.transitions))
+    h_cvx = np.matrix(np.zeros(len(sync_net.transitions))).transpose()
+    cost_vec = [x * 1.0 for x in cost_vec]
+
+    use_cvxopt = False
+    if lp_solver.DEFAULT_LP_SOLVER_VARIANT == lp_solver.CVXOPT_SOLVER_CUSTOM_ALIGN or lp_solver.DEFAULT_LP_SOLVER_VARIANT == lp_solver.CVXOPT_SOLVER_CUSTOM_ALIGN_ILP:
+        use_cvxopt = True
+
+    if use_cvxopt:
+        # not available in the latest version of PM4Py
+        from cvxopt import matrix
+
+        a_matrix = matrix(a_matrix)
+        g_matrix = matrix(g_matrix)
+        h_cvx = matrix(h_cvx)
+        cost_vec = matrix(cost_vec)
+
+    h, x = utils.__compute_exact_heuristic_from_vector(sync_net, a_matrix, h_cvx, g_matrix, cost_vec, ini_vec,
+                                                       fin_vec, lp_solver.DEFAULT_LP_SOLVER_VARIANT,
+                                                       use_cvxopt=use_cvxopt)
+    ini_state = utils.SearchTuple(0 + h, 0, h, ini_vec, None, None, x, True)
+    open_set = [ini_state]
+    heapq.heapify(open_set)
+    visited = 0
+    queued = 0
+    traversed = 0
+    lp_solved = 1
+
+    def expand(curr, closed):
+        nonlocal traversed, queued
+        new_states = []
+        for t_index in compiled.enabled(curr.m):
             traversed += 1
-            new_marking = utils.add_markings(current_marking, t.add_marking)
+            new_marking = compiled.fire(curr.m, t_index)
 
             if new_marking in closed:
                 continue
-            g = curr.g + cost
+            g = curr.g + trans_costs[t_index]
 
             queued += 1
-            h, x = utils.__derive_heuristic(incidence_matrix, cost_vec, curr.x, t, curr.h)
-            trustable = utils.__trust_solution(x)
-            new_f = g + h
+            x_prime = curr.x.copy()
+            x_prime[t_index] -= 1
+            h = max(0, curr.h - cost_vec[t_index])
+            trustable = utils.__trust_solution(x_prime)
+
+            new_states.append(utils.SearchTuple(g + h, g, h, new_marking, curr, transitions[t_index], x_prime,
+                                                trustable))
+        return new_states
+
+    bounded = budget is not None and budget.is_bounded()
+    state_size = __get_state_size(ini_state) if bounded else 0
+
+    def approximate(exhausted):
+        best, cost_lower_bound, expanded = __approximate_alignment(open_set, closed, expand, lambda m: m == fin_vec,
+                                                                   budget, max_align_time_trace, state_size)
+        return __get_approximate_result(best, cost_lower_bound, exhausted, visited + expanded, queued, traversed,
+                                        lp_solved, ret_tuple_as_trans_desc=ret_tuple_as_trans_desc)
+
+    while not len(open_set) == 0:
+        if bounded:
+            exhausted = budget.get_exhausted(visited, (len(open_set) + len(closed)) * state_size,
+                                             time.time() - start_time, max_align_time_trace)
+            if exhausted is not None:
+                return approximate(exhausted)
+
+        if (time.time() - start_time) > max_align_time_trace:
+            return None
+
+        curr = heapq.heappop(open_set)
+
+        current_marking = curr.m
+
+        while not curr.trust:
+            if (time.time() - start_time) > max_align_time_trace:
+                if bounded and budget.anytime:
+                    heapq.heappush(open_set, curr)
+                    return approximate("time")
+                return None
+
+            if current_marking in closed:
+                curr = heapq.heappop(open_set)
+                current_marking = curr.m
+                continue
+
+            h, x = utils.__compute_exact_heuristic_from_vector(sync_net, a_matrix, h_cvx, g_matrix, cost_vec,
+                                                               curr.m, fin_vec, lp_solver.DEFAULT_LP_SOLVER_VARIANT,
+                                                               use_cvxopt=use_cvxopt)
+            lp_solved += 1
+
+            tp = utils.SearchTuple(curr.g + h, curr.g, h, curr.m, curr.p, curr.t, x, True)
+            curr = heapq.heappushpop(open_set, tp)
+            current_marking = curr.m
+
+        # max allowed heuristics value (due to the numerical instability of some of our solvers)
+        if curr.h > lp_solver.MAX_ALLOWED_HEURISTICS:
+            continue
+
+        if current_marking in closed:
+            continue
+
+        if curr.h < 0.01:
+            if current_marking == fin_vec:
+                alignment = utils.__reconstruct_alignment(curr, visited, queued, traversed,
+                                                          ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+                                                          lp_solved=lp_solved)
+                if bounded:
+                    alignment["optimal"] = True
+                return alignment
+
+        closed.add(current_marking)
+        visited += 1
 
-            tp = utils.SearchTuple(new_f, g, h, new_marking, curr, t, x, trustable)
+        for tp in expand(curr, closed):
             heapq.heappush(open_set, tp)
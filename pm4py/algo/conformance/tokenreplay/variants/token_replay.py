@@ -51,6 +51,7 @@ class Parameters(Enum):
     CONSIDER_ACTIVITIES_NOT_IN_MODEL_IN_FITNESS = "consider_activities_not_in_model_in_fitness"
     ENABLE_PLTR_FITNESS = "enable_pltr_fitness"
     SHOW_PROGRESS_BAR = "show_progress_bar"
+    CORES = "cores"
 
 
 class TechnicalParameters(Enum):
@@ -1185,6 +1186,71 @@ def apply(log: EventLog, net: PetriNet, initial_marking: Marking, final_marking:
                      case_id_key=case_id_key)
 
 
+def apply_multiprocessing(log: EventLog, net: PetriNet, initial_marking: Marking, final_marking: Marking, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> typing.ListAlignments:
+    """
+    Applies the token-based replay using a process pool (multiprocessing), whose workers receive the Petri net once,
+    and the variants as integer-encoded activities in shared memory (see pm4py.objects.petri_net.utils.shared_pool).
+    The places and transitions of the Petri net should have unique names, and the place/transition-level fitness
+    (Parameters.ENABLE_PLTR_FITNESS) is not supported.
+
+    Parameters
+    -----------
+    log
+        Log
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method), including:
+            Parameters.CORES -> number of processes
+
+    Returns
+    -----------
+    replayed_traces
+        Results of the token-based replay of the traces
+    """
+    if parameters is None:
+        parameters = {}
+
+    import multiprocessing
+    from pm4py.objects.petri_net.utils.shared_pool import SharedNetPool
+
+    if exec_utils.get_param_value(Parameters.ENABLE_PLTR_FITNESS, parameters, False):
+        raise Exception("the place/transition-level fitness is not supported by the multiprocessing token-based replay")
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_util.DEFAULT_NAME_KEY)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    return_names = exec_utils.get_param_value(Parameters.RETURN_NAMES, parameters, False)
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR)
+    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, max(1, multiprocessing.cpu_count() - 2))
+
+    if pandas_utils.check_is_pandas_dataframe(log):
+        traces = [tuple(x) for x in log.groupby(case_id_key)[activity_key].agg(list).to_dict().values()]
+    else:
+        log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
+        traces = [tuple(x[activity_key] for x in trace) for trace in log]
+
+    variants = list(dict.fromkeys(traces))
+
+    progress = None
+    if importlib.util.find_spec("tqdm") and show_progress_bar and len(variants) > 1:
+        from tqdm.auto import tqdm
+        progress = tqdm(total=len(variants), desc="replaying log with TBR, completed traces :: ")
+
+    with SharedNetPool(net, initial_marking, final_marking, parameters=parameters, num_cores=num_cores) as pool:
+        results = pool.apply_token_replay(variants, return_names=return_names, progress=progress)
+
+    if progress is not None:
+        progress.close()
+    del progress
+
+    variants_results = dict(zip(variants, results))
+    return [copy(variants_results[trace]) for trace in traces]
+
+
 def apply_variants_list(variants_list, net, initial_marking, final_marking, parameters=None):
     if parameters is None:
         parameters = {}
@@ -2,9 +2,10 @@
     This is an effort to implement DataStream XES Extension within pm4py based on paper
     https://www.researchgate.net/publication/369252601_DataStream_XES_Extension_Embedding_IoT_Sensor_Data_into_Extensible_Event_Stream_Logs
 '''
-from pm4py.objects.iot import apis, exceptions, obj, importer, exporter
+from pm4py.objects.iot import apis, exceptions, obj, columnar, query, dataframe, join, importer, exporter
 from pm4py.objects.iot.apis import add_sensor_value_to_event, remove_sensor_value_from_event, \
-sensor_values_of_specific_type, get_traces_with_datastream, count_distinct_datacontext_groups_at_trace_level, \
+sensor_values_of_specific_type, sensor_values_statistics, get_traces_with_datastream, count_distinct_datacontext_groups_at_trace_level, \
     count_datastreams_and_points_in_event, find_all_stream_data_entries_in_event, \
-    count_points_in_multipoint_entry, count_events_with_datastreams_in_trace
+    count_points_in_multipoint_entry, count_events_with_datastreams_in_trace, log_to_dataframes, dataframes_to_log, \
+    sensor_asof_join, sensor_window_join
 from pm4py.objects.iot.utils import cleaner, verifier
\ No newline at end of file
@@ -19,6 +19,58 @@ def sensor_values_of_specific_type(event, fset):
     return event.fetch_sensor_values(fset)
 
 
+def sensor_values_statistics(obj, fsets):
+    """
+        Vectorized query of the sensor values of a log (or trace, event, datastream)
+        fsets is FilterSet() or a list of them
+        Returns, per sensor id, sorted distinct values, count, min, max and mean
+        obj can also be a pm4py.objects.iot.query.SensorTable, to reuse it across queries
+    """
+    from pm4py.objects.iot import query
+    return query.apply(obj, fsets)
+
+
+def log_to_dataframes(log):
+    """
+        Converts the log into the event table and the long-format sensor table (a row for each point)
+        Returns (events_df, sensor_df), see pm4py.objects.iot.dataframe
+    """
+    from pm4py.objects.iot import dataframe
+    return dataframe.to_dataframes(log)
+
+
+def dataframes_to_log(events_df, sensor_df):
+    """
+        Converts the event table and the sensor table (see log_to_dataframes) back into a log
+    """
+    from pm4py.objects.iot import dataframe
+    return dataframe.to_iot_log(events_df, sensor_df)
+
+
+def sensor_asof_join(log, sensor_ids=None, tolerance=None, by_case=True):
+    """
+        Attaches to each event the value of the last reading of each sensor at or before its timestamp,
+        as the attribute sensor:<sensor id> (the log is modified in place and returned)
+        tolerance is the maximum age of the reading (timedelta), by_case restricts to the readings of the trace
+    """
+    from pm4py.objects.iot import join
+    return join.asof_join(log, parameters={join.Parameters.SENSOR_IDS: sensor_ids, join.Parameters.TOLERANCE: tolerance,
+                                           join.Parameters.BY_CASE: by_case})
+
+
+def sensor_window_join(log, sensor_ids=None, aggregations=None, by_case=True):
+    """
+        Aggregates the readings of each sensor from the start to the completion of each activity, attaching
+        the attributes sensor:<sensor id>:<aggregation> to the events completing it (see pm4py.objects.iot.join)
+        aggregations are among count, first, last, min, max, mean (default: min, max, mean, last)
+    """
+    from pm4py.objects.iot import join
+    parameters = {join.Parameters.SENSOR_IDS: sensor_ids, join.Parameters.BY_CASE: by_case}
+    if aggregations is not None:
+        parameters[join.Parameters.AGGREGATIONS] = aggregations
+    return join.window_join(log, parameters=parameters)
+
+
 def get_traces_with_datastream(log):
     ret = []
     for trace in log:
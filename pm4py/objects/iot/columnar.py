@@ -0,0 +1,384 @@
+"""
+    Columnar storage for the points of a DataStream.
+
+    Timestamps are stored as datetime64[ns] (UTC instants, plus a dictionary-encoded time zone), values as a
+    typed array and id/source/meta as dictionary-encoded integer codes. Points are materialized on access,
+    so the storage can replace the list of points of a DataStream without changing its interface.
+"""
+import copy
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from pm4py.objects.iot.obj import Point
+
+INITIAL_CAPACITY = 16
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+NAIVE_EPOCH = datetime(1970, 1, 1)
+NAT = np.iinfo(np.int64).min
+MIN_MICROSECONDS = NAT // 1000 + 1
+MAX_MICROSECONDS = np.iinfo(np.int64).max // 1000
+MICROSECOND = timedelta(microseconds=1)
+SCALAR_TYPES = {str, int, float, bool, type(None)}
+
+
+def typed_key(value):
+    """
+    Gets a hashable key of a (possibly nested) attribute value, distinguishing the types of the values
+    (since they determine the XES type in the export) and the order of the nested attributes
+    """
+    value_type = type(value)
+    if value_type in SCALAR_TYPES:
+        return value_type, value
+    if isinstance(value, dict):
+        return dict, tuple((key, typed_key(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return value_type, tuple(typed_key(item) for item in value)
+    return value_type, value
+
+
+def copy_nested(value):
+    """
+    Copies the nested lists/dicts of an attribute value, so that materialized points do not share them
+    """
+    if type(value) is list:
+        return [copy_nested(item) for item in value]
+    if type(value) is dict:
+        return {key: copy_nested(item) for key, item in value.items()}
+    return value
+
+
+class DictionaryColumn:
+    """
+    Column storing each distinct value once (categories) and an integer code for each row
+    """
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self.codes = np.empty(capacity, dtype=np.int32)
+        self.categories = []
+        self._lookup = {}
+
+    def encode(self, value):
+        try:
+            key = typed_key(value)
+            code = self._lookup.get(key)
+        except TypeError:
+            key = None
+            code = None
+            for i, category in enumerate(self.categories):
+                if type(category) is type(value) and category == value:
+                    code = i
+                    break
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(value)
+            if key is not None:
+                self._lookup[key] = code
+        return code
+
+    def decode(self, code):
+        return copy_nested(self.categories[code])
+
+    def matching_codes(self, value, equals=None):
+        """
+        Gets the codes of the categories equal to the given value (by default, which are not different from it)
+        """
+        if equals is None:
+            return [i for i, category in enumerate(self.categories) if not (value != category)]
+        return [i for i, category in enumerate(self.categories) if equals(value, category)]
+
+    def __deepcopy__(self, memodict={}):
+        column = DictionaryColumn(0)
+        column.codes = self.codes.copy()
+        column.categories = copy.deepcopy(self.categories, memodict)
+        column._lookup = dict(self._lookup)
+        return column
+
+
+def meta_equals(meta, other):
+    """
+    Compares the meta attributes of two points as done by Point.__eq__
+    """
+    if (meta is not None) != (other is not None):
+        return False
+    if meta is None:
+        return True
+    if len(meta) != len(other):
+        return False
+    for i in range(len(meta)):
+        if meta[i] != other[i]:
+            return False
+    return True
+
+
+def to_microseconds(timestamp):
+    """
+    Gets the microseconds since the epoch of a datetime, or None if it does not fit in datetime64[ns]
+    """
+    if timestamp.tzinfo is None:
+        microseconds = (timestamp - NAIVE_EPOCH) // MICROSECOND
+    else:
+        microseconds = (timestamp - EPOCH) // MICROSECOND
+    if microseconds < MIN_MICROSECONDS or microseconds > MAX_MICROSECONDS:
+        return None
+    return microseconds
+
+
+class ColumnarPoints:
+    """
+    List-like storage of points, keeping the attributes of the points in columns
+
+    Only the type of the stored items is Point; reading an item materializes a new Point,
+    hence modifying it in place does not change the storage (assign it back instead).
+    """
+    def __init__(self, points=None):
+        self._size = 0
+        self._ids = DictionaryColumn()
+        self._sources = DictionaryColumn()
+        self._metas = DictionaryColumn()
+        self._timezones = DictionaryColumn()
+        self._timestamps = np.empty(INITIAL_CAPACITY, dtype=np.int64)
+        # timestamps that are not datetimes in the datetime64[ns] range switch the column to objects
+        self._timestamp_objects = False
+        # the type of the values of the first point decides the dtype, mixed types switch to objects
+        self._values = None
+        if points is not None:
+            for point in points:
+                self.append(point)
+
+    @property
+    def timestamps(self):
+        """
+        Timestamps of the points as datetime64[ns] UTC instants (NaT for missing timestamps)
+        """
+        if self._timestamp_objects:
+            return self._timestamps[:self._size].copy()
+        return self._timestamps[:self._size].view("datetime64[ns]")
+
+    @property
+    def values(self):
+        if self._values is None:
+            return np.empty(0, dtype=object)
+        return self._values[:self._size]
+
+    @property
+    def ids(self):
+        return self._ids
+
+    @property
+    def sources(self):
+        return self._sources
+
+    @property
+    def metas(self):
+        return self._metas
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self.get_point(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self.get_point(i) for i in range(*key.indices(self._size))]
+        return self.get_point(self.__position(key))
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            points = list(self)
+            points[key] = value
+            self.__init__(points)
+        else:
+            self.__set_row(self.__position(key), value)
+
+    def __delitem__(self, key):
+        keep = np.ones(self._size, dtype=bool)
+        if isinstance(key, slice):
+            keep[key] = False
+        else:
+            keep[self.__position(key)] = False
+        self.compact(keep)
+
+    def __copy__(self):
+        return self.__deepcopy__()
+
+    def __deepcopy__(self, memodict={}):
+        columns = ColumnarPoints()
+        columns._size = self._size
+        columns._ids = copy.deepcopy(self._ids, memodict)
+        columns._sources = copy.deepcopy(self._sources, memodict)
+        columns._metas = copy.deepcopy(self._metas, memodict)
+        columns._timezones = copy.deepcopy(self._timezones, memodict)
+        columns._timestamps = copy.deepcopy(self._timestamps, memodict)
+        columns._timestamp_objects = self._timestamp_objects
+        columns._values = copy.deepcopy(self._values, memodict)
+        return columns
+
+    def __position(self, key):
+        if key < 0:
+            key += self._size
+        if key < 0 or key >= self._size:
+            raise IndexError('columnar points index out of range')
+        return key
+
+    def index(self, x, start=0, end=None):
+        return list(self).index(x, start, self._size if end is None else end)
+
+    def count(self, x):
+        return sum(1 for point in self if point == x)
+
+    def append(self, point):
+        self.__reserve(self._size + 1)
+        self._size += 1
+        self.__set_row(self._size - 1, point)
+
+    def extend(self, points):
+        points = list(points)
+        self.__reserve(self._size + len(points))
+        for point in points:
+            self._size += 1
+            self.__set_row(self._size - 1, point)
+
+    def insert(self, i, point):
+        i = min(max(i + self._size if i < 0 else i, 0), self._size)
+        self.append(point)
+        if i < self._size - 1:
+            order = np.concatenate([np.arange(i), [self._size - 1], np.arange(i, self._size - 1)])
+            self.take(order)
+
+    def get_point(self, i):
+        point = Point()
+        point.id = self._ids.decode(self._ids.codes[i])
+        point.source = self._sources.decode(self._sources.codes[i])
+        point.meta = self._metas.decode(self._metas.codes[i])
+        point.timestamp = self.__get_timestamp(i)
+        point.value = self._values[i].item() if self._values.dtype != object else self._values[i]
+        return point
+
+    def take(self, order):
+        """
+        Keeps the rows at the given positions, in the given order
+        """
+        for column in [self._ids, self._sources, self._metas, self._timezones]:
+            column.codes = column.codes[:self._size][order]
+        self._timestamps = self._timestamps[:self._size][order]
+        if self._values is not None:
+            self._values = self._values[:self._size][order]
+        self._size = len(order)
+
+    def compact(self, keep):
+        """
+        Keeps the rows for which the boolean mask is True
+        """
+        self.take(np.flatnonzero(keep))
+
+    def find(self, point):
+        """
+        Gets the positions of the rows equal to the given point (according to Point.__eq__).
+        The columns are used to select the candidate rows, which are then compared with the point
+        """
+        mask = np.isin(self._ids.codes[:self._size], self._ids.matching_codes(point.id))
+        mask &= np.isin(self._sources.codes[:self._size], self._sources.matching_codes(point.source))
+        mask &= np.isin(self._metas.codes[:self._size], self._metas.matching_codes(point.meta, meta_equals))
+        if not self._timestamp_objects:
+            if point.timestamp is None:
+                mask &= self._timestamps[:self._size] == NAT
+            elif type(point.timestamp) is datetime:
+                microseconds = to_microseconds(point.timestamp)
+                if microseconds is None:
+                    return []
+                mask &= self._timestamps[:self._size] == microseconds * 1000
+        if self._values is not None and self._values.dtype != object and type(point.value) in (int, float, bool):
+            mask &= self._values[:self._size] == point.value
+        return [i for i in np.flatnonzero(mask) if point == self.get_point(i)]
+
+    def contains(self, point):
+        return len(self.find(point)) > 0
+
+    def remove_equal(self, point):
+        """
+        Removes all the rows equal to the given point
+        """
+        positions = self.find(point)
+        if positions:
+            keep = np.ones(self._size, dtype=bool)
+            keep[positions] = False
+            self.compact(keep)
+
+    def __reserve(self, size):
+        capacity = len(self._timestamps)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        for column in [self._ids, self._sources, self._metas, self._timezones]:
+            column.codes = self.__grow(column.codes, capacity)
+        self._timestamps = self.__grow(self._timestamps, capacity)
+        if self._values is not None:
+            self._values = self.__grow(self._values, capacity)
+
+    def __grow(self, array, capacity):
+        grown = np.empty(capacity, dtype=array.dtype)
+        grown[:self._size] = array[:self._size]
+        return grown
+
+    def __set_row(self, i, point):
+        if type(point) != Point:
+            raise TypeError(f'columnar points can only store Point, not {type(point)}')
+        self._ids.codes[i] = self._ids.encode(point.id)
+        self._sources.codes[i] = self._sources.encode(point.source)
+        self._metas.codes[i] = self._metas.encode(point.meta)
+        self.__set_timestamp(i, point.timestamp)
+        self.__set_value(i, point.value)
+
+    def __get_timestamp(self, i):
+        if self._timestamp_objects:
+            return self._timestamps[i]
+        nanoseconds = int(self._timestamps[i])
+        if nanoseconds == NAT:
+            return None
+        tzinfo = self._timezones.categories[self._timezones.codes[i]]
+        if tzinfo is None:
+            return NAIVE_EPOCH + timedelta(microseconds=nanoseconds // 1000)
+        return (EPOCH + timedelta(microseconds=nanoseconds // 1000)).astimezone(tzinfo)
+
+    def __set_timestamp(self, i, timestamp):
+        if not self._timestamp_objects:
+            if timestamp is None:
+                self._timestamps[i] = NAT
+                self._timezones.codes[i] = self._timezones.encode(None)
+                return
+            microseconds = to_microseconds(timestamp) if type(timestamp) is datetime else None
+            if microseconds is not None:
+                self._timestamps[i] = microseconds * 1000
+                self._timezones.codes[i] = self._timezones.encode(timestamp.tzinfo)
+                return
+            timestamps = np.empty(len(self._timestamps), dtype=object)
+            for j in range(self._size):
+                if j != i:
+                    timestamps[j] = self.__get_timestamp(j)
+            self._timestamps = timestamps
+            self._timestamp_objects = True
+        self._timestamps[i] = timestamp
+
+    def __set_value(self, i, value):
+        if self._values is None:
+            if type(value) is float:
+                dtype = np.float64
+            elif type(value) is bool:
+                dtype = np.bool_
+            elif type(value) is int and np.iinfo(np.int64).min <= value <= np.iinfo(np.int64).max:
+                dtype = np.int64
+            else:
+                dtype = object
+            self._values = np.empty(len(self._timestamps), dtype=dtype)
+        elif self._values.dtype != object and not self.__fits(value):
+            self._values = self._values.astype(object)
+        self._values[i] = value
+
+    def __fits(self, value):
+        if self._values.dtype == np.float64:
+            return type(value) is float
+        if self._values.dtype == np.bool_:
+            return type(value) is bool
+        return type(value) is int and np.iinfo(np.int64).min <= value <= np.iinfo(np.int64).max
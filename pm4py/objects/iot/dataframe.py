@@ -0,0 +1,480 @@
+"""
+    Conversion of IoT logs into two Pandas dataframes, and back.
+
+    The event table has a row for each event (the attributes of its trace prefixed by 'case:'), as the
+    dataframes of the other pm4py logs. The sensor table is in long format: a row for each point, with the
+    position of its trace and of the item (event, datastream or datacontext) containing it, the attributes
+    of its datastream and multipoint, and the id/timestamp/value/source/meta of the point. Repeated strings
+    are stored as categoricals and timestamps as UTC datetime64[ns], so the sensor data can be grouped and
+    aggregated by Pandas.
+
+    The points of multipoints keep their own attributes, the ones of the multipoint are in the multipoint:
+    columns (combine_first completes the points with them, as done by pm4py.objects.iot.query).
+    Datastreams, multipoints and datacontexts without points are represented by a row which is not a point
+    (see IS_POINT), and the traces without events are stored in the attrs of the event table, so that the
+    log can be converted back.
+"""
+import copy
+from datetime import datetime, timedelta
+from enum import Enum
+
+import numpy as np
+
+from pm4py.util import constants, exec_utils, pandas_utils
+from pm4py.objects.iot import constants as xes_iot_constants
+from pm4py.objects.iot.columnar import EPOCH, NAIVE_EPOCH, NAT, copy_nested, to_microseconds
+from pm4py.objects.iot.obj import IOTEventLog, IOTTrace, IOTEvent, DataStream, DataContext, Point, MultiPoint
+
+
+# position of the trace in the log (-1 for the items contained directly in the log)
+TRACE_INDEX = "@@trace_index"
+# position of the event (or, in the sensor table, of the item containing the point) in its trace, or in the log
+ITEM_INDEX = "@@item_index"
+# ordinal of the datastream in the log (datacontexts and datastreams are numbered together, in their order)
+STREAM_INDEX = "@@stream_index"
+# ordinals of the datacontexts containing the datastream, from the outermost one
+DATACONTEXT_PATH = "@@datacontext_path"
+# ordinal of the multipoint containing the point in the log (-1 for points directly in the datastream)
+MULTIPOINT_INDEX = "@@multipoint_index"
+# False for the rows of the datastreams, multipoints and datacontexts without points
+IS_POINT = "@@is_point"
+STREAM_DATA_KEY = "@@stream_data_key"
+DATASTREAM_NAME = "datastream:name"
+DATASTREAM_ID = "datastream:id"
+DATASTREAM_SOURCE = "datastream:source"
+MULTIPOINT_ID = "multipoint:id"
+MULTIPOINT_TIMESTAMP = "multipoint:timestamp"
+MULTIPOINT_SOURCE = "multipoint:source"
+MULTIPOINT_META = "multipoint:meta"
+# time zone of the timestamp of the point (missing for naive timestamps)
+TIMEZONE = "@@timezone"
+# keys of the attrs of the event table: the log without its items, and the traces without events by position
+LOG_HEADER = "iot:log_header"
+TRACES_WITHOUT_EVENTS = "iot:traces_without_events"
+
+INTEGER_COLUMNS = [TRACE_INDEX, ITEM_INDEX, STREAM_INDEX, MULTIPOINT_INDEX]
+DATASTREAM_COLUMNS = [DATACONTEXT_PATH, STREAM_DATA_KEY, DATASTREAM_NAME, DATASTREAM_ID, DATASTREAM_SOURCE]
+MULTIPOINT_COLUMNS = [MULTIPOINT_ID, MULTIPOINT_TIMESTAMP, MULTIPOINT_SOURCE, MULTIPOINT_META]
+CATEGORICAL_COLUMNS = DATASTREAM_COLUMNS + [MULTIPOINT_ID, MULTIPOINT_SOURCE, xes_iot_constants.TAG_STREAM_ID,
+                                            xes_iot_constants.TAG_STREAM_SOURCE, TIMEZONE]
+OBJECT_COLUMNS = [MULTIPOINT_TIMESTAMP, MULTIPOINT_META, xes_iot_constants.TAG_STREAM_META]
+
+
+class Parameters(Enum):
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+
+
+class Flattener:
+    """
+    Collects the rows of the event and sensor tables in a single pass over the log
+    """
+    def __init__(self, case_attribute_prefix, case_id_key):
+        self.case_attribute_prefix = case_attribute_prefix
+        self.case_id_key = case_id_key
+        self.events = []
+        self.traces_without_events = {}
+        self.columns = {column: [] for column in INTEGER_COLUMNS + [case_id_key, IS_POINT] + CATEGORICAL_COLUMNS
+                        + OBJECT_COLUMNS + [xes_iot_constants.TAG_STREAM_VALUE]}
+        self.timestamps = []
+        # position -> timestamp, for the timestamps that are not datetimes in the datetime64[ns] range
+        self.other_timestamps = {}
+        self.ordinal = 0
+        self.multipoint_ordinal = 0
+
+    def add_log(self, log):
+        for i, item in enumerate(log):
+            if type(item) == IOTTrace:
+                num_events = len(self.events)
+                case_attributes = {self.case_attribute_prefix + key: value for key, value in item.attributes.items()}
+                for j, trace_item in enumerate(item):
+                    self.add_item(trace_item, i, j, case_attributes)
+                if len(self.events) == num_events:
+                    self.traces_without_events[i] = item.attributes
+            else:
+                self.add_item(item, -1, i, {})
+
+    def add_item(self, item, trace_index, item_index, case_attributes):
+        container = (trace_index, item_index, case_attributes.get(self.case_id_key), ())
+        if type(item) == IOTEvent:
+            row = {TRACE_INDEX: trace_index, ITEM_INDEX: item_index}
+            row.update(case_attributes)
+            row.update(item.attributes)
+            self.events.append(row)
+            for event_item in item:
+                self.add_sensor_item(event_item, container)
+        else:
+            self.add_sensor_item(item, container)
+
+    def add_sensor_item(self, item, container):
+        self.ordinal += 1
+        if type(item) == DataStream:
+            self.add_datastream(item, container)
+        elif type(item) == DataContext:
+            trace_index, item_index, case_id, path = container
+            ordinal = self.ordinal
+            start = len(self.timestamps)
+            for datacontext_item in item:
+                self.add_sensor_item(datacontext_item, (trace_index, item_index, case_id, path + (ordinal,)))
+            if len(self.timestamps) == start:
+                # the stream index of the row is the ordinal of the datacontext itself
+                self.add_point(None, None, None, None, None, -1, is_point=False)
+                self.add_datastream_columns(container, ordinal, None, path + (ordinal,), 1)
+
+    def add_datastream(self, datastream, container):
+        ordinal = self.ordinal
+        start = len(self.timestamps)
+        if datastream.is_columnar():
+            self.add_columnar(datastream._list)
+        else:
+            for item in datastream:
+                if type(item) == Point:
+                    self.add_point(item.id, item.timestamp, item.value, item.source, item.meta, -1)
+                elif type(item) == MultiPoint:
+                    self.add_multipoint(item)
+        if len(self.timestamps) == start:
+            self.add_point(None, None, None, None, None, -1, is_point=False)
+        self.add_datastream_columns(container, ordinal, datastream, container[3], len(self.timestamps) - start)
+
+    def add_datastream_columns(self, container, ordinal, datastream, path, size):
+        trace_index, item_index, case_id, _ = container
+        columns = self.columns
+        for column, value in [(TRACE_INDEX, trace_index), (ITEM_INDEX, item_index), (STREAM_INDEX, ordinal),
+                              (self.case_id_key, case_id), (DATACONTEXT_PATH, path)]:
+            columns[column].extend([value] * size)
+        for column, attribute in [(STREAM_DATA_KEY, "stream_data_key"), (DATASTREAM_NAME, "name"),
+                                  (DATASTREAM_ID, "id"), (DATASTREAM_SOURCE, "source")]:
+            columns[column].extend([getattr(datastream, attribute) if datastream is not None else None] * size)
+
+    def add_multipoint(self, multipoint):
+        self.multipoint_ordinal += 1
+        columns = self.columns
+        start = len(self.timestamps)
+        for item in multipoint:
+            self.add_point(item.id, item.timestamp, item.value, item.source, item.meta, self.multipoint_ordinal)
+        if len(self.timestamps) == start:
+            self.add_point(None, None, None, None, None, self.multipoint_ordinal, is_point=False)
+        size = len(self.timestamps) - start
+        columns[MULTIPOINT_ID].extend([multipoint.id] * size)
+        columns[MULTIPOINT_TIMESTAMP].extend([multipoint.timestamp] * size)
+        columns[MULTIPOINT_SOURCE].extend([multipoint.source] * size)
+        columns[MULTIPOINT_META].extend([multipoint.meta] * size)
+
+    def add_point(self, id, timestamp, value, source, meta, multipoint_index, is_point=True):
+        columns = self.columns
+        columns[MULTIPOINT_INDEX].append(multipoint_index)
+        if multipoint_index == -1:
+            for column in MULTIPOINT_COLUMNS:
+                columns[column].append(None)
+        columns[IS_POINT].append(is_point)
+        columns[xes_iot_constants.TAG_STREAM_ID].append(id)
+        columns[xes_iot_constants.TAG_STREAM_VALUE].append(value)
+        columns[xes_iot_constants.TAG_STREAM_SOURCE].append(source)
+        columns[xes_iot_constants.TAG_STREAM_META].append(meta)
+        self.add_timestamp(timestamp)
+
+    def add_timestamp(self, timestamp):
+        microseconds = to_microseconds(timestamp) if type(timestamp) is datetime else None
+        if microseconds is not None:
+            self.timestamps.append(microseconds * 1000)
+            self.columns[TIMEZONE].append(timestamp.tzinfo)
+        else:
+            if timestamp is not None:
+                self.other_timestamps[len(self.timestamps)] = timestamp
+            self.timestamps.append(NAT)
+            self.columns[TIMEZONE].append(None)
+
+    def add_columnar(self, points):
+        """
+        Adds the points of a columnar datastream, copying its columns
+        """
+        size = len(points)
+        columns = self.columns
+        columns[MULTIPOINT_INDEX].extend([-1] * size)
+        columns[IS_POINT].extend([True] * size)
+        for column in MULTIPOINT_COLUMNS:
+            columns[column].extend([None] * size)
+        for column, source_column in [(xes_iot_constants.TAG_STREAM_ID, points.ids), (xes_iot_constants.TAG_STREAM_SOURCE, points.sources),
+                                      (xes_iot_constants.TAG_STREAM_META, points.metas)]:
+            categories = source_column.categories
+            columns[column].extend([categories[code] for code in source_column.codes[:size].tolist()])
+        columns[xes_iot_constants.TAG_STREAM_VALUE].extend(points.values.tolist())
+        if points._timestamp_objects:
+            for timestamp in points.timestamps:
+                self.add_timestamp(timestamp)
+        else:
+            timezones = points._timezones
+            self.timestamps.extend(points.timestamps.view(np.int64).tolist())
+            columns[TIMEZONE].extend([timezones.categories[code] for code in timezones.codes[:size].tolist()])
+
+
+def get_object_array(values):
+    # lists and tuples are kept as elements, instead of becoming dimensions of the array
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def get_values_array(values, is_point):
+    """
+    Gets a float64/int64/bool array of the values of the points when they all have that type, otherwise an object array
+    """
+    types = set(type(value) for value, point in zip(values, is_point) if point)
+    if len(types) == 1 and (all(is_point) or float in types):
+        value_type = next(iter(types))
+        try:
+            if value_type is float:
+                return np.array([value if point else np.nan for value, point in zip(values, is_point)], dtype=np.float64)
+            if value_type is int:
+                return np.array(values, dtype=np.int64)
+            if value_type is bool:
+                return np.array(values, dtype=bool)
+        except OverflowError:
+            pass
+    return get_object_array(values)
+
+
+def to_dataframes(log, parameters=None):
+    """
+    Converts an IoT log into the event table and the long-format sensor table
+
+    Parameters
+    -------------
+    log
+        IOTEventLog
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CASE_ATTRIBUTE_PREFIX -> prefix of the trace attributes (default: case:)
+            Parameters.CASE_ID_KEY -> column of the case identifier (default: case:concept:name)
+
+    Returns
+    -------------
+    events_df
+        Dataframe with a row for each event
+    sensor_df
+        Dataframe with a row for each point
+    """
+    import pandas as pd
+
+    if parameters is None:
+        parameters = {}
+
+    case_attribute_prefix = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters, constants.CASE_ATTRIBUTE_PREFIX)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+
+    flattener = Flattener(case_attribute_prefix, case_id_key)
+    flattener.add_log(log)
+
+    events_df = pandas_utils.instantiate_dataframe(flattener.events if flattener.events else {TRACE_INDEX: [], ITEM_INDEX: []})
+    header = copy.copy(log)
+    header._list = []
+    events_df.attrs = {LOG_HEADER: header, TRACES_WITHOUT_EVENTS: flattener.traces_without_events}
+
+    columns = flattener.columns
+    data = {}
+    for column in INTEGER_COLUMNS:
+        data[column] = np.array(columns[column], dtype=np.int64)
+    data[IS_POINT] = np.array(columns[IS_POINT], dtype=bool)
+    for column in [case_id_key] + CATEGORICAL_COLUMNS:
+        try:
+            data[column] = pd.Categorical(columns[column])
+        except TypeError:
+            # nested attributes (lists of dicts) cannot be categories
+            data[column] = get_object_array(columns[column])
+    for column in OBJECT_COLUMNS:
+        data[column] = get_object_array(columns[column])
+    if flattener.other_timestamps:
+        # the column is kept as objects if some timestamps cannot be stored as datetime64[ns]
+        timestamps = get_object_array([from_nanoseconds(timestamp, tzinfo) for timestamp, tzinfo in zip(flattener.timestamps, columns[TIMEZONE])])
+        for position, timestamp in flattener.other_timestamps.items():
+            timestamps[position] = timestamp
+        data[xes_iot_constants.TAG_STREAM_TIMESTAMP] = timestamps
+    else:
+        data[xes_iot_constants.TAG_STREAM_TIMESTAMP] = pd.to_datetime(np.array(flattener.timestamps, dtype=np.int64), utc=True, unit="ns")
+    data[xes_iot_constants.TAG_STREAM_VALUE] = get_values_array(columns[xes_iot_constants.TAG_STREAM_VALUE], columns[IS_POINT])
+
+    column_order = [case_id_key, TRACE_INDEX, ITEM_INDEX, DATACONTEXT_PATH, STREAM_INDEX] + DATASTREAM_COLUMNS[1:] \
+        + [MULTIPOINT_INDEX] + MULTIPOINT_COLUMNS + [IS_POINT, xes_iot_constants.TAG_STREAM_ID, xes_iot_constants.TAG_STREAM_TIMESTAMP,
+                                                     TIMEZONE, xes_iot_constants.TAG_STREAM_VALUE, xes_iot_constants.TAG_STREAM_SOURCE,
+                                                     xes_iot_constants.TAG_STREAM_META]
+    sensor_df = pd.DataFrame({column: data[column] for column in column_order})
+
+    return events_df, sensor_df
+
+
+def from_nanoseconds(nanoseconds, tzinfo):
+    """
+    Gets the datetime of the nanoseconds since the epoch, in the given time zone (naive if None)
+    """
+    if nanoseconds == NAT:
+        return None
+    if tzinfo is None:
+        return NAIVE_EPOCH + timedelta(microseconds=nanoseconds // 1000)
+    return (EPOCH + timedelta(microseconds=nanoseconds // 1000)).astimezone(tzinfo)
+
+
+def is_missing(value):
+    """
+    Checks if a cell of a dataframe is missing (None, NaN, NaT or NA)
+    """
+    import pandas as pd
+
+    if isinstance(value, (list, dict, tuple)):
+        return False
+    return bool(pd.isna(value))
+
+
+def get_column(df, column):
+    """
+    Gets the values of a column, missing values being None
+    """
+    values = df[column].tolist()
+    missing = df[column].isna().to_numpy()
+    if missing.any():
+        return [None if value_missing else value for value, value_missing in zip(values, missing.tolist())]
+    return values
+
+
+def get_timestamps(sensor_df):
+    """
+    Gets the timestamps of the points as datetimes, in their original time zones
+    """
+    timestamps = sensor_df[xes_iot_constants.TAG_STREAM_TIMESTAMP]
+    if timestamps.dtype == object:
+        return get_column(sensor_df, xes_iot_constants.TAG_STREAM_TIMESTAMP)
+    nanoseconds = timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64).tolist()
+    return [from_nanoseconds(value, tzinfo) for value, tzinfo in zip(nanoseconds, get_column(sensor_df, TIMEZONE))]
+
+
+def to_iot_log(events_df, sensor_df, parameters=None):
+    """
+    Converts the event table and the sensor table (see to_dataframes) back into an IoT log.
+    The attributes of the events follow the order of the columns
+
+    Parameters
+    -------------
+    events_df
+        Dataframe with a row for each event
+    sensor_df
+        Dataframe with a row for each point
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CASE_ATTRIBUTE_PREFIX -> prefix of the trace attributes (default: case:)
+            Parameters.CASE_ID_KEY -> column of the case identifier (default: case:concept:name)
+
+    Returns
+    -------------
+    log
+        IOTEventLog
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_attribute_prefix = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters, constants.CASE_ATTRIBUTE_PREFIX)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+
+    header = events_df.attrs.get(LOG_HEADER)
+    log = copy.copy(header) if header is not None else IOTEventLog()
+    log._list = []
+
+    # items of the traces by position (the items contained directly in the log have trace index -1)
+    items = {-1: {}}
+    traces = {}
+
+    def get_trace(trace_index):
+        if trace_index not in traces:
+            traces[trace_index] = IOTTrace()
+            items[trace_index] = {}
+        return traces[trace_index]
+
+    for trace_index, attributes in events_df.attrs.get(TRACES_WITHOUT_EVENTS, {}).items():
+        get_trace(trace_index).attributes.update(copy.deepcopy(attributes))
+
+    for row in events_df.to_dict("records"):
+        trace_index = int(row.pop(TRACE_INDEX))
+        item_index = int(row.pop(ITEM_INDEX))
+        event = IOTEvent(attributes={})
+        trace = get_trace(trace_index) if trace_index != -1 else None
+        for key, value in row.items():
+            if is_missing(value):
+                continue
+            if key.startswith(case_attribute_prefix):
+                trace.attributes[key[len(case_attribute_prefix):]] = value
+            else:
+                event.attributes[key] = value
+        items[trace_index][item_index] = event
+
+    trace_indices = sensor_df[TRACE_INDEX].to_numpy()
+    item_indices = sensor_df[ITEM_INDEX].to_numpy()
+    stream_indices = sensor_df[STREAM_INDEX].to_numpy()
+    multipoint_indices = sensor_df[MULTIPOINT_INDEX].to_numpy()
+    is_point = sensor_df[IS_POINT].to_numpy()
+    case_ids = get_column(sensor_df, case_id_key)
+    paths = sensor_df[DATACONTEXT_PATH].tolist()
+    stream_columns = {column: get_column(sensor_df, column) for column in DATASTREAM_COLUMNS[1:] + MULTIPOINT_COLUMNS}
+    ids = get_column(sensor_df, xes_iot_constants.TAG_STREAM_ID)
+    timestamps = get_timestamps(sensor_df)
+    values = sensor_df[xes_iot_constants.TAG_STREAM_VALUE].tolist()
+    sources = get_column(sensor_df, xes_iot_constants.TAG_STREAM_SOURCE)
+    metas = get_column(sensor_df, xes_iot_constants.TAG_STREAM_META)
+
+    datacontexts = {}
+    # the rows of a datastream are consecutive
+    starts = np.flatnonzero(np.r_[True, stream_indices[1:] != stream_indices[:-1]]) if len(stream_indices) > 0 else []
+    ends = np.r_[starts[1:], len(stream_indices)] if len(stream_indices) > 0 else []
+    for start, end in zip(starts, ends):
+        trace_index, item_index, path = int(trace_indices[start]), int(item_indices[start]), paths[start]
+        if trace_index != -1 and trace_index not in traces:
+            get_trace(trace_index)
+            if case_ids[start] is not None and case_id_key.startswith(case_attribute_prefix):
+                traces[trace_index].attributes[case_id_key[len(case_attribute_prefix):]] = case_ids[start]
+
+        # the parent of the datacontexts and datastreams contained directly in the trace (or log) is not an event
+        parent = items[trace_index].get(item_index)
+        for depth, ordinal in enumerate(path):
+            if ordinal not in datacontexts:
+                datacontexts[ordinal] = DataContext()
+                if depth > 0:
+                    datacontexts[path[depth - 1]].append(datacontexts[ordinal])
+                elif parent is None:
+                    items[trace_index][item_index] = datacontexts[ordinal]
+                else:
+                    parent.append(datacontexts[ordinal])
+        if int(stream_indices[start]) in path:
+            # datacontext without points
+            continue
+
+        datastream = DataStream(name=stream_columns[DATASTREAM_NAME][start], id=stream_columns[DATASTREAM_ID][start],
+                                source=stream_columns[DATASTREAM_SOURCE][start])
+        datastream.stream_data_key = stream_columns[STREAM_DATA_KEY][start]
+        points = []
+        for i in range(start, end):
+            if multipoint_indices[i] != -1 and (i == start or multipoint_indices[i] != multipoint_indices[i - 1]):
+                points.append(MultiPoint(id=stream_columns[MULTIPOINT_ID][i], timestamp=stream_columns[MULTIPOINT_TIMESTAMP][i],
+                                         source=stream_columns[MULTIPOINT_SOURCE][i], meta=copy_nested(stream_columns[MULTIPOINT_META][i])))
+            if not is_point[i]:
+                continue
+            point = Point(id=ids[i], timestamp=timestamps[i], value=values[i], source=sources[i], meta=copy_nested(metas[i]))
+            if multipoint_indices[i] != -1:
+                points[-1].append(point)
+            else:
+                points.append(point)
+        datastream.extend(points)
+
+        if len(path) > 0:
+            datacontexts[path[-1]].append(datastream)
+        elif parent is None:
+            items[trace_index][item_index] = datastream
+        else:
+            parent.append(datastream)
+
+    # the positions of the traces and of the items contained directly in the log are both positions in the log
+    log_items = items[-1]
+    for trace_index, trace in traces.items():
+        for item_index in sorted(items[trace_index]):
+            trace.append(items[trace_index][item_index])
+        log_items[trace_index] = trace
+    for position in sorted(log_items):
+        log._list.append(log_items[position])
+
+    return log
@@ -1,8 +1,9 @@
 from enum import Enum
-from pm4py.objects.iot.exporter.xes.variants import line_by_line
+from pm4py.objects.iot.exporter.xes.variants import line_by_line, buffered
 
 class Variants(Enum):
     LINE_BY_LINE = line_by_line
+    BUFFERED = buffered
 
 
 DEFAULT_VARIANT = Variants.LINE_BY_LINE
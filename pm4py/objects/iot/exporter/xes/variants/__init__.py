@@ -1 +1 @@
-from pm4py.objects.iot.exporter.xes.variants import line_by_line
\ No newline at end of file
+from pm4py.objects.iot.exporter.xes.variants import line_by_line, buffered
\ No newline at end of file
@@ -0,0 +1,443 @@
+"""
+    Exports an IoT XES log rendering each item of the log (trace, or event directly contained in the log)
+    into a text buffer, which is encoded and written to the file in large blocks. The opening of the
+    attribute tags (indentation, type and key) is cached per attribute, so the values are the only parts
+    rendered for each line. The output is the same as the one of the line_by_line variant.
+
+    The items can also be rendered in a process pool (shards of consecutive items, written in their
+    original order), and the output can be compressed with gzip.
+"""
+import gzip, importlib.util, io
+from collections import deque
+from enum import Enum
+
+from pm4py.util import exec_utils, constants
+from pm4py.objects.log.util import xes as xes_util
+from pm4py.objects.iot.utils import verifier
+from pm4py.objects.iot.exceptions import UnsupportedTypeError
+from pm4py.objects.iot import constants as xes_iot_constants
+from pm4py.objects.iot.obj import IOTEventLog, IOTEvent, IOTTrace, DataStream, DataContext, Point, MultiPoint
+from pm4py.objects.iot.exporter.xes.variants.line_by_line import Exporter
+
+
+class Parameters(Enum):
+    SHOW_PROGRESS_BAR = "show_progress_bar"
+    APPLY_VERIFIER = "apply_verifier"
+    ENCODING = "encoding"
+    COMPRESS = "compress"
+    BLOCK_SIZE = "block_size"
+    MULTIPROCESSING = "multiprocessing"
+    CORES = "cores"
+
+
+# number of characters rendered before the buffer is written to the file
+DEFAULT_BLOCK_SIZE = 2 ** 20
+# number of shards of consecutive items rendered by each worker in the multiprocessing export
+SHARDS_PER_CORE = 4
+# bound of the cached attribute openings, keeping the memory bounded on logs with many distinct keys
+MAX_CACHED_OPENINGS = 2 ** 12
+
+POINT_OPENING = f'<list key="{xes_iot_constants.TAG_STREAM_POINT}">\n'
+MULTIPOINT_OPENING = f'<list key="{xes_iot_constants.TAG_STREAM_MULTIPOINT}">\n'
+DATASTREAM_OPENING = f'<list key="{xes_iot_constants.TAG_STREAM_DATASTREAM}">\n'
+DATACONTEXT_OPENING = f'<list key="{xes_iot_constants.TAG_STREAM_DATACONTEXT}">\n'
+LIST_CLOSING = '</list>\n'
+ATTRIBUTE_CLOSING = '" />\n'
+
+# (indent, key, type of the value) -> (XES type, opening of the attribute tag, formatter of the value)
+openings = {}
+indents = []
+
+
+def get_indent(indent):
+    while len(indents) <= indent:
+        indents.append("\t" * len(indents))
+    return indents[indent]
+
+
+def get_opening(indent, attr_name, value_type):
+    """
+        Gets the XES type of an attribute, the opening of its tag (up to the opening quote of the value,
+        or up to the end of the key for lists) and the function rendering its value (see Exporter.get_xes_attr_value)
+    """
+    key = (indent, attr_name, value_type)
+    opening = openings.get(key)
+    if opening is None:
+        if len(openings) >= MAX_CACHED_OPENINGS:
+            openings.clear()
+        attr_type = Exporter.get_xes_attr_type(attr_name, value_type.__name__)
+        if attr_type == xes_util.TAG_LIST:
+            opening = attr_type, get_indent(indent) + '<list key="' + attr_name + '"', None
+        else:
+            if attr_type == xes_util.TAG_DATE:
+                formatter = value_type.isoformat
+            elif attr_type == xes_util.TAG_BOOLEAN:
+                formatter = lambda value: str(value).lower()
+            else:
+                formatter = str
+            opening = attr_type, get_indent(indent) + '<' + attr_type + ' key="' + attr_name + '" value="', formatter
+        openings[key] = opening
+    return opening
+
+
+def render_attribute(w, attr_name, attr_value, indent):
+    """
+        Renders an attribute (see line_by_line.export_nested_attribute_lines), w being the write method of the buffer
+    """
+    if attr_name is None:
+        return
+
+    value_type = type(attr_value)
+    attr_type, opening, formatter = openings.get((indent, attr_name, value_type)) or get_opening(indent, attr_name, value_type)
+    if formatter is None:
+        if len(attr_value) == 0:
+            w(opening)
+            w(' />\n')
+        else:
+            w(opening)
+            w('>\n')
+            for item_dict in attr_value:
+                for subattr_name, subattr_value in item_dict.items():
+                    render_attribute(w, subattr_name, subattr_value, indent + 1)
+            w(get_indent(indent))
+            w(LIST_CLOSING)
+        return
+
+    w(opening)
+    if value_type is str:
+        w(attr_value)
+    elif attr_value is None:
+        w(xes_iot_constants.NOT_SPECIFIED)
+    else:
+        w(formatter(attr_value))
+    w(ATTRIBUTE_CLOSING)
+
+
+def render_item(w, item, indent):
+    renderer = RENDERERS.get(type(item))
+    if renderer is not None:
+        renderer(w, item, indent)
+    elif hasattr(Exporter, type(item).__name__):
+        # same name of a supported type, but a different type
+        raise UnsupportedTypeError(type(item))
+
+
+def render_trace(w, trace, indent):
+    w(get_indent(indent))
+    w('<trace>\n')
+    for attr_name, attr_val in trace.attributes.items():
+        render_attribute(w, attr_name, attr_val, indent + 1)
+    for item in trace:
+        render_item(w, item, indent + 1)
+    w(get_indent(indent))
+    w('</trace>\n')
+
+
+def render_event(w, event, indent):
+    w(get_indent(indent))
+    w('<event>\n')
+    for attr_name, attr_val in event.attributes.items():
+        render_attribute(w, attr_name, attr_val, indent + 1)
+    for item in event:
+        render_item(w, item, indent + 1)
+    w(get_indent(indent))
+    w('</event>\n')
+
+
+def render_point(w, point, indent):
+    w(get_indent(indent))
+    w(POINT_OPENING)
+    if point.id is not None:
+        render_attribute(w, xes_iot_constants.TAG_STREAM_ID, point.id, indent + 1)
+    if point.timestamp is not None:
+        render_attribute(w, xes_iot_constants.TAG_STREAM_TIMESTAMP, point.timestamp, indent + 1)
+    if point.value is not None:
+        render_attribute(w, xes_iot_constants.TAG_STREAM_VALUE, point.value, indent + 1)
+    if point.source is not None:
+        render_attribute(w, xes_iot_constants.TAG_STREAM_SOURCE, point.source, indent + 1)
+    if point.meta is not None:
+        render_attribute(w, xes_iot_constants.TAG_STREAM_META, point.meta, indent + 1)
+    w(get_indent(indent))
+    w(LIST_CLOSING)
+
+
+def render_multipoint(w, multipoint, indent):
+    w(get_indent(indent))
+    w(MULTIPOINT_OPENING)
+    if multipoint.id is not None:
+        render_attribute(w, xes_iot_constants.TAG_STREAM_ID, multipoint.id, indent + 1)
+    if multipoint.timestamp is not None:
+        render_attribute(w, xes_iot_constants.TAG_STREAM_TIMESTAMP, multipoint.timestamp, indent + 1)
+    if multipoint.source is not None:
+        render_attribute(w, xes_iot_constants.TAG_STREAM_SOURCE, multipoint.source, indent + 1)
+    if multipoint.meta is not None:
+        render_attribute(w, xes_iot_constants.TAG_STREAM_META, multipoint.meta, indent + 1)
+    for item in multipoint:
+        render_item(w, item, indent + 1)
+    w(get_indent(indent))
+    w(LIST_CLOSING)
+
+
+def render_datastream(w, datastream, indent):
+    if datastream.stream_data_key is not None:
+        w(get_indent(indent))
+        w('<string key="' + datastream.stream_data_key + '" value="' + xes_iot_constants.STREAM_DATA + ATTRIBUTE_CLOSING)
+    w(get_indent(indent))
+    w(DATASTREAM_OPENING)
+    # the values of these attributes are always written as strings
+    if datastream.name is not None:
+        w(get_indent(indent + 1))
+        w('<string key="' + xes_iot_constants.TAG_STREAM_NAME + '" value="' + datastream.name + ATTRIBUTE_CLOSING)
+    if datastream.id is not None:
+        w(get_indent(indent + 1))
+        w('<string key="' + xes_iot_constants.TAG_STREAM_ID + '" value="' + datastream.id + ATTRIBUTE_CLOSING)
+    if datastream.source is not None:
+        w(get_indent(indent + 1))
+        w('<string key="' + xes_iot_constants.TAG_STREAM_SOURCE + '" value="' + datastream.source + ATTRIBUTE_CLOSING)
+    # most datastreams contain only points, which are rendered without dispatching on their type
+    for item in datastream:
+        if type(item) is Point:
+            render_point(w, item, indent + 1)
+        else:
+            render_item(w, item, indent + 1)
+    w(get_indent(indent))
+    w(LIST_CLOSING)
+
+
+def render_datacontext(w, datacontext, indent):
+    w(get_indent(indent))
+    w(DATACONTEXT_OPENING)
+    for item in datacontext:
+        render_item(w, item, indent + 1)
+    w(get_indent(indent))
+    w(LIST_CLOSING)
+
+
+RENDERERS = {
+    IOTTrace: render_trace,
+    IOTEvent: render_event,
+    Point: render_point,
+    MultiPoint: render_multipoint,
+    DataStream: render_datastream,
+    DataContext: render_datacontext,
+}
+
+
+def render_log_opening(w, log, encoding):
+    """
+        Renders the XML declaration and the log up to its first item
+    """
+    if type(log) != IOTEventLog:
+        raise UnsupportedTypeError(type(log))
+
+    w(f'<?xml version="1.0" encoding="{encoding}"?>\n')
+    w(f'<log {xes_util.TAG_VERSION}="{log.version}" {xes_util.TAG_FEATURES}="{log.features}" {xes_util.TAG_XMLNS}="{xes_util.VALUE_XMLNS}">\n')
+    for ext in log.extensions.values():
+        w(f'\t<extension name="{ext.name}" prefix="{ext.prefix}" uri="{ext.uri}" />\n')
+    for class_name, class_val in log.classifiers.items():
+        w(f'\t<classifier name="{class_name}" keys="{" ".join(class_val)}" />\n')
+    for attr_name, attr_val in log.attributes.items():
+        render_attribute(w, attr_name, attr_val, 1)
+    for scope in log.omni_present:
+        w(f'\t<global scope="{scope}">\n')
+        for attr_name, attr_val in log.omni_present[scope].items():
+            render_attribute(w, attr_name, attr_val, 2)
+        w('\t</global>\n')
+
+
+def render_items(items, encoding, compress):
+    """
+        Renders a shard of items of the log (executed in the worker processes)
+
+        Returns
+        ------------
+        content
+            Encoded items (gzip compressed, if required)
+    """
+    buffer = io.StringIO()
+    w = buffer.write
+    for item in items:
+        render_item(w, item, 1)
+    content = buffer.getvalue().encode(encoding)
+    if compress:
+        content = gzip.compress(content)
+    return content
+
+
+def get_shards(log, num_shards):
+    """
+        Partitions the items of the log in (at most) the given number of shards of consecutive items,
+        having approximately the same number of items
+
+        Returns
+        ------------
+        shards
+            List of (start, end) item indices
+    """
+    shard_size = max(1, -(-len(log) // max(1, num_shards)))
+    return [(start, min(start + shard_size, len(log))) for start in range(0, len(log), shard_size)]
+
+
+def export_log(log, fp_obj, encoding, parameters=None):
+    """
+        Exports the log to a file object, rendering its items into a buffer written every BLOCK_SIZE characters
+    """
+    if parameters is None:
+        parameters = {}
+
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR)
+    block_size = exec_utils.get_param_value(Parameters.BLOCK_SIZE, parameters, DEFAULT_BLOCK_SIZE)
+
+    progress = None
+    if importlib.util.find_spec("tqdm") and show_progress_bar:
+        from tqdm.auto import tqdm
+        progress = tqdm(total=len(log), desc="exporting log, completed :: ")
+
+    buffer = io.StringIO()
+    w = buffer.write
+    render_log_opening(w, log, encoding)
+    for item in log:
+        render_item(w, item, 1)
+        if buffer.tell() >= block_size:
+            fp_obj.write(buffer.getvalue().encode(encoding))
+            buffer = io.StringIO()
+            w = buffer.write
+        if progress is not None:
+            progress.update()
+    w('</log>\n')
+    fp_obj.write(buffer.getvalue().encode(encoding))
+
+    # gracefully close progress bar
+    if progress is not None:
+        progress.close()
+    del progress
+
+
+def export_with_multiprocessing(log, fp_obj, encoding, compress, parameters=None):
+    """
+        Exports the log to a file object, rendering shards of consecutive items in a process pool.
+        The shards are written in their original order between the opening and the closing of the log,
+        so the content is the same obtained by the sequential export. When compressing, the workers
+        compress their shards, which are written as the members of a multi-member gzip file
+
+        Parameters
+        ------------
+        log
+            IoT event log
+        fp_obj
+            Binary file object (written as it is, also when compressing)
+        encoding
+            Encoding
+        compress
+            Compresses the content with gzip
+        parameters
+            Parameters, including:
+                Parameters.CORES -> number of worker processes
+    """
+    if parameters is None:
+        parameters = {}
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, max(1, multiprocessing.cpu_count() - 2))
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR)
+
+    def write(content):
+        fp_obj.write(gzip.compress(content) if compress else content)
+
+    buffer = io.StringIO()
+    render_log_opening(buffer.write, log, encoding)
+    write(buffer.getvalue().encode(encoding))
+
+    shards = get_shards(log, num_cores * SHARDS_PER_CORE)
+
+    progress = None
+    if importlib.util.find_spec("tqdm") and show_progress_bar:
+        from tqdm.auto import tqdm
+        progress = tqdm(total=len(log), desc="exporting log, completed :: ")
+
+    with ProcessPoolExecutor(max_workers=num_cores) as executor:
+        # the shards are submitted in a bounded window, so only a few rendered shards are kept in memory
+        futures = deque()
+        for start, end in shards:
+            futures.append((end - start, executor.submit(render_items, [log[i] for i in range(start, end)], encoding, compress)))
+            if len(futures) >= 2 * num_cores:
+                num_items, future = futures.popleft()
+                fp_obj.write(future.result())
+                if progress is not None:
+                    progress.update(num_items)
+
+        while futures:
+            num_items, future = futures.popleft()
+            fp_obj.write(future.result())
+            if progress is not None:
+                progress.update(num_items)
+
+    write('</log>\n'.encode(encoding))
+
+    # gracefully close progress bar
+    if progress is not None:
+        progress.close()
+    del progress, futures
+
+
+def apply(log, filename, parameters=None):
+    """
+        Exports the log to a file (see line_by_line.apply)
+
+        Parameters
+        ------------
+        log
+            IoT event log
+        filename
+            Path of the exported file
+        parameters
+            Parameters, including:
+                Parameters.ENCODING -> encoding of the file
+                Parameters.APPLY_VERIFIER -> verifies the log before exporting it
+                Parameters.COMPRESS -> compresses the file with gzip (default: if the path ends with .gz)
+                Parameters.BLOCK_SIZE -> number of characters rendered before each write (default: 2 ** 20)
+                Parameters.MULTIPROCESSING -> renders the items in a process pool (default: False)
+                Parameters.CORES -> number of worker processes
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    apply_verifier = exec_utils.get_param_value(Parameters.APPLY_VERIFIER, parameters, xes_iot_constants.DEFAULT_VERIFIER)
+    compress = exec_utils.get_param_value(Parameters.COMPRESS, parameters, filename.lower().endswith(".gz"))
+
+    if apply_verifier:
+        verifier.verify(log)
+
+    if exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT):
+        # the workers compress their shards
+        with open(filename, "wb") as f:
+            export_with_multiprocessing(log, f, encoding, compress, parameters=parameters)
+    else:
+        with gzip.open(filename, "wb") if compress else open(filename, "wb") as f:
+            export_log(log, f, encoding, parameters=parameters)
+
+
+def export_log_as_string(log, parameters=None):
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    apply_verifier = exec_utils.get_param_value(Parameters.APPLY_VERIFIER, parameters, xes_iot_constants.DEFAULT_VERIFIER)
+    compress = exec_utils.get_param_value(Parameters.COMPRESS, parameters, False)
+
+    if apply_verifier:
+        verifier.verify(log)
+
+    b = io.BytesIO()
+    if exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT):
+        export_with_multiprocessing(log, b, encoding, compress, parameters=parameters)
+    elif compress:
+        with gzip.GzipFile(fileobj=b, mode="wb") as f:
+            export_log(log, f, encoding, parameters=parameters)
+    else:
+        export_log(log, b, encoding, parameters=parameters)
+
+    return b.getvalue()
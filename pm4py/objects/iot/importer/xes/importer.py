@@ -1,10 +1,11 @@
 from enum import Enum
 
-from pm4py.objects.iot.importer.xes.variants import xmlxes20
+from pm4py.objects.iot.importer.xes.variants import xmlxes20, chunk_regex
 from pm4py.objects.log.importer.xes.variants import iterparse
 
 class Variants(Enum):
     XMLXES20=xmlxes20
+    CHUNK_REGEX=chunk_regex
 
 def apply(path, parameters=None, variant=Variants.XMLXES20):
     if parameters == None:
@@ -13,3 +14,39 @@ def apply(path, parameters=None, variant=Variants.XMLXES20):
     log = variant.value.apply(path, parameters=parameters)
 
     return log
+
+
+def iter_traces(path, parameters=None, variant=Variants.XMLXES20):
+    """
+    Iterates over the traces of an IoT XES log without building the whole IOTEventLog
+
+    Parameters
+    -----------
+    path
+        Log path
+    parameters
+        Parameters of the variant, including
+            Parameters.APPLY_VERIFIER -> verifies the header, then each trace when it is parsed (default: True)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+    variant
+        Variant of the importer
+
+    Returns
+    -----------
+    trace_iterator
+        Generator of IOTTrace objects (and of the IOTEvent objects directly contained in the log)
+    """
+    if parameters == None:
+        parameters = {}
+
+    return variant.value.iter_traces(path, parameters=parameters)
+
+
+def get_log_header(path, parameters=None, variant=Variants.XMLXES20):
+    """
+    Gets the header of an IoT XES log (attributes, extensions and globals), as an IOTEventLog without traces
+    """
+    if parameters == None:
+        parameters = {}
+
+    return variant.value.get_log_header(path, parameters=parameters)
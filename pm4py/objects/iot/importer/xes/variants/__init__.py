@@ -1 +1 @@
-from pm4py.objects.iot.importer.xes.variants import xmlxes20
\ No newline at end of file
+from pm4py.objects.iot.importer.xes.variants import xmlxes20, chunk_regex
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""
+    Imports an IoT XES log reading the file in large byte chunks instead of line by line.
+    The tags of a chunk are tokenized at once by a precompiled regex (a '<' cannot occur inside
+    attribute values, so a chunk is only cut before its last '<'), then each tag is split in the
+    same content as the xmlxes20 variant and processed by its state machine. Hence tags do not need
+    to be on separate lines, and the resulting log is the same as the one of the xmlxes20 variant.
+
+    The tags of a datastream are dispatched directly to process_datastream, and its points are
+    collected and added to the datastream in bulk.
+"""
+import os, gzip, sys, re, codecs
+
+from enum import Enum
+from pm4py.util import constants, xes_constants, exec_utils
+from pm4py.objects.iot.utils import verifier
+from pm4py.objects.iot import constants as xes_iot_constants
+from pm4py.objects.iot.obj import IOTEventLog
+from pm4py.objects.iot.exceptions import AttributeShouldNotBeNoneError, UnexpectedMultipleLogError
+from pm4py.objects.iot.importer.xes.variants.xmlxes20 import State, StateProcess, process_log, process_datastream, process_point, set_log_level_attributes, read_attribute_key_value, verify_items
+
+
+# tag including the closing '>' (the last one before the next '<', since '>' is allowed in values)
+TAG = re.compile(r'<([^<]*>)')
+DEFAULT_CHUNK_SIZE = 2 ** 22
+# bound of the parsed dates cache, keeping the memory bounded on large logs
+MAX_CACHED_DATES = 2 ** 16
+# keys of the attributes of a point, set without going through process_point
+POINT_ATTRIBUTES = {
+    xes_iot_constants.TAG_STREAM_ID: 'id',
+    xes_iot_constants.TAG_STREAM_TIMESTAMP: 'timestamp',
+    xes_iot_constants.TAG_STREAM_VALUE: 'value',
+    xes_iot_constants.TAG_STREAM_SOURCE: 'source',
+    xes_iot_constants.TAG_STREAM_META: 'meta',
+}
+
+
+class Parameters(Enum):
+    ENCODING = "encoding"
+    APPLY_VERIFIER = "apply_verifier"
+    VERIFIER_SAMPLE_FRACTION = "verifier_sample_fraction"
+    COLUMNAR_DATASTREAMS = "columnar_datastreams"
+    CHUNK_SIZE = "chunk_size"
+
+
+def apply(filename, parameters=None):
+    return import_log(filename, parameters)
+
+
+def import_log(filename, parameters=None):
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    apply_verifier = exec_utils.get_param_value(Parameters.APPLY_VERIFIER, parameters, xes_iot_constants.DEFAULT_VERIFIER)
+
+    is_compressed = filename.endswith(".gz")
+    file_size = os.stat(filename).st_size
+
+    if is_compressed:
+        f = gzip.open(filename, mode="rb")
+    else:
+        f = open(filename, "rb")
+
+    log = import_log_from_file_object(f, encoding, file_size=file_size, parameters=parameters)
+    f.close()
+
+    if apply_verifier:
+        # the content of a sample of the traces is verified, if requested
+        sample_fraction = exec_utils.get_param_value(Parameters.VERIFIER_SAMPLE_FRACTION, parameters, 1.0)
+        verifier.verify(log, parameters={verifier.Parameters.SAMPLE_FRACTION: sample_fraction})
+
+    return log
+
+
+def read_tags(f, encoding, chunk_size):
+    """
+        Yields the tags of the file (without the opening '<'), reading it in chunks of chunk_size bytes
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    # text after the last '<' read so far, kept in pieces until the tag is complete
+    pending = []
+    while True:
+        chunk = f.read(chunk_size)
+        text = decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            pending.append(text)
+            yield from TAG.findall(''.join(pending))
+            return
+        cut = text.rfind('<')
+        if cut == -1:
+            pending.append(text)
+            continue
+        pending.append(text[:cut])
+        yield from TAG.findall(''.join(pending))
+        pending = [text[cut:]]
+
+
+def read_value(tag, content, dates):
+    """
+        Reads the value of an attribute as read_attribute_key_value, parsing each distinct date once
+    """
+    if tag.startswith(xes_constants.TAG_DATE) and content[3] != xes_iot_constants.NOT_SPECIFIED:
+        value = dates.get(content[3])
+        if value is None:
+            if len(dates) >= MAX_CACHED_DATES:
+                dates.clear()
+            value = State.date_parser.apply(content[3])
+            dates[content[3]] = value
+        return value
+    return read_attribute_key_value(tag, content)[1]
+
+
+def is_datastream_completed(tag, st):
+    return st.multipoint is None and st.point is None and tag[0] == '/' and tag[1:].startswith(xes_constants.TAG_LIST)
+
+
+def flush_points(points, st):
+    if len(points) > 0:
+        st.datastream.extend(points)
+        points.clear()
+
+
+def iter_log_items(f, encoding, st, chunk_size=DEFAULT_CHUNK_SIZE, header_only=False):
+    """
+        Parses the log, yielding its traces (and the events directly contained in the log) as soon as
+        they are completed (see xmlxes20.iter_log_items)
+    """
+    f.seek(0)
+
+    # completed points of the current datastream, not yet added to it
+    points = []
+    # parsed dates (the points of a datastream often share their timestamps)
+    dates = {}
+    is_log_processed = False
+    for tag_count, tag in enumerate(read_tags(f, encoding, chunk_size)):
+        content = tag.split("\"")
+        if st.debug:
+            print(tag_count + 1, ' --> ', len(content), content)
+
+        if is_log_processed:
+            raise UnexpectedMultipleLogError()
+
+        # extension and global tags are processed at the log level, wherever they are
+        if st.datastream is not None and not tag.startswith((xes_constants.TAG_EXTENSION, xes_constants.TAG_GLOBAL)):
+            if st.point is not None and st.multipoint is None:
+                # the attributes and the end of the point are handled here, the nested meta/source by process_point
+                if st.point_meta is None and st.point_source is None:
+                    if len(content) == 5 and content[1] in POINT_ATTRIBUTES:
+                        setattr(st.point, POINT_ATTRIBUTES[content[1]], read_value(tag, content, dates))
+                        continue
+                    if tag[0] == '/' and tag[1:].startswith(xes_constants.TAG_LIST):
+                        points.append(st.point)
+                        st.point = None
+                        continue
+                if process_point(tag, content, st) == StateProcess.POINT_COMPLETED:
+                    points.append(st.point)
+                    st.point = None
+                continue
+            if not is_datastream_completed(tag, st):
+                if len(content) != 3 or content[1] != xes_iot_constants.TAG_STREAM_POINT or content[2].lstrip().startswith('/>'):
+                    flush_points(points, st)
+                process_datastream(tag, content, st)
+                continue
+        flush_points(points, st)
+
+        if st.log is not None:
+            if process_log(tag, content, st) == StateProcess.LOG_COMPLETED:
+                is_log_processed = True
+            if len(st.log._list) > 0:
+                yield st.log._list.pop()
+            if header_only and (st.trace is not None or st.event is not None):
+                return
+        elif tag.startswith(xes_constants.TAG_LOG):
+            st.log = IOTEventLog()
+            set_log_level_attributes(st.log, content)
+            if st.debug:
+                print('START_LOG')
+
+    if st.log is None:
+        raise AttributeShouldNotBeNoneError('st.log')
+
+
+def import_log_from_file_object(f, encoding, file_size=sys.maxsize, parameters=None):
+    if parameters is None:
+        parameters = {}
+
+    chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, DEFAULT_CHUNK_SIZE)
+
+    st = State()
+    st.columnar_datastreams = exec_utils.get_param_value(Parameters.COLUMNAR_DATASTREAMS, parameters, False)
+    items = list(iter_log_items(f, encoding, st, chunk_size=chunk_size))
+    st.log._list.extend(items)
+
+    return st.log
+
+
+def iter_traces(filename, parameters=None):
+    """
+        Iterates over the traces of the log (and the events directly contained in the log), yielding each
+        one as soon as it is parsed (see xmlxes20.iter_traces)
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    apply_verifier = exec_utils.get_param_value(Parameters.APPLY_VERIFIER, parameters, xes_iot_constants.DEFAULT_VERIFIER)
+    chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, DEFAULT_CHUNK_SIZE)
+
+    st = State()
+    st.columnar_datastreams = exec_utils.get_param_value(Parameters.COLUMNAR_DATASTREAMS, parameters, False)
+    with gzip.open(filename, mode="rb") if filename.endswith(".gz") else open(filename, "rb") as f:
+        yield from verify_items(iter_log_items(f, encoding, st, chunk_size=chunk_size), st, apply_verifier)
+
+
+def get_log_header(filename, parameters=None):
+    """
+        Gets the log without its items: the attributes, extensions and globals preceding the first item
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, DEFAULT_CHUNK_SIZE)
+
+    st = State()
+    with gzip.open(filename, mode="rb") if filename.endswith(".gz") else open(filename, "rb") as f:
+        for item in iter_log_items(f, encoding, st, chunk_size=chunk_size, header_only=True):
+            pass
+
+    return st.log
@@ -1,4 +1,6 @@
-import os, gzip, sys, json
+import os, gzip, sys, json, pickle
+from collections import deque
+from io import BytesIO
 
 from enum import Enum
 from pm4py.util import constants, xes_constants, exec_utils
@@ -24,6 +26,19 @@ class StateProcess(Enum):
 class Parameters(Enum):
     ENCODING = "encoding"
     APPLY_VERIFIER = "apply_verifier"
+    VERIFIER_SAMPLE_FRACTION = "verifier_sample_fraction"
+    COLUMNAR_DATASTREAMS = "columnar_datastreams"
+    MULTIPROCESSING = "multiprocessing"
+    CORES = "cores"
+
+
+# minimum size of the byte range of traces handed to a single worker in the multiprocessing import
+MIN_CHUNK_SIZE = 1048576
+# number of byte ranges per worker (smaller ranges balance the load among the workers)
+CHUNKS_PER_CORE = 4
+# opening of a trace, which can not occur inside attribute values ('<' is escaped there)
+TRACE_START = b'<' + xes_constants.TAG_TRACE.encode()
+TRACE_START_FOLLOWERS = (b'>', b'/', b' ', b'\t', b'\r', b'\n')
 
 
 # Attributes for different states during Parser execution
@@ -41,6 +56,7 @@ class State:
         self.point_meta = None # for nested meta attribute 
         self.point_source = None # for nested source attribute
         self.stream_data_key = None
+        self.columnar_datastreams = False
         self.nested_key = []
         self.nested_datacontext = []
         self.line_count = 0
@@ -64,6 +80,10 @@ def import_log(filename, parameters=None):
     encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
     apply_verifier = exec_utils.get_param_value(Parameters.APPLY_VERIFIER, parameters, xes_iot_constants.DEFAULT_VERIFIER)
 
+    if exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT):
+        # the items are verified by the workers
+        return import_with_multiprocessing(filename, parameters=parameters)
+
     is_compressed = filename.endswith(".gz")
     file_size = os.stat(filename).st_size
 
@@ -76,11 +96,241 @@ def import_log(filename, parameters=None):
     f.close()
 
     if apply_verifier:
-        verifier.verify(log)
+        # the content of a sample of the traces is verified, if requested
+        sample_fraction = exec_utils.get_param_value(Parameters.VERIFIER_SAMPLE_FRACTION, parameters, 1.0)
+        verifier.verify(log, parameters={verifier.Parameters.SAMPLE_FRACTION: sample_fraction})
 
     return log
 
 
+def import_with_multiprocessing(filename, parameters=None):
+    """
+        Imports the log splitting the file at the lines opening a trace, near evenly spaced offsets.
+        The header of the log is parsed here, the ranges of traces in a process pool, each worker
+        running its own State machine (and the verifier on its items). The items are appended to the
+        log in the order of the file, and the mismatches counted by the workers are summed up in MisMatchCounter.
+        Compressed files are decompressed here, and their chunks of traces are sent to the workers.
+        The ranges are submitted in a bounded window (consumed in order), so only a few chunks and parsed ranges
+        are kept in memory
+    """
+    if parameters is None:
+        parameters = {}
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, max(1, multiprocessing.cpu_count() - 2))
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    apply_verifier = exec_utils.get_param_value(Parameters.APPLY_VERIFIER, parameters, xes_iot_constants.DEFAULT_VERIFIER)
+
+    file_size = os.stat(filename).st_size
+    chunk_size = max(MIN_CHUNK_SIZE, file_size // (num_cores * CHUNKS_PER_CORE) + 1)
+
+    is_compressed = filename.endswith(".gz")
+
+    with ProcessPoolExecutor(max_workers=num_cores) as executor, \
+            (gzip.open(filename, mode="rb") if is_compressed else open(filename, "rb")) as f:
+        if is_compressed:
+            chunks = iter_trace_chunks(f, chunk_size)
+            header = next(chunks)
+            tasks = ((parse_items, content, encoding, parameters) for content in chunks)
+        else:
+            boundaries = get_trace_boundaries(f, file_size, chunk_size)
+            f.seek(0)
+            header = f.read(boundaries[0] if len(boundaries) > 0 else file_size)
+            boundaries.append(file_size)
+            tasks = ((parse_file_range, filename, boundaries[i], boundaries[i + 1], encoding, parameters)
+                     for i in range(len(boundaries) - 1))
+
+        st = State()
+        st.columnar_datastreams = exec_utils.get_param_value(Parameters.COLUMNAR_DATASTREAMS, parameters, False)
+        # items directly contained in the log before its first trace
+        items = list(iter_log_items(BytesIO(header), encoding, st))
+        log = st.log
+        if apply_verifier:
+            verifier.verify_header(log)
+            for item in items:
+                verifier.verify(item)
+        log._list.extend(items)
+
+        mismatches = 0
+        futures = deque()
+        for task in tasks:
+            futures.append(executor.submit(*task))
+            if len(futures) >= 2 * num_cores:
+                mismatches += append_parsed_items(log, futures.popleft().result())
+
+        while futures:
+            mismatches += append_parsed_items(log, futures.popleft().result())
+
+    if apply_verifier:
+        verifier.MisMatchCounter.POINT_NONE_VALUE += mismatches
+        if len(log) == 0:
+            verifier.verify(log)
+
+    return log
+
+
+def append_parsed_items(log, result):
+    """
+        Appends to the log the items of a range parsed by a worker, merging the header of its log shell,
+        and returns the number of points without value counted by the worker
+    """
+    items, point_none_values, shell = pickle.loads(result)
+    log._list.extend(items)
+    merge_log_header(log, shell)
+    return point_none_values
+
+
+def get_trace_boundaries(f, file_size, chunk_size):
+    """
+        Gets the offsets of the lines opening a trace: the first one, then the first one after every chunk_size bytes
+    """
+    boundaries = []
+    for offset in range(0, file_size, chunk_size):
+        start = find_trace_line(f, offset)
+        if start is None:
+            break
+        if len(boundaries) == 0 or start > boundaries[-1]:
+            boundaries.append(start)
+    return boundaries
+
+
+def find_trace_line(f, offset):
+    """
+        Gets the offset of the first line opening a trace, starting after the line containing the given offset
+        (from the beginning of the file for offset 0), or None if there are not any
+    """
+    f.seek(offset)
+    if offset > 0:
+        offset += len(f.readline())
+    for line in iter(f.readline, b''):
+        if is_trace_line(line):
+            return offset
+        offset += len(line)
+    return None
+
+
+def is_trace_line(line):
+    line = line.lstrip()
+    return line.startswith(TRACE_START) and line[len(TRACE_START):len(TRACE_START) + 1] in TRACE_START_FOLLOWERS
+
+
+def iter_trace_chunks(f, chunk_size):
+    """
+        Yields the content of the file preceding the first trace, then chunks of (at least chunk_size bytes of)
+        lines, each one starting with a line opening a trace
+    """
+    lines = []
+    size = 0
+    is_header = True
+    for line in f:
+        if is_trace_line(line) and (is_header or size >= chunk_size):
+            yield b''.join(lines)
+            lines = []
+            size = 0
+            is_header = False
+        lines.append(line)
+        size += len(line)
+    if is_header:
+        yield b''.join(lines)
+    elif len(lines) > 0:
+        yield b''.join(lines)
+
+
+def parse_file_range(filename, start, end, encoding, parameters):
+    with open(filename, "rb") as f:
+        f.seek(start)
+        content = f.read(end - start)
+    return parse_items(content, encoding, parameters)
+
+
+def parse_items(content, encoding, parameters):
+    """
+        Parses the items of a range of traces (run by the workers of the multiprocessing import).
+        Returns the pickle of the items, of the count of points without value (if verified),
+        and of the log attributes, extensions and globals found in the range
+    """
+    apply_verifier = exec_utils.get_param_value(Parameters.APPLY_VERIFIER, parameters, xes_iot_constants.DEFAULT_VERIFIER)
+
+    st = State()
+    st.columnar_datastreams = exec_utils.get_param_value(Parameters.COLUMNAR_DATASTREAMS, parameters, False)
+    st.log = IOTEventLog()
+    items = list(iter_log_items(BytesIO(content), encoding, st))
+
+    point_none_values = 0
+    if apply_verifier:
+        verifier.MisMatchCounter.reset()
+        for item in items:
+            verifier.verify(item)
+        point_none_values = verifier.MisMatchCounter.POINT_NONE_VALUE
+
+    return pickle.dumps((items, point_none_values, st.log), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def merge_log_header(log, shell):
+    """
+        Adds to the log the attributes, extensions and globals parsed after its first trace
+    """
+    log.attributes.update(shell.attributes)
+    log.extensions.update(shell.extensions)
+    for scope, attributes in shell.omni_present.items():
+        for key, value in attributes.items():
+            log.set_global_attribute(scope, key, value)
+
+
+def iter_traces(filename, parameters=None):
+    """
+        Iterates over the traces of the log (and the events directly contained in the log), yielding each
+        one as soon as it is parsed. Only the item being parsed and the log header are kept in memory.
+        The verifier (if applied) checks the header before the first item, then each item on its own
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    apply_verifier = exec_utils.get_param_value(Parameters.APPLY_VERIFIER, parameters, xes_iot_constants.DEFAULT_VERIFIER)
+
+    st = State()
+    st.columnar_datastreams = exec_utils.get_param_value(Parameters.COLUMNAR_DATASTREAMS, parameters, False)
+    with gzip.open(filename, mode="rb") if filename.endswith(".gz") else open(filename, "rb") as f:
+        yield from verify_items(iter_log_items(f, encoding, st), st, apply_verifier)
+
+
+def verify_items(items, st, apply_verifier):
+    """
+        Verifies the header of the log (st.log) and each of the items while they are yielded
+    """
+    count = 0
+    for item in items:
+        if apply_verifier:
+            if count == 0:
+                verifier.verify_header(st.log)
+            verifier.verify(item)
+        count += 1
+        yield item
+    if apply_verifier and count == 0:
+        # the log should not be empty
+        verifier.verify(st.log)
+
+
+def get_log_header(filename, parameters=None):
+    """
+        Gets the log without its items: the attributes, extensions and globals preceding the first item
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+
+    st = State()
+    with gzip.open(filename, mode="rb") if filename.endswith(".gz") else open(filename, "rb") as f:
+        for item in iter_log_items(f, encoding, st, header_only=True):
+            pass
+
+    return st.log
+
+
 def inject_attribute(nested_attr, key, value):
     if isinstance(nested_attr, list):
         nested_attr.append({key:value})
@@ -276,6 +526,17 @@ def process_datastream(tag, content, st):
         raise UnexpectedStateError(process_datastream, st)
 
 
+def complete_datastream(st):
+    """
+        Returns the completed datastream, stored in columns if requested and if it contains only points
+    """
+    datastream = st.datastream
+    st.datastream = None
+    if st.columnar_datastreams and all(type(item) == Point for item in datastream):
+        datastream.to_columnar()
+    return datastream
+
+
 def process_event(tag, content, st):
     """
         Returns:
@@ -286,8 +547,7 @@ def process_event(tag, content, st):
     
     if st.datastream is not None:
         if process_datastream(tag, content, st) == StateProcess.DATASTREAM_COMPLETED:
-            st.event.append(st.datastream)
-            st.datastream = None
+            st.event.append(complete_datastream(st))
     elif len(content) == 3 and content[1] == xes_iot_constants.TAG_STREAM_DATASTREAM:
         if st.debug:
             print('START_DATASTREAM')
@@ -332,8 +592,7 @@ def process_datacontext(tag, content, st):
     
     if st.datastream is not None:
         if process_datastream(tag, content, st) == StateProcess.DATASTREAM_COMPLETED:
-            st.nested_datacontext[-1].append(st.datastream)
-            st.datastream = None
+            st.nested_datacontext[-1].append(complete_datastream(st))
     elif len(content) == 3 and tag.startswith(xes_constants.TAG_LIST) and content[1] == xes_iot_constants.TAG_STREAM_DATASTREAM:
         if st.datastream is not None:
             raise AttributeShouldBeNoneError('st.datastream', st.datastream)
@@ -372,8 +631,7 @@ def process_trace(tag, content, st):
             st.event = None
     elif st.datastream is not None:
         if process_datastream(tag, content, st) == StateProcess.DATASTREAM_COMPLETED:
-            st.trace.append(st.datastream)
-            st.datastream = None
+            st.trace.append(complete_datastream(st))
     elif tag.startswith(xes_constants.TAG_EVENT):
         if st.debug:
             print('START_EVENT')
@@ -473,11 +731,12 @@ def process_log(tag, content, st):
         raise UnexpectedStateError(process_log, st)
 
 
-def import_log_from_file_object(f, encoding, file_size=sys.maxsize, parameters=None):
-    if parameters is None:
-        parameters = {}
-
-    st = State()
+def iter_log_items(f, encoding, st, header_only=False):
+    """
+        Parses the log, yielding its traces (and the events directly contained in the log) as soon as
+        they are completed. The items are not kept in st.log, which holds only the attributes,
+        extensions and globals of the log. With header_only, stops at the start of the first item
+    """
     f.seek(0)
 
     is_log_processed = False
@@ -496,6 +755,10 @@ def import_log_from_file_object(f, encoding, file_size=sys.maxsize, parameters=N
         if st.log is not None:
             if process_log(tag, content, st) == StateProcess.LOG_COMPLETED:
                 is_log_processed = True
+            if len(st.log._list) > 0:
+                yield st.log._list.pop()
+            if header_only and (st.trace is not None or st.event is not None):
+                return
         elif tag.startswith(xes_constants.TAG_LOG):
             #parse log attrs here
             st.log = IOTEventLog()
@@ -506,6 +769,16 @@ def import_log_from_file_object(f, encoding, file_size=sys.maxsize, parameters=N
     if st.log is None:
         raise AttributeShouldNotBeNoneError('st.log')
 
+
+def import_log_from_file_object(f, encoding, file_size=sys.maxsize, parameters=None):
+    if parameters is None:
+        parameters = {}
+
+    st = State()
+    st.columnar_datastreams = exec_utils.get_param_value(Parameters.COLUMNAR_DATASTREAMS, parameters, False)
+    items = list(iter_log_items(f, encoding, st))
+    st.log._list.extend(items)
+
     return st.log
 
 
@@ -545,7 +818,11 @@ def parse_extension(content):
             prefix = content[i + 1]
         if content[i].endswith('uri='):
             uri = content[i + 1]
-    return XESExtension(name, prefix, uri)
+    try:
+        # extensions are the members of the XESExtension enum, looked up by value
+        return XESExtension((name, prefix, uri))
+    except ValueError:
+        raise InvalidAttributeError('extension', name, uri)
 
 
 def read_attribute_key_value(tag, content):
@@ -0,0 +1,426 @@
+"""
+    As-of and window joins between the events of an IoT log and its sensor readings.
+
+    The readings are flattened once into a SensorTable and sorted by (trace, sensor id, timestamp), so
+    that the readings of a sensor in a trace are a contiguous slice of sorted timestamps. Then the queries
+    of all the events are answered by binary search (numpy.searchsorted) instead of scanning the points:
+        - as-of: the value of the last reading of the sensor at or before the timestamp of the event
+        - window: the readings of the sensor between the start and the completion of the activity,
+          aggregated (count, first, last, min, max, mean) with numpy reduceat over the slices
+    The results are attached to the events as attributes.
+"""
+from collections import deque
+from datetime import datetime, timedelta
+from enum import Enum
+
+import numpy as np
+
+from pm4py.util import constants, xes_constants, exec_utils
+from pm4py.objects.iot.columnar import NAT, to_microseconds
+from pm4py.objects.iot.obj import IOTTrace, IOTEvent
+from pm4py.objects.iot.query import SensorTable
+
+
+AGGREGATIONS = ["count", "first", "last", "min", "max", "mean"]
+DEFAULT_WINDOW_AGGREGATIONS = ["min", "max", "mean", "last"]
+DEFAULT_ATTRIBUTE_PREFIX = "sensor:"
+
+
+class Parameters(Enum):
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    START_TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_START_TIMESTAMP_KEY
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TRANSITION_KEY = constants.PARAMETER_CONSTANT_TRANSITION_KEY
+    SENSOR_IDS = "sensor_ids"
+    BY_CASE = "by_case"
+    TOLERANCE = "tolerance"
+    AGGREGATIONS = "aggregations"
+    ATTRIBUTE_PREFIX = "attribute_prefix"
+    SENSOR_INDEX = "sensor_index"
+
+
+class SensorIndex:
+    """
+    Readings of an IoT object sorted by (group, sensor id, timestamp), the group of a reading being the
+    position of its trace (by case) or the whole object. The readings without a datetime timestamp are
+    not indexed. The index can be built once and reused across queries
+
+    Columns
+    -------------
+    timestamps
+        Nanoseconds since the epoch, sorted within each (group, sensor id) slice
+    values
+        Values of the readings (objects)
+    numeric_values
+        Values as floats (NaN for non-numeric values)
+    """
+    def __init__(self, obj, by_case=True):
+        table = obj if type(obj) == SensorTable else SensorTable(obj)
+        self.by_case = by_case
+        self.sensor_ids = table.ids.categories
+        # sensor ids that are not different from each other share the same slices
+        canonical = np.array([table.ids.matching_codes(category)[0] for category in self.sensor_ids], dtype=np.int64)
+
+        indexed = np.flatnonzero(table.timestamps != NAT)
+        groups = table.trace_indices[indexed] if by_case else np.zeros(len(indexed), dtype=np.int64)
+        codes = canonical[table.ids.codes[indexed]] if len(indexed) > 0 else np.empty(0, dtype=np.int64)
+        timestamps = table.timestamps[indexed]
+        order = np.lexsort((timestamps, codes, groups))
+        indexed = indexed[order]
+        groups = groups[order]
+        codes = codes[order]
+
+        self.timestamps = timestamps[order]
+        self.values = table.values[indexed]
+        self.numeric_values = table.numeric_values[indexed]
+
+        # (group, canonical code) -> (start, end) of the slice of its readings
+        self.slices = {}
+        if len(indexed) > 0:
+            starts = np.flatnonzero(np.r_[True, (groups[1:] != groups[:-1]) | (codes[1:] != codes[:-1])])
+            ends = np.r_[starts[1:], len(indexed)]
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                self.slices[(int(groups[start]), int(codes[start]))] = (start, end)
+        self.__canonical = canonical
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def get_sensor_ids(self):
+        """
+        Gets the distinct sensor ids of the indexed readings (the readings without id cannot be joined)
+        """
+        codes = sorted(set(code for _, code in self.slices))
+        return [self.sensor_ids[code] for code in codes if self.sensor_ids[code] is not None]
+
+    def get_code(self, sensor_id):
+        """
+        Gets the code of the slices of a sensor id (None if the sensor has no readings)
+        """
+        for i, category in enumerate(self.sensor_ids):
+            if not (sensor_id != category):
+                return int(self.__canonical[i])
+        return None
+
+    def search(self, sensor_id, timestamps, groups, side):
+        """
+        Binary search of the timestamps in the readings of the sensor in the given groups
+
+        Parameters
+        -------------
+        sensor_id
+            Sensor id
+        timestamps
+            Nanoseconds since the epoch (int64 array)
+        groups
+            Positions of the traces of the queries (ignored if the index is not by case)
+        side
+            'left' or 'right', as numpy.searchsorted
+
+        Returns
+        -------------
+        positions
+            Insertion positions in the index (int64 array)
+        starts, ends
+            Slices of the readings of the sensor in the group of each query (empty if there are not any)
+        """
+        size = len(timestamps)
+        positions = np.zeros(size, dtype=np.int64)
+        starts = np.zeros(size, dtype=np.int64)
+        ends = np.zeros(size, dtype=np.int64)
+        code = self.get_code(sensor_id)
+        if code is None or size == 0:
+            return positions, starts, ends
+        if not self.by_case:
+            groups = np.zeros(size, dtype=np.int64)
+        order = np.argsort(groups, kind="stable")
+        sorted_groups = groups[order]
+        bounds = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1], True])
+        for query_start, query_end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            readings = self.slices.get((int(sorted_groups[query_start]), code))
+            if readings is None:
+                continue
+            queries = order[query_start:query_end]
+            start, end = readings
+            positions[queries] = start + np.searchsorted(self.timestamps[start:end], timestamps[queries], side=side)
+            starts[queries] = start
+            ends[queries] = end
+        return positions, starts, ends
+
+    def asof(self, sensor_id, timestamps, groups, tolerance=None):
+        """
+        Gets the positions of the last readings of the sensor at or before the timestamps
+
+        Parameters
+        -------------
+        sensor_id
+            Sensor id
+        timestamps
+            Nanoseconds since the epoch (int64 array)
+        groups
+            Positions of the traces of the queries (ignored if the index is not by case)
+        tolerance
+            Maximum distance (timedelta) between the reading and the timestamp (default: no limit)
+
+        Returns
+        -------------
+        positions
+            Positions of the readings in the index (-1 if there is no reading)
+        """
+        positions, starts, _ = self.search(sensor_id, timestamps, groups, "right")
+        positions -= 1
+        missing = positions < starts
+        if tolerance is not None and len(self.timestamps) > 0:
+            distance = timestamps - self.timestamps[np.maximum(positions, 0)]
+            missing |= distance > tolerance // timedelta(microseconds=1) * 1000
+        positions[missing] = -1
+        return positions
+
+    def window(self, sensor_id, starts, ends, groups):
+        """
+        Gets the slices of the readings of the sensor between each start and end timestamp (both included)
+
+        Returns
+        -------------
+        lower, upper
+            Bounds of the slices in the index (lower == upper if there are no readings)
+        """
+        lower, _, _ = self.search(sensor_id, starts, groups, "left")
+        upper, _, _ = self.search(sensor_id, ends, groups, "right")
+        return lower, np.maximum(lower, upper)
+
+    def aggregate(self, lower, upper, aggregations):
+        """
+        Aggregates the readings of the slices
+
+        Parameters
+        -------------
+        lower, upper
+            Bounds of the slices in the index
+        aggregations
+            Aggregations among count, first, last (values of the readings), min, max, mean (of the numeric values)
+
+        Returns
+        -------------
+        results
+            Dictionary associating to each aggregation a list with a value for each slice
+            (None for an empty slice, or for min/max/mean of a slice without numeric values)
+        """
+        ret = {}
+        nonempty = upper > lower
+        for aggregation in aggregations:
+            if aggregation == "count":
+                ret[aggregation] = (upper - lower).tolist()
+            elif aggregation in ("first", "last"):
+                positions = lower if aggregation == "first" else upper - 1
+                ret[aggregation] = [self.values[position] if is_nonempty else None
+                                    for position, is_nonempty in zip(positions.tolist(), nonempty.tolist())]
+            elif aggregation in ("min", "max", "mean"):
+                if aggregation == "mean":
+                    numeric = ~np.isnan(self.numeric_values)
+                    totals = reduce_slices(np.add, np.where(numeric, self.numeric_values, 0.0), lower, upper)
+                    counts = reduce_slices(np.add, numeric.astype(np.int64), lower, upper)
+                    with np.errstate(invalid="ignore", divide="ignore"):
+                        results = np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+                else:
+                    # fmin/fmax ignore the NaN of the non-numeric values
+                    results = reduce_slices(np.fmin if aggregation == "min" else np.fmax, self.numeric_values, lower, upper)
+                ret[aggregation] = [None if np.isnan(result) else result for result in results.tolist()]
+            else:
+                raise ValueError("unsupported aggregation: " + str(aggregation))
+        return ret
+
+
+def reduce_slices(ufunc, array, lower, upper):
+    """
+    Reduces array[lower[i]:upper[i]] for each slice with a single ufunc.reduceat call (NaN for empty slices)
+    """
+    nonempty = upper > lower
+    ret = np.full(len(lower), np.nan)
+    if nonempty.any():
+        indices = np.empty(2 * int(nonempty.sum()), dtype=np.int64)
+        indices[0::2] = lower[nonempty]
+        indices[1::2] = upper[nonempty]
+        # the bounds are valid reduceat indices thanks to the padding element, the reductions
+        # between the end of a slice and the start of the next one are discarded
+        padded = np.r_[array, np.zeros(1, dtype=array.dtype)]
+        ret[nonempty] = ufunc.reduceat(padded, indices)[0::2]
+    return ret
+
+
+def to_nanoseconds(timestamp):
+    """
+    Gets the nanoseconds since the epoch of a timestamp (NaT if it is not a datetime in the datetime64[ns] range)
+    """
+    microseconds = to_microseconds(timestamp) if isinstance(timestamp, datetime) else None
+    return NAT if microseconds is None else microseconds * 1000
+
+
+def get_events(log):
+    """
+    Gets the events of the log with the positions of their traces (-1 for the events contained directly in the log)
+    """
+    for i, item in enumerate(log):
+        if type(item) == IOTTrace:
+            for trace_item in item:
+                if type(trace_item) == IOTEvent:
+                    yield i, item, trace_item
+        elif type(item) == IOTEvent:
+            yield -1, None, item
+
+
+def get_index(log, parameters):
+    index = exec_utils.get_param_value(Parameters.SENSOR_INDEX, parameters, None)
+    if index is None:
+        index = SensorIndex(log, by_case=exec_utils.get_param_value(Parameters.BY_CASE, parameters, True))
+    return index
+
+
+def asof_join(log, parameters=None):
+    """
+    Attaches to each event the value of the last reading of each sensor at or before the timestamp of the event,
+    as the attribute <prefix><sensor id>. The events without such a reading are left unchanged
+
+    Parameters
+    -------------
+    log
+        IOTEventLog (modified in place)
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.TIMESTAMP_KEY -> timestamp of the events (default: time:timestamp)
+            Parameters.SENSOR_IDS -> sensor ids to join (default: all)
+            Parameters.BY_CASE -> only join the readings of the trace of the event (default: True)
+            Parameters.TOLERANCE -> maximum age (timedelta) of the reading (default: no limit)
+            Parameters.ATTRIBUTE_PREFIX -> prefix of the attributes (default: sensor:)
+            Parameters.SENSOR_INDEX -> SensorIndex of the log, to reuse it across joins
+
+    Returns
+    -------------
+    log
+        The log with the attributes attached to its events
+    """
+    if parameters is None:
+        parameters = {}
+
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
+    tolerance = exec_utils.get_param_value(Parameters.TOLERANCE, parameters, None)
+    prefix = exec_utils.get_param_value(Parameters.ATTRIBUTE_PREFIX, parameters, DEFAULT_ATTRIBUTE_PREFIX)
+    index = get_index(log, parameters)
+    sensor_ids = exec_utils.get_param_value(Parameters.SENSOR_IDS, parameters, None)
+    if sensor_ids is None:
+        sensor_ids = index.get_sensor_ids()
+
+    events = []
+    groups = []
+    timestamps = []
+    for trace_index, _, event in get_events(log):
+        timestamp = to_nanoseconds(event.attributes.get(timestamp_key))
+        if timestamp != NAT:
+            events.append(event)
+            groups.append(trace_index)
+            timestamps.append(timestamp)
+    groups = np.array(groups, dtype=np.int64)
+    timestamps = np.array(timestamps, dtype=np.int64)
+
+    for sensor_id in sensor_ids:
+        key = prefix + str(sensor_id)
+        positions = index.asof(sensor_id, timestamps, groups, tolerance=tolerance)
+        for event, position in zip(events, positions.tolist()):
+            if position != -1:
+                event.attributes[key] = index.values[position]
+
+    return log
+
+
+def get_windows(log, parameters):
+    """
+    Gets the events completing an activity, with the start and end timestamps of its execution.
+    The start is the start timestamp attribute of the event if present, otherwise the timestamp of the
+    first pending start event of the same activity in the trace (as in interval_lifecycle.to_interval)
+    """
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
+    start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_START_TIMESTAMP_KEY)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    transition_key = exec_utils.get_param_value(Parameters.TRANSITION_KEY, parameters, xes_constants.DEFAULT_TRANSITION_KEY)
+
+    events = []
+    groups = []
+    starts = []
+    ends = []
+    pending = {}
+    current_trace = None
+    for trace_index, trace, event in get_events(log):
+        if trace is not current_trace:
+            pending = {}
+            current_trace = trace
+        attributes = event.attributes
+        end = to_nanoseconds(attributes.get(timestamp_key))
+        if end == NAT:
+            continue
+        if start_timestamp_key in attributes:
+            start = to_nanoseconds(attributes[start_timestamp_key])
+        else:
+            transition = str(attributes.get(transition_key, "")).lower()
+            activity = attributes.get(activity_key)
+            if transition == "start":
+                pending.setdefault(activity, deque()).append(end)
+                continue
+            if transition != "complete" or not pending.get(activity):
+                continue
+            start = pending[activity].popleft()
+        if start != NAT:
+            events.append(event)
+            groups.append(trace_index)
+            starts.append(start)
+            ends.append(end)
+    return events, np.array(groups, dtype=np.int64), np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64)
+
+
+def window_join(log, parameters=None):
+    """
+    Aggregates the readings of each sensor during the execution of the activities, attaching the
+    aggregations to the events completing them as the attributes <prefix><sensor id>:<aggregation>.
+    The window of an event goes from its start timestamp attribute, or from the timestamp of the matching
+    lifecycle start event, to its timestamp (both included). Aggregations without a value are not attached
+
+    Parameters
+    -------------
+    log
+        IOTEventLog (modified in place)
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.TIMESTAMP_KEY -> timestamp of the events (default: time:timestamp)
+            Parameters.START_TIMESTAMP_KEY -> start timestamp of the events (default: start_timestamp)
+            Parameters.ACTIVITY_KEY -> activity of the events (default: concept:name)
+            Parameters.TRANSITION_KEY -> lifecycle transition of the events (default: lifecycle:transition)
+            Parameters.SENSOR_IDS -> sensor ids to join (default: all)
+            Parameters.BY_CASE -> only join the readings of the trace of the event (default: True)
+            Parameters.AGGREGATIONS -> among count, first, last, min, max, mean (default: min, max, mean, last)
+            Parameters.ATTRIBUTE_PREFIX -> prefix of the attributes (default: sensor:)
+            Parameters.SENSOR_INDEX -> SensorIndex of the log, to reuse it across joins
+
+    Returns
+    -------------
+    log
+        The log with the attributes attached to its events
+    """
+    if parameters is None:
+        parameters = {}
+
+    aggregations = exec_utils.get_param_value(Parameters.AGGREGATIONS, parameters, DEFAULT_WINDOW_AGGREGATIONS)
+    prefix = exec_utils.get_param_value(Parameters.ATTRIBUTE_PREFIX, parameters, DEFAULT_ATTRIBUTE_PREFIX)
+    index = get_index(log, parameters)
+    sensor_ids = exec_utils.get_param_value(Parameters.SENSOR_IDS, parameters, None)
+    if sensor_ids is None:
+        sensor_ids = index.get_sensor_ids()
+
+    events, groups, starts, ends = get_windows(log, parameters)
+    for sensor_id in sensor_ids:
+        lower, upper = index.window(sensor_id, starts, ends, groups)
+        for aggregation, results in index.aggregate(lower, upper, aggregations).items():
+            key = prefix + str(sensor_id) + ":" + aggregation
+            for event, result in zip(events, results):
+                if result is not None:
+                    event.attributes[key] = result
+
+    return log
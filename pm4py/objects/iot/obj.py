@@ -2,6 +2,139 @@ import copy
 from enum import Enum
 from collections.abc import Sequence
 from pm4py.objects.log.obj import EventLog, Trace
+from pm4py.objects.iot.exceptions import UnsupportedTypeError
+
+
+def freeze_attribute(value):
+    """
+    Converts a (possibly nested) attribute value into a hashable one,
+    so that equal attribute values obtain equal frozen values
+    """
+    if isinstance(value, dict):
+        return frozenset((key, freeze_attribute(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_attribute(item) for item in value)
+    return value
+
+
+def point_signature(id, timestamp, value, source, meta):
+    """
+    Gets the signature of a point, i.e. a hashable key that is equal for all the points
+    that are equal according to Point.__eq__
+
+    Parameters
+    -------------
+    id
+        Identifier of the point
+    timestamp
+        Timestamp of the point
+    value
+        Value of the point
+    source
+        Source of the point
+    meta
+        Meta attributes of the point
+
+    Returns
+    -------------
+    signature
+        Hashable signature, or None if some of the fields cannot be hashed
+    """
+    try:
+        signature = (id, timestamp, freeze_attribute(value), freeze_attribute(source),
+                     None if meta is None else tuple(freeze_attribute(item) for item in meta))
+        hash(signature)
+    except TypeError:
+        return None
+    return signature
+
+
+class PointIndex:
+    """
+    Hash index mapping the signature of the points to the items of a container carrying it.
+    The index only pre-selects candidates: a lookup must still confirm them with Point.__eq__.
+    The indexed points notify their container when modified through their setters,
+    which then moves them to the bucket of their new signature (see PointIndex.update)
+    """
+    def __init__(self):
+        self._buckets = {}
+        self._unhashable = []
+        self._positions = {}
+        self._signatures = {}
+
+    def add(self, signature, item, position=None):
+        if position is not None:
+            self._positions[id(item)] = position
+        self._signatures[id(item)] = signature
+        self.__get_bucket(signature, create=True).append(item)
+
+    def discard(self, item):
+        """
+        Removes an occurrence of the item from the index
+        """
+        if id(item) not in self._signatures:
+            return
+        signature = self._signatures[id(item)]
+        bucket = self.__get_bucket(signature)
+        for i in range(len(bucket)):
+            if bucket[i] is item:
+                del bucket[i]
+                break
+        if not any(other is item for other in bucket):
+            del self._signatures[id(item)]
+            self._positions.pop(id(item), None)
+        if signature is not None and not bucket:
+            del self._buckets[signature]
+
+    def update(self, item, signature):
+        """
+        Moves all the occurrences of an item, modified in place, to the bucket of its new signature
+        """
+        if id(item) not in self._signatures:
+            return
+        old_signature = self._signatures[id(item)]
+        if old_signature == signature:
+            return
+        old_bucket = self.__get_bucket(old_signature)
+        occurrences = sum(1 for other in old_bucket if other is item)
+        old_bucket[:] = [other for other in old_bucket if other is not item]
+        if old_signature is not None and not old_bucket:
+            del self._buckets[old_signature]
+        self._signatures[id(item)] = signature
+        self.__get_bucket(signature, create=True).extend([item] * occurrences)
+
+    def tracks(self, item):
+        return id(item) in self._signatures
+
+    def __get_bucket(self, signature, create=False):
+        if signature is None:
+            return self._unhashable
+        if create:
+            return self._buckets.setdefault(signature, [])
+        return self._buckets.get(signature, [])
+
+    def locate(self, items, item):
+        """
+        Gets the position of an indexed item in the given list. The search starts from the position
+        the item was indexed at, since the item only moves backwards when preceding items are removed
+        """
+        position = min(self._positions.get(id(item), len(items) - 1), len(items) - 1)
+        for i in range(position, -1, -1):
+            if items[i] is item:
+                return i
+        for i in range(position + 1, len(items)):
+            if items[i] is item:
+                return i
+        return None
+
+    def candidates(self, signature):
+        if signature is None:
+            ret = [item for bucket in self._buckets.values() for item in bucket]
+        else:
+            ret = list(self._buckets.get(signature, []))
+        ret.extend(self._unhashable)
+        return ret
+
 
 class IOTEventLog(EventLog):
     def __init__(self, *args, **kwargs):
@@ -246,6 +379,9 @@ class IOTEvent(Sequence):
         return sorted(set(ret_values))
 
 class Point:
+    # containers whose index tracks the point, notified when the point is modified
+    _owners = None
+
     def __init__(self, *args, **kwargs):
         self._id = kwargs['id'] if 'id' in kwargs else None
         self._timestamp = kwargs['timestamp'] if 'timestamp' in kwargs else None
@@ -260,6 +396,7 @@ class Point:
     @id.setter
     def id(self, id):
         self._id = id
+        self._notify_owners()
     
     @property
     def timestamp(self):
@@ -268,6 +405,7 @@ class Point:
     @timestamp.setter
     def timestamp(self, timestamp):
         self._timestamp = timestamp
+        self._notify_owners()
 
     @property
     def value(self):
@@ -276,6 +414,7 @@ class Point:
     @value.setter
     def value(self, value):
         self._value = value
+        self._notify_owners()
     
     @property
     def source(self):
@@ -284,6 +423,7 @@ class Point:
     @source.setter
     def source(self, source):
         self._source = source
+        self._notify_owners()
     
     @property
     def meta(self):
@@ -292,6 +432,7 @@ class Point:
     @meta.setter
     def meta(self, meta):
         self._meta = meta
+        self._notify_owners()
 
     def __repr__(self):
         ret = {}
@@ -324,6 +465,29 @@ class Point:
                 return False
         return True
 
+    def signature(self):
+        return point_signature(self.id, self.timestamp, self.value, self.source, self.meta)
+
+    def _attach(self, owner):
+        if self._owners is None:
+            self._owners = [owner]
+        elif not any(other is owner for other in self._owners):
+            self._owners.append(owner)
+
+    def _detach(self, owner):
+        if self._owners is not None:
+            self._owners = [other for other in self._owners if other is not owner] or None
+
+    def _notify_owners(self):
+        if self._owners is not None:
+            for owner in list(self._owners):
+                owner._point_changed(self)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_owners", None)
+        return state
+
     def __copy__(self):
         point = Point()
         point._id = copy.copy(self._id)
@@ -349,6 +513,11 @@ class DataStream(Sequence):
         self._source = kwargs['source'] if 'source' in kwargs else None
         self._list = list()
         self._stream_data_key = None
+        # built on the first sensor value lookup, then kept in sync with the list
+        self._point_index = None
+        self._multipoints = None
+        if kwargs.get('columnar', False):
+            self.to_columnar()
 
     @property
     def name(self):
@@ -394,7 +563,17 @@ class DataStream(Sequence):
         return True
 
     def __setitem__(self, key, value):
-        self._list[key] = value
+        if isinstance(key, slice):
+            value = list(value)
+            self._fit_storage(value)
+            self._list[key] = value
+            self.drop_index()
+        else:
+            self._fit_storage([value])
+            if not self.is_columnar():
+                self._untrack(self._list[key])
+            self._list[key] = value
+            self._track(value, key % len(self._list), appended=False)
 
     def __getitem__(self, key):
         return self._list[key]
@@ -437,6 +616,9 @@ class DataStream(Sequence):
         datastream._id = copy.copy(self._id)
         datastream._source = copy.copy(self._source)
         datastream._stream_data_key = copy.copy(self._stream_data_key)
+        if self.is_columnar():
+            datastream._list = copy.copy(self._list)
+            return datastream
         for item in self._list:
             datastream.append(item)
         return datastream
@@ -447,6 +629,9 @@ class DataStream(Sequence):
         datastream._id = copy.deepcopy(self._id)
         datastream._source = copy.deepcopy(self._source)
         datastream._stream_data_key = copy.deepcopy(self._stream_data_key)
+        if self.is_columnar():
+            datastream._list = copy.deepcopy(self._list)
+            return datastream
         for item in self._list:
             datastream.append(copy.deepcopy(item))
         return datastream
@@ -464,40 +649,156 @@ class DataStream(Sequence):
         return self._list.count(x)
 
     def remove(self, key):
+        if isinstance(key, slice):
+            self.drop_index()
+        elif not self.is_columnar():
+            self._untrack(self._list[key])
         del self._list[key]
 
     def insert(self, i, x):
+        self._fit_storage([x])
         self._list.insert(i, x)
+        self._track(x, i, appended=False)
 
     def append(self, x):
+        self._fit_storage([x])
         self._list.append(x)
+        self._track(x, len(self._list) - 1, appended=True)
+
+    def extend(self, items):
+        """
+        Appends the items in bulk (the index, if already built, is kept in sync)
+        """
+        items = list(items)
+        self._fit_storage(items)
+        start = len(self._list)
+        self._list.extend(items)
+        if self._point_index is not None or self._multipoints is not None:
+            for position, item in enumerate(items, start):
+                self._track(item, position, appended=True)
+
+    def is_columnar(self):
+        return type(self._list) != list
+
+    def to_columnar(self):
+        """
+        Stores the points of the datastream in columns (see pm4py.objects.iot.columnar), materializing
+        them on access. Only datastreams containing just points can be stored in columns
+        """
+        if self.is_columnar():
+            return self
+        from pm4py.objects.iot.columnar import ColumnarPoints
+        for item in self._list:
+            if type(item) != Point:
+                raise UnsupportedTypeError(type(item))
+        self._list = ColumnarPoints(self._list)
+        self.drop_index()
+        return self
+
+    def to_row_based(self):
+        """
+        Stores the points of the datastream as a list of Point objects
+        """
+        if self.is_columnar():
+            self._list = list(self._list)
+            self.drop_index()
+        return self
+
+    def _fit_storage(self, items):
+        # the columnar storage falls back to a list when anything else than a point is added
+        if self.is_columnar() and any(type(item) != Point for item in items):
+            self.to_row_based()
+
+    def get_index(self):
+        """
+        Gets the hash index of the points of the datastream and the list of its multipoints,
+        building them if they are not available
+        """
+        if self._point_index is None:
+            self._point_index = PointIndex()
+            for position, item in enumerate(self._list):
+                if type(item) == Point:
+                    self._point_index.add(item.signature(), item, position)
+                    item._attach(self)
+        if self._multipoints is None:
+            self._multipoints = [item for item in self._list if type(item) == MultiPoint]
+        return self._point_index, self._multipoints
+
+    def __getstate__(self):
+        # the index is keyed by the identity of the points, hence it is rebuilt after unpickling
+        state = dict(self.__dict__)
+        state["_point_index"] = None
+        if "_multipoints" in state:
+            state["_multipoints"] = None
+        return state
+
+    def drop_index(self):
+        """
+        Drops the index (e.g., after modifying in place the mutable attribute values of its points,
+        which the index cannot notice), which is then rebuilt on the next lookup
+        """
+        self._point_index = None
+        self._multipoints = None
+
+    def _track(self, item, position, appended):
+        if type(item) == Point:
+            if self._point_index is not None:
+                self._point_index.add(item.signature(), item, position)
+                item._attach(self)
+        elif type(item) == MultiPoint and self._multipoints is not None:
+            if appended:
+                self._multipoints.append(item)
+            else:
+                self._multipoints = None
+
+    def _untrack(self, item):
+        if type(item) == Point:
+            if self._point_index is not None:
+                self._point_index.discard(item)
+                if not self._point_index.tracks(item):
+                    item._detach(self)
+        elif type(item) == MultiPoint:
+            self._multipoints = None
+
+    def _point_changed(self, item):
+        # called by a tracked point modified through its setters
+        if self._point_index is not None and self._point_index.tracks(item):
+            self._point_index.update(item, item.signature())
+        else:
+            item._detach(self)
 
     def add_sensor_value(self, point):
-        matched_key = None
-        point_exists = False
-        for i in range(len(self._list)):
-            if isinstance(self._list[i], Point) and type(self._list[i]) == Point and point == self._list[i]:
-                point_exists = True
-                break
-            elif isinstance(self._list[i], MultiPoint) and type(self._list[i]) == MultiPoint and self._list[i].matches(point):
-                matched_key = i
-                if self._list[i].contains(point):
-                    point_exists = True
-                    break
-        if not point_exists:
-            if matched_key is None:
+        if self.is_columnar():
+            if not self._list.contains(point):
                 self.append(point)
-            else:
-                self._list[matched_key].add_sensor_value(point)
+            return
+        point_index, multipoints = self.get_index()
+        for item in point_index.candidates(point.signature()):
+            if point == item:
+                return
+        matched = None
+        for multipoint in multipoints:
+            if multipoint.matches(point):
+                matched = multipoint
+                if multipoint.contains(point):
+                    return
+        if matched is None:
+            self.append(point)
+        else:
+            matched.add_sensor_value(point)
 
     def remove_sensor_value(self, point):
-        to_remove = []
-        for i in range(len(self._list)):
-            if type(self._list[i]) == Point and point == self._list[i]:
-                to_remove.append(i)
-            elif type(self._list[i]) == MultiPoint and self._list[i].matches(point):
-                self._list[i].remove_sensor_value(point)
-        self._list = [item for id, item in enumerate(self._list) if id not in to_remove]
+        if self.is_columnar():
+            self._list.remove_equal(point)
+            return
+        point_index, multipoints = self.get_index()
+        to_remove = [item for item in point_index.candidates(point.signature()) if point == item]
+        for multipoint in multipoints:
+            if multipoint.matches(point):
+                multipoint.remove_sensor_value(point)
+        for item in to_remove:
+            del self._list[point_index.locate(self._list, item)]
+            self._untrack(item)
 
     def fetch_sensor_values(self, fset):
         ret_values = []
@@ -596,6 +897,8 @@ class MultiPoint(Sequence):
         self._source = kwargs['source'] if 'source' in kwargs else None
         self._meta = kwargs['meta'] if 'meta' in kwargs else None
         self._list = list()
+        # built on the first sensor value lookup, then kept in sync with the list
+        self._point_index = None
 
     @property
     def id(self):
@@ -604,6 +907,7 @@ class MultiPoint(Sequence):
     @id.setter
     def id(self, id):
         self._id = id
+        self._point_index = None
     
     @property
     def timestamp(self):
@@ -612,6 +916,7 @@ class MultiPoint(Sequence):
     @timestamp.setter
     def timestamp(self, timestamp):
         self._timestamp = timestamp
+        self._point_index = None
     
     @property
     def source(self):
@@ -620,6 +925,7 @@ class MultiPoint(Sequence):
     @source.setter
     def source(self, source):
         self._source = source
+        self._point_index = None
     
     @property
     def meta(self):
@@ -628,9 +934,16 @@ class MultiPoint(Sequence):
     @meta.setter
     def meta(self, meta):
         self._meta = meta
+        self._point_index = None
 
     def __setitem__(self, key, value):
-        self._list[key] = value
+        if isinstance(key, slice):
+            self._list[key] = value
+            self._point_index = None
+        else:
+            self._untrack(self._list[key])
+            self._list[key] = value
+            self._track(value, key % len(self._list))
 
     def __getitem__(self, key):
         return self._list[key]
@@ -717,9 +1030,63 @@ class MultiPoint(Sequence):
 
     def insert(self, i, x):
         self._list.insert(i, x)
+        self._track(x, i)
 
     def append(self, x):
         self._list.append(x)
+        self._track(x, len(self._list) - 1)
+
+    def get_index(self):
+        """
+        Gets the hash index of the completed points of the multipoint,
+        building it if it is not available
+        """
+        if self._point_index is None:
+            self._point_index = PointIndex()
+            for position, item in enumerate(self._list):
+                self._point_index.add(self.completed_signature(item), item, position)
+                item._attach(self)
+        return self._point_index
+
+    def __getstate__(self):
+        # the index is keyed by the identity of the points, hence it is rebuilt after unpickling
+        state = dict(self.__dict__)
+        state["_point_index"] = None
+        if "_multipoints" in state:
+            state["_multipoints"] = None
+        return state
+
+    def drop_index(self):
+        """
+        Drops the index (e.g., after modifying in place the mutable attribute values of its points,
+        which the index cannot notice), which is then rebuilt on the next lookup
+        """
+        self._point_index = None
+
+    def _track(self, item, position):
+        if self._point_index is not None:
+            self._point_index.add(self.completed_signature(item), item, position)
+            item._attach(self)
+
+    def _untrack(self, item):
+        if self._point_index is not None:
+            self._point_index.discard(item)
+            if not self._point_index.tracks(item):
+                item._detach(self)
+
+    def _point_changed(self, item):
+        # called by a tracked point modified through its setters
+        if self._point_index is not None and self._point_index.tracks(item):
+            self._point_index.update(item, self.completed_signature(item))
+        else:
+            item._detach(self)
+
+    def completed_signature(self, item):
+        return point_signature(self.id if self.id is not None else item.id,
+                               self.timestamp if self.timestamp is not None else item.timestamp,
+                               item.value,
+                               self.source if self.source is not None else item.source,
+                               self.meta if self.meta is not None else item.meta)
 
     def matches(self, point):
         if (self.id is not None) and self.id != point.id:
@@ -739,27 +1106,30 @@ class MultiPoint(Sequence):
         return True
 
     def complete(self, key):
+        return self.complete_item(self._list[key])
+
+    def complete_item(self, item):
         point = Point()
-        point.id = self.id if self.id is not None else self._list[key].id
-        point.timestamp = self.timestamp if self.timestamp is not None else self._list[key].timestamp
-        point.source = self.source if self.source is not None else self._list[key].source
-        point.meta = self.meta if self.meta is not None else self._list[key].meta
-        point.value = self._list[key].value
+        point.id = self.id if self.id is not None else item.id
+        point.timestamp = self.timestamp if self.timestamp is not None else item.timestamp
+        point.source = self.source if self.source is not None else item.source
+        point.meta = self.meta if self.meta is not None else item.meta
+        point.value = item.value
         return point
 
-    def fetch_keys(self, point):
-        ret = []
+    def fetch_items(self, point):
         if not self.matches(point):
-            return ret
-        for key in range(len(self._list)):
-            if self.complete(key) == point:
-                ret.append(key)
-        return ret
+            return []
+        return [item for item in self.get_index().candidates(point.signature()) if self.complete_item(item) == point]
+
+    def fetch_keys(self, point):
+        found_ids = set(id(item) for item in self.fetch_items(point))
+        if not found_ids:
+            return []
+        return [key for key, item in enumerate(self._list) if id(item) in found_ids]
 
     def contains(self, point):
-        if not self.matches(point):
-            return False
-        return len(self.fetch_keys(point)) > 0
+        return len(self.fetch_items(point)) > 0
     
     def add_sensor_value(self, point):
         if not self.matches(point):
@@ -776,8 +1146,10 @@ class MultiPoint(Sequence):
         self.append(new_point)
 
     def remove_sensor_value(self, point):
-        to_remove = self.fetch_keys(point)
-        self._list = [item for id, item in enumerate(self._list) if id not in to_remove]
+        point_index = self.get_index()
+        for item in self.fetch_items(point):
+            del self._list[point_index.locate(self._list, item)]
+            self._untrack(item)
 
     def fetch_sensor_values(self, fset):
         if not fset.matches_multipoint(self):
@@ -0,0 +1,308 @@
+"""
+    Vectorized sensor value queries over IoT logs.
+
+    The points of a log (or trace/event/datastream) are flattened once into a SensorTable of columns,
+    then each FilterSet is compiled into a predicate computing a boolean mask over the columns.
+    Matching points are aggregated per sensor id (distinct values, count, min/max/mean).
+"""
+from datetime import datetime
+
+import numpy as np
+
+from pm4py.objects.iot.columnar import DictionaryColumn, meta_equals, to_microseconds, NAT
+from pm4py.objects.iot.obj import IOTEventLog, IOTTrace, IOTEvent, DataStream, DataContext, Point, MultiPoint, FilterSet
+
+
+class SensorTable:
+    """
+    Columns of all the points contained in an IoT object. The points of multipoints are completed
+    with the attributes of the multipoint.
+
+    Columns
+    -------------
+    trace_indices
+        Position of the trace in the log (-1 for events contained directly in the log)
+    event_indices
+        Position of the event in its trace, or in the log (-1 for datastreams outside events)
+    ids, sources, metas
+        Dictionary-encoded columns (codes and categories)
+    timestamps
+        Nanoseconds since the epoch (NaT for missing timestamps, or timestamps that are not datetimes)
+    naive
+        Whether the timestamp has no time zone
+    other_timestamps
+        Timestamps that are not datetimes (None if there are not any)
+    values
+        Values of the points (objects)
+    numeric_values
+        Values as floats (NaN for non-numeric values)
+    """
+    def __init__(self, obj):
+        self.ids = DictionaryColumn(0)
+        self.sources = DictionaryColumn(0)
+        self.metas = DictionaryColumn(0)
+        self.__chunks = []
+        self.__rows = None
+        self.__add_object(obj, -1, -1)
+        self.__flush_rows()
+        self.__concatenate()
+
+    def __len__(self):
+        return len(self.values)
+
+    def __add_object(self, obj, trace_index, event_index):
+        if type(obj) == IOTEventLog:
+            for i, item in enumerate(obj):
+                if type(item) == IOTEvent:
+                    self.__add_object(item, -1, i)
+                else:
+                    self.__add_object(item, i, -1)
+        elif type(obj) == IOTTrace:
+            for i, item in enumerate(obj):
+                self.__add_object(item, trace_index, i if type(item) == IOTEvent else -1)
+        elif type(obj) in [IOTEvent, DataContext]:
+            for item in obj:
+                self.__add_object(item, trace_index, event_index)
+        elif type(obj) == DataStream:
+            if obj.is_columnar():
+                self.__add_columnar(obj._list, trace_index, event_index)
+            else:
+                for item in obj:
+                    if type(item) == Point:
+                        self.__add_row(item.id, item.timestamp, item.value, item.source, item.meta, trace_index, event_index)
+                    elif type(item) == MultiPoint:
+                        self.__add_multipoint(item, trace_index, event_index)
+        elif type(obj) == MultiPoint:
+            self.__add_multipoint(obj, trace_index, event_index)
+        elif type(obj) == Point:
+            self.__add_row(obj.id, obj.timestamp, obj.value, obj.source, obj.meta, trace_index, event_index)
+
+    def __add_multipoint(self, multipoint, trace_index, event_index):
+        for item in multipoint:
+            self.__add_row(multipoint.id if multipoint.id is not None else item.id,
+                           multipoint.timestamp if multipoint.timestamp is not None else item.timestamp,
+                           item.value,
+                           multipoint.source if multipoint.source is not None else item.source,
+                           multipoint.meta if multipoint.meta is not None else item.meta,
+                           trace_index, event_index)
+
+    def __add_row(self, id, timestamp, value, source, meta, trace_index, event_index):
+        if self.__rows is None:
+            self.__rows = {key: [] for key in ["trace_indices", "event_indices", "ids", "sources", "metas",
+                                                "timestamps", "naive", "other_timestamps", "values"]}
+        rows = self.__rows
+        rows["trace_indices"].append(trace_index)
+        rows["event_indices"].append(event_index)
+        rows["ids"].append(self.ids.encode(id))
+        rows["sources"].append(self.sources.encode(source))
+        rows["metas"].append(self.metas.encode(meta))
+        microseconds = to_microseconds(timestamp) if isinstance(timestamp, datetime) else None
+        rows["timestamps"].append(NAT if microseconds is None else microseconds * 1000)
+        rows["naive"].append(microseconds is not None and timestamp.tzinfo is None)
+        rows["other_timestamps"].append(timestamp if microseconds is None else None)
+        rows["values"].append(value)
+
+    def __flush_rows(self):
+        if self.__rows is None:
+            return
+        rows = self.__rows
+        self.__rows = None
+        other_timestamps = rows["other_timestamps"]
+        self.__chunks.append({
+            "trace_indices": np.array(rows["trace_indices"], dtype=np.int64),
+            "event_indices": np.array(rows["event_indices"], dtype=np.int64),
+            "ids": np.array(rows["ids"], dtype=np.int32),
+            "sources": np.array(rows["sources"], dtype=np.int32),
+            "metas": np.array(rows["metas"], dtype=np.int32),
+            "timestamps": np.array(rows["timestamps"], dtype=np.int64),
+            "naive": np.array(rows["naive"], dtype=bool),
+            "other_timestamps": None if all(timestamp is None for timestamp in other_timestamps) else other_timestamps,
+            "values": rows["values"],
+        })
+
+    def __add_columnar(self, columns, trace_index, event_index):
+        self.__flush_rows()
+        size = len(columns)
+        chunk = {
+            "trace_indices": np.full(size, trace_index, dtype=np.int64),
+            "event_indices": np.full(size, event_index, dtype=np.int64),
+        }
+        for name, column in [("ids", self.ids), ("sources", self.sources), ("metas", self.metas)]:
+            source_column = getattr(columns, name)
+            mapping = np.array([column.encode(category) for category in source_column.categories], dtype=np.int32)
+            chunk[name] = mapping[source_column.codes[:size]] if size > 0 else np.empty(0, dtype=np.int32)
+        if columns._timestamp_objects:
+            timestamps = list(columns.timestamps)
+            chunk["timestamps"] = np.full(size, NAT, dtype=np.int64)
+            chunk["naive"] = np.zeros(size, dtype=bool)
+            chunk["other_timestamps"] = timestamps
+        else:
+            chunk["timestamps"] = columns.timestamps.view(np.int64).copy()
+            naive_codes = [i for i, tzinfo in enumerate(columns._timezones.categories) if tzinfo is None]
+            chunk["naive"] = np.isin(columns._timezones.codes[:size], naive_codes) & (chunk["timestamps"] != NAT)
+            chunk["other_timestamps"] = None
+        chunk["values"] = columns.values.astype(object)
+        self.__chunks.append(chunk)
+
+    def __concatenate(self):
+        chunks = self.__chunks
+        del self.__chunks
+
+        def concatenate(name, dtype):
+            if not chunks:
+                return np.empty(0, dtype=dtype)
+            return np.concatenate([np.asarray(chunk[name], dtype=dtype) for chunk in chunks])
+
+        self.trace_indices = concatenate("trace_indices", np.int64)
+        self.event_indices = concatenate("event_indices", np.int64)
+        self.ids.codes = concatenate("ids", np.int32)
+        self.sources.codes = concatenate("sources", np.int32)
+        self.metas.codes = concatenate("metas", np.int32)
+        self.timestamps = concatenate("timestamps", np.int64)
+        self.naive = concatenate("naive", bool)
+        self.other_timestamps = None
+        if any(chunk["other_timestamps"] is not None for chunk in chunks):
+            other_timestamps = []
+            for chunk in chunks:
+                if chunk["other_timestamps"] is None:
+                    other_timestamps.extend([None] * len(chunk["timestamps"]))
+                else:
+                    other_timestamps.extend(chunk["other_timestamps"])
+            self.other_timestamps = np.empty(len(other_timestamps), dtype=object)
+            self.other_timestamps[:] = other_timestamps
+        self.values = np.empty(len(self.timestamps), dtype=object)
+        if chunks:
+            self.values[:] = [value for chunk in chunks for value in chunk["values"]]
+        is_numeric = np.fromiter((type(value) in (int, float) for value in self.values), dtype=bool, count=len(self.values))
+        self.numeric_values = np.full(len(self.values), np.nan)
+        self.numeric_values[is_numeric] = self.values[is_numeric].astype(np.float64)
+
+
+def equals_mask(array, value):
+    """
+    Elementwise comparison of an object array with a value, with the semantics of FilterSet (value != item)
+    """
+    if type(value) in (str, int, float, bool):
+        return np.asarray(array == value, dtype=bool)
+    return np.fromiter((not (value != item) for item in array), dtype=bool, count=len(array))
+
+
+def compile_filter(fset):
+    """
+    Compiles a FilterSet into a predicate computing the mask of the matching points of a SensorTable
+
+    Parameters
+    -------------
+    fset
+        FilterSet (attributes set to None are not filtered)
+
+    Returns
+    -------------
+    predicate
+        Function getting a SensorTable and returning a boolean mask
+    """
+    checks = []
+    if fset.id is not None:
+        checks.append(lambda table: np.isin(table.ids.codes, table.ids.matching_codes(fset.id)))
+    if fset.source is not None:
+        checks.append(lambda table: np.isin(table.sources.codes, table.sources.matching_codes(fset.source)))
+    if fset.meta is not None:
+        checks.append(lambda table: np.isin(table.metas.codes, table.metas.matching_codes(fset.meta, meta_equals)))
+    if fset.timestamp is not None:
+        checks.append(lambda table: timestamp_mask(table, fset.timestamp))
+    if fset.value is not None:
+        checks.append(lambda table: equals_mask(table.values, fset.value))
+
+    def predicate(table):
+        mask = np.ones(len(table), dtype=bool)
+        for check in checks:
+            mask &= check(table)
+        return mask
+
+    return predicate
+
+
+def timestamp_mask(table, timestamp):
+    """
+    Gets the mask of the points having the given timestamp (aware and naive datetimes are never equal)
+    """
+    mask = np.zeros(len(table), dtype=bool)
+    microseconds = to_microseconds(timestamp) if isinstance(timestamp, datetime) else None
+    if microseconds is not None:
+        mask = (table.timestamps == microseconds * 1000) & (table.naive == (timestamp.tzinfo is None))
+    if table.other_timestamps is not None:
+        has_other = np.fromiter((item is not None for item in table.other_timestamps), dtype=bool, count=len(table))
+        mask[has_other] = equals_mask(table.other_timestamps[has_other], timestamp)
+    return mask
+
+
+def sorted_values(values):
+    """
+    Sorts the values, grouping them by type when values of different types cannot be compared
+    """
+    try:
+        return sorted(values)
+    except TypeError:
+        return sorted(values, key=lambda value: (type(value).__name__, str(value)))
+
+
+def aggregate(table, mask):
+    """
+    Aggregates the values of the points in the mask per sensor id
+
+    Returns
+    -------------
+    statistics
+        Dictionary associating to each sensor id the sorted distinct values, the count of the points,
+        and the min/max/mean of the numeric values (None if there are not any)
+    """
+    ret = {}
+    positions = np.flatnonzero(mask)
+    if len(positions) == 0:
+        return ret
+    codes = table.ids.codes[positions]
+    order = np.argsort(codes, kind="stable")
+    positions = positions[order]
+    codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.r_[starts[1:], len(codes)]
+    numeric = table.numeric_values[positions]
+    has_numeric = ~np.isnan(numeric)
+    for start, end in zip(starts, ends):
+        group_numeric = numeric[start:end][has_numeric[start:end]]
+        ret[table.ids.categories[codes[start]]] = {
+            "values": sorted_values(set(table.values[positions[start:end]].tolist())),
+            "count": int(end - start),
+            "min": float(group_numeric.min()) if len(group_numeric) > 0 else None,
+            "max": float(group_numeric.max()) if len(group_numeric) > 0 else None,
+            "mean": float(group_numeric.mean()) if len(group_numeric) > 0 else None,
+        }
+    return ret
+
+
+def apply(obj, fsets, parameters=None):
+    """
+    Queries the sensor values of an IoT object
+
+    Parameters
+    -------------
+    obj
+        IOTEventLog, IOTTrace, IOTEvent, DataStream, or an already built SensorTable
+        (to be reused across several queries)
+    fsets
+        FilterSet, or list of FilterSet
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -------------
+    statistics
+        Per-sensor statistics (see aggregate), or a list of them if a list of FilterSet is provided
+    """
+    if parameters is None:
+        parameters = {}
+
+    table = obj if type(obj) == SensorTable else SensorTable(obj)
+    if type(fsets) == FilterSet:
+        return aggregate(table, compile_filter(fsets)(table))
+    return [aggregate(table, compile_filter(fset)(table)) for fset in fsets]
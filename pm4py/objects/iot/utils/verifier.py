@@ -1,9 +1,40 @@
 """
     This is object verifiers for the extension by XES 2.0 standard.
+
+    The objects are walked iteratively with an explicit stack, in the order of a recursive verification
+    (a container is checked before its items), with a loop specialized for each type. The points of a
+    datastream are checked in a single loop, and the ones of a columnar datastream on its value column.
+    A log can also be verified on a random sample of its items, or on partitions of its items in a
+    process pool.
 """
+import random
+from enum import Enum
+
+from pm4py.util import constants, exec_utils
 from pm4py.objects.iot.obj import IOTEventLog, IOTEvent, IOTTrace, DataStream, DataContext, Point, MultiPoint
 from pm4py.objects.iot.exceptions import UnsupportedTypeError, VerificationFailedError
-from enum import Enum
+
+
+# shards of items per core in the multiprocessing verification
+SHARDS_PER_CORE = 4
+
+LOG_ITEMS = {IOTTrace, IOTEvent}
+TRACE_ITEMS = {IOTEvent, DataContext, DataStream}
+EVENT_ITEMS = {DataStream}
+DATACONTEXT_ITEMS = {DataContext, DataStream}
+DATASTREAM_ITEMS = {MultiPoint, Point}
+MULTIPOINT_ITEMS = {Point}
+VERIFIED_TYPES = {IOTEventLog, IOTTrace, IOTEvent, DataContext, DataStream, MultiPoint, Point}
+# items of the log being verified by forked workers
+shared_items = None
+
+
+class Parameters(Enum):
+    SAMPLE_FRACTION = "sample_fraction"
+    SEED = "seed"
+    MULTIPROCESSING = "multiprocessing"
+    CORES = "cores"
+
 
 class MisMatchCounter:
     POINT_NONE_VALUE = 0
@@ -14,113 +45,182 @@ class MisMatchCounter:
 def __containing_types_mismatch(obj, able_to_hold):
     return [item for item in set(type(item) for item in obj) if item not in able_to_hold]
 
-def _verify_log(log):
+
+def __check_items(obj, items, able_to_hold):
+    if not set(map(type, items)) <= able_to_hold:
+        raise VerificationFailedError(obj, f'should not contain {__containing_types_mismatch(obj, able_to_hold)}')
+
+
+def verify_header(log):
+    """
+        Verifies the log attributes only (not its items), resetting the mismatch counters
+    """
     if type(log) != IOTEventLog:
         raise UnsupportedTypeError(type(log))
-    
+
     MisMatchCounter.reset()
 
     if log.version is None:
         raise VerificationFailedError(log, 'should have version')
     if log.features != 'nested-attributes':
         raise VerificationFailedError(log, 'should have features=nested-attributes')
-    if len(log) == 0:
-        raise VerificationFailedError(log, 'should not be empty')
-    
-    mismatch = __containing_types_mismatch(log, [IOTTrace, IOTEvent])
-    if len(mismatch) > 0:
-        raise VerificationFailedError(log, f'should not contain {mismatch}')
-
-    for item in log:
-        verify(item)
-
-
-def _verify_trace(trace):
-    if type(trace) != IOTTrace:
-        raise UnsupportedTypeError(type(trace))
-
-    mismatch = __containing_types_mismatch(trace, [IOTEvent, DataContext, DataStream])
-    if len(mismatch) > 0:
-        raise VerificationFailedError(trace, f'should not contain {mismatch}')
-
-    for item in trace:
-        verify(item)
 
 
-def _verify_event(event):
-    if type(event) != IOTEvent:
-        raise UnsupportedTypeError(type(event))
-
-    mismatch = __containing_types_mismatch(event, [DataStream])
-    if len(mismatch) > 0:
-        raise VerificationFailedError(event, f'should not contain {mismatch}')
-
-    for item in event:
-        verify(item)
-
-
-def _verify_point(point):
-    # probably should add verification if not comes from multipoint, then should have 'id', 'timestamp', 'value as required
-    # but in the given tests the above is not correct, sometimes required attributes doesn't exist
-    if type(point) != Point:
-        raise UnsupportedTypeError(type(point))
-    
-    if point.value is None:
-        MisMatchCounter.POINT_NONE_VALUE = MisMatchCounter.POINT_NONE_VALUE + 1
-
-
-def _verify_multipoint(multipoint):
-    if type(multipoint) != MultiPoint:
-        raise UnsupportedTypeError(type(multipoint))
-
-    mismatch = __containing_types_mismatch(multipoint, [Point])
-    if len(mismatch) > 0:
-        raise VerificationFailedError(multipoint, f'should not contain {mismatch}')
-
-    for item in multipoint:
-        verify(item)
-
-
-def _verify_datastream(datastream):
-    if type(datastream) != DataStream:
-        raise UnsupportedTypeError(type(datastream))
-
-    mismatch = __containing_types_mismatch(datastream, [MultiPoint, Point])
-    if len(mismatch) > 0:
-        raise VerificationFailedError(datastream, f'should not contain {mismatch}')
-
-    for item in datastream:
-        verify(item)
-
-
-def _verify_datacontext(datacontext):
-    if type(datacontext) != DataContext:
-        raise UnsupportedTypeError(type(datacontext))
-
-    mismatch = __containing_types_mismatch(datacontext, [DataContext, DataStream])
-    if len(mismatch) > 0:
-        raise VerificationFailedError(datacontext, f'should not contain {mismatch}')
-
-    if not datacontext.contains_datastream():
-        raise VerificationFailedError(datacontext, 'should contain datastream')
-    
-    for item in datacontext:
-        verify(item)
-    
-
-class Attest(Enum):
-    IOTEventLog = _verify_log
-    IOTTrace = _verify_trace
-    IOTEvent = _verify_event
-    Point = _verify_point
-    MultiPoint = _verify_multipoint
-    DataStream = _verify_datastream
-    DataContext = _verify_datacontext
-
-def verify(obj):
-    name = type(obj).__name__
-    if not hasattr(Attest, name):
-        return UnsupportedTypeError(type(obj))
-    getattr(Attest, name)(obj)
-
-    
\ No newline at end of file
+def __verify_log_items(log):
+    if len(log) == 0:
+        raise VerificationFailedError(log, 'should not be empty')
+    __check_items(log, log._list, LOG_ITEMS)
+
+
+def __verify_multipoint(multipoint):
+    # probably should add verification of the points not coming from a multipoint, which should have 'id', 'timestamp', 'value'
+    # as required, but in the given tests the above is not correct, sometimes required attributes doesn't exist
+    items = multipoint._list
+    __check_items(multipoint, items, MULTIPOINT_ITEMS)
+    return sum(1 for point in items if point.value is None)
+
+
+def __verify_datastream(datastream):
+    items = datastream._list
+    if datastream.is_columnar():
+        # a columnar datastream only stores points, a value column which is not of objects has no None
+        values = items.values
+        return sum(1 for value in values.tolist() if value is None) if values.dtype == object else 0
+    __check_items(datastream, items, DATASTREAM_ITEMS)
+    none_values = 0
+    for item in items:
+        if type(item) is Point:
+            if item.value is None:
+                none_values += 1
+        else:
+            none_values += __verify_multipoint(item)
+    return none_values
+
+
+def __walk(obj):
+    """
+        Verifies the object and the items it contains, returning the number of points without value
+    """
+    none_values = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        obj_type = type(obj)
+        if obj_type is DataStream:
+            none_values += __verify_datastream(obj)
+        elif obj_type is IOTEvent:
+            __check_items(obj, obj._list, EVENT_ITEMS)
+            for datastream in obj._list:
+                none_values += __verify_datastream(datastream)
+        elif obj_type is IOTTrace:
+            __check_items(obj, obj._list, TRACE_ITEMS)
+            stack.extend(reversed(obj._list))
+        elif obj_type is DataContext:
+            __check_items(obj, obj._list, DATACONTEXT_ITEMS)
+            if not obj.contains_datastream():
+                raise VerificationFailedError(obj, 'should contain datastream')
+            stack.extend(reversed(obj._list))
+        elif obj_type is MultiPoint:
+            none_values += __verify_multipoint(obj)
+        elif obj_type is Point:
+            if obj.value is None:
+                none_values += 1
+        elif obj_type is IOTEventLog:
+            verify_header(obj)
+            __verify_log_items(obj)
+            stack.extend(reversed(obj._list))
+    return none_values
+
+
+def verify_items(items):
+    """
+        Verifies a list of items, returning the number of points without value
+    """
+    return sum(__walk(item) for item in items)
+
+
+def get_sample(log, sample_fraction, seed):
+    """
+        Gets a random sample of the items of the log (at least one), in the order of the log
+    """
+    size = max(1, round(len(log) * sample_fraction))
+    return [log[i] for i in sorted(random.Random(seed).sample(range(len(log)), size))]
+
+
+def verify_shared_items(start, end):
+    """
+        Verifies a range of the items shared with the forked worker
+    """
+    return verify_items(shared_items[start:end])
+
+
+def verify_with_multiprocessing(items, num_cores):
+    """
+        Verifies partitions of the items in a process pool, raising the error of the first failing partition
+        (in the order of the items), and returns the number of points without value.
+        Where processes can be forked, the workers inherit the items instead of receiving them pickled
+    """
+    global shared_items
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    shard_size = max(1, len(items) // (num_cores * SHARDS_PER_CORE) + 1)
+    ranges = [(i, min(i + shard_size, len(items))) for i in range(0, len(items), shard_size)]
+    if "fork" not in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=num_cores) as executor:
+            futures = [executor.submit(verify_items, items[start:end]) for start, end in ranges]
+            return sum(future.result() for future in futures)
+
+    shared_items = items
+    try:
+        with ProcessPoolExecutor(max_workers=num_cores, mp_context=multiprocessing.get_context("fork")) as executor:
+            futures = [executor.submit(verify_shared_items, start, end) for start, end in ranges]
+            return sum(future.result() for future in futures)
+    finally:
+        shared_items = None
+
+
+def verify(obj, parameters=None):
+    """
+        Verifies an IoT object and the items it contains, counting the points without value in MisMatchCounter
+        (reset when a log is verified). Raises VerificationFailedError on the first failed verification,
+        in the order of the items
+
+        Parameters
+        -------------
+        obj
+            IOTEventLog, IOTTrace, IOTEvent, DataContext, DataStream, MultiPoint or Point
+        parameters
+            Parameters of the verification of a log, including:
+                Parameters.SAMPLE_FRACTION -> fraction of the items (traces) of the log whose content is verified,
+                the header of the log and the types of its items being always verified (default: 1.0).
+                MisMatchCounter then counts the points of the verified items only
+                Parameters.SEED -> seed of the sample (default: 0)
+                Parameters.MULTIPROCESSING -> verifies the items in a process pool (default: False)
+                Parameters.CORES -> number of processes (default: number of cores - 2)
+    """
+    if parameters is None:
+        parameters = {}
+
+    obj_type = type(obj)
+    if obj_type not in VERIFIED_TYPES:
+        return UnsupportedTypeError(obj_type)
+
+    if obj_type is not IOTEventLog:
+        MisMatchCounter.POINT_NONE_VALUE += __walk(obj)
+        return
+
+    import multiprocessing
+
+    sample_fraction = exec_utils.get_param_value(Parameters.SAMPLE_FRACTION, parameters, 1.0)
+    seed = exec_utils.get_param_value(Parameters.SEED, parameters, 0)
+    enable_multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT)
+    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, max(1, multiprocessing.cpu_count() - 2))
+
+    verify_header(obj)
+    __verify_log_items(obj)
+    items = obj._list if sample_fraction >= 1.0 else get_sample(obj, sample_fraction, seed)
+    if enable_multiprocessing:
+        MisMatchCounter.POINT_NONE_VALUE += verify_with_multiprocessing(items, num_cores)
+    else:
+        MisMatchCounter.POINT_NONE_VALUE += verify_items(items)
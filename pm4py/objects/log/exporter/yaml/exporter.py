@@ -17,7 +17,7 @@
 from pm4py.objects.conversion.log import converter as log_conversion
 from pm4py.objects.log.exporter.yaml.variants import yaml_dumper
 from pm4py.objects.log.exporter.yaml.variants.yaml_dumper import DumperType
-from pm4py.util import exec_utils
+from pm4py.util import exec_utils, constants, pandas_utils
 
 
 DEFAULT_VARIANT = DumperType.C_DUMPER
@@ -49,10 +49,17 @@ def apply(
 
     parameters = dict() if parameters is None else parameters
 
-    yaml_dumper.apply(
-        log_conversion.apply(
+    if not pandas_utils.check_is_pandas_dataframe(log) or exec_utils.get_param_value(
+        yaml_dumper.Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT
+    ):
+        # the dataframes are exported without the conversion to an event log,
+        # except in the parallel export (which partitions the traces of the event log)
+        log = log_conversion.apply(
             log, variant=log_conversion.Variants.TO_EVENT_LOG, parameters=parameters
-        ),
+        )
+
+    yaml_dumper.apply(
+        log,
         output_file_path,
         variant,
         parameters=parameters,
@@ -0,0 +1,227 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import codecs
+import io
+from functools import lru_cache
+
+import yaml
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+
+
+# Emitter for the flat XES-YAML documents (event/trace documents having only scalar attributes).
+# The documents are rendered directly in a text buffer, following the rules of the YAML emitters
+# (sorted keys, plain style when allowed, single-quoted style otherwise), so the output is the same
+# obtained through yaml.dump. The documents that are not flat, or that contain values requiring
+# escaping/line folding, are dumped with the given YAML dumper.
+
+# size of the text buffer before it is written to the file
+BUFFER_SIZE = 1048576
+# width of the lines of the YAML emitters, above which the scalars containing spaces are folded
+BEST_WIDTH = 80
+# maximum length of a simple key
+MAX_SIMPLE_KEY_LENGTH = 128
+
+TAG_STR = "tag:yaml.org,2002:str"
+
+__RESOLVER = Resolver()
+__PRINTABLE = frozenset(chr(i) for i in range(0x20, 0x7F))
+__ALWAYS_INDICATORS = frozenset("#,[]{}&*!|>'\"%@`")
+
+
+def render_string(value: str):
+    """
+    Renders a string as the YAML emitters do, returning None if the string requires the double-quoted style
+
+    Parameters
+    -------------
+    value
+        String
+
+    Returns
+    -------------
+    rendered
+        Rendered string (plain or single-quoted)
+    """
+    if not value:
+        return "''"
+
+    if not __PRINTABLE.issuperset(value):
+        return None
+
+    first = value[0]
+    plain = not (
+        first in __ALWAYS_INDICATORS
+        or (first in "-?:" and (len(value) == 1 or value[1] == " "))
+        or first == " "
+        or value[-1] == " "
+        or value[-1] == ":"
+        or value.startswith("---")
+        or value.startswith("...")
+        or ": " in value
+        or " #" in value
+    )
+
+    if plain and __RESOLVER.resolve(ScalarNode, value, (True, False)) == TAG_STR:
+        return value
+
+    return "'" + value.replace("'", "''") + "'"
+
+
+@lru_cache(maxsize=4096)
+def render_key(key: str):
+    """
+    Renders an attribute key (the keys are repeated in all the documents, hence their rendering is cached)
+    """
+    return render_string(key)
+
+
+def render_scalar(value):
+    """
+    Renders a scalar value (str, int, float, bool, None) as the YAML emitters do,
+    returning None if the value can not be rendered by this emitter
+    """
+    value_type = type(value)
+
+    if value_type is str:
+        return render_string(value)
+    elif value_type is bool:
+        return "true" if value else "false"
+    elif value_type is int:
+        return str(value)
+    elif value_type is float:
+        if value != value:
+            return ".nan"
+        elif value == float("inf"):
+            return ".inf"
+        elif value == -float("inf"):
+            return "-.inf"
+        rendered = repr(value).lower()
+        if "." not in rendered and "e" in rendered:
+            rendered = rendered.replace("e", ".0e", 1)
+        return rendered
+    elif value is None:
+        return "null"
+
+    return None
+
+
+def render_flat_document(document: dict):
+    """
+    Renders a flat document ({root: {key: scalar, ...}}), returning None if the document
+    can not be rendered by this emitter
+
+    Parameters
+    -------------
+    document
+        Document
+
+    Returns
+    -------------
+    rendered
+        Text of the document
+    """
+    if len(document) != 1:
+        return None
+
+    root, attributes = next(iter(document.items()))
+
+    if type(root) is not str or type(attributes) is not dict or not attributes:
+        return None
+
+    rendered_root = render_string(root)
+    if rendered_root is None or rendered_root != root:
+        return None
+
+    lines = [root, ":\n"]
+
+    for key in sorted(attributes):
+        if type(key) is not str:
+            return None
+
+        rendered_key = render_key(key)
+        rendered_value = render_scalar(attributes[key])
+
+        if rendered_key is None or rendered_value is None or len(rendered_key) > MAX_SIMPLE_KEY_LENGTH:
+            return None
+
+        if " " in rendered_value and len(rendered_key) + len(rendered_value) + 4 > BEST_WIDTH:
+            # the emitter would fold the scalar on several lines
+            return None
+
+        lines.append("  ")
+        lines.append(rendered_key)
+        lines.append(": ")
+        lines.append(rendered_value)
+        lines.append("\n")
+
+    return "".join(lines)
+
+
+class BufferedDocumentWriter(object):
+    def __init__(self, fp_obj, encoding: str, dumper):
+        """
+        Writes the documents of a XES-YAML file through a text buffer, which is flushed in large blocks
+
+        Parameters
+        --------------
+        fp_obj
+            Binary file object
+        encoding
+            Encoding
+        dumper
+            YAML dumper class, used for the documents that are not flat
+        """
+        self.fp_obj = fp_obj
+        self.encoding = encoding
+        self.dumper = dumper
+        self.buffer = io.StringIO()
+        # the documents rendered here are ASCII; the UTF-16/32 encodings would require the BOM of the dumper
+        self.enabled = codecs.lookup(encoding).name in ("utf-8", "ascii")
+
+    def write(self, text: str):
+        self.buffer.write(text)
+        if self.buffer.tell() >= BUFFER_SIZE:
+            self.flush()
+
+    def dump(self, document: dict, separator: bool = True):
+        """
+        Writes a document, preceded (if required) by the document separator
+        """
+        rendered = render_flat_document(document) if self.enabled else None
+
+        if rendered is None:
+            self.flush()
+            if separator:
+                self.fp_obj.write("---\n".encode(self.encoding))
+            yaml.dump(
+                document,
+                self.fp_obj,
+                encoding=self.encoding,
+                default_flow_style=False,
+                Dumper=self.dumper,
+            )
+        else:
+            if separator:
+                self.write("---\n")
+            self.write(rendered)
+
+    def flush(self):
+        if self.buffer.tell() > 0:
+            self.fp_obj.write(self.buffer.getvalue().encode(self.encoding))
+            self.buffer.seek(0)
+            self.buffer.truncate(0)
@@ -16,12 +16,15 @@
 '''
 import gzip
 import importlib.util
+import io
+from collections import deque
 from enum import Enum
 import math
 import numbers
 
 from pm4py.objects.log.util import xes as xes_util
-from pm4py.util import exec_utils, constants, xes_constants
+from pm4py.objects.log.exporter.yaml.variants import flat_emitter
+from pm4py.util import exec_utils, constants, xes_constants, pandas_utils
 import yaml
 from yaml.cyaml import CDumper, CSafeDumper
 from yaml import Dumper, SafeDumper
@@ -38,8 +41,17 @@ class Parameters(Enum):
     COMPRESS = "compress"
     SHOW_PROGRESS_BAR = "show_progress_bar"
     ENCODING = "encoding"
+    BATCHED = "batched"
+    MULTIPROCESSING = "multiprocessing"
+    CORES = "cores"
+    MULTI_MEMBER_GZIP = "multi_member_gzip"
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
 
 
+# number of shards (groups of consecutive traces) per worker process in the parallel export
+SHARDS_PER_CORE = 4
+
 # defines correspondence between Python types and XES types
 __TYPE_CORRESPONDENCE = {
     "str": xes_util.TAG_STRING,
@@ -77,6 +89,56 @@ def __get_xes_attr_type(attr_name, attr_type):
     return attr_type_xes
 
 
+def get_log_header(log):
+    """
+    Gets the header document (log: ...) of the XES-YAML file from the log
+    (XES-YAML features, extensions, classifiers, globals and log attributes)
+
+    Parameters
+    --------------
+    log
+        Event log
+
+    Returns
+    --------------
+    log_header
+        Header document
+    """
+    log_header = dict({xes_constants.TAG_LOG: dict()})
+
+    log_header[xes_constants.TAG_LOG]["xes"] = {
+        "creator": "cpee.org",
+        "features": "nested-attributes",
+    }
+
+    log_header[xes_constants.TAG_LOG][xes_constants.TAG_EXTENSION] = dict()
+    for ext_key, ext_value in log.extensions.items():
+        log_header[xes_constants.TAG_LOG][xes_constants.TAG_EXTENSION][
+            ext_key
+        ] = ext_value
+
+    log_header[xes_constants.TAG_LOG][xes_constants.TAG_CLASSIFIER] = dict()
+    for class_name, class_attributes in log.classifiers.items():
+        log_header[xes_constants.TAG_LOG][xes_constants.TAG_CLASSIFIER][
+            class_name
+        ] = class_attributes
+
+    log_header[xes_constants.TAG_LOG][xes_constants.TAG_GLOBAL] = dict()
+    for scope in log.omni_present:
+        log_header[xes_constants.TAG_LOG][xes_constants.TAG_GLOBAL][scope] = dict()
+        for attr_name, attr_value in log.omni_present[scope].items():
+            log_header[xes_constants.TAG_LOG][xes_constants.TAG_GLOBAL][scope][
+                attr_name
+            ] = attr_value
+
+    for att_key, att_value in log.attributes.items():
+        log_header[xes_constants.TAG_LOG][att_key] = export_attribute(
+            att_key, att_value
+        )
+
+    return log_header
+
+
 def export_log(log, fp_obj, encoding, variant, parameters=None, log_header=None, append=False):
     """
     Exports the contents of the log line-by-line
@@ -93,13 +155,21 @@ def export_log(log, fp_obj, encoding, variant, parameters=None, log_header=None,
     variant
         YAML Dumper variant
     parameters
-        Parameters
+        Parameters, including:
+            Parameters.BATCHED -> renders the flat documents directly in a text buffer written in large blocks,
+                using the YAML dumper only for the other documents (default: False)
     """
 
     show_progress_bar = exec_utils.get_param_value(
         Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR
     )
+    batched = exec_utils.get_param_value(Parameters.BATCHED, parameters, False)
     progress = None
+    writer = (
+        flat_emitter.BufferedDocumentWriter(fp_obj, encoding, variant.value)
+        if batched
+        else None
+    )
 
     if importlib.util.find_spec("tqdm") and show_progress_bar:
         from tqdm.auto import tqdm
@@ -110,117 +180,335 @@ def export_log(log, fp_obj, encoding, variant, parameters=None, log_header=None,
 
     # in case log_header is not given as parameter
     if log_header is None:
-        log_header = dict({xes_constants.TAG_LOG: dict()})
-
-        log_header[xes_constants.TAG_LOG]["xes"] = {
-            "creator": "cpee.org",
-            "features": "nested-attributes",
-        }
-
-        log_header[xes_constants.TAG_LOG][xes_constants.TAG_EXTENSION] = dict()
-        for ext_key, ext_value in log.extensions.items():
-            log_header[xes_constants.TAG_LOG][xes_constants.TAG_EXTENSION][
-                ext_key
-            ] = ext_value
-
-        log_header[xes_constants.TAG_LOG][xes_constants.TAG_CLASSIFIER] = dict()
-        for class_name, class_attributes in log.classifiers.items():
-            log_header[xes_constants.TAG_LOG][xes_constants.TAG_CLASSIFIER][
-                class_name
-            ] = class_attributes
-
-        log_header[xes_constants.TAG_LOG][xes_constants.TAG_GLOBAL] = dict()
-        for scope in log.omni_present:
-            log_header[xes_constants.TAG_LOG][xes_constants.TAG_GLOBAL][scope] = dict()
-            for attr_name, attr_value in log.omni_present[scope].items():
-                log_header[xes_constants.TAG_LOG][xes_constants.TAG_GLOBAL][scope][
-                    attr_name
-                ] = attr_value
-
-        for att_key, att_value in log.attributes.items():
-            log_header[xes_constants.TAG_LOG][att_key] = export_attribute(
-                att_key, att_value
-            )
+        log_header = get_log_header(log)
 
     if not append:
-        yaml.dump(
-            log_header,
+        if writer is not None:
+            writer.dump(log_header, separator=False)
+        else:
+            yaml.dump(
+                log_header,
+                fp_obj,
+                encoding=encoding,
+                default_flow_style=False,
+                Dumper=variant.value,
+            )
+
+    # XES-YAML normal form consists of only 1 trace => no need to record the trace
+    # => in case of multiple traces, record them
+    record_traces = len(log) > 1
+
+    for trace in log:
+        export_trace(
+            trace,
             fp_obj,
-            encoding=encoding,
-            default_flow_style=False,
-            Dumper=variant.value,
+            encoding,
+            variant,
+            writer=writer,
+            record_trace=record_traces,
+            progress=progress,
         )
 
-    for trace in log:
-        trace_obj = dict({xes_constants.TAG_TRACE: dict()})
-        for trace_att_key, trace_att_value in trace.attributes.items():
-            if isinstance(trace_att_value, numbers.Number) and math.isnan(
-                trace_att_value
-            ):
-                continue
-
-            if trace_att_key == xes_util.DEFAULT_TIMESTAMP_KEY and not isinstance(
-                trace_att_value, str
-            ):
-                trace_obj[xes_constants.TAG_TRACE][trace_att_key] = str(
-                    trace_att_value.isoformat()
-                )
+    if writer is not None:
+        writer.flush()
+
+    # gracefully close progress bar
+    if progress is not None:
+        progress.close()
+    del progress, log
 
-            else:
-                exported_attribute = export_attribute(trace_att_key, trace_att_value)
-                trace_obj[xes_constants.TAG_TRACE][trace_att_key] = exported_attribute
 
-        # XES-YAML normal form consists of only 1 trace => no need to record the trace
-        # => in case of multiple traces, record them
-        if len(log) > 1 and trace_obj[xes_constants.TAG_TRACE] != {}:
-            fp_obj.write("---\n".encode(encoding))
+def export_dataframe(dataframe, fp_obj, encoding, variant, parameters=None, log_header=None, append=False):
+    """
+    Exports the contents of a dataframe to a file object, without converting it to an event log.
+    The rows are grouped by case (keeping the order of the first occurrence of the cases, as in the conversion
+    to an event log) and the documents are built directly from the columns, producing the same file
+    obtained by exporting the converted event log.
+
+    Parameters
+    --------------
+    dataframe
+        Dataframe
+    fp_obj
+        File object
+    encoding
+        Encoding
+    variant
+        YAML Dumper variant
+    parameters
+        Parameters, including:
+            Parameters.CASE_ID_KEY -> column containing the case identifier (default: case:concept:name)
+            Parameters.CASE_ATTRIBUTE_PREFIX -> prefix of the columns containing the case attributes (default: case:)
+            Parameters.BATCHED -> renders the flat documents directly in a text buffer (default: False)
+    log_header
+        (if provided) header document
+    append
+        Appends the traces to an existing file (without writing the header document)
+    """
+    if parameters is None:
+        parameters = {}
+
+    import numpy as np
+    import pandas as pd
+    from pm4py.objects.conversion.log import converter as log_conversion
+
+    show_progress_bar = exec_utils.get_param_value(
+        Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR
+    )
+    batched = exec_utils.get_param_value(Parameters.BATCHED, parameters, False)
+    case_id_key = exec_utils.get_param_value(
+        Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME
+    )
+    case_attribute_prefix = exec_utils.get_param_value(
+        Parameters.CASE_ATTRIBUTE_PREFIX, parameters, constants.CASE_ATTRIBUTE_PREFIX
+    )
+    writer = (
+        flat_emitter.BufferedDocumentWriter(fp_obj, encoding, variant.value)
+        if batched
+        else None
+    )
+
+    if not append:
+        if log_header is None:
+            # the header (extensions detected from the columns, log attributes) is the one
+            # of the event log obtained from the conversion of the dataframe
+            log_header = get_log_header(
+                log_conversion.apply(
+                    dataframe.iloc[:0],
+                    variant=log_conversion.Variants.TO_EVENT_LOG,
+                    parameters=parameters,
+                )
+            )
+
+        if writer is not None:
+            writer.dump(log_header, separator=False)
+        else:
             yaml.dump(
-                trace_obj,
+                log_header,
                 fp_obj,
                 encoding=encoding,
                 default_flow_style=False,
                 Dumper=variant.value,
             )
 
-        for event in trace:
-            event_obj = dict({xes_constants.TAG_EVENT: dict()})
-            for event_att_key, event_att_value in event.items():
-                if isinstance(event_att_value, numbers.Number) and math.isnan(
-                    event_att_value
-                ):
-                    continue
+    # groups the rows by case, keeping the order of the first occurrence of the cases
+    # and the order of the rows inside the cases
+    case_codes, _ = pd.factorize(dataframe[case_id_key], use_na_sentinel=False)
+    order = np.argsort(case_codes, kind="stable")
+    case_starts = np.flatnonzero(np.diff(case_codes[order], prepend=-1))
+    case_ends = np.append(case_starts[1:], len(order))
+
+    case_ids = dataframe[case_id_key].take(order[case_starts]).tolist()
+    trace_columns = []
+    event_columns = []
+
+    for column in dataframe.columns:
+        if column.startswith(case_attribute_prefix):
+            # the case attributes are read from the first row of the case
+            trace_columns.append(
+                (column.replace(case_attribute_prefix, ""), dataframe[column].take(order[case_starts]).tolist())
+            )
+        elif column == xes_util.DEFAULT_TIMESTAMP_KEY and pd.api.types.is_datetime64_any_dtype(dataframe[column]):
+            event_columns.append((column, format_iso_timestamps(dataframe[column].take(order))))
+        else:
+            event_columns.append((column, dataframe[column].take(order).tolist()))
 
-                if event_att_key == xes_util.DEFAULT_TIMESTAMP_KEY and not isinstance(
-                    event_att_value, str
-                ):
-                    event_obj[xes_constants.TAG_EVENT][event_att_key] = str(
-                        event_att_value.isoformat()
-                    )
+    progress = None
+    if importlib.util.find_spec("tqdm") and show_progress_bar:
+        from tqdm.auto import tqdm
 
-                else:
-                    exported_attribute = export_attribute(
-                        event_att_key, event_att_value
-                    )
-                    event_obj[xes_constants.TAG_EVENT][
-                        event_att_key
-                    ] = exported_attribute
+        progress = tqdm(
+            total=len(order), desc="exporting log, completed traces :: "
+        )
 
-            fp_obj.write("---\n".encode(encoding))
-            yaml.dump(
-                event_obj,
+    # XES-YAML normal form consists of only 1 trace => no need to record the trace
+    # => in case of multiple traces, record them
+    record_traces = len(case_starts) > 1
+
+    for case_index in range(len(case_starts)):
+        if record_traces:
+            trace_attributes = {key: values[case_index] for key, values in trace_columns}
+            if xes_constants.DEFAULT_TRACEID_KEY not in trace_attributes:
+                trace_attributes[xes_constants.DEFAULT_TRACEID_KEY] = case_ids[case_index]
+
+            trace_obj = get_trace_document(trace_attributes)
+            if trace_obj[xes_constants.TAG_TRACE] != {}:
+                dump_document(trace_obj, fp_obj, encoding, variant, writer=writer)
+
+        for row in range(case_starts[case_index], case_ends[case_index]):
+            dump_document(
+                get_event_document({key: values[row] for key, values in event_columns}),
                 fp_obj,
-                encoding=encoding,
-                default_flow_style=False,
-                Dumper=variant.value,
+                encoding,
+                variant,
+                writer=writer,
             )
 
-            if progress is not None:
-                progress.update()
+        if progress is not None:
+            progress.update(case_ends[case_index] - case_starts[case_index])
+
+    if writer is not None:
+        writer.flush()
 
     # gracefully close progress bar
     if progress is not None:
         progress.close()
-    del progress, log
+    del progress
+
+
+def format_iso_timestamps(series):
+    """
+    Formats a datetime column to ISO 8601 strings in bulk (as done by the isoformat method of the timestamps)
+
+    Parameters
+    --------------
+    series
+        Datetime column
+
+    Returns
+    --------------
+    values
+        List of strings (NaT for the missing values)
+    """
+    import numpy as np
+    import pandas as pd
+
+    # wall-clock time of the timestamps (in their time zone)
+    local = series.dt.tz_localize(None) if series.dt.tz is not None else series
+    formatted = pd.Series(
+        np.datetime_as_string(local.to_numpy().astype("datetime64[s]"), unit="s"),
+        index=series.index,
+    )
+
+    microsecond = series.dt.microsecond.fillna(0).astype("int64")
+    nanosecond = series.dt.nanosecond.fillna(0).astype("int64")
+    has_fraction = (microsecond != 0) | (nanosecond != 0)
+    if has_fraction.any():
+        fraction = "." + microsecond.astype(str).str.zfill(6)
+        fraction = fraction.where(nanosecond == 0, fraction + nanosecond.astype(str).str.zfill(3))
+        formatted = formatted.where(~has_fraction, formatted + fraction)
+
+    if series.dt.tz is not None:
+        # the UTC offset is reported as +HH:MM (+HH:MM:SS for the offsets having seconds)
+        offset_seconds = (
+            (local - series.dt.tz_convert("UTC").dt.tz_localize(None)).dt.total_seconds().fillna(0).astype("int64")
+        )
+        absolute = offset_seconds.abs()
+        offset = (
+            offset_seconds.lt(0).map({True: "-", False: "+"})
+            + (absolute // 3600).astype(str).str.zfill(2)
+            + ":"
+            + (absolute % 3600 // 60).astype(str).str.zfill(2)
+        )
+        offset = offset.where(absolute % 60 == 0, offset + ":" + (absolute % 60).astype(str).str.zfill(2))
+        formatted = formatted + offset
+
+    return formatted.where(series.notna(), "NaT").tolist()
+
+
+def export_trace(trace, fp_obj, encoding, variant, writer=None, record_trace=True, progress=None):
+    """
+    Exports a trace (the trace document, if required, and the event documents) to a file object
+
+    Parameters
+    --------------
+    trace
+        Trace
+    fp_obj
+        File object
+    encoding
+        Encoding
+    variant
+        YAML Dumper variant
+    writer
+        (if provided) buffered writer of the flat documents
+    record_trace
+        Records the trace document (not done in the XES-YAML normal form, consisting of only 1 trace)
+    progress
+        (if provided) progress bar, updated for every exported event
+    """
+    trace_obj = get_trace_document(trace.attributes)
+
+    if record_trace and trace_obj[xes_constants.TAG_TRACE] != {}:
+        dump_document(trace_obj, fp_obj, encoding, variant, writer=writer)
+
+    for event in trace:
+        dump_document(get_event_document(event), fp_obj, encoding, variant, writer=writer)
+
+        if progress is not None:
+            progress.update()
+
+
+def get_trace_document(trace_attributes):
+    """
+    Gets the trace document (trace: ...) from the attributes of a trace
+    """
+    trace_obj = dict({xes_constants.TAG_TRACE: dict()})
+    for trace_att_key, trace_att_value in trace_attributes.items():
+        if isinstance(trace_att_value, numbers.Number) and math.isnan(
+            trace_att_value
+        ):
+            continue
+
+        if trace_att_key == xes_util.DEFAULT_TIMESTAMP_KEY and not isinstance(
+            trace_att_value, str
+        ):
+            trace_obj[xes_constants.TAG_TRACE][trace_att_key] = str(
+                trace_att_value.isoformat()
+            )
+
+        else:
+            exported_attribute = export_attribute(trace_att_key, trace_att_value)
+            trace_obj[xes_constants.TAG_TRACE][trace_att_key] = exported_attribute
+
+    return trace_obj
+
+
+def get_event_document(event):
+    """
+    Gets the event document (event: ...) from an event
+    """
+    event_obj = dict({xes_constants.TAG_EVENT: dict()})
+    for event_att_key, event_att_value in event.items():
+        if isinstance(event_att_value, numbers.Number) and math.isnan(
+            event_att_value
+        ):
+            continue
+
+        if event_att_key == xes_util.DEFAULT_TIMESTAMP_KEY and not isinstance(
+            event_att_value, str
+        ):
+            event_obj[xes_constants.TAG_EVENT][event_att_key] = str(
+                event_att_value.isoformat()
+            )
+
+        else:
+            exported_attribute = export_attribute(
+                event_att_key, event_att_value
+            )
+            event_obj[xes_constants.TAG_EVENT][
+                event_att_key
+            ] = exported_attribute
+
+    return event_obj
+
+
+def dump_document(document, fp_obj, encoding, variant, writer=None):
+    """
+    Writes a trace/event document, preceded by the document separator, to a file object
+    (through the buffered writer of the flat documents, if provided)
+    """
+    if writer is not None:
+        writer.dump(document)
+    else:
+        fp_obj.write("---\n".encode(encoding))
+        yaml.dump(
+            document,
+            fp_obj,
+            encoding=encoding,
+            default_flow_style=False,
+            Dumper=variant.value,
+        )
 
 
 def export_attribute(attr_key, attr_value):
@@ -276,16 +564,29 @@ def apply(
     Parameters
     ------------
     log
-        Event log
+        Event log (or dataframe, exported directly by export_dataframe)
     output_file_path
         Path to the XES file
     parameters
-        Parameters
+        Parameters, including:
+            Parameters.MULTIPROCESSING -> exports the traces in a process pool (default: False)
     """
 
     if parameters is None:
         parameters = {}
 
+    if exec_utils.get_param_value(
+        Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT
+    ):
+        return export_with_multiprocessing(
+            log,
+            output_file_path,
+            variant,
+            parameters=parameters,
+            append=append,
+            log_header=log_header,
+        )
+
     encoding = exec_utils.get_param_value(
         Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING
     )
@@ -300,18 +601,218 @@ def apply(
     else:
         f = open(output_file_path, "ab" if append else "wb")
 
-    export_log(
-        log,
-        f,
-        encoding,
-        variant,
-        parameters=parameters,
-        log_header=log_header,
-        append=append,
+    if pandas_utils.check_is_pandas_dataframe(log):
+        export_dataframe(
+            log,
+            f,
+            encoding,
+            variant,
+            parameters=parameters,
+            log_header=log_header,
+            append=append,
+        )
+    else:
+        export_log(
+            log,
+            f,
+            encoding,
+            variant,
+            parameters=parameters,
+            log_header=log_header,
+            append=append,
+        )
+
+    f.close()
+
+
+
+def export_with_multiprocessing(
+    log,
+    output_file_path,
+    variant: DumperType,
+    parameters=None,
+    append=False,
+    log_header=None,
+):
+    """
+    Exports a XES log by partitioning it in shards of consecutive traces, which are rendered in a process pool.
+    The shards are written in their original order after the header document, so the resulting file
+    is the same obtained by the sequential export.
+
+    Parameters
+    ------------
+    log
+        Event log
+    output_file_path
+        Path to the XES file
+    variant
+        YAML Dumper variant
+    parameters
+        Parameters, including:
+            Parameters.CORES -> number of worker processes
+            Parameters.MULTI_MEMBER_GZIP -> when compressing, the shards are compressed by the workers
+                and written as the members of a multi-member gzip file (default: True)
+            Parameters.BATCHED -> uses the buffered writer of the flat documents in the workers (default: False)
+    append
+        Appends the traces to an existing file (without writing the header document)
+    log_header
+        (if provided) header document
+    """
+    if parameters is None:
+        parameters = {}
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    num_cores = exec_utils.get_param_value(
+        Parameters.CORES, parameters, max(1, multiprocessing.cpu_count() - 2)
+    )
+    show_progress_bar = exec_utils.get_param_value(
+        Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR
+    )
+    encoding = exec_utils.get_param_value(
+        Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING
     )
+    compress = exec_utils.get_param_value(
+        Parameters.COMPRESS, parameters, output_file_path.lower().endswith(".gz")
+    )
+    multi_member_gzip = exec_utils.get_param_value(
+        Parameters.MULTI_MEMBER_GZIP, parameters, True
+    )
+    batched = exec_utils.get_param_value(Parameters.BATCHED, parameters, False)
+
+    if compress and not output_file_path.lower().endswith(".gz"):
+        output_file_path = output_file_path + ".gz"
+
+    # the workers compress their shards only when the file is a sequence of gzip members
+    compress_shards = compress and multi_member_gzip
+
+    if compress and not compress_shards:
+        f = gzip.open(output_file_path, mode="ab" if append else "wb")
+    else:
+        f = open(output_file_path, "ab" if append else "wb")
+
+    if not append:
+        if log_header is None:
+            log_header = get_log_header(log)
+
+        header_content = yaml.dump(
+            log_header,
+            encoding=encoding,
+            default_flow_style=False,
+            Dumper=variant.value,
+        )
+        f.write(gzip.compress(header_content) if compress_shards else header_content)
+
+    # XES-YAML normal form consists of only 1 trace => no need to record the trace
+    # => in case of multiple traces, record them
+    record_traces = len(log) > 1
+
+    shards = __get_shards(log, num_cores * SHARDS_PER_CORE)
+
+    progress = None
+    if importlib.util.find_spec("tqdm") and show_progress_bar:
+        from tqdm.auto import tqdm
+
+        progress = tqdm(
+            total=len(shards), desc="exporting log, completed shards :: "
+        )
+
+    with ProcessPoolExecutor(max_workers=num_cores) as executor:
+        # the shards are submitted in a bounded window, so only a few rendered shards are kept in memory
+        futures = deque()
+
+        for start, end in shards:
+            futures.append(
+                executor.submit(
+                    __export_shard,
+                    [log[i] for i in range(start, end)],
+                    encoding,
+                    variant,
+                    batched,
+                    record_traces,
+                    compress_shards,
+                )
+            )
+
+            if len(futures) >= 2 * num_cores:
+                f.write(futures.popleft().result())
+                if progress is not None:
+                    progress.update()
+
+        while futures:
+            f.write(futures.popleft().result())
+            if progress is not None:
+                progress.update()
 
     f.close()
 
+    # gracefully close progress bar
+    if progress is not None:
+        progress.close()
+    del progress, futures
+
+
+def __get_shards(log, num_shards):
+    """
+    Partitions the log in (at most) the given number of shards of consecutive traces,
+    having approximately the same number of events
+
+    Returns
+    ------------
+    shards
+        List of (start, end) trace indices
+    """
+    total_events = get_yaml_num_events(log)
+    shard_events = max(1, total_events // max(1, num_shards) + 1)
+
+    shards = []
+    start = 0
+    events = 0
+
+    for index, trace in enumerate(log):
+        events += len(trace)
+        if events >= shard_events:
+            shards.append((start, index + 1))
+            start = index + 1
+            events = 0
+
+    if start < len(log):
+        shards.append((start, len(log)))
+
+    return shards
+
+
+def __export_shard(traces, encoding, variant, batched, record_traces, compress):
+    """
+    Renders a shard of traces in the XES-YAML format (executed in the worker processes)
+
+    Returns
+    ------------
+    content
+        Bytes of the shard (gzip compressed, if required)
+    """
+    buffer = io.BytesIO()
+    writer = (
+        flat_emitter.BufferedDocumentWriter(buffer, encoding, variant.value)
+        if batched
+        else None
+    )
+
+    for trace in traces:
+        export_trace(
+            trace, buffer, encoding, variant, writer=writer, record_trace=record_traces
+        )
+
+    if writer is not None:
+        writer.flush()
+
+    content = buffer.getvalue()
+
+    if compress:
+        content = gzip.compress(content)
+
+    return content
 
 
 def get_yaml_num_events(log):
@@ -55,6 +55,34 @@ def apply(
     return yaml_loader.apply(path, parameters=parameters, variant=variant)
 
 
+def iter_traces(
+    path,
+    parameters=None,
+    variant=DEFAULT_VARIANT,
+):
+    """
+    Iterates over the traces of a XES-YAML log without building the whole EventLog
+
+    Parameters
+    -----------
+    path
+        Log path
+    parameters
+        Parameters of the algorithm, including
+            Parameters.MAX_TRACES -> Specify the maximum number of traces to yield (read in order in the YAML file)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+    variant
+        YAML loader to use
+
+    Returns
+    -----------
+    trace_iterator
+        Generator of Trace objects
+    """
+
+    return yaml_loader.iter_traces(path, parameters=parameters, variant=variant)
+
+
 def get_log_header(
     path: str,
     variant=DEFAULT_VARIANT,
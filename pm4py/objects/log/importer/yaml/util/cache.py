@@ -0,0 +1,284 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import hashlib
+import json
+import math
+import os
+import warnings
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    CACHE_DIR = "cache_dir"
+    MAX_CACHE_SIZE = "max_cache_size"
+    CACHE_COMPRESSION = "cache_compression"
+    FINGERPRINT_BYTES = "fingerprint_bytes"
+
+
+# extension of the cached (Arrow IPC) dataframes
+CACHE_EXTENSION = ".arrow"
+# default maximum size (in bytes) of the cache directory
+DEFAULT_MAX_CACHE_SIZE = 10 * 1024 ** 3
+# number of bytes, at the beginning and at the end of the file, included in the fingerprint
+DEFAULT_FINGERPRINT_BYTES = 1048576
+
+__METADATA_ATTRS = b"pm4py:attrs"
+__METADATA_JSON_COLUMNS = b"pm4py:json_columns"
+__METADATA_OBJECT_COLUMNS = b"pm4py:object_columns"
+
+
+def get_fingerprint(filename: str, key_parameters=None, parameters: Optional[dict] = None) -> str:
+    """
+    Gets the key of a XES-YAML file in the cache, from its path, size and modification time
+    and from a hash of the first and the last bytes of its content
+
+    Parameters
+    ------------
+    filename
+        Path to the XES-YAML file
+    key_parameters
+        (if provided) values of the import parameters affecting the imported dataframe
+    parameters
+        Parameters, including:
+            Parameters.FINGERPRINT_BYTES -> number of bytes read at the beginning and at the end of the file
+
+    Returns
+    ------------
+    fingerprint
+        Hexadecimal key
+    """
+    if parameters is None:
+        parameters = {}
+
+    fingerprint_bytes = exec_utils.get_param_value(Parameters.FINGERPRINT_BYTES, parameters,
+                                                   DEFAULT_FINGERPRINT_BYTES)
+
+    stat = os.stat(filename)
+    hasher = hashlib.sha256()
+    hasher.update(repr((os.path.abspath(filename), stat.st_size, stat.st_mtime_ns, key_parameters)).encode("utf-8"))
+
+    with open(filename, "rb") as f:
+        hasher.update(f.read(fingerprint_bytes))
+        if stat.st_size > fingerprint_bytes:
+            f.seek(max(fingerprint_bytes, stat.st_size - fingerprint_bytes))
+            hasher.update(f.read())
+
+    return hasher.hexdigest()
+
+
+def get_cache_path(fingerprint: str, cache_dir: str) -> str:
+    """
+    Gets the path of the cached dataframe having the given fingerprint
+    """
+    return os.path.join(cache_dir, fingerprint + CACHE_EXTENSION)
+
+
+def get(filename: str, key_parameters=None, parameters: Optional[dict] = None):
+    """
+    Gets the dataframe of a XES-YAML file from the cache. The cached Arrow file is memory-mapped
+    (its buffers are read without copies when not compressed), then converted to a dataframe,
+    which copies its columns
+
+    Parameters
+    ------------
+    filename
+        Path to the XES-YAML file
+    key_parameters
+        (if provided) values of the import parameters affecting the imported dataframe
+    parameters
+        Parameters, including:
+            Parameters.CACHE_DIR -> directory of the cache
+
+    Returns
+    ------------
+    dataframe
+        Dataframe (None if the file is not in the cache)
+    """
+    if parameters is None:
+        parameters = {}
+
+    import pyarrow as pa
+
+    cache_dir = exec_utils.get_param_value(Parameters.CACHE_DIR, parameters, None)
+    cache_path = get_cache_path(get_fingerprint(filename, key_parameters, parameters), cache_dir)
+
+    try:
+        with pa.memory_map(cache_path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (FileNotFoundError, pa.ArrowInvalid):
+        # missing (or evicted while being read) or truncated entry
+        return None
+
+    # records the access, for the least-recently-used eviction
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+
+    metadata = table.schema.metadata or {}
+    json_columns = json.loads(metadata.get(__METADATA_JSON_COLUMNS, b"[]"))
+    object_columns = json.loads(metadata.get(__METADATA_OBJECT_COLUMNS, b"[]"))
+
+    dataframe = table.to_pandas()
+    for column in object_columns:
+        # the missing values of the imported dataframe are NaN, while Arrow restores them as None
+        values = dataframe[column].astype(object)
+        dataframe[column] = values.where(values.notna(), math.nan)
+    for column in json_columns:
+        dataframe[column] = [decode_value(json.loads(value)) for value in dataframe[column]]
+    dataframe.attrs = json.loads(metadata.get(__METADATA_ATTRS, b"{}"))
+
+    return dataframe
+
+
+def put(filename: str, dataframe, key_parameters=None, parameters: Optional[dict] = None):
+    """
+    Stores the dataframe of a XES-YAML file in the cache, as an Arrow IPC file,
+    evicting the least recently used entries when the cache exceeds its maximum size.
+    The object columns of strings or booleans are stored as Arrow columns, while the other columns
+    of generic objects (e.g., nested attributes) are stored as JSON strings (see encode_value).
+    A dataframe containing values that cannot be encoded is not stored.
+
+    Parameters
+    ------------
+    filename
+        Path to the XES-YAML file
+    dataframe
+        Dataframe
+    key_parameters
+        (if provided) values of the import parameters affecting the imported dataframe
+    parameters
+        Parameters, including:
+            Parameters.CACHE_DIR -> directory of the cache
+            Parameters.MAX_CACHE_SIZE -> maximum size (in bytes) of the cache (default: 10 GB)
+            Parameters.CACHE_COMPRESSION -> compression of the Arrow buffers: lz4, zstd or None (default: None,
+            the compressed buffers cannot be memory-mapped without copies)
+    """
+    if parameters is None:
+        parameters = {}
+
+    import pyarrow as pa
+
+    cache_dir = exec_utils.get_param_value(Parameters.CACHE_DIR, parameters, None)
+    max_cache_size = exec_utils.get_param_value(Parameters.MAX_CACHE_SIZE, parameters, DEFAULT_MAX_CACHE_SIZE)
+    compression = exec_utils.get_param_value(Parameters.CACHE_COMPRESSION, parameters, None)
+
+    stored = dataframe.copy(deep=False)
+    object_columns = []
+    json_columns = []
+    for column in stored.columns:
+        if stored[column].dtype == object:
+            try:
+                arrow_type = pa.array(stored[column], from_pandas=True).type
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                arrow_type = None
+            if arrow_type is not None and (pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+                                           or pa.types.is_boolean(arrow_type)):
+                object_columns.append(column)
+            else:
+                # e.g., nested attributes, which Arrow does not restore as the same Python objects
+                try:
+                    stored[column] = [json.dumps(encode_value(value)) for value in stored[column]]
+                except TypeError as e:
+                    warnings.warn("the dataframe is not stored in the cache: " + str(e))
+                    return
+                json_columns.append(column)
+
+    table = pa.Table.from_pandas(stored, preserve_index=False)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        __METADATA_ATTRS: json.dumps(dataframe.attrs, default=str).encode("utf-8"),
+        __METADATA_JSON_COLUMNS: json.dumps(json_columns).encode("utf-8"),
+        __METADATA_OBJECT_COLUMNS: json.dumps(object_columns).encode("utf-8"),
+    })
+
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_path = get_cache_path(get_fingerprint(filename, key_parameters, parameters), cache_dir)
+
+    # the entry is written under a temporary name, so concurrent readers never see a partial file
+    temp_path = cache_path + ".%d.tmp" % os.getpid()
+    with pa.OSFile(temp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema, options=pa.ipc.IpcWriteOptions(compression=compression)) as writer:
+            writer.write_table(table)
+    os.replace(temp_path, cache_path)
+
+    evict(cache_dir, max_cache_size)
+
+
+def encode_value(value):
+    """
+    Encodes a (possibly nested) attribute value into a JSON-serializable one. Lists and scalars
+    are kept as they are, while tuples, dictionaries and datetimes are wrapped in a single-key object
+    tagging their type, so that decode_value restores the same Python objects
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {"t": [encode_value(item) for item in value]}
+    if isinstance(value, dict):
+        return {"d": [[encode_value(key), encode_value(item)] for key, item in value.items()]}
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    raise TypeError("unsupported value of type %s" % type(value).__name__)
+
+
+def decode_value(value):
+    """
+    Decodes an attribute value encoded by encode_value
+    """
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    if isinstance(value, dict):
+        if "t" in value:
+            return tuple(decode_value(item) for item in value["t"])
+        if "d" in value:
+            return {decode_value(key): decode_value(item) for key, item in value["d"]}
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def evict(cache_dir: str, max_cache_size: int):
+    """
+    Removes the least recently used entries of the cache, until its size is below the given maximum size
+    """
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(CACHE_EXTENSION):
+            path = os.path.join(cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+    entries.sort()
+    total_size = sum(entry[1] for entry in entries)
+
+    for _, size, path in entries:
+        if total_size <= max_cache_size:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
@@ -0,0 +1,269 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import gzip
+import os
+import struct
+from enum import Enum
+from typing import List, Optional, Tuple
+
+import yaml
+
+from pm4py.util import constants, exec_utils, xes_constants
+from pm4py.objects.log.importer.yaml.variants.yaml_loader import DOCUMENT_SEPARATOR
+
+
+class Parameters(Enum):
+    INDEX_PATH = "index_path"
+    ENCODING = "encoding"
+
+
+# suffix of the sidecar file, placed next to the XES-YAML file
+INDEX_EXTENSION = ".idx"
+INDEX_MAGIC = b"PMYAMLIX"
+INDEX_VERSION = 1
+
+# magic, version, size and modification time of the XES-YAML file, length of the log header, number of traces
+__HEADER_STRUCT = struct.Struct("<8sHQqQQ")
+# offset and length (in bytes) of a trace, number of events of the trace
+__ENTRY_STRUCT = struct.Struct("<QQI")
+__LENGTH_STRUCT = struct.Struct("<I")
+
+
+class YamlIndex(object):
+    def __init__(self, header_length: int = 0):
+        """
+        Byte-offset index of the traces of a XES-YAML file.
+        For compressed (.gz) files, the offsets refer to the decompressed stream.
+
+        Parameters
+        -------------
+        header_length
+            Length (in bytes) of the log header document
+        """
+        self.header_length = header_length
+        self.offsets = []
+        self.lengths = []
+        self.num_events = []
+        self.case_ids = []
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def get_trace_range(self, trace_index: int) -> Tuple[int, int]:
+        """
+        Gets the (start, end) byte range of the trace at the given position
+        """
+        return self.offsets[trace_index], self.offsets[trace_index] + self.lengths[trace_index]
+
+    def get_trace_index(self, case_id) -> Optional[int]:
+        """
+        Gets the position of the trace having the given case identifier (None if not found)
+        """
+        case_id = str(case_id)
+        for i in range(len(self.case_ids)):
+            if self.case_ids[i] == case_id:
+                return i
+        return None
+
+
+def get_index_path(filename: str, parameters: Optional[dict] = None) -> str:
+    """
+    Gets the path of the sidecar index of a XES-YAML file
+    """
+    if parameters is None:
+        parameters = {}
+
+    return exec_utils.get_param_value(Parameters.INDEX_PATH, parameters, filename + INDEX_EXTENSION)
+
+
+def __is_document_start(line: bytes) -> bool:
+    return line.startswith(DOCUMENT_SEPARATOR) and line[len(DOCUMENT_SEPARATOR): len(DOCUMENT_SEPARATOR) + 1] in (
+        b"\n", b"\r", b" ", b"\t", b"")
+
+
+def __get_root_key(line: bytes) -> Optional[bytes]:
+    if not line.strip() or line.startswith(b"#") or line[:1] in (b" ", b"\t"):
+        return None
+    return line.split(b":", 1)[0].strip()
+
+
+def build(filename: str, parameters: Optional[dict] = None) -> YamlIndex:
+    """
+    Scans a XES-YAML file (without constructing the events) and records the byte offset,
+    the length and the number of events of each trace, along with its case identifier
+    (concept:name of the Trace document).
+    The index is stored in a compact binary sidecar file.
+
+    Parameters
+    --------------
+    filename
+        Path to the XES-YAML file (possibly .gz compressed)
+    parameters
+        Parameters, including:
+            - Parameters.INDEX_PATH => path of the sidecar file (default: the path of the log followed by .idx)
+            - Parameters.ENCODING => encoding of the log (default: utf-8)
+
+    Returns
+    --------------
+    index
+        Index of the traces of the log
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    is_compressed = filename.lower().endswith(".gz")
+
+    index = YamlIndex()
+
+    position = 0
+    document_start = 0
+    root_key = None
+    trace_lines = None
+    # position of the document closing the log header
+    header_end = None
+
+    def open_trace(start):
+        index.offsets.append(start)
+        index.lengths.append(0)
+        index.num_events.append(0)
+        index.case_ids.append("")
+
+    def close_document(end):
+        if root_key == xes_constants.TAG_EVENT.encode():
+            if len(index) == 0:
+                # events not preceded by a Trace document belong to an implicit trace
+                open_trace(document_start)
+            index.num_events[-1] += 1
+        elif root_key == xes_constants.TAG_TRACE.encode():
+            trace_context = yaml.safe_load(b"".join(trace_lines).decode(encoding))[xes_constants.TAG_TRACE]
+            if trace_context is not None and trace_context.get(xes_constants.DEFAULT_NAME_KEY) is not None:
+                index.case_ids[-1] = str(trace_context[xes_constants.DEFAULT_NAME_KEY])
+        if len(index) > 0:
+            index.lengths[-1] = end - index.offsets[-1]
+
+    with (gzip.open(filename, "rb") if is_compressed else open(filename, "rb")) as yaml_file:
+        for line in yaml_file:
+            if __is_document_start(line):
+                if position > 0:
+                    close_document(position)
+                    if header_end is None:
+                        header_end = position
+                document_start = position
+                root_key = None
+                trace_lines = None
+            elif root_key is None:
+                root_key = __get_root_key(line)
+                if root_key == xes_constants.TAG_TRACE.encode():
+                    open_trace(document_start)
+                    trace_lines = [line]
+            elif trace_lines is not None:
+                trace_lines.append(line)
+
+            position += len(line)
+
+        close_document(position)
+
+    index.header_length = header_end if header_end is not None else position
+
+    write(index, filename, parameters=parameters)
+
+    return index
+
+
+def write(index: YamlIndex, filename: str, parameters: Optional[dict] = None):
+    """
+    Writes the index in the sidecar file of the given XES-YAML file
+    """
+    stat = os.stat(filename)
+
+    with open(get_index_path(filename, parameters=parameters), "wb") as index_file:
+        index_file.write(__HEADER_STRUCT.pack(INDEX_MAGIC, INDEX_VERSION, stat.st_size, stat.st_mtime_ns,
+                                              index.header_length, len(index)))
+        for i in range(len(index)):
+            index_file.write(__ENTRY_STRUCT.pack(index.offsets[i], index.lengths[i], index.num_events[i]))
+        for case_id in index.case_ids:
+            case_id = case_id.encode("utf-8")
+            index_file.write(__LENGTH_STRUCT.pack(len(case_id)))
+            index_file.write(case_id)
+
+
+def read(filename: str, parameters: Optional[dict] = None) -> Optional[YamlIndex]:
+    """
+    Reads the sidecar index of a XES-YAML file.
+    Returns None if the index does not exist or if it is not up-to-date with the file
+    """
+    index_path = get_index_path(filename, parameters=parameters)
+    if not os.path.exists(index_path):
+        return None
+
+    stat = os.stat(filename)
+
+    with open(index_path, "rb") as index_file:
+        content = index_file.read()
+
+    if len(content) < __HEADER_STRUCT.size:
+        return None
+
+    magic, version, size, mtime_ns, header_length, num_traces = __HEADER_STRUCT.unpack_from(content, 0)
+    if magic != INDEX_MAGIC or version != INDEX_VERSION or size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+        return None
+
+    index = YamlIndex(header_length=header_length)
+    position = __HEADER_STRUCT.size
+    for offset, length, num_events in __ENTRY_STRUCT.iter_unpack(
+            content[position: position + num_traces * __ENTRY_STRUCT.size]):
+        index.offsets.append(offset)
+        index.lengths.append(length)
+        index.num_events.append(num_events)
+
+    position += num_traces * __ENTRY_STRUCT.size
+    for i in range(num_traces):
+        length = __LENGTH_STRUCT.unpack_from(content, position)[0]
+        position += __LENGTH_STRUCT.size
+        index.case_ids.append(content[position: position + length].decode("utf-8"))
+        position += length
+
+    return index
+
+
+def get(filename: str, parameters: Optional[dict] = None) -> YamlIndex:
+    """
+    Gets the index of a XES-YAML file, reading it from the sidecar file if it is up-to-date,
+    otherwise building (and storing) it
+    """
+    index = read(filename, parameters=parameters)
+    if index is None:
+        index = build(filename, parameters=parameters)
+    return index
+
+
+def read_ranges(filename: str, ranges: List[Tuple[int, int]]) -> List[bytes]:
+    """
+    Reads the given (start, end) byte ranges of a XES-YAML file.
+    For compressed files, the stream is decompressed up to the requested offsets
+    (gzip does not allow random access to the deflate stream)
+    """
+    is_compressed = filename.lower().endswith(".gz")
+    contents = []
+
+    with (gzip.open(filename, "rb") if is_compressed else open(filename, "rb")) as yaml_file:
+        for start, end in ranges:
+            yaml_file.seek(start)
+            contents.append(yaml_file.read(end - start))
+
+    return contents
@@ -14,4 +14,4 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.log.importer.yaml.variants import yaml_loader
\ No newline at end of file
+from pm4py.objects.log.importer.yaml.variants import line_scanner, yaml_loader
\ No newline at end of file
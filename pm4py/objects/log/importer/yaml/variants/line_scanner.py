@@ -0,0 +1,246 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import io
+import re
+
+import yaml
+from yaml.constructor import SafeConstructor
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+
+from pm4py.util import xes_constants
+
+
+# Fast-path scanner for the flat XES-YAML event (and trace) documents, i.e., documents of the form
+#
+# ---
+# event:
+#   key1: scalar1
+#   key2: 'scalar2'
+#
+# The plain scalars are typed with the implicit resolvers of PyYAML (int, float, bool, null, timestamp),
+# hence the parsed values are the same obtained by the YAML loaders.
+# Any document that is not flat (nested mappings, lists, block/flow scalars, anchors, tags,
+# comments, multi-line scalars, ...) is parsed by the given YAML loader.
+
+DOCUMENT_SEPARATOR = "---"
+EVENT_ROOT = xes_constants.TAG_EVENT + ":"
+TRACE_ROOT = xes_constants.TAG_TRACE + ":"
+
+TAG_STR = "tag:yaml.org,2002:str"
+
+# characters that can not start a plain scalar (or that start a non-scalar node) in a block mapping
+__INDICATORS = set("-?:,[]{}#&*!|>'\"%@`")
+# fast path for the most common typed values (plain decimal integers)
+__DECIMAL_INT = re.compile(r"^-?(?:0|[1-9][0-9]*)$")
+
+__CONSTRUCTOR = SafeConstructor()
+__SCALAR_CONSTRUCTORS = {
+    "tag:yaml.org,2002:null": __CONSTRUCTOR.construct_yaml_null,
+    "tag:yaml.org,2002:bool": __CONSTRUCTOR.construct_yaml_bool,
+    "tag:yaml.org,2002:int": __CONSTRUCTOR.construct_yaml_int,
+    "tag:yaml.org,2002:float": __CONSTRUCTOR.construct_yaml_float,
+    "tag:yaml.org,2002:timestamp": __CONSTRUCTOR.construct_yaml_timestamp,
+}
+
+
+class NotFlatDocument(Exception):
+    pass
+
+
+def resolve_plain_scalar(value: str):
+    """
+    Types a plain scalar as the PyYAML (YAML 1.1) implicit resolvers do
+
+    Parameters
+    ------------
+    value
+        Plain scalar (stripped)
+
+    Returns
+    ------------
+    typed_value
+        Typed value
+    """
+    resolvers = Resolver.yaml_implicit_resolvers.get(value[0] if value else "")
+    if resolvers is None:
+        return value
+
+    if __DECIMAL_INT.match(value) is not None:
+        return int(value)
+
+    for tag, regexp in resolvers:
+        if regexp.match(value):
+            if tag not in __SCALAR_CONSTRUCTORS:
+                raise NotFlatDocument()
+            return __SCALAR_CONSTRUCTORS[tag](ScalarNode(tag, value))
+
+    return value
+
+
+def parse_scalar(value: str):
+    """
+    Parses the (single-line) scalar value of a key of the event, raising NotFlatDocument
+    if the value is not supported by the scanner
+    """
+    if not value:
+        return None
+
+    first = value[0]
+
+    if first == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != "'" or "'" in inner.replace("''", ""):
+            raise NotFlatDocument()
+        return inner.replace("''", "'")
+
+    if first == '"':
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != '"' or '"' in inner or "\\" in inner:
+            raise NotFlatDocument()
+        return inner
+
+    if first in __INDICATORS:
+        if first not in "-?:" or len(value) == 1 or value[1] in " \t":
+            raise NotFlatDocument()
+
+    if ": " in value or " #" in value or "\t" in value:
+        raise NotFlatDocument()
+
+    return resolve_plain_scalar(value)
+
+
+def parse_flat_document(lines):
+    """
+    Parses the lines of a flat event (or trace) document
+
+    Parameters
+    -------------
+    lines
+        Lines of the document, excluding the separator
+
+    Returns
+    -------------
+    document
+        Parsed document ({"event": {...}} or {"trace": {...}})
+    """
+    root = None
+    attributes = None
+    indent = None
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+
+        if root is None:
+            if line == EVENT_ROOT:
+                root = xes_constants.TAG_EVENT
+            elif line == TRACE_ROOT:
+                root = xes_constants.TAG_TRACE
+            else:
+                raise NotFlatDocument()
+            continue
+
+        stripped = line.lstrip(" ")
+        current_indent = len(line) - len(stripped)
+
+        if indent is None:
+            indent = current_indent
+            attributes = {}
+            if indent == 0:
+                raise NotFlatDocument()
+        elif current_indent != indent:
+            raise NotFlatDocument()
+
+        separator = stripped.find(": ")
+        if separator == -1:
+            if not stripped.endswith(":"):
+                raise NotFlatDocument()
+            key, value = stripped[:-1], ""
+        else:
+            key, value = stripped[:separator], stripped[separator + 2:].strip()
+
+        if not key or key[0] in __INDICATORS or key != key.strip() or " #" in key:
+            raise NotFlatDocument()
+        if resolve_plain_scalar(key) is not key or key in attributes:
+            raise NotFlatDocument()
+
+        attributes[key] = parse_scalar(value)
+
+    if root is None:
+        raise NotFlatDocument()
+
+    return {root: attributes}
+
+
+def load_all(stream, loader, encoding: str = "utf-8"):
+    """
+    Iterates over the documents of a XES-YAML stream, parsing the flat event and trace documents
+    with the line scanner and the other documents with the given YAML loader
+
+    Parameters
+    -------------
+    stream
+        Stream (text or binary) of the XES-YAML file
+    loader
+        YAML loader class (e.g., yaml.cyaml.CSafeLoader) used for the documents that are not flat
+    encoding
+        Encoding of the binary streams
+
+    Returns
+    -------------
+    documents
+        Generator of documents
+    """
+    wrapper = None
+    if not isinstance(stream, io.TextIOBase):
+        # decodes binary (e.g., gzip) streams with the C implementation of the text layer
+        wrapper = io.TextIOWrapper(stream, encoding=encoding)
+        stream = wrapper
+
+    try:
+        yield from __scan_documents(stream, loader)
+    finally:
+        if wrapper is not None:
+            # the underlying stream is closed by its owner
+            wrapper.detach()
+
+
+def __scan_documents(stream, loader):
+    lines = []
+
+    while True:
+        line = stream.readline()
+
+        if not line or (
+            line.startswith(DOCUMENT_SEPARATOR)
+            and line[len(DOCUMENT_SEPARATOR): len(DOCUMENT_SEPARATOR) + 1] in ("\n", "\r", " ", "\t", "")
+        ):
+            if any(x.strip() for x in lines):
+                try:
+                    yield parse_flat_document(lines)
+                except NotFlatDocument:
+                    yield yaml.load("".join(lines), Loader=loader)
+
+            # content placed on the separator line (e.g., tags) is left to the YAML loader
+            lines = [line] if line[len(DOCUMENT_SEPARATOR):].strip() else []
+
+            if not line:
+                break
+        else:
+            lines.append(line)
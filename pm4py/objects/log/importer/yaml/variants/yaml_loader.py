@@ -17,10 +17,15 @@
 from enum import Enum
 import importlib
 import sys, os
+import io
+import math
+import warnings
+from collections import deque
 
 from pm4py.util import constants, xes_constants, exec_utils
 from pm4py.objects.log.util import sorting
 from pm4py.objects.log.obj import EventLog, Trace, Event
+from pm4py.objects.log.importer.yaml.variants import line_scanner as yaml_line_scanner
 import gzip
 import yaml
 from yaml import SafeLoader, FullLoader
@@ -42,6 +47,22 @@ class Parameters(Enum):
     SHOW_PROGRESS_BAR = "show_progress_bar"
     DECOMPRESS_SERIALIZATION = "decompress_serialization"
     ENCODING = "encoding"
+    MULTIPROCESSING = "multiprocessing"
+    CORES = "cores"
+    RETURN_LEGACY_LOG_OBJECT = "return_legacy_log_object"
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+    TRACE_INDICES = "trace_indices"
+    CASE_IDS = "case_ids"
+    LINE_SCANNER = "line_scanner"
+    CACHE_DIR = "cache_dir"
+
+
+# minimum size of the byte range handed to a single worker in the multiprocessing import
+MIN_CHUNK_SIZE = 1048576
+# number of byte ranges per worker (smaller ranges balance the load among the workers)
+CHUNKS_PER_CORE = 4
+# XES-YAML document separator, marking the start of a document when placed at the beginning of a line
+DOCUMENT_SEPARATOR = b"---"
 
 
 def apply(
@@ -64,12 +85,52 @@ def apply(
             Parameters.MAX_TRACES -> Specify the maximum number of traces to import from the log (read in order in the XML file)
             Parameters.SHOW_PROGRESS_BAR -> Enables/disables the progress bar (default: True)
             Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.MULTIPROCESSING -> splits the file at the document separators and parses the chunks in a process pool (only when importing a log object)
+            Parameters.CORES -> number of worker processes used when multiprocessing is enabled
+            Parameters.RETURN_LEGACY_LOG_OBJECT -> if False, builds a Pandas dataframe directly (default: True)
+            Parameters.TRACE_INDICES -> positions of the traces to import, using the sidecar index of the file
+            Parameters.CASE_IDS -> case identifiers of the traces to import, using the sidecar index of the file
+            Parameters.LINE_SCANNER -> parses the flat event documents with a line scanner, using the YAML loader only for the other documents (default: False)
+            Parameters.CACHE_DIR -> when importing a dataframe, stores it in (and reads it from) the given cache directory (requires pyarrow)
 
     Returns
     -------
     log : :class:`pm4py.log.log.EventLog`
         A log
     """
+    if parameters is None:
+        parameters = {}
+
+    if (
+        exec_utils.get_param_value(Parameters.TRACE_INDICES, parameters, None) is not None
+        or exec_utils.get_param_value(Parameters.CASE_IDS, parameters, None) is not None
+    ):
+        return import_with_index(
+            filename=filename, variant=variant, parameters=parameters
+        )
+
+    if not exec_utils.get_param_value(
+        Parameters.RETURN_LEGACY_LOG_OBJECT, parameters, True
+    ):
+        if exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, False):
+            warnings.warn("the import of XES-YAML files into a dataframe does not support multiprocessing: the file is imported in the current process")
+
+        if exec_utils.get_param_value(Parameters.CACHE_DIR, parameters, None) is not None:
+            return import_dataframe_with_cache(
+                filename=filename, variant=variant, parameters=parameters
+            )
+
+        return import_dataframe(
+            filename=filename, variant=variant, parameters=parameters
+        )
+
+    if exec_utils.get_param_value(
+        Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT
+    ):
+        return import_with_multiprocessing(
+            filename=filename, variant=variant, parameters=parameters
+        )
+
     return import_from_context_with_progress(
         filename=filename, variant=variant, parameters=parameters
     )
@@ -84,21 +145,15 @@ def import_from_context_with_progress(
     max_no_traces_to_import = exec_utils.get_param_value(
         Parameters.MAX_TRACES, parameters, sys.maxsize
     )
-    timestamp_sort = exec_utils.get_param_value(
-        Parameters.TIMESTAMP_SORT, parameters, False
-    )
-    timestamp_key = exec_utils.get_param_value(
-        Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY
-    )
-    reverse_sort = exec_utils.get_param_value(
-        Parameters.REVERSE_SORT, parameters, False
-    )
     show_progress_bar = exec_utils.get_param_value(
         Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR
     )
     encoding = exec_utils.get_param_value(
         Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING
     )
+    line_scanner = exec_utils.get_param_value(
+        Parameters.LINE_SCANNER, parameters, False
+    )
     is_compressed = filename.lower().endswith(".gz")
 
     progress = None
@@ -123,7 +178,9 @@ def import_from_context_with_progress(
                 unit_divisor=1048576,
             )
 
-        context = yaml_load(yaml_file, loader=variant)
+        context = yaml_load(
+            yaml_file, loader=variant, line_scanner=line_scanner, encoding=encoding
+        )
 
         for elem, document in enumerate(context):
             if document is None:
@@ -156,6 +213,9 @@ def import_from_context_with_progress(
 
             # parse Trace document
             elif trace_context is not None:
+                if len(log) >= max_no_traces_to_import:
+                    break
+
                 trace = parse_trace_object(trace_context=trace_context)
                 log.append(trace)
 
@@ -171,39 +231,836 @@ def import_from_context_with_progress(
 
     del context, progress
 
+    return finalize_log(log, parameters=parameters)
+
+
+def finalize_log(log: EventLog, parameters: Parameters = None) -> EventLog:
+    """
+    Sorts the imported log (if required) and sets the default keys in its properties
+
+    Parameters
+    ----------
+    log
+        Imported event log
+    parameters
+        Parameters of the algorithm, including
+            Parameters.TIMESTAMP_SORT -> Specify if we should sort log by timestamp
+            Parameters.TIMESTAMP_KEY -> If sort is enabled, then sort the log by using this key
+            Parameters.REVERSE_SORT -> Specify in which direction the log should be sorted
+
+    Returns
+    -------
+    log
+        Event log
+    """
+    if parameters is None:
+        parameters = {}
+
+    timestamp_sort = exec_utils.get_param_value(
+        Parameters.TIMESTAMP_SORT, parameters, False
+    )
+    timestamp_key = exec_utils.get_param_value(
+        Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY
+    )
+    reverse_sort = exec_utils.get_param_value(
+        Parameters.REVERSE_SORT, parameters, False
+    )
+
     if timestamp_sort:
         log = sorting.sort_timestamp(
             log, timestamp_key=timestamp_key, reverse_sort=reverse_sort
         )
 
+    set_default_properties(log.properties)
+
+    return log
+
+
+def set_default_properties(properties: dict):
+    """
+    Sets the default attribute keys in the properties of an imported log (or in the attrs of a dataframe)
+
+    Parameters
+    ----------
+    properties
+        Properties of the log
+    """
     # sets the activity key as default classifier in the log's properties
-    log.properties[constants.PARAMETER_CONSTANT_ACTIVITY_KEY] = (
+    properties[constants.PARAMETER_CONSTANT_ACTIVITY_KEY] = (
         xes_constants.DEFAULT_NAME_KEY
     )
-    log.properties[constants.PARAMETER_CONSTANT_ATTRIBUTE_KEY] = (
+    properties[constants.PARAMETER_CONSTANT_ATTRIBUTE_KEY] = (
         xes_constants.DEFAULT_NAME_KEY
     )
     # sets the default timestamp key
-    log.properties[constants.PARAMETER_CONSTANT_TIMESTAMP_KEY] = (
+    properties[constants.PARAMETER_CONSTANT_TIMESTAMP_KEY] = (
         xes_constants.DEFAULT_TIMESTAMP_KEY
     )
     # sets the default resource key
-    log.properties[constants.PARAMETER_CONSTANT_RESOURCE_KEY] = (
+    properties[constants.PARAMETER_CONSTANT_RESOURCE_KEY] = (
         xes_constants.DEFAULT_RESOURCE_KEY
     )
     # sets the default transition key
-    log.properties[constants.PARAMETER_CONSTANT_TRANSITION_KEY] = (
+    properties[constants.PARAMETER_CONSTANT_TRANSITION_KEY] = (
         xes_constants.DEFAULT_TRANSITION_KEY
     )
     # sets the default group key
-    log.properties[constants.PARAMETER_CONSTANT_GROUP_KEY] = (
+    properties[constants.PARAMETER_CONSTANT_GROUP_KEY] = (
         xes_constants.DEFAULT_GROUP_KEY
     )
 
-    return log
 
+def import_dataframe(
+    filename: str, variant: LoaderType, parameters: Parameters = None
+):
+    """
+    Imports an XES-YAML file directly into a Pandas dataframe, without building the
+    EventLog/Trace/Event objects. The values of each attribute are collected in a column buffer,
+    the trace attributes are added as case attributes (with the case:  prefix) to every event of the trace,
+    and the timestamp columns are converted at the end in a vectorized way.
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename (possibly .gz compressed)
+    variant
+        YAML loader to use
+    parameters
+        Parameters of the algorithm, including
+            Parameters.MAX_TRACES -> Specify the maximum number of traces to import from the log (read in order in the YAML file)
+            Parameters.SHOW_PROGRESS_BAR -> Enables/disables the progress bar (default: True)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.CASE_ATTRIBUTE_PREFIX -> prefix of the case attributes (default: case:)
+            Parameters.LINE_SCANNER -> parses the flat documents with the line scanner (default: False)
+            Parameters.TIMESTAMP_SORT -> Specify if we should sort the events by timestamp (grouped by trace)
+            Parameters.TIMESTAMP_KEY -> If sort is enabled, then sort the events by using this key
+            Parameters.REVERSE_SORT -> Specify in which direction the events should be sorted
+
+    Returns
+    -------
+    dataframe
+        Pandas dataframe
+    """
+    if parameters is None:
+        parameters = {}
+
+    from pm4py.util import pandas_utils
+    from pm4py.objects.log.util import dataframe_utils
+
+    max_no_traces_to_import = exec_utils.get_param_value(
+        Parameters.MAX_TRACES, parameters, sys.maxsize
+    )
+    show_progress_bar = exec_utils.get_param_value(
+        Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR
+    )
+    encoding = exec_utils.get_param_value(
+        Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING
+    )
+    line_scanner = exec_utils.get_param_value(
+        Parameters.LINE_SCANNER, parameters, False
+    )
+    case_attribute_prefix = exec_utils.get_param_value(
+        Parameters.CASE_ATTRIBUTE_PREFIX, parameters, constants.CASE_ATTRIBUTE_PREFIX
+    )
+    timestamp_sort = exec_utils.get_param_value(
+        Parameters.TIMESTAMP_SORT, parameters, False
+    )
+    timestamp_key = exec_utils.get_param_value(
+        Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY
+    )
+    reverse_sort = exec_utils.get_param_value(
+        Parameters.REVERSE_SORT, parameters, False
+    )
+    is_compressed = filename.lower().endswith(".gz")
+
+    progress = None
+
+    total_size_bytes = os.path.getsize(filename)
+
+    # one buffer per attribute. the buffers are padded lazily with NaN values
+    # for the events not having the attribute
+    columns = {}
+    # position of the trace of each event, used to sort the events grouped by trace
+    event_traces = []
+    no_events = 0
+    no_traces = 0
+    case_attributes = None
+
+    with (
+        gzip.open(filename, "rb")
+        if is_compressed
+        else open(filename, "r", encoding=encoding)
+    ) as yaml_file:
+        if importlib.util.find_spec("tqdm") and show_progress_bar:
+            from tqdm.auto import tqdm
+
+            progress = tqdm(
+                total=total_size_bytes,
+                desc="parsing log, completed events/documents :: ",
+                unit="B",
+                unit_divisor=1048576,
+            )
+
+        context = yaml_load(
+            yaml_file, loader=variant, line_scanner=line_scanner, encoding=encoding
+        )
+
+        for elem, document in enumerate(context):
+            if document is None:
+                continue
+
+            log_context = document.get(xes_constants.TAG_LOG)
+            event_context = document.get(xes_constants.TAG_EVENT)
+            trace_context = document.get(xes_constants.TAG_TRACE)
 
-def yaml_load(stream, loader: LoaderType = LoaderType.SAFE_PYYAML):
+            if elem == 0 and log_context is None:
+                raise SyntaxError("file contains no Log object")
+
+            if len(set(document.keys())) != 1:
+                raise SyntaxError("YAML document contains more than one root key")
+
+            if event_context is not None:
+                if case_attributes is None:
+                    # events not preceded by a Trace document belong to an implicit trace
+                    case_attributes = {}
+                    no_traces += 1
+
+                row = {}
+                for event_att_key, event_att_value in event_context.items():
+                    if event_att_value is None:
+                        row[event_att_key] = ""
+                    else:
+                        parse_and_add_attribute(row, event_att_key, event_att_value)
+                row.update(case_attributes)
+
+                for key, value in row.items():
+                    column = columns.get(key)
+                    if column is None:
+                        column = []
+                        columns[key] = column
+                    if len(column) < no_events:
+                        column.extend([math.nan] * (no_events - len(column)))
+                    column.append(value)
+
+                event_traces.append(no_traces)
+                no_events += 1
+
+            elif trace_context is not None:
+                if no_traces >= max_no_traces_to_import:
+                    break
+
+                trace = parse_trace_object(trace_context=trace_context)
+                case_attributes = {
+                    case_attribute_prefix + key: value
+                    for key, value in trace.attributes.items()
+                }
+                no_traces += 1
+
+            if progress is not None:
+                current_position_in_bytes = yaml_file.tell()
+                progress.update(current_position_in_bytes - progress.n)
+
+            del log_context, event_context, trace_context
+
+        # gracefully close progress bar
+        if progress is not None:
+            progress.close()
+
+    del context, progress
+
+    for column in columns.values():
+        if len(column) < no_events:
+            column.extend([math.nan] * (no_events - len(column)))
+
+    dataframe = pandas_utils.instantiate_dataframe(columns)
+    del columns
+
+    dataframe = dataframe_utils.convert_timestamp_columns_in_df(
+        dataframe, timest_format="ISO8601"
+    )
+    if timestamp_sort:
+        dataframe = __sort_dataframe(
+            dataframe, event_traces, timestamp_key=timestamp_key, reverse_sort=reverse_sort
+        )
+    set_default_properties(dataframe.attrs)
+
+    return dataframe
+
+
+def __sort_dataframe(dataframe, event_traces, timestamp_key: str, reverse_sort: bool = False):
+    """
+    Sorts the events of the dataframe as sorting.sort_timestamp sorts an event log: the events of each trace
+    are sorted by timestamp, and the traces by the timestamp of their first event (both sorts being stable)
+
+    Parameters
+    ----------
+    dataframe
+        Pandas dataframe
+    event_traces
+        Position of the trace of each event of the dataframe
+    timestamp_key
+        Timestamp key
+    reverse_sort
+        If true, reverses the direction in which the sort is done (ascending)
+
+    Returns
+    -------
+    dataframe
+        Sorted dataframe
+    """
+    import numpy as np
+    import pandas as pd
+
+    if timestamp_key not in dataframe.columns:
+        return dataframe
+
+    events = pd.DataFrame({"trace": event_traces, "timestamp": dataframe[timestamp_key].to_numpy()})
+    events = events.sort_values(
+        ["trace", "timestamp"], ascending=[True, not reverse_sort], kind="stable"
+    )
+    first_events = events.drop_duplicates("trace").sort_values(
+        "timestamp", ascending=not reverse_sort, kind="stable"
+    )
+    trace_ranks = pd.Series(np.arange(len(first_events)), index=first_events["trace"].to_numpy())
+    events = events.iloc[
+        np.argsort(trace_ranks.loc[events["trace"].to_numpy()].to_numpy(), kind="stable")
+    ]
+
+    return dataframe.iloc[events.index.to_numpy()].reset_index(drop=True)
+
+
+def import_dataframe_with_cache(
+    filename: str, variant: LoaderType, parameters: Parameters = None
+):
+    """
+    Imports an XES-YAML file into a Pandas dataframe, reading it from the cache directory when
+    the file (identified by its path, size, modification time and a hash of its first and last bytes)
+    has already been imported. Otherwise, the file is imported and its dataframe is stored in the cache
+    (as an Arrow file, which is memory-mapped by the following reads).
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename (possibly .gz compressed)
+    variant
+        YAML loader to use
+    parameters
+        Parameters of the algorithm, including
+            Parameters.CACHE_DIR -> directory of the cache
+            (see also the parameters of pm4py.objects.log.importer.yaml.util.cache and of import_dataframe)
+
+    Returns
+    -------
+    dataframe
+        Pandas dataframe
+    """
+    if parameters is None:
+        parameters = {}
+
+    if not importlib.util.find_spec("pyarrow"):
+        warnings.warn("pyarrow is required by the cache of the XES-YAML logs: the file is imported without cache")
+        return import_dataframe(filename=filename, variant=variant, parameters=parameters)
+
+    from pm4py.objects.log.importer.yaml.util import cache as yaml_cache
+
+    # the loader and the parameters changing the content of the dataframe are part of the key of the cache
+    key_parameters = (str(variant),) + tuple(
+        exec_utils.get_param_value(p, parameters, None)
+        for p in [
+            Parameters.MAX_TRACES,
+            Parameters.CASE_ATTRIBUTE_PREFIX,
+            Parameters.TIMESTAMP_SORT,
+            Parameters.TIMESTAMP_KEY,
+            Parameters.REVERSE_SORT,
+            Parameters.ENCODING,
+        ]
+    )
+
+    dataframe = yaml_cache.get(filename, key_parameters, parameters=parameters)
+
+    if dataframe is None:
+        dataframe = import_dataframe(filename=filename, variant=variant, parameters=parameters)
+        yaml_cache.put(filename, dataframe, key_parameters, parameters=parameters)
+
+    return dataframe
+
+
+def import_with_index(
+    filename: str, variant: LoaderType, parameters: Parameters = None
+) -> EventLog:
+    """
+    Imports a subset of the traces of an XES-YAML file, seeking directly to them
+    through the byte-offset index stored in the sidecar file (which is built if missing or outdated).
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename (possibly .gz compressed)
+    variant
+        YAML loader to use
+    parameters
+        Parameters of the algorithm, including
+            Parameters.TRACE_INDICES -> positions of the traces to import (e.g., a range, or a random sample of positions)
+            Parameters.CASE_IDS -> case identifiers (concept:name of the trace) of the traces to import
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+
+    Returns
+    -------
+    log
+        Event log containing the requested traces (in the order of the file)
+    """
+    if parameters is None:
+        parameters = {}
+
+    from pm4py.objects.log.importer.yaml.util import index as yaml_index
+
+    trace_indices = exec_utils.get_param_value(Parameters.TRACE_INDICES, parameters, None)
+    case_ids = exec_utils.get_param_value(Parameters.CASE_IDS, parameters, None)
+    encoding = exec_utils.get_param_value(
+        Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING
+    )
+    line_scanner = exec_utils.get_param_value(
+        Parameters.LINE_SCANNER, parameters, False
+    )
+
+    index = yaml_index.get(filename, parameters=parameters)
+
+    selected = set()
+    if trace_indices is not None:
+        selected.update(i for i in trace_indices if 0 <= i < len(index))
+    if case_ids is not None:
+        case_ids = set(str(x) for x in case_ids)
+        selected.update(i for i in range(len(index)) if index.case_ids[i] in case_ids)
+    selected = sorted(selected)
+
+    ranges = [(0, index.header_length)] + [index.get_trace_range(i) for i in selected]
+    contents = yaml_index.read_ranges(filename, ranges)
+
+    log = EventLog()
+    header = next(iter(yaml_load(contents[0].decode(encoding), loader=variant)), None)
+    if header is None or header.get(xes_constants.TAG_LOG) is None:
+        raise SyntaxError("file contains no Log object")
+    log = parse_log_object(log_context=header[xes_constants.TAG_LOG])
+
+    for content in contents[1:]:
+        trace = Trace()
+
+        for document in yaml_load(
+            content.decode(encoding), loader=variant, line_scanner=line_scanner
+        ):
+            if document is None:
+                continue
+
+            event_context = document.get(xes_constants.TAG_EVENT)
+            trace_context = document.get(xes_constants.TAG_TRACE)
+
+            if event_context is not None:
+                trace.append(parse_event_object(event_context=event_context))
+            elif trace_context is not None:
+                trace = parse_trace_object(trace_context=trace_context)
+
+        log.append(trace)
+
+    return finalize_log(log, parameters=parameters)
+
+
+def import_with_multiprocessing(
+    filename: str, variant: LoaderType, parameters: Parameters = None
+) -> EventLog:
+    """
+    Imports an XES-YAML file by splitting the document stream at the document separators (---)
+    and parsing the resulting chunks in a process pool.
+    The parsed documents are stitched back in their original order, so events are assigned
+    to the correct trace also when the trace document lies in a different chunk.
+    The chunks are submitted in a bounded window (consumed in order), so only a few chunks
+    and parsed chunks are kept in memory.
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename (possibly .gz compressed)
+    variant
+        YAML loader to use
+    parameters
+        Parameters of the algorithm, including
+            Parameters.CORES -> number of worker processes
+            Parameters.MAX_TRACES -> Specify the maximum number of traces to import from the log (read in order in the YAML file)
+            Parameters.SHOW_PROGRESS_BAR -> Enables/disables the progress bar (default: True)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+
+    Returns
+    -------
+    log
+        Event log
+    """
+    if parameters is None:
+        parameters = {}
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    num_cores = exec_utils.get_param_value(
+        Parameters.CORES, parameters, max(1, multiprocessing.cpu_count() - 2)
+    )
+    max_no_traces_to_import = exec_utils.get_param_value(
+        Parameters.MAX_TRACES, parameters, sys.maxsize
+    )
+    show_progress_bar = exec_utils.get_param_value(
+        Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR
+    )
+    encoding = exec_utils.get_param_value(
+        Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING
+    )
+    line_scanner = exec_utils.get_param_value(
+        Parameters.LINE_SCANNER, parameters, False
+    )
+    is_compressed = filename.lower().endswith(".gz")
+
+    progress = None
+
+    with ProcessPoolExecutor(max_workers=num_cores) as executor, (
+        gzip.open(filename, "rb") if is_compressed else open(filename, "rb")
+    ) as yaml_file:
+        if is_compressed:
+            # a compressed stream can not be accessed at arbitrary offsets, and its decompressed size
+            # is not known in advance: chunks of MIN_CHUNK_SIZE bytes are decompressed here and sent to the workers
+            tasks = (
+                (__parse_documents, content, encoding, variant, line_scanner)
+                for content in __iter_document_chunks(yaml_file, MIN_CHUNK_SIZE)
+            )
+            no_tasks = None
+        else:
+            total_size_bytes = os.path.getsize(filename)
+            chunk_size = max(MIN_CHUNK_SIZE, total_size_bytes // (num_cores * CHUNKS_PER_CORE) + 1)
+            boundaries = __get_chunk_boundaries(
+                yaml_file, total_size_bytes, chunk_size
+            )
+            tasks = (
+                (__parse_file_range, filename, boundaries[i], boundaries[i + 1], encoding, variant, line_scanner)
+                for i in range(len(boundaries) - 1)
+            )
+            no_tasks = len(boundaries) - 1
+
+        if importlib.util.find_spec("tqdm") and show_progress_bar:
+            from tqdm.auto import tqdm
+
+            progress = tqdm(
+                total=no_tasks, desc="parsing log, completed chunks :: "
+            )
+
+        log = EventLog()
+        is_first = True
+        is_complete = False
+        futures = deque()
+
+        while not is_complete:
+            for task in tasks:
+                futures.append(executor.submit(*task))
+                if len(futures) >= 2 * num_cores:
+                    break
+
+            if not futures:
+                break
+
+            log, is_complete = __append_documents(
+                log, futures.popleft().result(), is_first, max_no_traces_to_import
+            )
+            is_first = False
+
+            if progress is not None:
+                progress.update()
+
+        # the chunks following the last imported trace are not needed
+        for future in futures:
+            future.cancel()
+
+        # gracefully close progress bar
+        if progress is not None:
+            progress.close()
+
+    del progress, futures
+
+    return finalize_log(log, parameters=parameters)
+
+
+def __append_documents(
+    log: EventLog, documents, is_first: bool, max_no_traces_to_import: int
+):
+    """
+    Appends the (tag, object) documents parsed by a worker to the log, stopping
+    at the first trace exceeding the maximum number of traces
+
+    Returns
+    -------
+    log
+        Event log (replaced by the parsed Log object, if contained in the documents)
+    is_complete
+        Boolean value telling if the maximum number of traces has been reached
+    """
+    for position, (tag, obj) in enumerate(documents):
+        if is_first and position == 0 and tag != xes_constants.TAG_LOG:
+            raise SyntaxError("file contains no Log object")
+
+        if tag == xes_constants.TAG_LOG:
+            log = obj
+
+        elif tag == xes_constants.TAG_EVENT:
+            if len(log) == 0:
+                log.append(Trace())
+
+            log[-1].append(obj)
+
+        elif tag == xes_constants.TAG_TRACE:
+            if len(log) >= max_no_traces_to_import:
+                return log, True
+
+            log.append(obj)
+
+    return log, False
+
+
+def __is_document_separator(buffer: bytes, index: int) -> bool:
+    """
+    Checks if the separator found at the given index of the buffer
+    opens a new document (it must be followed by a whitespace or by the end of the line)
+    """
+    following = buffer[index + len(DOCUMENT_SEPARATOR): index + len(DOCUMENT_SEPARATOR) + 1]
+    return following in (b"\n", b"\r", b" ", b"\t")
+
+
+def __get_chunk_boundaries(yaml_file, total_size_bytes: int, chunk_size: int):
+    """
+    Gets the byte offsets at which the file is split, each placed at the beginning of a document
+    """
+    boundaries = [0]
+    position = chunk_size
+
+    while position < total_size_bytes:
+        yaml_file.seek(position - 1)
+        base = position - 1
+        buffer = b""
+        boundary = total_size_bytes
+
+        while True:
+            block = yaml_file.read(MIN_CHUNK_SIZE)
+            buffer += block
+            index = buffer.find(b"\n" + DOCUMENT_SEPARATOR)
+            found = False
+
+            while index != -1:
+                if __is_document_separator(buffer, index + 1):
+                    boundary = base + index + 1
+                    found = True
+                    break
+                elif not block and index + 1 + len(DOCUMENT_SEPARATOR) == len(buffer):
+                    # the separator closes the file
+                    break
+                index = buffer.find(b"\n" + DOCUMENT_SEPARATOR, index + 1)
+
+            if found or not block:
+                break
+
+            # keeps the tail of the buffer, which could contain a truncated separator
+            tail = len(DOCUMENT_SEPARATOR) + 1
+            if len(buffer) > tail:
+                base += len(buffer) - tail
+                buffer = buffer[-tail:]
+
+        if boundary >= total_size_bytes:
+            break
+
+        boundaries.append(boundary)
+        position = boundary + chunk_size
+
+    boundaries.append(total_size_bytes)
+
+    return boundaries
+
+
+def __iter_document_chunks(yaml_file, chunk_size: int):
+    """
+    Reads a (binary) stream line by line and yields chunks of complete documents
+    of approximately the given size
+    """
+    lines = []
+    current_size = 0
+
+    for line in yaml_file:
+        if (
+            current_size >= chunk_size
+            and line.startswith(DOCUMENT_SEPARATOR)
+            and __is_document_separator(line, 0)
+        ):
+            yield b"".join(lines)
+            lines = []
+            current_size = 0
+
+        lines.append(line)
+        current_size += len(line)
+
+    if lines:
+        yield b"".join(lines)
+
+
+def __parse_file_range(
+    filename: str,
+    start: int,
+    end: int,
+    encoding: str,
+    variant: LoaderType,
+    line_scanner: bool = False,
+):
+    """
+    Parses the documents contained in the given byte range of the file
+    """
+    with open(filename, "rb") as yaml_file:
+        yaml_file.seek(start)
+        content = yaml_file.read(end - start)
+
+    return __parse_documents(content, encoding, variant, line_scanner)
+
+
+def __parse_documents(
+    content: bytes, encoding: str, variant: LoaderType, line_scanner: bool = False
+):
+    """
+    Parses a chunk of complete YAML documents, returning the list of the parsed
+    objects (tagged with the root key of the document) in the order of the file
+    """
+    parsed = []
+
+    for document in yaml_load(
+        content.decode(encoding), loader=variant, line_scanner=line_scanner
+    ):
+        if document is None:
+            continue
+
+        if len(set(document.keys())) != 1:
+            raise SyntaxError("YAML document contains more than one root key")
+
+        log_context = document.get(xes_constants.TAG_LOG)
+        event_context = document.get(xes_constants.TAG_EVENT)
+        trace_context = document.get(xes_constants.TAG_TRACE)
+
+        if log_context is not None:
+            parsed.append(
+                (xes_constants.TAG_LOG, parse_log_object(log_context=log_context))
+            )
+
+        elif event_context is not None:
+            parsed.append(
+                (
+                    xes_constants.TAG_EVENT,
+                    parse_event_object(event_context=event_context),
+                )
+            )
+
+        elif trace_context is not None:
+            parsed.append(
+                (
+                    xes_constants.TAG_TRACE,
+                    parse_trace_object(trace_context=trace_context),
+                )
+            )
+
+    return parsed
+
+
+def iter_traces(
+    filename: str,
+    variant: LoaderType = LoaderType.C_SAFE_PYYAML,
+    parameters: Parameters = None,
+):
+    """
+    Lazily iterates over the traces of an XES-YAML file, keeping at most one
+    trace in memory at a time
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename (possibly .gz compressed)
+    variant
+        YAML loader to use
+    parameters
+        Parameters of the algorithm, including
+            Parameters.MAX_TRACES -> Specify the maximum number of traces to yield (read in order in the YAML file)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.LINE_SCANNER -> parses the flat documents with the line scanner (default: False)
+
+    Returns
+    -------
+    trace_iterator
+        Generator of :class:`pm4py.objects.log.obj.Trace` objects
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_no_traces_to_import = exec_utils.get_param_value(
+        Parameters.MAX_TRACES, parameters, sys.maxsize
+    )
+    encoding = exec_utils.get_param_value(
+        Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING
+    )
+    line_scanner = exec_utils.get_param_value(
+        Parameters.LINE_SCANNER, parameters, False
+    )
+    is_compressed = filename.lower().endswith(".gz")
+
+    if max_no_traces_to_import <= 0:
+        return
+
+    no_traces = 0
+    trace = None
+
+    with (
+        gzip.open(filename, "rb")
+        if is_compressed
+        else open(filename, "r", encoding=encoding)
+    ) as yaml_file:
+        context = yaml_load(
+            yaml_file, loader=variant, line_scanner=line_scanner, encoding=encoding
+        )
+
+        for elem, document in enumerate(context):
+            if document is None:
+                continue
+
+            log_context = document.get(xes_constants.TAG_LOG)
+            event_context = document.get(xes_constants.TAG_EVENT)
+            trace_context = document.get(xes_constants.TAG_TRACE)
+
+            if elem == 0 and log_context is None:
+                raise SyntaxError("file contains no Log object")
+
+            if len(set(document.keys())) != 1:
+                raise SyntaxError("YAML document contains more than one root key")
+
+            if event_context is not None:
+                if trace is None:
+                    trace = Trace()
+
+                trace.append(parse_event_object(event_context=event_context))
+
+            elif trace_context is not None:
+                if trace is not None:
+                    yield trace
+                    no_traces += 1
+
+                    if no_traces >= max_no_traces_to_import:
+                        return
+
+                trace = parse_trace_object(trace_context=trace_context)
+
+        if trace is not None:
+            yield trace
+
+
+def yaml_load(
+    stream,
+    loader: LoaderType = LoaderType.SAFE_PYYAML,
+    line_scanner: bool = False,
+    encoding: str = constants.DEFAULT_ENCODING,
+):
     """
     Load a YAML file
 
@@ -213,12 +1070,22 @@ def yaml_load(stream, loader: LoaderType = LoaderType.SAFE_PYYAML):
         YAML stream
     loader
         Loader type
+    line_scanner
+        Parses the flat event documents with the line scanner, using the loader only for the other documents
+    encoding
+        Encoding of the (binary) stream, used by the line scanner
 
     Returns
     ----------
     document
         YAML document
     """
+    if line_scanner:
+        if isinstance(stream, str):
+            stream = io.StringIO(stream)
+
+        return yaml_line_scanner.load_all(stream, loader.value, encoding=encoding)
+
     return yaml.load_all(stream, Loader=loader.value)
 
 
@@ -16,4 +16,4 @@
 '''
 from pm4py.objects.petri_net.utils import align_utils, check_soundness, consumption_matrix, decomposition, \
     embed_stochastic_map, explore_path, final_marking, incidence_matrix, initial_marking, performance_map, petri_utils, \
-    projection, reachability_graph, reduction, synchronous_product
+    projection, reachability_graph, reduction, synchronous_product, compiled_net, shared_pool
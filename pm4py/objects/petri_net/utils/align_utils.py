@@ -247,6 +247,12 @@ def __trust_solution(x):
 def __compute_exact_heuristic_new_version(sync_net, a_matrix, h_cvx, g_matrix, cost_vec, incidence_matrix,
                                           marking, fin_vec, variant, use_cvxopt=False, strict=True):
     m_vec = incidence_matrix.encode_marking(marking)
+    return __compute_exact_heuristic_from_vector(sync_net, a_matrix, h_cvx, g_matrix, cost_vec, m_vec, fin_vec, variant,
+                                                 use_cvxopt=use_cvxopt, strict=strict)
+
+
+def __compute_exact_heuristic_from_vector(sync_net, a_matrix, h_cvx, g_matrix, cost_vec, m_vec, fin_vec, variant,
+                                          use_cvxopt=False, strict=True):
     b_term = [i - j for i, j in zip(fin_vec, m_vec)]
     b_term = np.matrix([x * 1.0 for x in b_term]).transpose()
 
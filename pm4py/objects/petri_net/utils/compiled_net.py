@@ -0,0 +1,128 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from pm4py.objects.petri_net.obj import Marking
+
+
+class CompiledNet(object):
+    """
+    Integer encoding of a Petri net, computed once per net: the places are mapped to indexes, and the
+    markings are stored as tuples of token counts (hashable, and compared/hashed on the token counts,
+    contrarily to Marking whose hash only depends on the marked places). Each transition is described by
+    its preset (index, weight) and by the (index, delta) of the places whose count changes when firing it,
+    so that the enabled transitions and the successor markings are computed without building Markings.
+
+    The places are numbered as in the incidence matrix, if provided, so that the encoded markings are
+    also the marking vectors of the state equation.
+    """
+
+    def __init__(self, net, incidence_matrix=None):
+        if incidence_matrix is not None:
+            self.__place_indices = dict(incidence_matrix.places)
+            transitions = sorted(incidence_matrix.transitions, key=lambda t: incidence_matrix.transitions[t])
+        else:
+            places = sorted(net.places, key=lambda x: (str(x.name), id(x)))
+            self.__place_indices = {p: i for i, p in enumerate(places)}
+            transitions = sorted(net.transitions, key=lambda x: (str(x.name), id(x)))
+        self.__places = sorted(self.__place_indices, key=lambda p: self.__place_indices[p])
+        self.__transitions = transitions
+        self.__transition_indices = {t: i for i, t in enumerate(transitions)}
+
+        pre = []
+        deltas = []
+        for t in transitions:
+            t_pre = {}
+            t_delta = {}
+            for arc in t.in_arcs:
+                index = self.__place_indices[arc.source]
+                t_pre[index] = t_pre.get(index, 0) + arc.weight
+                t_delta[index] = t_delta.get(index, 0) - arc.weight
+            for arc in t.out_arcs:
+                index = self.__place_indices[arc.target]
+                t_delta[index] = t_delta.get(index, 0) + arc.weight
+            pre.append(tuple(sorted(t_pre.items())))
+            deltas.append(tuple((index, delta) for index, delta in sorted(t_delta.items()) if delta != 0))
+        self.__pre = pre
+        self.__deltas = deltas
+
+        # transitions consuming from each place, and transitions that are always enabled
+        consumers = [[] for _ in self.__places]
+        for i, t_pre in enumerate(pre):
+            for index, _ in t_pre:
+                consumers[index].append(i)
+        self.__consumers = [tuple(c) for c in consumers]
+        self.__always_enabled = tuple(i for i, t_pre in enumerate(pre) if len(t_pre) == 0)
+
+    def __get_places(self):
+        return self.__places
+
+    def __get_transitions(self):
+        return self.__transitions
+
+    def __get_place_indices(self):
+        return self.__place_indices
+
+    def __get_transition_indices(self):
+        return self.__transition_indices
+
+    places = property(__get_places)
+    transitions = property(__get_transitions)
+    place_indices = property(__get_place_indices)
+    transition_indices = property(__get_transition_indices)
+
+    def encode(self, marking):
+        """
+        Encodes a Marking as a tuple of token counts
+        """
+        vector = [0] * len(self.__places)
+        for p, count in marking.items():
+            vector[self.__place_indices[p]] = count
+        return tuple(vector)
+
+    def decode(self, vector):
+        """
+        Decodes a tuple of token counts into a Marking
+        """
+        marking = Marking()
+        for index, count in enumerate(vector):
+            if count != 0:
+                marking[self.__places[index]] = count
+        return marking
+
+    def enabled(self, vector):
+        """
+        Gets the (sorted) indexes of the transitions enabled in the encoded marking
+        """
+        pre = self.__pre
+        candidates = set(self.__always_enabled)
+        consumers = self.__consumers
+        for index, count in enumerate(vector):
+            if count > 0:
+                candidates.update(consumers[index])
+        return [i for i in sorted(candidates) if all(vector[index] >= weight for index, weight in pre[i])]
+
+    def fire(self, vector, transition_index):
+        """
+        Gets the encoded marking reached by firing the transition (assumed enabled) in the encoded marking
+        """
+        successor = list(vector)
+        for index, delta in self.__deltas[transition_index]:
+            successor[index] += delta
+        return tuple(successor)
+
+
+def compile_net(net, incidence_matrix=None):
+    return CompiledNet(net, incidence_matrix=incidence_matrix)
@@ -0,0 +1,319 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import math
+from copy import copy
+from typing import Optional, Dict, Any, List, Tuple
+
+import numpy as np
+
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+
+# kinds of replay executed by the pool
+ALIGNMENTS = "alignments"
+TOKEN_REPLAY = "token_replay"
+
+# scalar fields of the results of each kind, returned through the shared result buffer
+SCALAR_FIELDS = {
+    ALIGNMENTS: ("cost", "visited_states", "queued_states", "traversed_arcs", "lp_solved", "fitness", "bwc"),
+    TOKEN_REPLAY: ("trace_is_fit", "trace_fitness", "missing_tokens", "consumed_tokens", "remaining_tokens",
+                   "produced_tokens"),
+}
+# types of the values in the shared result buffer
+MISSING, BOOL, INT, FLOAT = 0, 1, 2, 3
+NONE_RESULT = -1
+
+# chunks of variants per process (the chunks containing a similar number of events)
+CHUNKS_PER_CORE = 4
+
+# state of the worker process: Petri net, markings and parameters, set once by the initializer
+worker_state = {}
+
+
+def initialize_worker(net: PetriNet, im: Marking, fm: Marking, parameters: Dict[Any, Any]):
+    """
+    Initializes a worker of the pool with the accepting Petri net and the parameters of the replay
+    """
+    worker_state["net"] = net
+    worker_state["im"] = im
+    worker_state["fm"] = fm
+    worker_state["parameters"] = parameters
+
+
+def encode_variants(variants: List[Tuple]) -> Tuple[np.ndarray, np.ndarray, List]:
+    """
+    Encodes a list of variants (tuples of activities) as an array of activity codes, the offsets of the variants
+    in the array, and the list of the activities (indexed by code)
+    """
+    codes = {}
+    encoded = []
+    offsets = np.zeros(len(variants) + 1, dtype=np.int64)
+    for i, variant in enumerate(variants):
+        for activity in variant:
+            code = codes.get(activity)
+            if code is None:
+                code = codes[activity] = len(codes)
+            encoded.append(code)
+        offsets[i + 1] = len(encoded)
+    return np.asarray(encoded, dtype=np.int32), offsets, list(codes)
+
+
+def get_chunks(offsets: np.ndarray, num_chunks: int) -> List[Tuple[int, int]]:
+    """
+    Splits the (encoded) variants in contiguous chunks containing a similar number of events
+    (each variant also counting as an event, for its fixed cost)
+    """
+    num_variants = len(offsets) - 1
+    if num_variants == 0:
+        return []
+    weights = offsets[1:] + np.arange(1, num_variants + 1)
+    target = weights[-1] / max(1, num_chunks)
+    bounds = np.searchsorted(weights, np.arange(1, num_chunks) * target, side="right")
+    bounds = [0] + sorted(set(int(b) for b in bounds if 0 < b < num_variants)) + [num_variants]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def replay_variants(kind: str, variants: List[Tuple], replay_parameters: Dict[Any, Any]) -> List:
+    """
+    Replays a list of variants on the Petri net of the worker
+    """
+    from pm4py.util import variants_util
+    net, im, fm = worker_state["net"], worker_state["im"], worker_state["fm"]
+    parameters = worker_state["parameters"]
+
+    if kind == ALIGNMENTS:
+        from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
+        return [alignments.apply_trace(variants_util.variant_to_trace(variant, parameters=parameters), net, im, fm,
+                                       parameters=copy(parameters), variant=replay_parameters["variant"])
+                for variant in variants]
+
+    from pm4py.algo.conformance.tokenreplay.variants import token_replay
+    from pm4py.objects.log.obj import EventLog
+    log = EventLog([variants_util.variant_to_trace(variant, parameters=parameters) for variant in variants])
+    return token_replay.apply(log, net, im, fm, parameters={**parameters, token_replay.Parameters.RETURN_NAMES: True,
+                                                            token_replay.Parameters.SHOW_PROGRESS_BAR: False})
+
+
+def run_chunk(kind: str, shm_name: str, num_variants: int, num_events: int, activities: List, start: int, end: int,
+              replay_parameters: Dict[Any, Any]) -> List:
+    """
+    Replays the variants [start, end) of the shared variants, writing their scalar results in the shared result
+    buffer, and returns the other parts of their results
+    """
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        codes, offsets, values, types = get_views(shm.buf, num_variants, num_events, len(SCALAR_FIELDS[kind]))
+        variants = [tuple(activities[c] for c in codes[offsets[i]:offsets[i + 1]].tolist()) for i in
+                    range(start, end)]
+        results = replay_variants(kind, variants, replay_parameters)
+
+        parts = []
+        for i, result in zip(range(start, end), results):
+            if result is None:
+                types[i, 0] = NONE_RESULT
+                parts.append(None)
+                continue
+            result = dict(result)
+            for j, field in enumerate(SCALAR_FIELDS[kind]):
+                if field in result:
+                    value = result.pop(field)
+                    types[i, j] = BOOL if type(value) is bool else INT if isinstance(value, (int, np.integer)) \
+                        else FLOAT
+                    values[i, j] = value
+            parts.append(result)
+        del codes, offsets, values, types
+        return parts
+    finally:
+        shm.close()
+
+
+def get_views(buf, num_variants, num_events, num_fields):
+    """
+    Gets the arrays stored in the shared memory of a call: activity codes, offsets of the variants,
+    values and types of the scalar fields of the results
+    """
+    codes_size = 4 * num_events
+    offsets_size = 8 * (num_variants + 1)
+    values_size = 8 * num_variants * num_fields
+    codes = np.ndarray((num_events,), dtype=np.int32, buffer=buf, offset=0)
+    offsets = np.ndarray((num_variants + 1,), dtype=np.int64, buffer=buf, offset=codes_size)
+    values = np.ndarray((num_variants, num_fields), dtype=np.float64, buffer=buf,
+                        offset=align_offset(codes_size + offsets_size))
+    types = np.ndarray((num_variants, num_fields), dtype=np.int8, buffer=buf,
+                       offset=align_offset(codes_size + offsets_size) + values_size)
+    return codes, offsets, values, types
+
+
+def align_offset(offset):
+    # the arrays of values are aligned to 8 bytes
+    return int(math.ceil(offset / 8) * 8)
+
+
+def get_buffer_size(num_variants, num_events, num_fields):
+    """
+    Gets the size of the shared memory of a call
+    """
+    return align_offset(4 * num_events + 8 * (num_variants + 1)) + 9 * num_variants * num_fields
+
+
+class SharedNetPool(object):
+    """
+    Persistent pool of processes replaying variants on an accepting Petri net (alignments or token-based replay).
+
+    The net, the markings and the parameters are sent once to each worker (inherited, where processes can be
+    forked), instead of with each task. The variants of each call are shared with the workers as an array of
+    integer activity codes in shared memory, split in chunks of a similar number of events (the longest
+    variants being in the first chunks), and the scalar fields of the results (costs, fitness, tokens) are
+    written by the workers in a shared result buffer, the other fields (moves, transitions) being returned
+    with the chunks.
+
+    The pool can be reused for several calls (e.g., several logs on the same model), and should be closed
+    (or used as a context manager).
+    """
+
+    def __init__(self, net: PetriNet, im: Marking, fm: Marking, parameters: Optional[Dict[Any, Any]] = None,
+                 num_cores: Optional[int] = None):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        if parameters is None:
+            parameters = {}
+
+        self.net = net
+        self.num_cores = num_cores if num_cores is not None else max(1, multiprocessing.cpu_count() - 2)
+        mp_context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() \
+            else None
+        self.executor = ProcessPoolExecutor(max_workers=self.num_cores, mp_context=mp_context,
+                                            initializer=initialize_worker, initargs=(net, im, fm, parameters))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown()
+
+    def run(self, kind: str, variants: List[Tuple], replay_parameters: Optional[Dict[Any, Any]] = None,
+            progress=None) -> List:
+        """
+        Replays a list of variants (tuples of activities) in the pool, returning their results in the same order
+
+        Parameters
+        ------------
+        kind
+            ALIGNMENTS or TOKEN_REPLAY
+        variants
+            Variants
+        replay_parameters
+            Parameters of the call (for the alignments, the variant of the algorithm as "variant")
+        progress
+            (if provided) progress bar, updated with the number of replayed variants
+
+        Returns
+        ------------
+        results
+            Results of the variants
+        """
+        from concurrent.futures import as_completed
+        from multiprocessing import shared_memory
+
+        if replay_parameters is None:
+            replay_parameters = {}
+        if not variants:
+            return []
+
+        # the longest variants are replayed first, for a better balance between the workers
+        order = sorted(range(len(variants)), key=lambda i: len(variants[i]), reverse=True)
+        codes, offsets, activities = encode_variants([variants[i] for i in order])
+        fields = SCALAR_FIELDS[kind]
+
+        shm = shared_memory.SharedMemory(create=True,
+                                         size=max(1, get_buffer_size(len(variants), len(codes), len(fields))))
+        try:
+            shm_codes, shm_offsets, values, types = get_views(shm.buf, len(variants), len(codes), len(fields))
+            shm_codes[:] = codes
+            shm_offsets[:] = offsets
+            types[:] = MISSING
+
+            futures = {}
+            for start, end in get_chunks(offsets, self.num_cores * CHUNKS_PER_CORE):
+                futures[self.executor.submit(run_chunk, kind, shm.name, len(variants), len(codes), activities,
+                                             start, end, replay_parameters)] = (start, end)
+            parts = [None] * len(variants)
+            for future in as_completed(futures):
+                start, end = futures[future]
+                parts[start:end] = future.result()
+                if progress is not None:
+                    progress.update(end - start)
+
+            results = [None] * len(variants)
+            values_list = values.tolist()
+            types_list = types.tolist()
+            for i, part in enumerate(parts):
+                if types_list[i][0] == NONE_RESULT:
+                    continue
+                for j, field in enumerate(fields):
+                    value_type = types_list[i][j]
+                    if value_type == BOOL:
+                        part[field] = bool(values_list[i][j])
+                    elif value_type == INT:
+                        part[field] = int(values_list[i][j])
+                    elif value_type == FLOAT:
+                        part[field] = values_list[i][j]
+                results[order[i]] = part
+            del shm_codes, shm_offsets, values, types
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return results
+
+    def apply_alignments(self, variants: List[Tuple], variant=None, progress=None) -> List:
+        """
+        Aligns a list of variants (tuples of activities), with the given variant of the alignments
+        (the parameters being the ones of the pool)
+        """
+        from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
+        variant = variant if variant is not None else alignments.DEFAULT_VARIANT
+        return self.run(ALIGNMENTS, variants, replay_parameters={"variant": str(variant)}, progress=progress)
+
+    def apply_token_replay(self, variants: List[Tuple], return_names: bool = False, progress=None) -> List:
+        """
+        Replays a list of variants (tuples of activities) with the token-based replay (the parameters being the ones
+        of the pool). Unless return_names is set, the names of the places and transitions in the results are mapped
+        back to the objects of the Petri net, hence they should be unique
+        """
+        results = self.run(TOKEN_REPLAY, variants, progress=progress)
+        if return_names:
+            return results
+
+        transitions = {t.name: t for t in self.net.transitions}
+        places = {p.name: p for p in self.net.places}
+        if len(transitions) < len(self.net.transitions) or len(places) < len(self.net.places):
+            raise Exception("the token-based replay in the pool requires unique names of places and transitions")
+        for result in results:
+            for key in ["activated_transitions", "transitions_with_problems"]:
+                result[key] = [transitions[name] for name in result[key]]
+            result["enabled_transitions_in_marking"] = set(
+                transitions[name] for name in result["enabled_transitions_in_marking"])
+            result["reached_marking"] = Marking({places[name]: count for name, count in result["reached_marking"].items()})
+            del result["activated_transitions_labels"]
+            del result["enabled_transitions_in_marking_labels"]
+        return results
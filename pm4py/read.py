@@ -14,11 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from typing import Tuple, Dict, Optional
+from typing import Tuple, Dict, Optional, Iterator
 
-from pm4py.objects.iot.obj import IOTEventLog
+from pm4py.objects.iot.obj import IOTEventLog, IOTTrace
 from pm4py.objects.bpmn.obj import BPMN
-from pm4py.objects.log.obj import EventLog
+from pm4py.objects.log.obj import EventLog, Trace
 from pm4py.objects.ocel.obj import OCEL
 from pm4py.objects.petri_net.obj import PetriNet, Marking
 from pm4py.objects.process_tree.obj import ProcessTree
@@ -38,6 +38,28 @@ __doc__ = """
 The ``pm4py.read`` module contains all funcationality related to reading files/objects from disk.
 """
 
+def __get_yaml_loader_variant(variant: str):
+    from pm4py.objects.log.importer.yaml import importer as yaml_importer
+
+    v = yaml_importer.LoaderType.C_SAFE_PYYAML
+    if variant == "safe":
+        v = yaml_importer.LoaderType.SAFE_PYYAML
+
+    elif variant == "full":
+        v = yaml_importer.LoaderType.FULL_PYYAML
+
+    elif variant == "c-safe":
+        v = yaml_importer.LoaderType.C_SAFE_PYYAML
+
+    elif variant == "c-full":
+        v = yaml_importer.LoaderType.C_FULL_PYYAML
+
+    elif variant == "ruamel":
+        v = yaml_importer.LoaderType.RUAMEL_YAML
+
+    return v
+
+
 def read_yaml(
     file_path: str,
     variant: str = "c-safe",
@@ -60,6 +82,9 @@ def read_yaml(
     :param encoding: the encoding to be used (default: utf-8)
     :rtype: ``DataFrame``
 
+    Passing ``cache_dir="<directory>"`` stores the imported dataframe in a columnar (Arrow) cache,
+    from which the following reads of the same (unchanged) file are served (requires ``pyarrow``).
+
     .. code-block:: python3
 
         import pm4py
@@ -70,21 +95,7 @@ def read_yaml(
         raise Exception("File does not exist")
     from pm4py.objects.log.importer.yaml import importer as yaml_importer
 
-    v = yaml_importer.LoaderType.C_SAFE_PYYAML
-    if variant == "safe":
-        v = yaml_importer.LoaderType.SAFE_PYYAML
-
-    elif variant == "full":
-        v = yaml_importer.LoaderType.FULL_PYYAML
-
-    elif variant == "c-safe":
-        v = yaml_importer.LoaderType.C_SAFE_PYYAML
-
-    elif variant == "c-full":
-        v = yaml_importer.LoaderType.C_FULL_PYYAML
-
-    elif variant == "ruamel":
-        v = yaml_importer.LoaderType.RUAMEL_YAML
+    v = __get_yaml_loader_variant(variant)
 
     from copy import copy
 
@@ -106,6 +117,42 @@ def read_yaml(
 
     return log
 
+def iter_yaml(
+    file_path: str,
+    variant: str = "c-safe",
+    encoding: str = constants.DEFAULT_ENCODING,
+    **kwargs,
+) -> Iterator[Trace]:
+    """
+    Lazily reads an event log stored in XES-YAML format, yielding one trace at a time.
+    At most one trace is kept in memory, hence arbitrarily large (also ``.gz`` compressed) logs can be processed.
+
+    :param file_path: file path of the event log (``.xes.yaml`` file) on disk
+    :param variant: the variant of the importer (YAML Loader) to use (see ``read_yaml``)
+    :param encoding: the encoding to be used (default: utf-8)
+    :rtype: ``Iterator[Trace]``
+
+    .. code-block:: python3
+
+        import pm4py
+
+        for trace in pm4py.iter_yaml("<path_to_xes.yaml_file>", max_traces=1000):
+            print(len(trace))
+    """
+    if not os.path.exists(file_path):
+        raise Exception("File does not exist")
+    from pm4py.objects.log.importer.yaml import importer as yaml_importer
+
+    v = __get_yaml_loader_variant(variant)
+
+    from copy import copy
+
+    parameters = copy(kwargs)
+    parameters["encoding"] = encoding
+
+    return yaml_importer.iter_traces(file_path, variant=v, parameters=parameters)
+
+
 def read_iot_xes(file_path: str, encoding: str = constants.DEFAULT_ENCODING, **kwargs) -> IOTEventLog:
     if not os.path.exists(file_path):
         raise Exception("File does not exist")
@@ -117,6 +164,32 @@ def read_iot_xes(file_path: str, encoding: str = constants.DEFAULT_ENCODING, **k
     return log
 
 
+def iter_iot_xes(file_path: str, encoding: str = constants.DEFAULT_ENCODING, **kwargs) -> Iterator[IOTTrace]:
+    """
+    Lazily reads an IoT event log stored in XES format (with the datastream extension), yielding one trace at a time.
+    Only the trace being parsed and the header of the log are kept in memory, and each trace is verified on its own.
+    The traces are yielded in the order of the file, together with the events directly contained in the log.
+
+    :param file_path: file path of the event log (``.xes`` file) on disk
+    :param encoding: the encoding to be used (default: utf-8)
+    :rtype: ``Iterator[IOTTrace]``
+
+    .. code-block:: python3
+
+        import pm4py
+
+        for trace in pm4py.iter_iot_xes("<path_to_xes_file>"):
+            print(len(trace))
+    """
+    if not os.path.exists(file_path):
+        raise Exception("File does not exist")
+    from pm4py.objects.iot.importer.xes import importer as iot_xes_importer
+    from copy import copy
+    parameters = copy(kwargs)
+    parameters["encoding"] = encoding
+    return iot_xes_importer.iter_traces(file_path, parameters=parameters)
+
+
 def read_xes(file_path: str, variant: Optional[str] = None, return_legacy_log_object: bool = constants.DEFAULT_READ_XES_LEGACY_OBJECT, encoding: str = constants.DEFAULT_ENCODING, **kwargs) -> Union[DataFrame, EventLog]:
     """
     Reads an event log stored in XES format (see `xes-standard <https://xes-standard.org/>`_)
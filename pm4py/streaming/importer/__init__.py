@@ -15,7 +15,7 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import importlib.util
-from pm4py.streaming.importer import csv
+from pm4py.streaming.importer import csv, yaml
 
 if importlib.util.find_spec("lxml"):
     from pm4py.streaming.importer import xes
@@ -0,0 +1,353 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import collections
+import json
+import os
+import threading
+import time
+import warnings
+from enum import Enum
+
+import yaml
+
+from pm4py.objects.log.importer.yaml.variants import yaml_loader
+from pm4py.objects.log.importer.yaml.variants.yaml_loader import LoaderType
+from pm4py.util import xes_constants, exec_utils, constants
+
+
+class Parameters(Enum):
+    ACCEPTANCE_CONDITION = "acceptance_condition"
+    ENCODING = "encoding"
+    LOADER = "loader"
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+    POLL_INTERVAL = "poll_interval"
+    IDLE_TIMEOUT = "idle_timeout"
+    PERSIST_OFFSET = "persist_offset"
+    OFFSET_PATH = "offset_path"
+
+
+# extension of the file (stored next to the log) recording the byte offset up to which the log has been consumed
+OFFSET_EXTENSION = ".offset"
+DOCUMENT_SEPARATOR = b"---"
+
+
+def is_document_separator(line: bytes) -> bool:
+    """
+    Checks if the line opens a new document (--- followed by a whitespace or by the end of the line)
+    """
+    return line.startswith(DOCUMENT_SEPARATOR) and line[3:4] in (b"\n", b"\r", b" ", b"\t", b"")
+
+
+class StreamingTailYamlReader:
+    def __init__(self, path, parameters=None):
+        """
+        Initialize the reader of a growing XES-YAML log (e.g., the instance log
+        to which the documents are appended by the CPEE engine).
+        The documents are parsed as soon as they are completed, i.e., when the following document separator
+        is written (the last document of the log, which is not followed by a separator, is parsed when the idle
+        timeout expires), and the byte offset of the consumed documents is persisted,
+        so the reading is resumed from the same point after a restart.
+
+        Parameters
+        -------------
+        path
+            Path to the XES-YAML log
+        parameters
+            Parameters of the reader, including:
+                Parameters.ACCEPTANCE_CONDITION -> condition on the events to be returned (default: all the events)
+                Parameters.ENCODING -> encoding of the log (default: utf-8)
+                Parameters.LOADER -> YAML loader (default: LoaderType.C_SAFE_PYYAML)
+                Parameters.CASE_ATTRIBUTE_PREFIX -> prefix of the trace attributes added to the events (default: case:)
+                Parameters.POLL_INTERVAL -> seconds between two checks of the size of the log (default: 1.0)
+                Parameters.IDLE_TIMEOUT -> stops the reading when the log does not grow for the given number
+                    of seconds (default: None, the log is followed until the stop method is called)
+                Parameters.PERSIST_OFFSET -> persists the byte offset of the consumed documents (default: True)
+                Parameters.OFFSET_PATH -> path of the file storing the offset (default: path + ".offset")
+        """
+        if parameters is None:
+            parameters = {}
+        self.path = path
+        self.acceptance_condition = exec_utils.get_param_value(Parameters.ACCEPTANCE_CONDITION, parameters,
+                                                               lambda x: True)
+        self.encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+        self.loader = exec_utils.get_param_value(Parameters.LOADER, parameters, LoaderType.C_SAFE_PYYAML)
+        self.case_attribute_prefix = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters,
+                                                                constants.CASE_ATTRIBUTE_PREFIX)
+        self.poll_interval = exec_utils.get_param_value(Parameters.POLL_INTERVAL, parameters, 1.0)
+        self.idle_timeout = exec_utils.get_param_value(Parameters.IDLE_TIMEOUT, parameters, None)
+        self.persist_offset = exec_utils.get_param_value(Parameters.PERSIST_OFFSET, parameters, True)
+        self.offset_path = exec_utils.get_param_value(Parameters.OFFSET_PATH, parameters, path + OFFSET_EXTENSION)
+        self.stop_event = threading.Event()
+        self.reset()
+        if self.persist_offset:
+            self.restore()
+
+    def __iter__(self):
+        """
+        Starts the iteration
+        """
+        return self
+
+    def __next__(self):
+        """
+        Gets the next event of the log
+        """
+        event = self.read_event()
+        if event is None:
+            raise StopIteration
+        return event
+
+    def to_event_stream(self, event_stream):
+        """
+        Sends the events of the XES-YAML log to an event stream, until the reader is stopped
+
+        Parameters
+        --------------
+        event_stream
+            Event stream
+        """
+        event = self.read_event()
+        while event is not None:
+            event_stream.append(event)
+            event = self.read_event()
+
+    def stop(self):
+        """
+        Stops the reading (can be called from another thread)
+        """
+        self.stop_event.set()
+
+    def reset(self):
+        """
+        Resets the reader at the beginning of the log
+        """
+        # byte offset (in the log) of the first document not yet parsed
+        self.offset = 0
+        # byte offset of the last trace document parsed (None if the trace is defined in the log header)
+        self.trace_offset = None
+        self.trace_attributes = {}
+        self.buffer = b""
+        self.events = collections.deque()
+        self.committed = (0, None)
+        self.last_growth = time.time()
+
+    def restore(self):
+        """
+        Restores the offset persisted by a previous execution of the reader,
+        along with the attributes of the trace in which the reading is resumed
+        """
+        if not os.path.exists(self.offset_path) or not os.path.exists(self.path):
+            return
+
+        with open(self.offset_path, "r") as offset_file:
+            state = json.load(offset_file)
+
+        if state["offset"] > os.path.getsize(self.path):
+            # the log has been replaced: the reading starts again from the beginning
+            return
+
+        self.offset = state["offset"]
+        self.trace_offset = state["trace_offset"]
+        self.committed = (self.offset, self.trace_offset)
+
+        if self.offset > 0:
+            self.parse_document(self.read_document_at(0 if self.trace_offset is None else self.trace_offset), None)
+
+    def persist(self):
+        """
+        Persists the offset of the documents for which all the events have been returned
+        """
+        if not self.persist_offset:
+            return
+
+        offset, trace_offset = self.committed if self.events else (self.offset, self.trace_offset)
+
+        temp_path = self.offset_path + ".tmp"
+        with open(temp_path, "w") as offset_file:
+            json.dump({"offset": offset, "trace_offset": trace_offset}, offset_file)
+        os.replace(temp_path, self.offset_path)
+
+    def read_event(self):
+        """
+        Gets the next event of the log, waiting for the log to grow if all the current events have been read
+
+        Returns
+        ------------
+        event
+            Event (None if the reader has been stopped or the idle timeout has expired)
+        """
+        while True:
+            if self.stop_event.is_set():
+                # the events parsed but not yet returned are read again after a restart
+                self.persist()
+                return None
+
+            if self.events:
+                event, self.committed = self.events.popleft()
+                if not self.events:
+                    self.persist()
+                return event
+
+            if not self.poll():
+                if self.idle_timeout is not None and time.time() - self.last_growth >= self.idle_timeout:
+                    # the log has stopped growing: its last document is complete
+                    self.split_documents(trailing=True)
+                    if self.events:
+                        continue
+                    self.persist()
+                    return None
+                if not self.events:
+                    self.stop_event.wait(self.poll_interval)
+
+    def poll(self) -> bool:
+        """
+        Reads the bytes appended to the log since the last check, and parses the documents followed by a separator
+
+        Returns
+        ------------
+        grown
+            Boolean value (the log has grown since the last check)
+        """
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        read_position = self.offset + len(self.buffer)
+
+        if size < read_position:
+            # the log has been truncated or replaced: the reading starts again from the beginning
+            self.reset()
+            read_position = 0
+
+        grown = size > read_position
+
+        if grown:
+            with open(self.path, "rb") as log_file:
+                log_file.seek(read_position)
+                self.buffer += log_file.read(size - read_position)
+            self.last_growth = time.time()
+
+        self.split_documents(trailing=False)
+
+        return grown
+
+    def split_documents(self, trailing: bool):
+        """
+        Parses the completed documents contained in the buffer
+
+        Parameters
+        -------------
+        trailing
+            Parses also the last document of the buffer, if it is terminated by a newline
+            (used when the idle timeout expires; otherwise, the writer could still be appending lines to it)
+        """
+        buffer = self.buffer
+        start = 0
+        position = buffer.find(b"\n" + DOCUMENT_SEPARATOR)
+
+        while position != -1:
+            end = position + 1
+            if end > start and is_document_separator(buffer[end:end + len(DOCUMENT_SEPARATOR) + 1]):
+                if len(buffer) == end + len(DOCUMENT_SEPARATOR):
+                    # the line following the separator is not yet complete
+                    break
+                try:
+                    self.parse_document(buffer[start:end], self.offset + start)
+                except yaml.YAMLError as e:
+                    # a completed document which is not valid YAML is skipped
+                    warnings.warn("skipping the invalid document at offset %d: %s" % (self.offset + start, e))
+                start = end
+            position = buffer.find(b"\n" + DOCUMENT_SEPARATOR, end)
+
+        if trailing and start < len(buffer) and buffer.endswith(b"\n"):
+            try:
+                self.parse_document(buffer[start:], self.offset + start)
+                start = len(buffer)
+            except yaml.YAMLError:
+                # the document is still being written
+                pass
+
+        self.buffer = buffer[start:]
+        self.offset += start
+
+    def parse_document(self, content: bytes, document_offset):
+        """
+        Parses a document of the log, adding the event (if it is an event document) to the events to be returned
+
+        Parameters
+        -------------
+        content
+            Content of the document
+        document_offset
+            Byte offset of the document in the log (None when the document is read again after a restart)
+        """
+        document = yaml.load(content.decode(self.encoding), Loader=self.loader)
+
+        if not isinstance(document, dict):
+            return
+
+        log_context = document.get(xes_constants.TAG_LOG)
+        trace_context = document.get(xes_constants.TAG_TRACE)
+        event_context = document.get(xes_constants.TAG_EVENT)
+
+        if log_context is not None:
+            # in the XES-YAML normal form, the trace is described in the log header
+            trace_context = log_context.get(xes_constants.TAG_TRACE) if isinstance(log_context, dict) else None
+            self.trace_attributes = yaml_loader.parse_trace_object(trace_context).attributes if isinstance(
+                trace_context, dict) else {}
+
+        elif trace_context is not None:
+            self.trace_attributes = yaml_loader.parse_trace_object(trace_context).attributes
+            if document_offset is not None:
+                self.trace_offset = document_offset
+
+        elif event_context is not None and document_offset is not None:
+            event = yaml_loader.parse_event_object(event_context)
+            for attr in self.trace_attributes:
+                event[self.case_attribute_prefix + attr] = self.trace_attributes[attr]
+            if self.acceptance_condition(event):
+                self.events.append((event, (document_offset + len(content), self.trace_offset)))
+
+    def read_document_at(self, position) -> bytes:
+        """
+        Reads the document starting at the given byte offset of the log
+        """
+        with open(self.path, "rb") as log_file:
+            log_file.seek(position)
+            lines = [log_file.readline()]
+            for line in iter(log_file.readline, b""):
+                if is_document_separator(line):
+                    break
+                lines.append(line)
+
+        return b"".join(lines)
+
+
+def apply(path, parameters=None):
+    """
+    Creates a StreamingTailYamlReader object
+
+    Parameters
+    ---------------
+    path
+        Path
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    ---------------
+    stream_read_obj
+        Stream reader object
+    """
+    return StreamingTailYamlReader(path, parameters=parameters)
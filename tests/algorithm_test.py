@@ -70,6 +70,18 @@ class AlgorithmTest(unittest.TestCase):
         generalization = generalization_evaluation.apply(log, net, im, fm,
                                                          variant=generalization_evaluation.Variants.GENERALIZATION_TOKEN)
 
+    def test_tokenreplay_multiprocessing(self):
+        log = xes_importer.apply(os.path.join("compressed_input_data", "04_reviewing.xes.gz"))
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        net, im, fm = process_tree_converter.apply(inductive_miner.apply(log))
+        from pm4py.algo.conformance.tokenreplay.variants import token_replay
+        replayed_traces = token_replay.apply(log, net, im, fm)
+        self.assertEqual(replayed_traces, token_replay.apply_multiprocessing(
+            log, net, im, fm, parameters={token_replay.Parameters.CORES: 2}))
+        self.assertEqual(token_replay.apply(log, net, im, fm, parameters={token_replay.Parameters.RETURN_NAMES: True}),
+                         token_replay.apply_multiprocessing(log, net, im, fm, parameters={
+                             token_replay.Parameters.CORES: 2, token_replay.Parameters.RETURN_NAMES: True}))
+
     def test_evaluation(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.alpha import algorithm as alpha_miner
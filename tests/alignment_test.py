@@ -100,6 +100,159 @@ class AlignmentTest(unittest.TestCase):
         net, im, fm = pm4py.discover_petri_net_inductive(log)
         align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_TWEAKED_STATE_EQUATION_A_STAR)
 
+    def test_variant_state_eq_a_star_integer_markings(self):
+        import pm4py
+        from pm4py.algo.conformance.alignments.petri_net.variants import state_equation_a_star
+        for log_path in ["input_data/running-example.xes", "compressed_input_data/04_reviewing.xes.gz"]:
+            log = pm4py.read_xes(log_path, return_legacy_log_object=True)
+            for net, im, fm in [pm4py.discover_petri_net_inductive(log, noise_threshold=0.2),
+                                pm4py.discover_petri_net_alpha(log)]:
+                aligned_traces = align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_STATE_EQUATION_A_STAR)
+                aligned_traces_int = align_alg.apply(log, net, im, fm,
+                                                     variant=align_alg.Variants.VERSION_STATE_EQUATION_A_STAR,
+                                                     parameters={state_equation_a_star.Parameters.INTEGER_MARKINGS: True})
+                for al, al_int in zip(aligned_traces, aligned_traces_int):
+                    self.assertEqual(al is None, al_int is None)
+                    if al is not None:
+                        self.assertEqual(al["cost"], al_int["cost"])
+
+    def test_variant_state_eq_a_star_budgets(self):
+        import pm4py
+        from pm4py.algo.conformance.alignments.petri_net.variants import state_equation_a_star
+        log = pm4py.read_xes("input_data/running-example.xes", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.2)
+        aligned_traces = align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_STATE_EQUATION_A_STAR)
+        for integer_markings in [False, True]:
+            bounded_traces = align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_STATE_EQUATION_A_STAR,
+                                             parameters={state_equation_a_star.Parameters.INTEGER_MARKINGS: integer_markings,
+                                                         state_equation_a_star.Parameters.MAX_NODES_TRACE: 10000})
+            approx_traces = align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_STATE_EQUATION_A_STAR,
+                                            parameters={state_equation_a_star.Parameters.INTEGER_MARKINGS: integer_markings,
+                                                        state_equation_a_star.Parameters.MAX_NODES_TRACE: 5})
+            self.assertTrue(any(al is not None and "exhausted_budget" in al for al in approx_traces))
+            for al, al_bounded, al_approx in zip(aligned_traces, bounded_traces, approx_traces):
+                self.assertTrue(al_bounded["optimal"])
+                self.assertEqual(al["cost"], al_bounded["cost"])
+                if al_approx is not None and "exhausted_budget" in al_approx:
+                    self.assertEqual(al_approx["exhausted_budget"], "nodes")
+                    self.assertGreaterEqual(al_approx["cost"], al["cost"])
+                    self.assertGreaterEqual(al["cost"], al_approx["cost_lower_bound"])
+                    self.assertEqual(al_approx["optimal"], al_approx["cost"] <= al_approx["cost_lower_bound"])
+                    # the beam search expands at most beam_width states per layer, for at most max_nodes layers
+                    self.assertLessEqual(al_approx["visited_states"], 5 * (1 + state_equation_a_star.DEFAULT_BEAM_WIDTH))
+
+    def test_variant_state_eq_a_star_anytime(self):
+        import time
+        import pm4py
+        from pm4py.algo.conformance.alignments.petri_net.variants import state_equation_a_star
+        log = pm4py.read_xes("compressed_input_data/04_reviewing.xes.gz", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.5)
+        for integer_markings in [False, True]:
+            # a wide beam search, stopped by the time budget
+            parameters = {state_equation_a_star.Parameters.INTEGER_MARKINGS: integer_markings,
+                          state_equation_a_star.Parameters.ANYTIME: True,
+                          state_equation_a_star.Parameters.PARAM_MAX_ALIGN_TIME_TRACE: 0.02,
+                          state_equation_a_star.Parameters.BEAM_WIDTH: 1000}
+            for trace in log[:10]:
+                exact = state_equation_a_star.apply(trace, net, im, fm,
+                                                    parameters={state_equation_a_star.Parameters.INTEGER_MARKINGS: integer_markings})
+                aa = time.time()
+                al = state_equation_a_star.apply(trace, net, im, fm, parameters=dict(parameters))
+                # only guards against a search ignoring the budget (the flags are checked below)
+                self.assertLess(time.time() - aa, 30.0)
+                if al is None:
+                    continue
+                if "exhausted_budget" in al:
+                    self.assertEqual(al["exhausted_budget"], "time")
+                    self.assertLessEqual(al["cost_lower_bound"], exact["cost"])
+                else:
+                    self.assertTrue(al["optimal"])
+                if al["optimal"]:
+                    self.assertEqual(al["cost"], exact["cost"])
+                else:
+                    self.assertGreaterEqual(al["cost"], exact["cost"])
+
+    def test_variants_list_prefix_sharing(self):
+        import pm4py
+        from pm4py.algo.conformance.alignments.petri_net.variants import state_equation_a_star
+        for log_path in ["input_data/running-example.xes", "compressed_input_data/04_reviewing.xes.gz"]:
+            log = pm4py.read_xes(log_path, return_legacy_log_object=True)
+            net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.2)
+            # the variants sharing a prefix with a longer one are also aligned
+            variants = pm4py.get_variants(log)
+            var_list = [(v, c) for v, c in variants.items()] + [((), 0), (next(iter(variants))[:2], 0)]
+            aligned_variants = state_equation_a_star.apply_from_variants_list(var_list, net, im, fm)
+            aligned_variants_ps = state_equation_a_star.apply_from_variants_list(
+                var_list, net, im, fm, parameters={state_equation_a_star.Parameters.PREFIX_SHARING: True})
+            self.assertEqual(set(aligned_variants), set(aligned_variants_ps))
+            for variant, al in aligned_variants.items():
+                al_ps = aligned_variants_ps[variant]
+                self.assertEqual(al["cost"], al_ps["cost"])
+                self.assertEqual(list(variant), [move[0] for move in al_ps["alignment"] if move[0] != ">>"])
+
+    def test_alignments_multiprocessing(self):
+        import pm4py
+        from pm4py.objects.petri_net.utils.shared_pool import SharedNetPool
+        log = pm4py.read_xes("compressed_input_data/04_reviewing.xes.gz", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.2)
+        variant = align_alg.Variants.VERSION_STATE_EQUATION_A_STAR
+        aligned_traces = align_alg.apply(log, net, im, fm, variant=variant)
+        aligned_traces_mp = align_alg.apply_multiprocessing(log, net, im, fm, variant=variant,
+                                                            parameters={align_alg.Parameters.CORES: 2})
+        self.assertEqual([(al["cost"], al["fitness"]) for al in aligned_traces],
+                         [(al["cost"], al["fitness"]) for al in aligned_traces_mp])
+
+        # a persistent pool replays several lists of variants, the Petri net being sent once to the workers
+        variants = [tuple(e["concept:name"] for e in trace) for trace in log]
+        with SharedNetPool(net, im, fm, parameters={"enable_best_worst_cost": False}, num_cores=2) as pool:
+            for i in range(2):
+                aligned_variants = pool.apply_alignments(variants[i::2], variant=variant)
+                self.assertEqual([al["cost"] for al in aligned_traces[i::2]], [al["cost"] for al in aligned_variants])
+            self.assertEqual([], pool.apply_alignments([], variant=variant))
+
+    def test_alignments_cache(self):
+        import pm4py
+        from pm4py.algo.conformance.alignments.petri_net.utils import cache as alignments_cache
+        from tests.constants import OUTPUT_DATA_DIR
+        log = pm4py.read_xes("input_data/running-example.xes", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log)
+        cache_path = os.path.join(OUTPUT_DATA_DIR, "alignments_cache.sqlite")
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        variant = align_alg.Variants.VERSION_STATE_EQUATION_A_STAR
+        parameters = {align_alg.Parameters.CACHE_PATH: cache_path}
+
+        aligned_traces = align_alg.apply(log, net, im, fm, variant=variant)
+        # the first execution stores the alignments of the variants, that are read by the following ones
+        stored = align_alg.apply(log, net, im, fm, variant=variant, parameters=parameters)
+        cached = align_alg.apply(log, net, im, fm, variant=variant, parameters=parameters)
+        cached_mp = align_alg.apply_multiprocessing(log, net, im, fm, variant=variant,
+                                                    parameters={**parameters, align_alg.Parameters.CORES: 1})
+        self.assertEqual(aligned_traces, stored)
+        self.assertEqual(aligned_traces, cached)
+        self.assertEqual(aligned_traces, cached_mp)
+
+        # the alignments are stored as JSON, restoring the moves (and their transition descriptions) as tuples
+        sync_prod_parameters = {**parameters, align_alg.Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE: True}
+        aligned_sync_prod = align_alg.apply(log, net, im, fm, variant=variant, parameters=dict(sync_prod_parameters))
+        cached_sync_prod = align_alg.apply(log, net, im, fm, variant=variant, parameters=dict(sync_prod_parameters))
+        self.assertEqual(aligned_sync_prod, cached_sync_prod)
+        self.assertIsInstance(cached_sync_prod[0]["alignment"][0][0], tuple)
+
+        # the cost functions are part of the key of the model
+        model_cost_function = {t: 2 if t.label is not None else 1 for t in net.transitions}
+        model_cost_parameters = {**parameters, align_alg.Parameters.PARAM_MODEL_COST_FUNCTION: model_cost_function}
+        self.assertEqual(align_alg.apply(log, net, im, fm, variant=variant, parameters=model_cost_parameters),
+                         align_alg.apply(log, net, im, fm, variant=variant,
+                                         parameters={align_alg.Parameters.PARAM_MODEL_COST_FUNCTION: model_cost_function}))
+        fingerprint = alignments_cache.get_model_fingerprint(net, im, fm, str(variant), (None,) * 9)
+        variants = [tuple(e["concept:name"] for e in trace) for trace in log]
+        self.assertEqual(len(set(variants)), len(alignments_cache.get(cache_path, fingerprint, variants)))
+
+        alignments_cache.evict(cache_path, 0)
+        self.assertEqual(0, len(alignments_cache.get(cache_path, fingerprint, variants)))
+        os.remove(cache_path)
+
 
 
 if __name__ == "__main__":
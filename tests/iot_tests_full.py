@@ -9,6 +9,7 @@ from pm4py.objects.iot.obj import IOTEventLog, IOTEvent, IOTTrace, Point, DataSt
 from pm4py.objects.iot.importer.xes.variants.xmlxes20 import State
 from pm4py.objects.iot import apis
 from pm4py.objects.iot.utils import verifier
+from pm4py.objects.iot.exceptions import VerificationFailedError
 from iot_tests import TestCase, SENSOR_FILES
 
 
@@ -338,6 +339,164 @@ def test_remove_sensor_value_from_event():
     cleaner.remove_modified(modified)
 
 
+def test_datastream_index_add_remove_sensor_value():
+    """
+        should ignore points already in datastream, also after in-place modification
+        should keep index in sync on append, insert, setitem and remove
+    """
+    datastream = DataStream(name='datastream_name')
+    for point in [point1, point2, point3]:
+        datastream.add_sensor_value(copy.copy(point))
+    datastream.add_sensor_value(copy.copy(point2))
+    assert len(datastream) == 3
+
+    datastream.insert(0, copy.copy(point4))
+    datastream[1] = copy.copy(point_add)
+    datastream.remove(2)
+    assert [item.id for item in datastream] == ['point4_id', 'point5_id', 'point3_id']
+
+    datastream.add_sensor_value(copy.copy(point1))
+    datastream.add_sensor_value(copy.copy(point4))
+    assert len(datastream) == 4
+
+    datastream.remove_sensor_value(point_add)
+    datastream.remove_sensor_value(point2)
+    assert [item.id for item in datastream] == ['point4_id', 'point3_id', 'point1_id']
+
+    datastream[0].value = 'point4_new_val'
+    datastream.add_sensor_value(Point(id='point4_id', timestamp=point4.timestamp, value='point4_new_val', source='point4_source', meta=[{'type':'System.String4'}]))
+    assert len(datastream) == 3
+
+
+def test_datastream_index_point_setters():
+    """
+        should keep index in sync when indexed points are modified through their setters
+    """
+    datastream = DataStream(name='datastream_name')
+    point = Point(id='a', timestamp=1, value=1)
+    datastream.append(point)
+    datastream.add_sensor_value(Point(id='b', timestamp=1, value=1))
+    point.value = 2
+    datastream.add_sensor_value(Point(id='a', timestamp=1, value=2))
+    assert len(datastream) == 2
+    datastream.add_sensor_value(Point(id='a', timestamp=1, value=1))
+    assert len(datastream) == 3
+
+    datastream.remove_sensor_value(Point(id='a', timestamp=1, value=2))
+    assert [(item.id, item.value) for item in datastream] == [('b', 1), ('a', 1)]
+
+    multipoint = MultiPoint(id='c')
+    multipoint.append(Point(timestamp=1, value=1))
+    assert multipoint.contains(Point(id='c', timestamp=1, value=1))
+    multipoint[0].timestamp = 2
+    assert not multipoint.contains(Point(id='c', timestamp=1, value=1))
+    assert multipoint.contains(Point(id='c', timestamp=2, value=1))
+
+
+def test_multipoint_index_add_remove_sensor_value():
+    """
+        should find points by their completion with the multipoint attributes
+        should rebuild index when the multipoint attributes change
+    """
+    multipoint = MultiPoint(timestamp=point2.timestamp)
+    datastream = DataStream(name='datastream_name')
+    datastream.append(multipoint)
+    datastream.add_sensor_value(copy.copy(point2))
+    datastream.add_sensor_value(copy.copy(point3))
+    datastream.add_sensor_value(copy.copy(point2))
+    assert len(datastream) == 1
+    assert len(multipoint) == 2
+    assert multipoint.fetch_keys(point3) == [1]
+    assert multipoint[0].timestamp is None
+
+    multipoint.timestamp = point4.timestamp
+    assert not multipoint.contains(point2)
+    datastream.add_sensor_value(copy.copy(point4))
+    assert len(multipoint) == 3
+    assert multipoint.fetch_keys(point4) == [2]
+
+    datastream.remove_sensor_value(point4)
+    assert len(multipoint) == 2
+    assert not multipoint.contains(point4)
+
+
+def test_columnar_datastream():
+    """
+        should store points in columns, materializing equal points
+        should export the same as list-based datastream
+        should fall back to list-based storage when adding a multipoint
+    """
+    from pm4py.objects.iot.exporter.xes import exporter as iot_xes_exporter
+    points = [point1, point2, point3, point4, Point(id='point6_id', value=1.5), Point(id='point7_id', value=2)]
+
+    logs = []
+    for columnar in [False, True]:
+        log = IOTEventLog(version='2.0', features='nested-attributes')
+        trace = IOTTrace()
+        event = IOTEvent()
+        datastream = DataStream(name='datastream_name', columnar=columnar)
+        for point in points:
+            datastream.append(copy.copy(point))
+        event.append(datastream)
+        trace.append(event)
+        log.append(trace)
+        logs.append(log)
+
+    row_datastream, datastream = logs[0][0][0][0], logs[1][0][0][0]
+    assert datastream.is_columnar()
+    assert type(datastream[0]) == Point
+    assert datastream == row_datastream
+    assert datastream[-2].value == 1.5 and datastream[-1].value == 2 and type(datastream[-1].value) == int
+    assert iot_xes_exporter.serialize(logs[1]) == iot_xes_exporter.serialize(logs[0])
+    assert datastream.fetch_sensor_values(FilterSet(id='point1_id')) == ['point1_val']
+
+    datastream.add_sensor_value(copy.copy(point2))
+    datastream.add_sensor_value(copy.copy(point_add))
+    datastream.remove_sensor_value(point3)
+    assert len(datastream) == 6
+    assert datastream == copy.deepcopy(datastream)
+    assert [item.id for item in datastream] == ['point1_id', 'point2_id', 'point4_id', 'point6_id', 'point7_id', 'point5_id']
+
+    datastream.append(MultiPoint(id='multipoint_id'))
+    assert not datastream.is_columnar()
+    assert len(datastream) == 7
+    assert datastream[1] == point2
+
+
+def test_sensor_values_statistics():
+    """
+        should return the values of fetch_sensor_values per sensor id, with count and min/max/mean
+        should complete multipoint points and read columnar datastreams
+    """
+    log = IOTEventLog(version='2.0', features='nested-attributes')
+    trace = IOTTrace()
+    event = IOTEvent()
+    datastream = DataStream(name='datastream1_name')
+    for value in [1.0, 2.0, 2.0]:
+        datastream.append(Point(id='sensor1', timestamp=point1.timestamp, value=value, source='source1'))
+    datastream.append(Point(id='sensor2', timestamp=point2.timestamp, value='off', source='source1'))
+    multipoint = MultiPoint(id='sensor1', timestamp=point3.timestamp)
+    multipoint.append(Point(value=6.0, source='source2'))
+    datastream.append(multipoint)
+    columnar_datastream = DataStream(name='datastream2_name', columnar=True)
+    columnar_datastream.append(Point(id='sensor2', timestamp=point4.timestamp, value='on', source='source2'))
+    event.append(datastream)
+    event.append(columnar_datastream)
+    trace.append(event)
+    log.append(trace)
+
+    fsets = [FilterSet(source='source1'), FilterSet(id='sensor1'), FilterSet(id='sensor2', timestamp=point4.timestamp)]
+    statistics = apis.sensor_values_statistics(log, fsets)
+
+    assert statistics[0] == {
+        'sensor1': {'values': [1.0, 2.0], 'count': 3, 'min': 1.0, 'max': 2.0, 'mean': 5.0 / 3},
+        'sensor2': {'values': ['off'], 'count': 1, 'min': None, 'max': None, 'mean': None},
+    }
+    assert statistics[1]['sensor1']['values'] == event.fetch_sensor_values(fsets[1]) == [1.0, 2.0, 6.0]
+    assert statistics[1]['sensor1']['count'] == 4 and statistics[1]['sensor1']['max'] == 6.0
+    assert statistics[2]['sensor2']['values'] == event.fetch_sensor_values(fsets[2]) == ['on']
+
+
 def test_sensor_values_of_specific_type():
     expected_values1 = ['point1_val', 'point1_val_d2', 'point1_val_d2_m1']
     expected_values2 = ['point2_val', 'point2_val_d2', 'point2_val_d2_m2']
@@ -517,3 +676,265 @@ def test_exporter_sensor_data(sensor_id):
     assert have_log == expected_log
 
     cleaner.remove_modified(modified)
+
+
+def assert_chunk_regex_conforms(path, modified, chunk_size):
+    from pm4py.objects.iot.importer.xes import importer as iot_xes_importer
+    cleaner.rewrite(path, modified)
+    expected_log = iot_xes_importer.apply(modified, variant=iot_xes_importer.Variants.XMLXES20)
+    have_log = iot_xes_importer.apply(modified, variant=iot_xes_importer.Variants.CHUNK_REGEX, parameters={'chunk_size': chunk_size})
+
+    assert have_log == expected_log
+    assert have_log.version == expected_log.version and have_log.features == expected_log.features
+
+    cleaner.remove_modified(modified)
+
+
+@pytest.mark.parametrize("sensor_id", list(range(len(SENSOR_FILES))))
+def test_chunk_regex_importer_sensor_data(sensor_id):
+    path, modified = TestCase.SENSOR_DATA(sensor_id)
+    assert_chunk_regex_conforms(path, modified, 2 ** 16)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 2 ** 22])
+@pytest.mark.parametrize("case", [TestCase.ALLOW_EMPTY_MULTIPOINT, TestCase.MULTIPOINT, TestCase.DATASTREAM_IN_TRACE,
+                                  TestCase.DATACONTEXT_IN_TRACE, TestCase.EVENT_IN_LOG,
+                                  TestCase.EXPORTER_EMPTY_LIST, TestCase.COUNT_POINTS_IN_MULTIPOINT_ENTRY,
+                                  TestCase.COUNT_DISTINCT_DATACONTEXT_GROUPS_AT_TRACE_LEVEL,
+                                  TestCase.FIND_ALL_STREAM_DATA_ENTRIES_IN_EVENT, TestCase.REMOVE_SENSOR_VALUE_FROM_EVENT])
+def test_chunk_regex_importer_additional(case, chunk_size):
+    path, modified = case()
+    assert_chunk_regex_conforms(path, modified, chunk_size)
+
+
+@pytest.mark.parametrize("case", [TestCase.EVENT_IN_LOG, TestCase.DATACONTEXT_IN_TRACE, TestCase.MULTIPOINT])
+def test_iter_traces(case):
+    from pm4py.objects.iot.importer.xes import importer as iot_xes_importer
+    path, modified = case()
+    cleaner.rewrite(path, modified)
+    expected_log = read.read_iot_xes(modified)
+
+    header = iot_xes_importer.get_log_header(modified)
+    assert len(header) == 0
+    assert header.attributes == expected_log.attributes
+    assert header.extensions == expected_log.extensions
+    assert header.omni_present == expected_log.omni_present
+
+    for variant in iot_xes_importer.Variants:
+        items = list(iot_xes_importer.iter_traces(modified, variant=variant))
+        assert len(items) == len(expected_log)
+        for item, expected_item in zip(items, expected_log):
+            assert type(item) == type(expected_item)
+            assert item == expected_item
+
+    cleaner.remove_modified(modified)
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_multiprocessing_import(monkeypatch, compressed):
+    import gzip
+    import shutil
+    from pm4py.objects.iot.importer.xes.variants import xmlxes20
+    path, modified = TestCase.EVENT_IN_LOG()
+    cleaner.rewrite(path, modified)
+    log = read.read_iot_xes(modified)
+    cleaner.remove_modified(modified)
+
+    # several traces, followed by the events directly contained in the log
+    multi_trace_log = copy.deepcopy(log)
+    multi_trace_log._list = [copy.deepcopy(log[0]) for i in range(5)] + multi_trace_log._list
+    file = tempfile.NamedTemporaryFile(suffix='.xes')
+    write.write_iot_xes(multi_trace_log, file.name)
+    file_path = file.name
+    if compressed:
+        compressed_file = tempfile.NamedTemporaryFile(suffix='.xes.gz')
+        with open(file.name, 'rb') as f_in, gzip.open(compressed_file.name, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        file_path = compressed_file.name
+
+    expected_log = read.read_iot_xes(file_path)
+    expected_mismatches = verifier.MisMatchCounter.POINT_NONE_VALUE
+    # one range of traces per worker task
+    monkeypatch.setattr(xmlxes20, 'MIN_CHUNK_SIZE', 1)
+    have_log = read.read_iot_xes(file_path, multiprocessing=True, cores=2)
+
+    assert len(have_log) == len(multi_trace_log)
+    assert [type(item) for item in have_log] == [type(item) for item in expected_log]
+    assert have_log == expected_log
+    assert verifier.MisMatchCounter.POINT_NONE_VALUE == expected_mismatches
+
+
+@pytest.mark.parametrize("parameters", [{'block_size': 1}, {'compress': True}, {'multiprocessing': True, 'cores': 2},
+                                        {'multiprocessing': True, 'cores': 2, 'compress': True}])
+@pytest.mark.parametrize("case", [TestCase.EVENT_IN_LOG, TestCase.DATACONTEXT_IN_TRACE, TestCase.MULTIPOINT,
+                                  TestCase.EXPORTER_EMPTY_LIST, TestCase.ALLOW_EMPTY_MULTIPOINT])
+def test_buffered_exporter(case, parameters):
+    import gzip
+    from pm4py.objects.iot.exporter.xes import exporter as iot_xes_exporter
+    path, modified = case()
+    cleaner.rewrite(path, modified)
+    log = read.read_iot_xes(modified)
+    cleaner.remove_modified(modified)
+
+    expected = iot_xes_exporter.serialize(log, variant=iot_xes_exporter.Variants.LINE_BY_LINE)
+    have = iot_xes_exporter.serialize(log, variant=iot_xes_exporter.Variants.BUFFERED, parameters=parameters)
+    if parameters.get('compress', False):
+        have = gzip.decompress(have)
+    assert have == expected
+
+    # the extension of the file enables the compression
+    file = tempfile.NamedTemporaryFile(suffix='.xes.gz')
+    iot_xes_exporter.apply(log, file.name, variant=iot_xes_exporter.Variants.BUFFERED, parameters=parameters)
+    with gzip.open(file.name, 'rb') as f:
+        assert f.read() == expected
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("case", [TestCase.EVENT_IN_LOG, TestCase.DATACONTEXT_IN_TRACE, TestCase.MULTIPOINT,
+                                  TestCase.ALLOW_EMPTY_MULTIPOINT, TestCase.GET_TRACES_WITH_DATASTREAM,
+                                  TestCase.COUNT_DATASTRAMS_AND_POINTS_IN_EVENT, TestCase.COUNT_DISTINCT_DATACONTEXT_GROUPS_AT_TRACE_LEVEL])
+def test_dataframes(case, columnar):
+    from pm4py.objects.iot import dataframe
+    path, modified = case()
+    cleaner.rewrite(path, modified)
+    log = read.read_iot_xes(modified, columnar_datastreams=columnar)
+    cleaner.remove_modified(modified)
+
+    events_df, sensor_df = apis.log_to_dataframes(log)
+    assert len(events_df) == sum(1 for item in log for event in (item if type(item) == IOTTrace else [item]) if type(event) == IOTEvent)
+    statistics = apis.sensor_values_statistics(log, FilterSet())
+    assert sensor_df[dataframe.IS_POINT].sum() == sum(sensor["count"] for sensor in statistics.values())
+
+    have_log = apis.dataframes_to_log(events_df, sensor_df)
+    assert have_log == log
+    assert have_log.version == log.version and have_log.features == log.features
+
+
+def get_readings(item, multipoint=None):
+    from pm4py.objects.iot.columnar import to_microseconds
+    from datetime import datetime
+    if type(item) == Point:
+        timestamp = multipoint.timestamp if multipoint is not None and multipoint.timestamp is not None else item.timestamp
+        id = multipoint.id if multipoint is not None and multipoint.id is not None else item.id
+        if isinstance(timestamp, datetime):
+            yield id, to_microseconds(timestamp), item.value
+    elif type(item) == MultiPoint:
+        for point in item:
+            yield from get_readings(point, item)
+    elif type(item) != IOTEventLog:
+        for child in item:
+            yield from get_readings(child)
+
+
+def check_sensor_joins(log, have_log):
+    from pm4py.objects.iot.columnar import to_microseconds
+    # the readings outside traces are shared by the events contained directly in the log
+    log_readings = [reading for item in log if type(item) != IOTTrace for reading in get_readings(item)]
+    for item, have_item in zip(log, have_log):
+        readings = list(get_readings(item)) if type(item) == IOTTrace else log_readings
+        events = list(zip(item, have_item)) if type(item) == IOTTrace else [(item, have_item)]
+        for event, have_event in events:
+            if type(event) != IOTEvent or 'start_timestamp' not in event.attributes:
+                continue
+            end = to_microseconds(event.attributes['time:timestamp'])
+            start = to_microseconds(event.attributes['start_timestamp'])
+            for id in set(reading[0] for reading in readings if reading[0] is not None):
+                before = [reading for reading in readings if reading[0] == id and reading[1] <= end]
+                if before:
+                    # the last reading in the order of the log among the ones with the latest timestamp
+                    latest = max(reading[1] for reading in before)
+                    assert have_event.attributes['sensor:' + str(id)] == [reading for reading in before if reading[1] == latest][-1][2]
+                else:
+                    assert 'sensor:' + str(id) not in have_event.attributes
+                inside = [reading[2] for reading in readings if reading[0] == id and start <= reading[1] <= end]
+                assert have_event.attributes['sensor:' + str(id) + ':count'] == len(inside)
+                numeric = [value for value in inside if type(value) in (int, float)]
+                if numeric:
+                    assert have_event.attributes['sensor:' + str(id) + ':min'] == min(numeric)
+                    assert have_event.attributes['sensor:' + str(id) + ':max'] == max(numeric)
+                    assert abs(have_event.attributes['sensor:' + str(id) + ':mean'] - sum(numeric) / len(numeric)) < 1e-9
+                else:
+                    assert 'sensor:' + str(id) + ':mean' not in have_event.attributes
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("case", [TestCase.EVENT_IN_LOG, TestCase.DATACONTEXT_IN_TRACE, TestCase.MULTIPOINT,
+                                  TestCase.GET_TRACES_WITH_DATASTREAM, TestCase.COUNT_DATASTRAMS_AND_POINTS_IN_EVENT,
+                                  TestCase.COUNT_DISTINCT_DATACONTEXT_GROUPS_AT_TRACE_LEVEL])
+def test_sensor_joins(case, columnar):
+    from datetime import timedelta
+    from pm4py.objects.iot import join
+    path, modified = case()
+    cleaner.rewrite(path, modified)
+    log = read.read_iot_xes(modified, columnar_datastreams=columnar)
+    cleaner.remove_modified(modified)
+
+    for item in log:
+        for event in (item if type(item) == IOTTrace else [item]):
+            if type(event) == IOTEvent and 'time:timestamp' in event.attributes:
+                event.attributes['start_timestamp'] = event.attributes['time:timestamp'] - timedelta(days=1)
+    have_log = apis.sensor_window_join(apis.sensor_asof_join(copy.deepcopy(log)), aggregations=join.AGGREGATIONS)
+    check_sensor_joins(log, have_log)
+
+
+def test_sensor_joins_lifecycle():
+    import random
+    from datetime import datetime, timedelta, timezone
+    from pm4py.objects.iot import join
+    random.seed(42)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    log = IOTEventLog()
+    for i in range(10):
+        trace = IOTTrace(attributes={'concept:name': str(i)})
+        for j in range(8):
+            timestamp = start + timedelta(seconds=100 * j + random.randint(0, 50))
+            event = IOTEvent(attributes={'concept:name': 'activity' + str(j // 2 % 2), 'time:timestamp': timestamp,
+                                         'lifecycle:transition': 'start' if j % 2 == 0 else 'complete'})
+            datastream = DataStream(name='machine')
+            for k in range(20):
+                datastream.append(Point(id=random.choice(['temperature', 'pressure', 'door']),
+                                        timestamp=start + timedelta(seconds=random.randint(0, 800)),
+                                        value=random.choice([1, 2.5, 'open', 7.0])))
+            event.append(datastream)
+            trace.append(event)
+        log.append(trace)
+
+    have_log = join.window_join(join.asof_join(copy.deepcopy(log)), parameters={'aggregations': join.AGGREGATIONS})
+    # the windows of the events completing an activity start at the matching start event
+    for trace in log:
+        for j in range(1, len(trace), 2):
+            trace[j].attributes['start_timestamp'] = trace[j - 1].attributes['time:timestamp']
+    check_sensor_joins(log, have_log)
+    assert all('sensor:door:count' not in have_log[i][j].attributes for i in range(10) for j in range(0, 8, 2))
+    assert sum(have_log[i][j].attributes['sensor:door:count'] for i in range(10) for j in range(1, 8, 2)) > 0
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("case", [TestCase.EVENT_IN_LOG, TestCase.DATACONTEXT_IN_TRACE, TestCase.MULTIPOINT,
+                                  TestCase.ALLOW_EMPTY_MULTIPOINT, TestCase.GET_TRACES_WITH_DATASTREAM])
+def test_verifier_modes(case, columnar):
+    path, modified = case()
+    cleaner.rewrite(path, modified)
+    log = read.read_iot_xes(modified, columnar_datastreams=columnar, apply_verifier=False)
+    assert read.read_iot_xes(modified, columnar_datastreams=columnar, verifier_sample_fraction=0.5) == log
+    cleaner.remove_modified(modified)
+
+    verifier.verify(log)
+    expected_mismatches = verifier.MisMatchCounter.POINT_NONE_VALUE
+    verifier.verify(log, parameters={'multiprocessing': True, 'cores': 2})
+    assert verifier.MisMatchCounter.POINT_NONE_VALUE == expected_mismatches
+    verifier.verify(log, parameters={'sample_fraction': 0.5})
+    assert verifier.MisMatchCounter.POINT_NONE_VALUE <= expected_mismatches
+
+    # the first failing item (in the order of the log) is reported in every mode
+    invalid_log = copy.deepcopy(log)
+    invalid_log._list = [copy.deepcopy(log[0]) for i in range(3)] + [IOTTrace([DataStream(), IOTTrace()]), IOTTrace([IOTEvent([Point()])])]
+    for parameters in [{}, {'multiprocessing': True, 'cores': 2}]:
+        with pytest.raises(VerificationFailedError) as error:
+            verifier.verify(invalid_log, parameters=parameters)
+        assert error.value.type == IOTTrace
+    # the types of the items of the log are verified even if they are not sampled
+    invalid_log._list.append(DataStream())
+    with pytest.raises(VerificationFailedError) as error:
+        verifier.verify(invalid_log, parameters={'sample_fraction': 0.01})
+    assert error.value.type == IOTEventLog
@@ -42,6 +42,525 @@ class XesYamlTest(unittest.TestCase):
         )
         os.remove(os.path.join(OUTPUT_DATA_DIR, file_name))
 
+    # ======================================== lazy trace iteration test cases ========================================
+    def test_iterTracesYAML_running_example(self):
+        yaml_log_path = os.path.join(INPUT_DATA_DIR, "running-example.xes.yaml")
+        yaml_log = yaml_importer.apply(yaml_log_path)
+        traces = list(yaml_importer.iter_traces(yaml_log_path))
+
+        self.assertEqual(len(yaml_log), len(traces))
+        for trace, trace_iter in zip(yaml_log, traces):
+            self.check_difference(list(trace), list(trace_iter))
+
+    def test_iterTracesYAML_fromGZIP_max_traces(self):
+        self.dummy_variable = "dummy_value"
+        yaml_log_path = os.path.join(COMPRESSED_INPUT_DATA, "chess_production.xes.yaml.gz")
+        traces = list(
+            yaml_importer.iter_traces(
+                yaml_log_path,
+                parameters={yaml_importer.yaml_loader.Parameters.MAX_TRACES: 1},
+            )
+        )
+        self.assertEqual(len(traces), 1)
+        self.assertGreater(len(traces[0]), 0)
+
+    # ======================================== multiprocessing import test cases ========================================
+    def test_importYAML_multiprocessing_running_example(self):
+        xes_log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        exported_yaml_log_path = os.path.join(
+            OUTPUT_DATA_DIR, "running-example_multiprocessing.xes.yaml"
+        )
+        yaml_exporter.apply(xes_log, exported_yaml_log_path)
+
+        yaml_log = yaml_importer.apply(exported_yaml_log_path)
+
+        # forces the split of the file in several chunks, separating events from their trace
+        min_chunk_size = yaml_importer.yaml_loader.MIN_CHUNK_SIZE
+        yaml_importer.yaml_loader.MIN_CHUNK_SIZE = 256
+        try:
+            yaml_log_mp = yaml_importer.apply(
+                exported_yaml_log_path,
+                parameters={
+                    yaml_importer.yaml_loader.Parameters.MULTIPROCESSING: True,
+                    yaml_importer.yaml_loader.Parameters.CORES: 2,
+                },
+            )
+        finally:
+            yaml_importer.yaml_loader.MIN_CHUNK_SIZE = min_chunk_size
+
+        self.assertEqual(len(yaml_log), len(yaml_log_mp))
+        self.check_difference(yaml_log, yaml_log_mp)
+
+        os.remove(exported_yaml_log_path)
+
+    def test_importYAML_multiprocessing_fromGZIP_max_traces(self):
+        import gzip
+        import shutil
+
+        xes_log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        exported_yaml_log_path = os.path.join(
+            OUTPUT_DATA_DIR, "running-example_multiprocessing_max_traces.xes.yaml"
+        )
+        yaml_exporter.apply(xes_log, exported_yaml_log_path)
+        file_path = exported_yaml_log_path + ".gz"
+        with open(exported_yaml_log_path, "rb") as f_in, gzip.open(file_path, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(exported_yaml_log_path)
+
+        yaml_log = yaml_importer.apply(file_path, parameters={yaml_importer.yaml_loader.Parameters.MAX_TRACES: 3})
+        self.assertEqual(len(yaml_log), 3)
+
+        # forces the split of the decompressed stream in more chunks than the window of submitted chunks
+        min_chunk_size = yaml_importer.yaml_loader.MIN_CHUNK_SIZE
+        yaml_importer.yaml_loader.MIN_CHUNK_SIZE = 256
+        try:
+            yaml_log_mp = yaml_importer.apply(
+                file_path,
+                parameters={
+                    yaml_importer.yaml_loader.Parameters.MULTIPROCESSING: True,
+                    yaml_importer.yaml_loader.Parameters.CORES: 2,
+                    yaml_importer.yaml_loader.Parameters.MAX_TRACES: 3,
+                },
+            )
+        finally:
+            yaml_importer.yaml_loader.MIN_CHUNK_SIZE = min_chunk_size
+
+        self.assertEqual(len(yaml_log), len(yaml_log_mp))
+        self.check_difference(yaml_log, yaml_log_mp)
+
+        # the dataframe import runs in the current process
+        with self.assertWarns(UserWarning):
+            dataframe = yaml_importer.apply(
+                file_path,
+                parameters={
+                    yaml_importer.yaml_loader.Parameters.MULTIPROCESSING: True,
+                    yaml_importer.yaml_loader.Parameters.RETURN_LEGACY_LOG_OBJECT: False,
+                    yaml_importer.yaml_loader.Parameters.MAX_TRACES: 3,
+                },
+            )
+        self.assertEqual(dataframe["case:concept:name"].nunique(), 3)
+
+        os.remove(file_path)
+
+    # ======================================== dataframe import test cases ========================================
+    def test_importYAMLtoDataframe_running_example(self):
+        import pandas as pd
+        from pm4py.objects.conversion.log import converter as log_converter
+        from pm4py.objects.log.util import dataframe_utils
+
+        xes_log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        exported_yaml_log_path = os.path.join(
+            OUTPUT_DATA_DIR, "running-example_dataframe.xes.yaml"
+        )
+        yaml_exporter.apply(xes_log, exported_yaml_log_path)
+
+        yaml_log = yaml_importer.apply(exported_yaml_log_path)
+        expected_df = log_converter.apply(yaml_log, variant=log_converter.Variants.TO_DATA_FRAME)
+        expected_df = dataframe_utils.convert_timestamp_columns_in_df(expected_df, timest_format="ISO8601")
+
+        df = yaml_importer.apply(
+            exported_yaml_log_path,
+            parameters={yaml_importer.yaml_loader.Parameters.RETURN_LEGACY_LOG_OBJECT: False},
+        )
+
+        self.assertIn("case:concept:name", df.columns)
+        pd.testing.assert_frame_equal(expected_df, df)
+
+        os.remove(exported_yaml_log_path)
+
+    def test_importYAMLtoDataframe_sorted_running_example(self):
+        import pandas as pd
+        import pm4py
+        from pm4py.objects.conversion.log import converter as log_converter
+        from pm4py.objects.log.util import dataframe_utils
+
+        xes_log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        exported_yaml_log_path = os.path.join(
+            OUTPUT_DATA_DIR, "running-example_dataframe_sorted.xes.yaml"
+        )
+        yaml_exporter.apply(xes_log, exported_yaml_log_path)
+
+        for reverse_sort in [False, True]:
+            yaml_log = pm4py.read_yaml(exported_yaml_log_path, return_legacy_log_object=True,
+                                       timestamp_sort=True, reverse_sort=reverse_sort)
+            expected_df = log_converter.apply(yaml_log, variant=log_converter.Variants.TO_DATA_FRAME)
+            expected_df = dataframe_utils.convert_timestamp_columns_in_df(expected_df, timest_format="ISO8601")
+
+            df = pm4py.read_yaml(exported_yaml_log_path, timestamp_sort=True, reverse_sort=reverse_sort)
+
+            pd.testing.assert_frame_equal(expected_df, df)
+            for _, timestamps in df.groupby("case:concept:name", sort=False)["time:timestamp"]:
+                if reverse_sort:
+                    self.assertTrue(timestamps.is_monotonic_decreasing)
+                else:
+                    self.assertTrue(timestamps.is_monotonic_increasing)
+
+        os.remove(exported_yaml_log_path)
+
+    # ======================================== indexed import test cases ========================================
+    def test_importYAML_index_running_example(self):
+        from pm4py.objects.log.importer.yaml.util import index as yaml_index
+
+        xes_log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        exported_yaml_log_path = os.path.join(
+            OUTPUT_DATA_DIR, "running-example_index.xes.yaml"
+        )
+        yaml_exporter.apply(xes_log, exported_yaml_log_path)
+
+        yaml_log = yaml_importer.apply(exported_yaml_log_path)
+
+        index = yaml_index.build(exported_yaml_log_path)
+        self.assertEqual(len(index), len(yaml_log))
+        self.assertEqual(index.num_events, [len(trace) for trace in yaml_log])
+        self.assertEqual(vars(index), vars(yaml_index.read(exported_yaml_log_path)))
+
+        yaml_log_range = yaml_importer.apply(
+            exported_yaml_log_path,
+            parameters={yaml_importer.yaml_loader.Parameters.TRACE_INDICES: range(2, 4)},
+        )
+        self.check_difference(list(yaml_log)[2:4], list(yaml_log_range))
+
+        case_id = yaml_log[-1].attributes["concept:name"]
+        yaml_log_case = yaml_importer.apply(
+            exported_yaml_log_path,
+            parameters={yaml_importer.yaml_loader.Parameters.CASE_IDS: [case_id]},
+        )
+        self.assertEqual(len(yaml_log_case), 1)
+        self.check_difference(yaml_log[-1], yaml_log_case[0])
+
+        os.remove(yaml_index.get_index_path(exported_yaml_log_path))
+        os.remove(exported_yaml_log_path)
+
+    # ======================================== cached import test cases ========================================
+    def test_importYAML_cache_running_example(self):
+        import importlib.util
+
+        if importlib.util.find_spec("pyarrow"):
+            import shutil
+            import pandas as pd
+            from pm4py.objects.log.importer.yaml.util import cache as yaml_cache
+
+            yaml_log_path = os.path.join(INPUT_DATA_DIR, "running-example.xes.yaml")
+            cache_dir = os.path.join(OUTPUT_DATA_DIR, "xes_yaml_cache")
+            parameters = {yaml_importer.yaml_loader.Parameters.RETURN_LEGACY_LOG_OBJECT: False}
+
+            df = yaml_importer.apply(yaml_log_path, parameters=parameters)
+            df_stored = yaml_importer.apply(
+                yaml_log_path, parameters={**parameters, yaml_importer.yaml_loader.Parameters.CACHE_DIR: cache_dir})
+            self.assertEqual(1, len(os.listdir(cache_dir)))
+            df_cached = yaml_importer.apply(
+                yaml_log_path, parameters={**parameters, yaml_importer.yaml_loader.Parameters.CACHE_DIR: cache_dir})
+
+            pd.testing.assert_frame_equal(df, df_stored)
+            pd.testing.assert_frame_equal(df, df_cached)
+            self.assertEqual(df.attrs, df_cached.attrs)
+
+            # the parameters changing the dataframe are part of the key
+            yaml_importer.apply(yaml_log_path, parameters={
+                **parameters, yaml_importer.yaml_loader.Parameters.CACHE_DIR: cache_dir,
+                yaml_importer.yaml_loader.Parameters.MAX_TRACES: 1})
+            self.assertEqual(2, len(os.listdir(cache_dir)))
+            yaml_importer.apply(yaml_log_path, variant=yaml_importer.LoaderType.SAFE_PYYAML, parameters={
+                **parameters, yaml_importer.yaml_loader.Parameters.CACHE_DIR: cache_dir})
+            self.assertEqual(3, len(os.listdir(cache_dir)))
+
+            yaml_cache.evict(cache_dir, 0)
+            self.assertEqual(0, len(os.listdir(cache_dir)))
+
+            # the columns of strings are stored as Arrow columns (not as JSON strings), also when of object dtype
+            import pyarrow as pa
+
+            df_object = df.astype({"concept:name": object, "cpee:activity": object})
+            cache_parameters = {yaml_cache.Parameters.CACHE_DIR: cache_dir}
+            yaml_cache.put(yaml_log_path, df_object, "object", parameters=cache_parameters)
+            pd.testing.assert_frame_equal(df_object, yaml_cache.get(yaml_log_path, "object", parameters=cache_parameters))
+            cache_path = yaml_cache.get_cache_path(yaml_cache.get_fingerprint(yaml_log_path, "object"), cache_dir)
+            with pa.memory_map(cache_path, "r") as source:
+                schema = pa.ipc.open_file(source).schema
+            self.assertTrue(pa.types.is_string(schema.field("concept:name").type))
+            self.assertTrue(pa.types.is_string(schema.field("cpee:activity").type))
+
+            # the nested attributes are stored as JSON strings, restoring the same Python objects
+            from datetime import datetime, timezone
+
+            nested_values = [
+                {"value": None, "children": [("", {"name": "queue", "value": 1})]},
+                [1.5, True, datetime(2023, 4, 28, 17, 0, tzinfo=timezone.utc)],
+                "string",
+            ]
+            df_nested = pd.DataFrame({"data": pd.Series(nested_values, dtype=object)})
+            yaml_cache.put(yaml_log_path, df_nested, "nested", parameters=cache_parameters)
+            df_nested_cached = yaml_cache.get(yaml_log_path, "nested", parameters=cache_parameters)
+            self.assertEqual(nested_values, list(df_nested_cached["data"]))
+            self.assertIsInstance(df_nested_cached["data"][0]["children"][0], tuple)
+
+            shutil.rmtree(cache_dir)
+
+    # ======================================== line scanner test cases ========================================
+    def test_importYAML_line_scanner_running_example(self):
+        yaml_log_path = os.path.join(INPUT_DATA_DIR, "running-example.xes.yaml")
+        yaml_log = yaml_importer.apply(yaml_log_path)
+        yaml_log_scanner = yaml_importer.apply(
+            yaml_log_path,
+            parameters={yaml_importer.yaml_loader.Parameters.LINE_SCANNER: True},
+        )
+        self.check_difference(yaml_log, yaml_log_scanner)
+
+    def test_line_scanner_scalars(self):
+        import io
+        import yaml
+        from yaml.cyaml import CSafeLoader
+        from pm4py.objects.log.importer.yaml.variants import line_scanner
+
+        self.dummy_variable = "dummy_value"
+        content = "\n".join([
+            "---",
+            "trace:",
+            "  concept:name: 12",
+            "---",
+            "event:",
+            "  str: abc def",
+            "  quoted: 'it''s'",
+            "  dquoted: \"2023-04-28T17:04:32.207+02:00\"",
+            "  int: -42",
+            "  octal: 012",
+            "  float: 1.5",
+            "  exp: 1.0e+3",
+            "  not_exp: 1e3",
+            "  inf: -.inf",
+            "  bools: [yes, off]",
+            "  bool: Off",
+            "  null:",
+            "  tilde: ~",
+            "  date: 2023-04-28",
+            "  timestamp: 2023-04-28T17:04:32.207+02:00",
+            "  colon: a:b",
+            "---",
+            "event:",
+            "  a: 1",
+            "  nested:",
+            "    b: 2",
+            "---",
+            "event:",
+            "  a: plain # comment",
+            "",
+        ])
+        self.assertEqual(
+            list(yaml.load_all(content, Loader=CSafeLoader)),
+            list(line_scanner.load_all(io.StringIO(content), CSafeLoader)),
+        )
+
+    # ======================================== batched export test cases ========================================
+    def test_exportYAML_batched_running_example(self):
+        xes_log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        yaml_log = yaml_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes.yaml"))
+        self.perform_exportYAML_batched(xes_log, "running-example_xes")
+        self.perform_exportYAML_batched(yaml_log, "running-example_yaml")
+
+    def test_exportYAML_batched_fromGZIP_chess_production(self):
+        yaml_log = yaml_importer.apply(
+            os.path.join(COMPRESSED_INPUT_DATA, "chess_production.xes.yaml.gz"),
+            parameters={yaml_importer.yaml_loader.Parameters.MAX_TRACES: 50},
+        )
+        self.perform_exportYAML_batched(yaml_log, "chess_production")
+
+    # ======================================== multiprocessing export test cases ========================================
+    def test_exportYAML_multiprocessing_running_example(self):
+        import gzip
+
+        xes_log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        exported_yaml_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example_exported.xes.yaml")
+        exported_mp_yaml_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example_exported_mp.xes.yaml")
+        exported_mp_gz_yaml_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example_exported_mp.xes.yaml.gz")
+
+        yaml_exporter.apply(xes_log, exported_yaml_log_path)
+        parameters = {
+            yaml_exporter.yaml_dumper.Parameters.MULTIPROCESSING: True,
+            yaml_exporter.yaml_dumper.Parameters.CORES: 2,
+        }
+        yaml_exporter.apply(xes_log, exported_mp_yaml_log_path, parameters=parameters)
+        yaml_exporter.apply(xes_log, exported_mp_gz_yaml_log_path, parameters=parameters)
+
+        with open(exported_yaml_log_path, "rb") as f1, open(exported_mp_yaml_log_path, "rb") as f2:
+            content = f1.read()
+            self.assertEqual(content, f2.read())
+
+        # multi-member gzip file
+        with gzip.open(exported_mp_gz_yaml_log_path, "rb") as f3:
+            self.assertEqual(content, f3.read())
+
+        yaml_log = yaml_importer.apply(exported_yaml_log_path)
+        yaml_log_mp = yaml_importer.apply(exported_mp_gz_yaml_log_path)
+        self.check_difference(yaml_log, yaml_log_mp)
+
+        os.remove(exported_yaml_log_path)
+        os.remove(exported_mp_yaml_log_path)
+        os.remove(exported_mp_gz_yaml_log_path)
+
+    # ======================================== tail-following reader test cases ========================================
+    def test_tailYAML_live_event_stream_running_example(self):
+        from pm4py.algo.discovery.dfg import algorithm as dfg_algorithm
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg_discovery
+        from pm4py.streaming.importer.yaml import importer as streaming_yaml_importer
+        from pm4py.streaming.importer.yaml.variants.yaml_tail_event_stream import Parameters
+        from pm4py.streaming.stream.live_event_stream import LiveEventStream
+
+        xes_log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        exported_yaml_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example_tail.xes.yaml")
+        yaml_exporter.apply(xes_log, exported_yaml_log_path)
+
+        live_event_stream = LiveEventStream()
+        streaming_dfg = streaming_dfg_discovery.apply()
+        live_event_stream.register(streaming_dfg)
+        live_event_stream.start()
+        reader = streaming_yaml_importer.apply(
+            exported_yaml_log_path,
+            parameters={Parameters.POLL_INTERVAL: 0.05, Parameters.IDLE_TIMEOUT: 0.2,
+                        Parameters.PERSIST_OFFSET: False},
+        )
+        reader.to_event_stream(live_event_stream)
+        live_event_stream.stop()
+
+        self.assertEqual(dict(dfg_algorithm.apply(xes_log)), dict(streaming_dfg.get()[0]))
+
+        os.remove(exported_yaml_log_path)
+
+    def test_tailYAML_resume_from_offset(self):
+        from pm4py.objects.log.exporter.yaml.variants import yaml_dumper
+        from pm4py.objects.log.obj import EventLog
+        from pm4py.streaming.importer.yaml import importer as streaming_yaml_importer
+        from pm4py.streaming.importer.yaml.variants.yaml_tail_event_stream import Parameters
+
+        xes_log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        exported_yaml_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example_tail_resume.xes.yaml")
+        offset_path = exported_yaml_log_path + ".offset"
+        parameters = {Parameters.POLL_INTERVAL: 0.05, Parameters.IDLE_TIMEOUT: 0.2, Parameters.OFFSET_PATH: offset_path}
+
+        yaml_exporter.apply(EventLog(xes_log[:3]), exported_yaml_log_path)
+        all_events = list(streaming_yaml_importer.apply(
+            exported_yaml_log_path, parameters={**parameters, Parameters.PERSIST_OFFSET: False}))
+
+        # the reader is stopped in the middle of a trace
+        reader = streaming_yaml_importer.apply(exported_yaml_log_path, parameters=parameters)
+        events = [next(reader) for _ in range(7)]
+        reader.stop()
+        self.assertIsNone(next(reader, None))
+
+        # the restarted reader continues from the persisted offset, also on the documents appended in the meanwhile
+        with open(exported_yaml_log_path, "ab") as f:
+            yaml_dumper.export_log(EventLog(xes_log[3:]), f, "utf-8", yaml_exporter.DEFAULT_VARIANT, append=True)
+        events += list(streaming_yaml_importer.apply(exported_yaml_log_path, parameters=parameters))
+
+        self.assertEqual([dict(event) for event in all_events], [dict(event) for event in events[:len(all_events)]])
+        self.assertEqual(sum(len(trace) for trace in xes_log), len(events))
+        self.assertEqual(xes_log[-1].attributes["concept:name"], events[-1]["case:concept:name"])
+
+        os.remove(offset_path)
+        os.remove(exported_yaml_log_path)
+
+    def test_tailYAML_document_being_written(self):
+        from pm4py.streaming.importer.yaml import importer as streaming_yaml_importer
+        from pm4py.streaming.importer.yaml.variants.yaml_tail_event_stream import Parameters
+
+        yaml_log_path = os.path.join(OUTPUT_DATA_DIR, "tail_being_written.xes.yaml")
+        with open(yaml_log_path, "w") as f:
+            f.write("log:\n  trace:\n    concept:name: c1\n---\nevent:\n  concept:name: A\n")
+
+        reader = streaming_yaml_importer.apply(
+            yaml_log_path,
+            parameters={Parameters.POLL_INTERVAL: 0.05, Parameters.IDLE_TIMEOUT: 0.2,
+                        Parameters.PERSIST_OFFSET: False},
+        )
+        # the writer pauses in the middle of the event: the event is not parsed until it is completed
+        reader.poll()
+        reader.poll()
+        with open(yaml_log_path, "a") as f:
+            f.write("  org:resource: Bob\n---\nevent: [A\n---\nevent:\n  concept:name: B\n")
+
+        with self.assertWarns(UserWarning):
+            events = [dict(event) for event in reader]
+        self.assertEqual([{"concept:name": "A", "org:resource": "Bob", "case:concept:name": "c1"},
+                          {"concept:name": "B", "case:concept:name": "c1"}], events)
+
+        os.remove(yaml_log_path)
+
+    # ======================================== dataframe export test cases ========================================
+    def test_exportYAML_dataframe_running_example(self):
+        import numpy as np
+        import pandas as pd
+        import pm4py
+        from pm4py.objects.conversion.log import converter as log_converter
+
+        dataframe = pm4py.read_xes(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        dataframe["time:timestamp"] = dataframe["time:timestamp"].dt.tz_convert("Europe/Vienna") + pd.to_timedelta(
+            np.arange(len(dataframe)) * 1234567, unit="ns")
+        dataframe.loc[3, "time:timestamp"] = pd.NaT
+        dataframe.loc[5, "Costs"] = np.nan
+        dataframe["case:number"] = dataframe.index
+        # the cases are not contiguous in the dataframe
+        dataframe = dataframe.sample(frac=1, random_state=1)
+
+        exported_yaml_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example_exported_df.xes.yaml")
+        exported_conv_yaml_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example_exported_conv.xes.yaml")
+
+        for parameters in [{}, {yaml_exporter.yaml_dumper.Parameters.BATCHED: True}]:
+            yaml_exporter.apply(dataframe, exported_yaml_log_path, parameters=parameters)
+            yaml_exporter.apply(
+                log_converter.apply(dataframe, variant=log_converter.Variants.TO_EVENT_LOG),
+                exported_conv_yaml_log_path,
+                parameters=parameters,
+            )
+
+            with open(exported_yaml_log_path, "rb") as f1, open(exported_conv_yaml_log_path, "rb") as f2:
+                self.assertEqual(f2.read(), f1.read())
+
+        os.remove(exported_yaml_log_path)
+        os.remove(exported_conv_yaml_log_path)
+
+    def test_flat_emitter_scalars(self):
+        import yaml
+        from yaml.cyaml import CSafeDumper
+        from pm4py.objects.log.exporter.yaml.variants import flat_emitter
+
+        self.dummy_variable = "dummy_value"
+        values = [
+            "", "abc", "abc def", "it's", "- a", "-a", "? a", ": a", "a:", "a: b", "a:b", "a #b", "a#b",
+            "#a", "&a", "*a", "!a", "|a", ">a", "%a", "@a", "`a", " a", "a ", "---", "--- a", "...",
+            "yes", "Off", "null", "~", "12", "012", "0x1F", "1.5", "1e3", ".inf", "2023-04-28",
+            "2023-04-28T17:04:32.207+02:00", "x" * 100, "x " * 50, "\u00e8", "a\tb", "a\nb",
+            True, False, None, 0, -42, 10 ** 20, 1.5, -0.0, 1e20, 1e-20, float("inf"), float("nan"),
+        ]
+        rendered_count = 0
+        for value in values:
+            for attributes in ({"key": value}, {"key": value, "concept:name": "A", "x" * 130: 1}):
+                document = {"event": attributes}
+                rendered = flat_emitter.render_flat_document(document)
+                if rendered is not None:
+                    rendered_count += 1
+                    self.assertEqual(yaml.dump(document, default_flow_style=False, Dumper=CSafeDumper), rendered)
+        self.assertGreater(rendered_count, 0)
+
+    def perform_exportYAML_batched(self, log, log_name: str):
+        exported_yaml_log_path = os.path.join(OUTPUT_DATA_DIR, f"{log_name}_exported.xes.yaml")
+        exported_batched_yaml_log_path = os.path.join(
+            OUTPUT_DATA_DIR, f"{log_name}_exported_batched.xes.yaml"
+        )
+        dumper = yaml_exporter.yaml_dumper.DumperType.C_SAFE_DUMPER
+
+        yaml_exporter.apply(log, exported_yaml_log_path, variant=dumper)
+        yaml_exporter.apply(
+            log,
+            exported_batched_yaml_log_path,
+            variant=dumper,
+            parameters={yaml_exporter.yaml_dumper.Parameters.BATCHED: True},
+        )
+
+        with open(exported_yaml_log_path, "rb") as f1, open(exported_batched_yaml_log_path, "rb") as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+        os.remove(exported_yaml_log_path)
+        os.remove(exported_batched_yaml_log_path)
+
     # ====================================================================================================================
 
     def check_difference(self, log_1, log_2):